@@ -0,0 +1,11 @@
+"""Bench - startup and latency measurements for hook entry points.
+
+Reports where each hook spends its cold-start time so import-time costs
+(third-party packages, config parsing) can be kept out of the hot path, and
+replays recorded events to track per-hook latency against a JSON baseline.
+A stress harness runs many sessions at once against one .data tree and
+audits it for lost or corrupted records.
+"""
+
+__all__ = ["importtime", "latency", "stress"]
+__version__ = "0.1.0"
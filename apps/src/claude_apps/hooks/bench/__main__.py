@@ -0,0 +1,173 @@
+"""Entry point for hook benchmarks.
+
+Usage:
+    python -m claude_apps.hooks.bench importtime
+    python -m claude_apps.hooks.bench importtime logger rules_loader --top 5
+    python -m claude_apps.hooks.bench importtime --format json
+    python -m claude_apps.hooks.bench latency
+    python -m claude_apps.hooks.bench latency logger --mode inprocess -n 200
+    python -m claude_apps.hooks.bench latency --save-baseline
+    python -m claude_apps.hooks.bench stress --sessions 16 --rounds 10
+    python -m claude_apps.hooks.bench stress logger --mode dispatch --format json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from claude_apps.shared.config_helper import get_data_path
+
+from . import latency, stress
+from .importtime import format_report, profile_hooks
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measure hook entry point startup costs",
+        prog="hooks-bench",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    importtime = subparsers.add_parser("importtime", help="Per-hook import-time report")
+    importtime.add_argument("hooks", nargs="*", help="Hooks to profile (default: all)")
+    importtime.add_argument("--top", type=int, default=10, help="Modules to list per hook")
+    importtime.add_argument("--format", choices=["text", "json"], default="text")
+
+    bench = subparsers.add_parser("latency", help="Replay recorded events and report latency")
+    bench.add_argument(
+        "hooks",
+        nargs="*",
+        help="Hooks to benchmark (default: logger, rules_loader, playwright_healer)",
+    )
+    bench.add_argument(
+        "--fixture",
+        action="append",
+        choices=latency.list_fixtures(),
+        help="Fixture to replay (repeatable; default: the hook's usual events)",
+    )
+    bench.add_argument("--mode", choices=[*latency.MODES, "both"], default="both")
+    bench.add_argument("-n", "--iterations", type=int, default=50, help="In-process runs per case")
+    bench.add_argument("--no-imports", action="store_true", help="Skip import-time measurement")
+    bench.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help="Baseline JSON (default: .data/bench/latency_baseline.json)",
+    )
+    bench.add_argument(
+        "--save-baseline", action="store_true", help="Write this run as the new baseline"
+    )
+    bench.add_argument(
+        "--threshold", type=float, default=0.25, help="Relative growth counted as a regression"
+    )
+    bench.add_argument("--format", choices=["text", "json"], default="text")
+
+    load = subparsers.add_parser(
+        "stress", help="Run concurrent sessions and audit the shared .data tree"
+    )
+    load.add_argument(
+        "hooks",
+        nargs="*",
+        help=f"Hooks to run in hooks mode (default: {', '.join(stress.DEFAULT_HOOKS)})",
+    )
+    load.add_argument("-s", "--sessions", type=int, default=8, help="Concurrent sessions")
+    load.add_argument("-r", "--rounds", type=int, default=5, help="Prompt rounds per session")
+    load.add_argument("--mode", choices=stress.MODES, default="hooks")
+    load.add_argument("--seed", type=int, default=0, help="Seed for the sessions' tool mix")
+    load.add_argument("--format", choices=["text", "json"], default="text")
+
+    return parser.parse_args(argv)
+
+
+def _select_cases(hooks: list[str], fixtures: list[str] | None) -> dict[str, list[str]]:
+    names = hooks or list(latency.DEFAULT_CASES)
+    return {name: fixtures or latency.DEFAULT_CASES.get(name, ["session_start"]) for name in names}
+
+
+def run_latency(args: argparse.Namespace) -> int:
+    """Run the latency suite and compare against the baseline."""
+    modes = latency.MODES if args.mode == "both" else (args.mode,)
+    try:
+        report = latency.run_suite(
+            _select_cases(args.hooks, args.fixture),
+            modes=modes,
+            iterations=args.iterations,
+            measure_imports=not args.no_imports,
+        )
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+
+    baseline_path = args.baseline or get_data_path("bench") / "latency_baseline.json"
+    rows = []
+    if baseline_path.exists() and not args.save_baseline:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        rows = latency.compare(report, baseline, threshold=args.threshold)
+
+    if args.format == "json":
+        print(json.dumps({**report, "comparison": rows}, indent=2))
+    else:
+        print(latency.format_report(report))
+        if rows:
+            print(f"\nvs {baseline_path}:")
+            print(latency.format_comparison(rows))
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(
+            json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        print(f"baseline written to {baseline_path}", file=sys.stderr)
+
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+def run_stress(args: argparse.Namespace) -> int:
+    """Run the stress harness; non-zero when calls failed or state was lost."""
+    try:
+        report = stress.run_stress(
+            sessions=args.sessions,
+            rounds=args.rounds,
+            hooks=args.hooks or stress.DEFAULT_HOOKS,
+            mode=args.mode,
+            seed=args.seed,
+        )
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+
+    if args.format == "json":
+        print(json.dumps(report, indent=2))
+    else:
+        print(stress.format_report(report))
+
+    return 0 if stress.is_clean(report) else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    args = parse_args(argv)
+
+    if args.command == "latency":
+        return run_latency(args)
+    if args.command == "stress":
+        return run_stress(args)
+
+    try:
+        reports = profile_hooks(args.hooks)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+
+    if args.format == "json":
+        print(json.dumps([r.to_dict(args.top) for r in reports], indent=2))
+    else:
+        print(format_report(reports, args.top))
+
+    return 1 if any(r.error for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
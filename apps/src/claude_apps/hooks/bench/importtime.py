@@ -0,0 +1,152 @@
+"""Import-time profiling of hook entry points via ``python -X importtime``."""
+
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Any
+
+from claude_apps.hooks.daemon.registry import HOOK_MODULES
+
+
+@dataclass
+class ImportEntry:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    """Import-time profile for a single hook module."""
+
+    hook: str
+    module: str
+    entries: list[ImportEntry] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def total_us(self) -> int:
+        """Cumulative import time of all top-level imports."""
+        return sum(e.cumulative_us for e in self.entries if e.depth == 0)
+
+    def top(self, count: int) -> list[ImportEntry]:
+        """Modules with the highest cumulative import time."""
+        return sorted(self.entries, key=lambda e: e.cumulative_us, reverse=True)[:count]
+
+    def to_dict(self, count: int) -> dict[str, Any]:
+        return {
+            "hook": self.hook,
+            "module": self.module,
+            "total_us": self.total_us,
+            "error": self.error,
+            "top": [
+                {"module": e.module, "self_us": e.self_us, "cumulative_us": e.cumulative_us}
+                for e in self.top(count)
+            ],
+        }
+
+
+def parse_importtime(output: str) -> list[ImportEntry]:
+    """Parse ``import time: self | cumulative | name`` lines.
+
+    Args:
+        output: stderr of a ``python -X importtime`` run
+
+    Returns:
+        Parsed entries in output order; the header and other lines are skipped
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append(ImportEntry(stripped, self_us, cumulative_us, max(depth, 0)))
+    return entries
+
+
+def strip_startup(entries: list[ImportEntry]) -> list[ImportEntry]:
+    """Drop imports made by interpreter startup (``site`` and ``.pth`` files).
+
+    Children are reported before their parent, so everything up to and
+    including the top-level ``site`` entry belongs to startup.
+    """
+    for index in range(len(entries) - 1, -1, -1):
+        if entries[index].depth == 0 and entries[index].module == "site":
+            return entries[index + 1 :]
+    return entries
+
+
+def profile_module(hook: str, module: str, timeout: float = 60.0) -> ImportReport:
+    """Import a module in a fresh interpreter and collect its import profile.
+
+    Args:
+        hook: Hook name used for reporting
+        module: Dotted module path to import
+        timeout: Seconds before the child interpreter is abandoned
+
+    Returns:
+        ImportReport; ``error`` holds the child's traceback if the import failed
+    """
+    report = ImportReport(hook=hook, module=module)
+    try:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        report.error = f"timed out after {timeout}s"
+        return report
+
+    report.entries = strip_startup(parse_importtime(result.stderr))
+    if result.returncode != 0:
+        lines = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        report.error = "\n".join(lines[-5:])
+    return report
+
+
+def profile_hooks(hooks: list[str] | None = None) -> list[ImportReport]:
+    """Profile hook entry points from the daemon registry.
+
+    Args:
+        hooks: Hook names to profile (default: all registered hooks)
+
+    Returns:
+        One ImportReport per hook
+
+    Raises:
+        ValueError: If a hook name is not registered
+    """
+    names = hooks or sorted(HOOK_MODULES)
+    unknown = [n for n in names if n not in HOOK_MODULES]
+    if unknown:
+        raise ValueError(f"Unknown hook: {', '.join(unknown)}")
+    return [profile_module(name, HOOK_MODULES[name]) for name in names]
+
+
+def format_report(reports: list[ImportReport], count: int) -> str:
+    """Render reports as a plain-text table."""
+    lines = []
+    for report in sorted(reports, key=lambda r: r.total_us, reverse=True):
+        lines.append(f"{report.hook}: {report.total_us / 1000:.1f} ms ({report.module})")
+        if report.error:
+            lines.append(f"  error: {report.error.splitlines()[-1]}")
+        for entry in report.top(count):
+            cumulative_ms = entry.cumulative_us / 1000
+            self_ms = entry.self_us / 1000
+            lines.append(f"  {cumulative_ms:8.1f} ms  {self_ms:7.1f} ms  {entry.module}")
+    return "\n".join(lines)
@@ -0,0 +1,340 @@
+"""Latency benchmarks that replay recorded hook events.
+
+Each case feeds one fixture from ``bench/fixtures`` to a hook's ``main()``,
+either in-process through the daemon runner or as a fresh
+``python -m <hook>`` subprocess, inside a throwaway claude root so log
+writes land in a temp directory and can be measured.
+"""
+
+import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from claude_apps.hooks.daemon.registry import HOOK_MODULES
+from claude_apps.hooks.daemon.runner import run_hook
+from claude_apps.shared.config_helper import get_config_path
+
+from .importtime import profile_module
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+MODES = ("inprocess", "subprocess")
+
+# Hooks on the critical path and the recorded events they see. Hooks with
+# side effects outside the claude root (git fetches, browser recovery) are
+# not replayed by default.
+DEFAULT_CASES: dict[str, list[str]] = {
+    "logger": [
+        "session_start",
+        "user_prompt_submit",
+        "pre_tool_use",
+        "post_tool_use",
+        "post_tool_use_playwright",
+    ],
+    "rules_loader": ["session_start", "user_prompt_submit"],
+    "playwright_healer": ["post_tool_use_playwright", "post_tool_use"],
+}
+
+
+@dataclass
+class CaseStats:
+    """Latency and output size for one hook/fixture/mode combination."""
+
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+    stdout_bytes: int
+    disk_bytes: int
+    iterations: int
+    errors: int
+
+
+def list_fixtures() -> list[str]:
+    """Names of the recorded event fixtures."""
+    return sorted(p.stem for p in FIXTURES_DIR.glob("*.json"))
+
+
+def load_fixture(name: str) -> str:
+    """Load a recorded event as a single-line JSON payload.
+
+    Raises:
+        ValueError: If no fixture has this name
+    """
+    path = FIXTURES_DIR / f"{name}.json"
+    if not path.exists():
+        raise ValueError(f"Unknown fixture: {name}")
+    return json.dumps(json.loads(path.read_text(encoding="utf-8"))) + "\n"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a sample list (0.0 for no samples)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples: list[float], stdout_bytes: int, disk_bytes: int, errors: int) -> CaseStats:
+    """Reduce raw timings to percentile statistics."""
+    return CaseStats(
+        p50_ms=round(percentile(samples, 50), 3),
+        p95_ms=round(percentile(samples, 95), 3),
+        p99_ms=round(percentile(samples, 99), 3),
+        mean_ms=round(sum(samples) / len(samples), 3) if samples else 0.0,
+        min_ms=round(min(samples), 3) if samples else 0.0,
+        max_ms=round(max(samples), 3) if samples else 0.0,
+        stdout_bytes=stdout_bytes,
+        disk_bytes=disk_bytes,
+        iterations=len(samples),
+        errors=errors,
+    )
+
+
+def _tree_size(root: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                total += (Path(dirpath) / filename).stat().st_size
+            except OSError:
+                pass
+    return total
+
+
+@contextmanager
+def sandbox() -> Iterator[Path]:
+    """Run hooks against a temporary copy of the claude root.
+
+    config.yml is copied from CLAUDE_CONFIG_YML_PATH when set, and the rules
+    directory is symlinked, so hooks behave as configured while every write
+    under .data stays in the temp directory.
+
+    Yields:
+        Path to the temporary claude root
+    """
+    saved = {
+        k: os.environ.get(k)
+        for k in ("CLAUDE_CONFIG_YML_PATH", "CLAUDE_DATA_PATH", "CLAUDE_LOGS_PATH")
+    }
+    with tempfile.TemporaryDirectory(prefix="hooks-bench-") as tmp:
+        root = Path(tmp) / ".claude"
+        root.mkdir()
+        config_file = root / "config.yml"
+
+        try:
+            source = get_config_path()
+        except EnvironmentError:
+            source = None
+        if source is not None and source.exists():
+            shutil.copyfile(source, config_file)
+            if (source.parent / "rules").is_dir():
+                (root / "rules").symlink_to(source.parent / "rules")
+        else:
+            config_file.write_text("hooks: {}\n", encoding="utf-8")
+
+        os.environ["CLAUDE_CONFIG_YML_PATH"] = str(config_file)
+        os.environ["CLAUDE_DATA_PATH"] = str(root / ".data")
+        os.environ["CLAUDE_LOGS_PATH"] = str(root / ".data" / "logs")
+        try:
+            yield root
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+def _run_inprocess(hook: str, payload: str) -> tuple[float, int, bool]:
+    result = run_hook(hook, payload)
+    return result.duration_ms, len(result.stdout.encode("utf-8")), result.exit_code == 0
+
+
+def _run_subprocess(hook: str, payload: str) -> tuple[float, int, bool]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-m", HOOK_MODULES[hook].removesuffix(".__main__")],
+        input=payload.encode("utf-8"),
+        capture_output=True,
+        timeout=60,
+    )
+    duration_ms = (time.perf_counter() - start) * 1000
+    return duration_ms, len(result.stdout), result.returncode == 0
+
+
+def run_case(hook: str, fixture: str, mode: str, iterations: int, warmup: int = 1) -> CaseStats:
+    """Replay one fixture through one hook and collect statistics.
+
+    Must be called inside sandbox() so disk usage can be attributed to the
+    hook; disk_bytes is the growth of the claude root per measured run.
+
+    Args:
+        hook: Registered hook name
+        fixture: Fixture name from list_fixtures()
+        mode: "inprocess" or "subprocess"
+        iterations: Measured runs
+        warmup: Unmeasured runs first (imports, caches)
+
+    Returns:
+        CaseStats for the measured runs
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+    if hook not in HOOK_MODULES:
+        raise ValueError(f"Unknown hook: {hook}")
+
+    runner = _run_inprocess if mode == "inprocess" else _run_subprocess
+    payload = load_fixture(fixture)
+    root = Path(os.environ["CLAUDE_CONFIG_YML_PATH"]).parent
+
+    for _ in range(warmup):
+        runner(hook, payload)
+
+    before = _tree_size(root)
+    samples: list[float] = []
+    stdout_bytes = 0
+    errors = 0
+    for _ in range(iterations):
+        duration_ms, written, ok = runner(hook, payload)
+        samples.append(duration_ms)
+        stdout_bytes = written
+        errors += 0 if ok else 1
+    disk_bytes = (_tree_size(root) - before) // max(iterations, 1)
+
+    return summarize(samples, stdout_bytes, disk_bytes, errors)
+
+
+def run_suite(
+    cases: dict[str, list[str]] | None = None,
+    modes: tuple[str, ...] = MODES,
+    iterations: int = 50,
+    measure_imports: bool = True,
+) -> dict[str, Any]:
+    """Run every case and return a baseline-compatible report.
+
+    Args:
+        cases: Hook name to fixture names (default: DEFAULT_CASES)
+        modes: Execution modes to measure
+        iterations: Measured runs per case; subprocess mode uses a fifth
+        measure_imports: Include per-hook import time
+
+    Returns:
+        Report dictionary with "meta" and "results" keys
+    """
+    cases = cases or DEFAULT_CASES
+    results: dict[str, Any] = {}
+
+    with sandbox():
+        for hook, fixtures in cases.items():
+            entry: dict[str, Any] = {"cases": {}}
+            if measure_imports:
+                entry["import_ms"] = round(
+                    profile_module(hook, HOOK_MODULES[hook]).total_us / 1000, 3
+                )
+            for fixture in fixtures:
+                entry["cases"][fixture] = {}
+                for mode in modes:
+                    count = iterations if mode == "inprocess" else max(iterations // 5, 1)
+                    entry["cases"][fixture][mode] = asdict(run_case(hook, fixture, mode, count))
+            results[hook] = entry
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = 0.25,
+    min_delta_ms: float = 1.0,
+) -> list[dict[str, Any]]:
+    """Compare a report with a baseline.
+
+    A metric regresses when it grows by more than ``threshold`` (relative)
+    and by more than ``min_delta_ms`` (absolute), so sub-millisecond noise
+    on fast hooks does not fail the comparison.
+
+    Returns:
+        One row per metric present in both, with a "regressed" flag
+    """
+    rows = []
+    base_results = baseline.get("results", {})
+
+    def add(key: str, current: float, previous: float) -> None:
+        delta = current - previous
+        ratio = delta / previous if previous else 0.0
+        rows.append(
+            {
+                "key": key,
+                "baseline": previous,
+                "current": current,
+                "delta": round(delta, 3),
+                "ratio": round(ratio, 3),
+                "regressed": ratio > threshold and delta > min_delta_ms,
+            }
+        )
+
+    for hook, entry in report.get("results", {}).items():
+        base_entry = base_results.get(hook)
+        if not base_entry:
+            continue
+        if "import_ms" in entry and "import_ms" in base_entry:
+            add(f"{hook}.import_ms", entry["import_ms"], base_entry["import_ms"])
+        for fixture, modes in entry.get("cases", {}).items():
+            for mode, stats in modes.items():
+                base_stats = base_entry.get("cases", {}).get(fixture, {}).get(mode)
+                if not base_stats:
+                    continue
+                for metric in ("p50_ms", "p95_ms"):
+                    add(f"{hook}.{fixture}.{mode}.{metric}", stats[metric], base_stats[metric])
+    return rows
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a report as a plain-text table."""
+    lines = [f"{'case':<52} {'p50':>8} {'p95':>8} {'p99':>8} {'stdout':>7} {'disk':>7} {'err':>4}"]
+    for hook, entry in report["results"].items():
+        if "import_ms" in entry:
+            lines.append(f"{hook} (import {entry['import_ms']:.1f} ms)")
+        for fixture, modes in entry["cases"].items():
+            for mode, s in modes.items():
+                label = f"{fixture} [{mode}]"
+                lines.append(
+                    f"  {label:<50} {s['p50_ms']:>8.2f} {s['p95_ms']:>8.2f} {s['p99_ms']:>8.2f} "
+                    f"{s['stdout_bytes']:>7} {s['disk_bytes']:>7} {s['errors']:>4}"
+                )
+    return "\n".join(lines)
+
+
+def format_comparison(rows: list[dict[str, Any]]) -> str:
+    """Render baseline comparison rows, regressions marked with '!'."""
+    lines = []
+    for row in rows:
+        mark = "!" if row["regressed"] else " "
+        lines.append(
+            f"{mark} {row['key']:<60} {row['baseline']:>9.2f} -> {row['current']:>9.2f} "
+            f"({row['ratio']:+.0%})"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,386 @@
+"""Concurrent multi-session stress runs against hook entry points.
+
+N simulated sessions run at once against one sandboxed claude root. Each
+session fires a realistic event sequence (SessionStart, prompt/tool
+rounds with matching PreToolUse/PostToolUse pairs, Stop) as fresh
+``python -m`` processes, routed the way hooks.dispatch routes them:
+
+- ``hooks`` mode starts every routed hook of an event at once, like
+  separate settings.json commands do
+- ``dispatch`` mode starts one dispatch process per event
+
+Afterwards the shared .data tree is audited: every logger record and
+tool summary pair must be present and every JSON state file and log
+line must parse.
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from claude_apps.hooks.daemon.registry import HOOK_MODULES
+from claude_apps.hooks.dispatch.config import get_config as get_dispatch_config
+from claude_apps.hooks.dispatch.config import get_hooks_for_event
+from claude_apps.hooks.logger.paths import get_config as get_logger_config
+from claude_apps.hooks.logger.paths import get_session_log_dir
+from claude_apps.hooks.logger.tool_stats import load_summary
+from claude_apps.shared.event_log import BLOB_DIR_NAME, iter_session_records, read_log_text
+
+from .latency import load_fixture, percentile, sandbox
+
+MODES = ("hooks", "dispatch")
+
+# Hooks with shared read-modify-write state under .data
+DEFAULT_HOOKS = ("logger", "rules_loader", "playwright_healer", "submodule_auto_updater")
+
+DISPATCH_MODULE = "claude_apps.hooks.dispatch"
+
+# Share of tool calls that are Playwright calls (routed to playwright_healer)
+PLAYWRIGHT_SHARE = 0.25
+MAX_TOOLS_PER_ROUND = 3
+
+
+@dataclass
+class Call:
+    """One hook process run."""
+
+    session: str
+    target: str
+    event: str
+    duration_ms: float
+    ok: bool
+
+
+@dataclass
+class Audit:
+    """Integrity of the shared .data tree after a run."""
+
+    expected_records: int = 0
+    found_records: int = 0
+    expected_tool_calls: int = 0
+    found_tool_calls: int = 0
+    corrupt_files: list[str] = field(default_factory=list)
+    corrupt_lines: int = 0
+
+    @property
+    def lost_records(self) -> int:
+        return max(0, self.expected_records - self.found_records)
+
+    @property
+    def lost_tool_calls(self) -> int:
+        return max(0, self.expected_tool_calls - self.found_tool_calls)
+
+
+def _fixture(name: str, session_id: str) -> dict[str, Any]:
+    event = json.loads(load_fixture(name))
+    event["session_id"] = session_id
+    event["transcript_path"] = str(Path(event["transcript_path"]).with_name(f"{session_id}.jsonl"))
+    return event
+
+
+def session_events(session_id: str, rounds: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Event sequence of one simulated session.
+
+    Args:
+        session_id: Session id stamped on every event
+        rounds: Prompt rounds; each has one to MAX_TOOLS_PER_ROUND tool calls
+        seed: Seed for the tool mix
+
+    Returns:
+        Events in the order Claude Code would send them
+    """
+    rng = random.Random(seed)
+    events = [_fixture("session_start", session_id)]
+    calls = 0
+    for _ in range(rounds):
+        events.append(_fixture("user_prompt_submit", session_id))
+        for _ in range(rng.randint(1, MAX_TOOLS_PER_ROUND)):
+            calls += 1
+            playwright = rng.random() < PLAYWRIGHT_SHARE
+            post = _fixture(
+                "post_tool_use_playwright" if playwright else "post_tool_use", session_id
+            )
+            pre = _fixture("pre_tool_use", session_id)
+            pre["tool_name"] = post["tool_name"]
+            pre["tool_input"] = post["tool_input"]
+            pre["tool_use_id"] = post["tool_use_id"] = f"toolu_stress_{session_id[:8]}_{calls:04d}"
+            events += [pre, post]
+    stop = {k: events[0][k] for k in ("session_id", "transcript_path", "cwd")}
+    events.append({**stop, "hook_event_name": "Stop", "stop_hook_active": False})
+    return events
+
+
+def route(
+    event: dict[str, Any], mode: str, hooks: Iterable[str], routing: dict[str, Any]
+) -> list[str]:
+    """Targets an event is sent to: hook names, or "dispatch"."""
+    if mode == "dispatch":
+        return ["dispatch"]
+    routed = get_hooks_for_event(routing, event["hook_event_name"], event.get("tool_name", ""))
+    return [hook for hook in routed if hook in hooks]
+
+
+def _module(target: str) -> str:
+    if target == "dispatch":
+        return DISPATCH_MODULE
+    return HOOK_MODULES[target].removesuffix(".__main__")
+
+
+def _invoke(
+    session: str, target: str, event_name: str, payload: bytes, env: dict[str, str]
+) -> Call:
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", _module(target)],
+            input=payload,
+            capture_output=True,
+            env=env,
+            timeout=60,
+        )
+        ok = result.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        ok = False
+    return Call(session, target, event_name, (time.perf_counter() - start) * 1000, ok)
+
+
+def _run_session(
+    session: str,
+    events: list[dict[str, Any]],
+    targets: list[list[str]],
+    env: dict[str, str],
+    pool: ThreadPoolExecutor,
+) -> list[Call]:
+    calls: list[Call] = []
+    for event, event_targets in zip(events, targets):
+        payload = (json.dumps(event) + "\n").encode("utf-8")
+        futures = [
+            pool.submit(_invoke, session, target, event["hook_event_name"], payload, env)
+            for target in event_targets
+        ]
+        calls.extend(future.result() for future in futures)
+    return calls
+
+
+def _bad_lines(text: str) -> int:
+    bad = 0
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            json.loads(line)
+        except ValueError:
+            bad += 1
+    return bad
+
+
+def _audit_file(path: Path, audit: Audit) -> None:
+    try:
+        text = read_log_text(path)
+    except OSError:
+        audit.corrupt_files.append(str(path))
+        return
+    if ".ndjson" in path.name:
+        audit.corrupt_lines += _bad_lines(text)
+        return
+    try:
+        json.loads(text)
+    except ValueError:
+        # Config snapshots are a header line followed by the document
+        if _bad_lines(text):
+            audit.corrupt_files.append(str(path))
+
+
+def audit_tree(
+    root: Path,
+    plans: dict[str, list[dict[str, Any]]],
+    targets: dict[str, list[list[str]]],
+    mode: str,
+    routing: dict[str, Any],
+) -> Audit:
+    """Check the sandbox's .data tree against what the sessions sent.
+
+    Must be called inside the sandbox the run used.
+    """
+    audit = Audit()
+    logger_config = get_logger_config()
+
+    for session, events in plans.items():
+        logged = []
+        for event, event_targets in zip(events, targets[session]):
+            # Dispatch runs the logger wherever it routes it
+            if mode == "dispatch":
+                event_targets = route(event, "hooks", ["logger"], routing)
+            if "logger" in event_targets:
+                logged.append(event)
+        session_dir = get_session_log_dir(session, logger_config)
+        audit.expected_records += len(logged)
+        audit.found_records += sum(1 for _ in iter_session_records(session_dir))
+        if logger_config.get("tool_summary", True):
+            audit.expected_tool_calls += sum(
+                1 for event in logged if event["hook_event_name"] == "PostToolUse"
+            )
+            tools = load_summary(session_dir).get("tools", {})
+            audit.found_tool_calls += sum(stats.get("count", 0) for stats in tools.values())
+
+    for dirpath, dirnames, filenames in os.walk(root / ".data"):
+        dirnames[:] = [d for d in dirnames if d != BLOB_DIR_NAME]
+        for filename in filenames:
+            if filename.endswith(".tmp"):
+                continue
+            if filename.endswith(".json") or ".ndjson" in filename:
+                _audit_file(Path(dirpath) / filename, audit)
+    return audit
+
+
+def summarize_calls(calls: list[Call]) -> dict[str, dict[str, Any]]:
+    """Per-target call counts, errors and latency percentiles."""
+    by_target: dict[str, list[Call]] = {}
+    for call in calls:
+        by_target.setdefault(call.target, []).append(call)
+    summary = {}
+    for target, target_calls in sorted(by_target.items()):
+        samples = [c.duration_ms for c in target_calls]
+        summary[target] = {
+            "calls": len(target_calls),
+            "errors": sum(1 for c in target_calls if not c.ok),
+            "p50_ms": round(percentile(samples, 50), 3),
+            "p95_ms": round(percentile(samples, 95), 3),
+            "p99_ms": round(percentile(samples, 99), 3),
+            "max_ms": round(max(samples), 3),
+        }
+    return summary
+
+
+def run_stress(
+    sessions: int = 8,
+    rounds: int = 5,
+    hooks: Iterable[str] = DEFAULT_HOOKS,
+    mode: str = "hooks",
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Run concurrent sessions against a sandbox and audit the result.
+
+    Args:
+        sessions: Concurrent simulated sessions
+        rounds: Prompt rounds per session
+        hooks: Hooks to run in ``hooks`` mode (dispatch runs what it routes)
+        mode: "hooks" or "dispatch"
+        seed: Seed for the sessions' tool mixes
+
+    Returns:
+        Report dictionary with load, latency and integrity sections
+
+    Raises:
+        ValueError: For an unknown mode or hook
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+    hooks = tuple(hooks)
+    for hook in hooks:
+        if hook not in HOOK_MODULES:
+            raise ValueError(f"Unknown hook: {hook}")
+
+    with sandbox() as root:
+        env = dict(os.environ)
+        # Keeps submodule_auto_updater away from a real checkout
+        env["CLAUDE_PATH"] = str(root / "submodule")
+        env.pop("CLAUDE_HOOK_DEADLINE", None)
+
+        routing = get_dispatch_config()
+        plans = {
+            session: session_events(session, rounds, seed + i)
+            for i, session in enumerate(
+                f"{i:08x}-5eed-4000-8000-{seed:012x}" for i in range(sessions)
+            )
+        }
+        targets = {
+            session: [route(event, mode, hooks, routing) for event in events]
+            for session, events in plans.items()
+        }
+        fanout = max((len(t) for ts in targets.values() for t in ts), default=1)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(sessions * fanout, 1)) as calls_pool:
+            with ThreadPoolExecutor(max_workers=max(sessions, 1)) as sessions_pool:
+                futures = [
+                    sessions_pool.submit(
+                        _run_session, session, plans[session], targets[session], env, calls_pool
+                    )
+                    for session in plans
+                ]
+                calls = [call for future in futures for call in future.result()]
+        wall_s = time.perf_counter() - start
+
+        audit = audit_tree(root, plans, targets, mode, routing)
+
+    events = sum(len(events) for events in plans.values())
+    return {
+        "load": {
+            "mode": mode,
+            "sessions": sessions,
+            "rounds": rounds,
+            "events": events,
+            "calls": len(calls),
+            "wall_s": round(wall_s, 3),
+            "events_per_s": round(events / wall_s, 2) if wall_s else 0.0,
+            "calls_per_s": round(len(calls) / wall_s, 2) if wall_s else 0.0,
+        },
+        "latency": summarize_calls(calls),
+        "integrity": {
+            "errors": sum(1 for c in calls if not c.ok),
+            "expected_records": audit.expected_records,
+            "found_records": audit.found_records,
+            "lost_records": audit.lost_records,
+            "expected_tool_calls": audit.expected_tool_calls,
+            "found_tool_calls": audit.found_tool_calls,
+            "lost_tool_calls": audit.lost_tool_calls,
+            "corrupt_files": audit.corrupt_files,
+            "corrupt_lines": audit.corrupt_lines,
+        },
+    }
+
+
+def is_clean(report: dict[str, Any]) -> bool:
+    """Whether a run had no failed calls, lost records or corrupt state."""
+    integrity = report["integrity"]
+    return not (
+        integrity["errors"]
+        or integrity["lost_records"]
+        or integrity["lost_tool_calls"]
+        or integrity["corrupt_files"]
+        or integrity["corrupt_lines"]
+    )
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a stress report as plain text."""
+    load = report["load"]
+    integrity = report["integrity"]
+    lines = [
+        f"{load['sessions']} sessions x {load['rounds']} rounds [{load['mode']}]: "
+        f"{load['events']} events, {load['calls']} calls in {load['wall_s']:.2f}s "
+        f"({load['events_per_s']:.1f} events/s, {load['calls_per_s']:.1f} calls/s)",
+        f"{'target':<28} {'calls':>6} {'err':>4} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}",
+    ]
+    for target, s in report["latency"].items():
+        lines.append(
+            f"  {target:<26} {s['calls']:>6} {s['errors']:>4} {s['p50_ms']:>8.1f} "
+            f"{s['p95_ms']:>8.1f} {s['p99_ms']:>8.1f} {s['max_ms']:>8.1f}"
+        )
+    lines.append(
+        f"records {integrity['found_records']}/{integrity['expected_records']} "
+        f"(lost {integrity['lost_records']}), tool calls "
+        f"{integrity['found_tool_calls']}/{integrity['expected_tool_calls']} "
+        f"(lost {integrity['lost_tool_calls']}), corrupt lines {integrity['corrupt_lines']}"
+    )
+    for path in integrity["corrupt_files"]:
+        lines.append(f"  corrupt: {path}")
+    return "\n".join(lines)
@@ -2,3 +2,14 @@
 
 __all__ = ["analyzer", "fetcher", "parser"]
 __version__ = "0.1.0"
+
+# The summary changes with the changelog cache (rewritten on every fetch)
+# and ROADMAP.md; the ttl keeps expiry of the cache itself checked (see
+# shared.hook_memo)
+MEMO_INPUTS = {
+    "events": ["SessionStart"],
+    "fields": ["hook_event_name"],
+    "files": ["docs/ROADMAP.md"],
+    "data_files": ["cache/changelog.md"],
+    "ttl_seconds": 3600,
+}
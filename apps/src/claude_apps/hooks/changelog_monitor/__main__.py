@@ -1,4 +1,9 @@
-"""Entry point for changelog monitor hook."""
+"""Entry point for changelog monitor hook.
+
+The changelog fetch runs under the hook's deadline; when it does not fit
+the hook works from the stale cache and ``--continue`` refreshes the
+cache in the background.
+"""
 
 from __future__ import annotations
 
@@ -6,28 +11,14 @@ import json
 import sys
 from typing import Any
 
-import structlog
-
-from claude_apps.shared.config_helper import get_hook_config
+from claude_apps.shared.config_helper import get_hook_config, get_lazy_logger
+from claude_apps.shared.deadline import current_deadline, release_continuation
 
 from .analyzer import AnalysisResult, analyze_versions, format_context_injection
-from .fetcher import fetch_changelog, get_last_known_version
+from .fetcher import CONTINUATION, fetch_changelog, get_last_known_version
 from .parser import get_versions_since, parse_changelog
 
-# Configure logging
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer(),
-    ],
-    wrapper_class=structlog.BoundLogger,
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
-    cache_logger_on_first_use=True,
-)
-
-log = structlog.get_logger()
+log = get_lazy_logger(json_output=True)
 
 
 def is_enabled() -> bool:
@@ -55,7 +46,7 @@ def process_event(event: dict[str, Any]) -> dict[str, Any]:
 
     try:
         # Fetch changelog
-        content = fetch_changelog()
+        content = fetch_changelog(deadline=current_deadline())
         if not content:
             log.warning("changelog_fetch_failed")
             return {"hookSpecificOutput": {"hookEventName": event_name}}
@@ -101,8 +92,19 @@ def process_event(event: dict[str, Any]) -> dict[str, Any]:
     return {"hookSpecificOutput": {"hookEventName": event_name}}
 
 
+def run_continuation() -> int:
+    """Refresh the changelog cache without a deadline (``--continue``)."""
+    try:
+        return 0 if fetch_changelog(force_refresh=True) else 1
+    finally:
+        release_continuation(CONTINUATION)
+
+
 def main() -> int:
     """Main entry point."""
+    if "--continue" in sys.argv[1:]:
+        return run_continuation()
+
     try:
         # Read event from stdin
         line = sys.stdin.readline()
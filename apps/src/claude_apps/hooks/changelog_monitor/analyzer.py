@@ -4,11 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-import structlog
+from claude_apps.shared.config_helper import get_lazy_logger
 
 from .parser import VersionEntry, extract_keywords
 
-log = structlog.get_logger()
+log = get_lazy_logger(json_output=True)
 
 
 @dataclass
@@ -2,26 +2,38 @@
 
 from __future__ import annotations
 
-import json
+import os
 import time
-import urllib.request
 from pathlib import Path
 
-import structlog
-
-from claude_apps.shared.config_helper import get_hook_config
-
-log = structlog.get_logger()
-
-# Cache configuration
-CACHE_DIR = Path("/workspace/.claude/.data/cache")
-CACHE_FILE = CACHE_DIR / "changelog.md"
-CACHE_META = CACHE_DIR / "changelog.meta.json"
+from claude_apps.shared.config_helper import (
+    get_claude_root,
+    get_data_path,
+    get_hook_config,
+    get_lazy_logger,
+)
+from claude_apps.shared.deadline import Deadline, DeadlineExceededError, continue_in_background
+from claude_apps.shared.state_store import get_state_store
+
+log = get_lazy_logger(json_output=True)
+
+# Cache configuration (the file is under the data directory's cache/)
+CACHE_NAME = "changelog.md"
+# Cache metadata lives in the shared state store and expires with the cache
+STATE_NAMESPACE = "changelog_monitor"
+CACHE_META_KEY = "cache_meta"
 DEFAULT_TTL = 86400  # 24 hours in seconds
+FETCH_TIMEOUT = 10  # seconds
+CONTINUATION = "changelog_monitor"
 
 CHANGELOG_URL = "https://raw.githubusercontent.com/anthropics/claude-code/main/CHANGELOG.md"
 
 
+def get_cache_file() -> Path:
+    """Path of the cached changelog."""
+    return get_data_path("cache") / CACHE_NAME
+
+
 def get_cache_ttl() -> int:
     """Get cache TTL from config or use default."""
     try:
@@ -34,26 +46,81 @@ def get_cache_ttl() -> int:
 
 
 def is_cache_valid() -> bool:
-    """Check if cached changelog is still valid."""
-    if not CACHE_META.exists() or not CACHE_FILE.exists():
+    """Check if cached changelog is still valid.
+
+    The metadata entry is written with the cache TTL and reads as absent
+    once it has expired.
+    """
+    if not get_cache_file().exists():
         return False
 
     try:
-        meta = json.loads(CACHE_META.read_text())
-        fetched_at = meta.get("fetched_at", 0)
-        ttl = get_cache_ttl()
-        return (time.time() - fetched_at) < ttl
+        return get_state_store().get(STATE_NAMESPACE, CACHE_META_KEY) is not None
     except Exception as e:
         log.warning("cache_check_failed", error=str(e))
         return False
 
 
-def fetch_changelog(force_refresh: bool = False) -> str | None:
-    """Fetch changelog from GitHub, using cache if valid."""
+def write_cache(content: str) -> None:
+    """Replace the cached changelog and record its metadata."""
+    cache_file = get_cache_file()
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # Readers in other sessions never see a partly written file
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    tmp.write_text(content)
+    os.replace(tmp, cache_file)
+    try:
+        get_state_store().set(
+            STATE_NAMESPACE,
+            CACHE_META_KEY,
+            {"fetched_at": time.time(), "url": CHANGELOG_URL, "size": len(content)},
+            ttl=get_cache_ttl(),
+        )
+    except Exception as e:
+        # The cache is still served, just refetched on the next check
+        log.warning("cache_meta_write_failed", error=str(e))
+
+
+def read_stale_cache() -> str | None:
+    """Return the cached changelog regardless of its age, if there is one."""
+    cache_file = get_cache_file()
+    if cache_file.exists():
+        log.info("using_stale_cache")
+        return cache_file.read_text()
+    return None
+
+
+def defer_fetch() -> str | None:
+    """Refresh the cache in a background continuation; serve the stale copy now."""
+    started = continue_in_background(
+        CONTINUATION, "claude_apps.hooks.changelog_monitor", ["--continue"]
+    )
+    log.info("changelog_fetch_deferred", continuation_started=started)
+    return read_stale_cache()
+
+
+def fetch_changelog(force_refresh: bool = False, deadline: Deadline | None = None) -> str | None:
+    """Fetch changelog from GitHub, using cache if valid.
+
+    With a deadline the fetch gets at most the time left. If that is not
+    enough the stale cache (or None) is returned and the fetch continues
+    in the background.
+    """
     # Check cache first
     if not force_refresh and is_cache_valid():
         log.debug("using_cached_changelog")
-        return CACHE_FILE.read_text()
+        return get_cache_file().read_text()
+
+    deadline = deadline or Deadline()
+    try:
+        timeout = deadline.timeout(FETCH_TIMEOUT)
+    except DeadlineExceededError:
+        return defer_fetch()
+    cut_by_deadline = deadline.binds(FETCH_TIMEOUT)
+
+    # urllib.request pulls in http.client and email; only pay for it on a fetch
+    import urllib.error
+    import urllib.request
 
     # Fetch from GitHub
     log.info("fetching_changelog", url=CHANGELOG_URL)
@@ -62,32 +129,24 @@ def fetch_changelog(force_refresh: bool = False) -> str | None:
             CHANGELOG_URL,
             headers={"User-Agent": "Claude-Code-Changelog-Monitor/0.1.0"},
         )
-        with urllib.request.urlopen(request, timeout=10) as response:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
             content = response.read().decode("utf-8")
 
         # Cache the result
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        CACHE_FILE.write_text(content)
-        CACHE_META.write_text(
-            json.dumps(
-                {
-                    "fetched_at": time.time(),
-                    "url": CHANGELOG_URL,
-                    "size": len(content),
-                }
-            )
-        )
+        write_cache(content)
 
         log.info("changelog_cached", size=len(content))
         return content
 
-    except urllib.error.URLError as e:
+    except (urllib.error.URLError, TimeoutError) as e:
         log.warning("fetch_failed", error=str(e))
+        timed_out = isinstance(e, TimeoutError) or isinstance(
+            getattr(e, "reason", None), TimeoutError
+        )
+        if timed_out and cut_by_deadline:
+            return defer_fetch()
         # Fall back to cache if available
-        if CACHE_FILE.exists():
-            log.info("using_stale_cache")
-            return CACHE_FILE.read_text()
-        return None
+        return read_stale_cache()
 
     except Exception as e:
         log.error("unexpected_fetch_error", error=str(e))
@@ -96,7 +155,7 @@ def fetch_changelog(force_refresh: bool = False) -> str | None:
 
 def get_last_known_version() -> str | None:
     """Get the last known version from roadmap."""
-    roadmap_path = Path("/workspace/.claude/docs/ROADMAP.md")
+    roadmap_path = get_claude_root() / "docs" / "ROADMAP.md"
     if not roadmap_path.exists():
         return None
 
@@ -6,9 +6,9 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-import structlog
+from claude_apps.shared.config_helper import get_lazy_logger
 
-log = structlog.get_logger()
+log = get_lazy_logger(json_output=True)
 
 
 @dataclass
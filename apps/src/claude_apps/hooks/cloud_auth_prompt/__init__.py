@@ -2,3 +2,6 @@
 
 __all__ = ["config_reader", "formatter"]
 __version__ = "0.1.0"
+
+# Output depends only on the event name and config.yml (see shared.hook_memo)
+MEMO_INPUTS = {"fields": ["hook_event_name"]}
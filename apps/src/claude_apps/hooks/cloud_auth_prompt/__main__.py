@@ -4,67 +4,18 @@ Reads SessionStart hook events from stdin and outputs context
 instructing Claude to invoke cloud-auth-agent for provider selection.
 """
 
-import json
 import sys
-from typing import Any, Generator
 
-import structlog
+from claude_apps.shared.config_helper import get_lazy_logger
+from claude_apps.shared.hook_protocol import read_hook_event  # noqa: F401 - re-exported
+from claude_apps.shared.hook_protocol import process_stdin, write_response
 
 from .config_reader import get_enabled_providers
 from .formatter import format_hook_output
 
 
-# Configure structlog to write to stderr (not stdout)
 # Hooks must only write JSON to stdout - all logging goes to stderr
-structlog.configure(
-    processors=[
-        structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
-    cache_logger_on_first_use=True,
-)
-
-logger = structlog.get_logger()
-
-
-def read_hook_event() -> dict[str, Any] | None:
-    """Read a single hook event from stdin.
-
-    Returns:
-        Parsed JSON event or None if EOF/error
-    """
-    try:
-        line = sys.stdin.readline()
-        if not line:
-            return None
-
-        line = line.strip()
-        if not line:
-            return None
-
-        return json.loads(line)
-
-    except json.JSONDecodeError:
-        return None
-    except Exception:
-        return None
-
-
-def process_stdin() -> Generator[dict[str, Any], None, None]:
-    """Process hook events from stdin.
-
-    Yields:
-        Hook event dictionaries
-    """
-    while True:
-        hook_data = read_hook_event()
-        if hook_data is None:
-            break
-        yield hook_data
+logger = get_lazy_logger()
 
 
 def main() -> int:
@@ -101,12 +52,12 @@ def main() -> int:
 
     except Exception as e:
         logger.exception("fatal_error", error=str(e))
-        print(json.dumps({
+        write_response({
             "hookSpecificOutput": {
                 "hookEventName": "SessionStart",
                 "additionalContext": ""
             }
-        }))
+        })
         return 0
 
 
@@ -0,0 +1,9 @@
+"""Hooks daemon - long-lived server that runs hook entry points in-process.
+
+A thin client forwards each hook invocation over a Unix domain socket so
+config, compiled rules and loggers stay warm between events. When the
+daemon is down the client runs the hook in-process instead.
+"""
+
+__all__ = ["client", "paths", "registry", "runner", "server"]
+__version__ = "0.1.0"
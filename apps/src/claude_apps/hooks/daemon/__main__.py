@@ -0,0 +1,85 @@
+"""Entry point for the hooks daemon.
+
+Usage:
+    python -m claude_apps.hooks.daemon serve    # run in the foreground
+    python -m claude_apps.hooks.daemon status   # report whether it is running
+    python -m claude_apps.hooks.daemon stop     # terminate a running daemon
+"""
+
+import argparse
+import os
+import signal
+import sys
+
+from .client import request_hook
+from .paths import get_config, get_pid_path, get_socket_path
+from .server import read_pid, serve
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Long-lived server for Claude Code hook entry points",
+        prog="hooks-daemon",
+    )
+    parser.add_argument(
+        "command",
+        choices=["serve", "status", "stop"],
+        help="Action to perform",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Seconds without requests before exiting (default: from config, 0 = never)",
+    )
+    return parser.parse_args(argv)
+
+
+def is_running() -> bool:
+    """Check whether a daemon is answering on the socket."""
+    return request_hook(get_socket_path(), "", "", timeout=2.0) is not None
+
+
+def stop() -> int:
+    """Send SIGTERM to the running daemon."""
+    pid = read_pid(get_pid_path())
+    if pid is None:
+        print("hooks daemon is not running")
+        return 0
+
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        print("hooks daemon is not running")
+        return 0
+
+    print(f"stopped hooks daemon (pid {pid})")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    args = parse_args(argv)
+
+    if args.command == "serve":
+        idle_timeout = args.idle_timeout
+        if idle_timeout is None:
+            idle_timeout = get_config().get("idle_timeout_minutes", 30) * 60
+        return serve(get_socket_path(), get_pid_path(), idle_timeout)
+
+    if args.command == "stop":
+        return stop()
+
+    if is_running():
+        print(
+            f"hooks daemon is running (pid {read_pid(get_pid_path())}, socket {get_socket_path()})"
+        )
+        return 0
+
+    print("hooks daemon is not running")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
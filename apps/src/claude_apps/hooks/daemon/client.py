@@ -0,0 +1,170 @@
+"""Thin client that forwards a hook invocation to the hooks daemon.
+
+Usage in settings.json:
+    uv run --directory ${CLAUDE_PATH} python -m claude_apps.hooks.daemon.client <hook>
+
+stdin, the working directory and the environment are forwarded as-is and
+the hook's stdout/stderr/exit code are replayed locally. If the daemon is
+not reachable, or does not accept the request within ACCEPT_TIMEOUT, the
+hook runs in-process and, when autostart is enabled, a daemon is spawned
+for later events.
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from .paths import get_config, get_log_file, get_socket_path
+
+DEFAULT_TIMEOUT = 60.0
+# A daemon that has not started the hook by then is treated as unreachable
+ACCEPT_TIMEOUT = 5.0
+
+
+def _cwd() -> str | None:
+    try:
+        return os.getcwd()
+    except OSError:
+        return None
+
+
+def request_hook(
+    socket_path: Path,
+    hook_name: str,
+    stdin: str,
+    argv: list[str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    accept_timeout: float = ACCEPT_TIMEOUT,
+) -> dict[str, Any] | None:
+    """Send a hook request to the daemon.
+
+    The request carries this process's working directory and environment,
+    which the daemon applies for the duration of the hook.
+
+    Args:
+        socket_path: Daemon socket path
+        hook_name: Registered hook name
+        stdin: Raw hook event payload
+        argv: Extra arguments for the hook
+        timeout: Seconds to wait for the response once the hook started
+        accept_timeout: Seconds to wait for the daemon to start the hook
+
+    Returns:
+        Response dict, or None if the daemon could not be reached or did not
+        accept the request in time. Failures after the daemon accepted the
+        request return an error response instead of None so the hook is
+        never run twice for one event.
+    """
+    payload = json.dumps(
+        {
+            "hook": hook_name,
+            "argv": argv or [],
+            "stdin": stdin,
+            "cwd": _cwd(),
+            "env": dict(os.environ),
+        }
+    )
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(accept_timeout)
+    try:
+        try:
+            sock.connect(str(socket_path))
+            sock.sendall(payload.encode("utf-8") + b"\n")
+            reader = sock.makefile("rb")
+            first = json.loads(reader.readline())
+        except (OSError, ValueError):
+            return None
+
+        if not first.get("accepted"):
+            # Rejected before running (malformed request)
+            return first
+
+        try:
+            sock.settimeout(timeout)
+            return json.loads(reader.readline())
+        except (OSError, ValueError) as e:
+            return {
+                "hook": hook_name,
+                "stdout": "",
+                "stderr": f"[hooks client] daemon request failed: {e}\n",
+                "exit_code": 0,
+            }
+    finally:
+        sock.close()
+
+
+def spawn_daemon() -> None:
+    """Start a detached daemon process for subsequent hook events."""
+    log_file = get_log_file()
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(log_file, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "claude_apps.hooks.daemon", "serve"],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+            close_fds=True,
+        )
+
+
+def run_fallback(hook_name: str, stdin: str, argv: list[str]) -> dict[str, Any]:
+    """Run the hook in-process and optionally start the daemon.
+
+    Args:
+        hook_name: Registered hook name
+        stdin: Raw hook event payload
+        argv: Extra arguments for the hook
+
+    Returns:
+        Response dict (HookResult fields)
+    """
+    try:
+        if get_config().get("autostart", True):
+            spawn_daemon()
+    except Exception as e:
+        sys.stderr.write(f"[hooks client] Failed to start daemon: {e}\n")
+
+    from .runner import run_hook
+
+    return asdict(run_hook(hook_name, stdin, argv))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Forward one hook invocation and replay its output."""
+    args = sys.argv[1:] if argv is None else argv
+    if not args:
+        sys.stderr.write("usage: python -m claude_apps.hooks.daemon.client <hook> [args...]\n")
+        return 2
+
+    hook_name, hook_args = args[0], args[1:]
+
+    try:
+        stdin = sys.stdin.read()
+        response = request_hook(get_socket_path(), hook_name, stdin, hook_args)
+        if response is None:
+            response = run_fallback(hook_name, stdin, hook_args)
+
+    except KeyboardInterrupt:
+        return 0
+
+    except Exception as e:
+        sys.stderr.write(f"[hooks client] Unexpected error: {e}\n")
+        return 0
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stderr.flush()
+    return response.get("exit_code", 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
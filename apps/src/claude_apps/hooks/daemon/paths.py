@@ -0,0 +1,40 @@
+"""Path and configuration utilities for the hooks daemon."""
+
+from pathlib import Path
+from typing import Any
+
+from claude_apps.shared.config_helper import get_hook_config, resolve_log_path
+from claude_apps.shared.config_helper.paths import get_data_path
+
+DEFAULT_CONFIG = {
+    "log_base_path": ".data/logs/daemon",
+    "autostart": True,
+    "idle_timeout_minutes": 30,
+}
+
+
+def get_config() -> dict[str, Any]:
+    """Load daemon configuration from global config.yml."""
+    config = DEFAULT_CONFIG.copy()
+    config.update(get_hook_config("daemon"))
+    return config
+
+
+def get_run_dir() -> Path:
+    """Get the runtime directory holding the socket and pid file."""
+    return get_data_path("run")
+
+
+def get_socket_path() -> Path:
+    """Get the Unix domain socket path the daemon listens on."""
+    return get_run_dir() / "hooks.sock"
+
+
+def get_pid_path() -> Path:
+    """Get the pid/lock file path for the running daemon."""
+    return get_run_dir() / "hooks.pid"
+
+
+def get_log_file() -> Path:
+    """Get the file receiving daemon stdout/stderr when spawned."""
+    return resolve_log_path("daemon") / "daemon.log"
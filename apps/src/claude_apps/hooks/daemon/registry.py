@@ -0,0 +1,31 @@
+"""Registry of hook entry points served by the daemon."""
+
+HOOK_MODULES: dict[str, str] = {
+    "changelog_monitor": "claude_apps.hooks.changelog_monitor.__main__",
+    "cloud_auth_prompt": "claude_apps.hooks.cloud_auth_prompt.__main__",
+    "dispatch": "claude_apps.hooks.dispatch.__main__",
+    "logger": "claude_apps.hooks.logger.__main__",
+    "plan_distributor": "claude_apps.hooks.plan_distributor.__main__",
+    "playwright_healer": "claude_apps.hooks.playwright_healer.__main__",
+    "rules_loader": "claude_apps.hooks.rules_loader.__main__",
+    "session_context_injector": "claude_apps.hooks.session_context_injector.__main__",
+    "submodule_auto_updater": "claude_apps.hooks.submodule_auto_updater.__main__",
+}
+
+
+def get_hook_module(hook_name: str) -> str:
+    """Get the entry point module path for a hook.
+
+    Args:
+        hook_name: Name of the hook (e.g., 'logger', 'rules_loader')
+
+    Returns:
+        Dotted module path exposing a ``main() -> int`` function
+
+    Raises:
+        ValueError: If the hook is not registered
+    """
+    try:
+        return HOOK_MODULES[hook_name]
+    except KeyError:
+        raise ValueError(f"Unknown hook: {hook_name}") from None
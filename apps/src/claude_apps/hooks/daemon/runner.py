@@ -0,0 +1,172 @@
+"""In-process execution of hook entry points with captured stdio."""
+
+import importlib
+import io
+import os
+import sys
+import time
+import traceback
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Mapping
+
+from claude_apps.shared.deadline import deadline_scope, hook_deadline
+from claude_apps.shared.hook_memo import (
+    DEFAULT_MAX_ENTRIES,
+    get_memo_config,
+    get_memo_dir,
+    memo_lookup,
+    store_memo,
+)
+
+from .registry import get_hook_module
+
+
+@dataclass
+class HookResult:
+    """Captured result of a single hook invocation.
+
+    Attributes:
+        hook: Name of the hook that ran
+        stdout: Captured standard output (the hook protocol response)
+        stderr: Captured standard error
+        exit_code: Exit code returned by the hook's main()
+        duration_ms: Wall time spent inside main()
+        memo_hit: Whether stdout was replayed from the hook memo
+    """
+
+    hook: str
+    stdout: str = ""
+    stderr: str = ""
+    exit_code: int = 0
+    duration_ms: float = 0.0
+    memo_hit: bool = False
+
+
+def _exit_code(code: object) -> int:
+    """Normalize a SystemExit code to an integer exit status."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
+
+
+@contextmanager
+def request_scope(cwd: str | None = None, env: Mapping[str, str] | None = None) -> Iterator[None]:
+    """Run with a client's working directory and environment.
+
+    Both are process-wide, so the previous values are restored afterwards.
+    None leaves the current one in place.
+    """
+    saved_env = dict(os.environ) if env is not None else None
+    try:
+        saved_cwd = os.getcwd() if cwd else None
+    except OSError:
+        saved_cwd = None
+    try:
+        if env is not None:
+            os.environ.clear()
+            os.environ.update(env)
+        if cwd:
+            os.chdir(cwd)
+        yield
+    finally:
+        if saved_env is not None:
+            os.environ.clear()
+            os.environ.update(saved_env)
+        if saved_cwd:
+            os.chdir(saved_cwd)
+
+
+def run_hook(
+    hook_name: str,
+    stdin: str,
+    argv: list[str] | None = None,
+    cwd: str | None = None,
+    env: Mapping[str, str] | None = None,
+) -> HookResult:
+    """Run a hook's main() in the current interpreter.
+
+    The module is imported before stdio is swapped so import-time side
+    effects (logger configuration, for example) bind to the real streams.
+    sys.stdin, sys.stdout, sys.stderr and sys.argv are restored afterwards.
+
+    main() runs under the hook's deadline (see shared.deadline).
+
+    Hooks that declare MEMO_INPUTS are first looked up in the hook memo;
+    a hit returns the stored stdout without importing the entry point.
+
+    cwd and env are those of the client the event came from; the memo
+    lookup and main() both run with them (see request_scope).
+
+    Args:
+        hook_name: Registered hook name
+        stdin: Raw hook event payload to present on stdin
+        argv: Extra command line arguments for the hook
+        cwd: Working directory to run in (default: the current one)
+        env: Complete environment to run with (default: the current one)
+
+    Returns:
+        HookResult with captured output and timing
+
+    Raises:
+        ValueError: If the hook is not registered
+    """
+    module_path = get_hook_module(hook_name)
+    with request_scope(cwd, env):
+        return _run(hook_name, module_path, stdin, argv)
+
+
+def _run(hook_name: str, module_path: str, stdin: str, argv: list[str] | None) -> HookResult:
+    memo_key = None
+    if not argv:
+        start = time.perf_counter()
+        stored, memo_key = memo_lookup(hook_name, module_path.rpartition(".")[0], stdin)
+        if stored is not None:
+            return HookResult(
+                hook=hook_name,
+                stdout=stored,
+                duration_ms=round((time.perf_counter() - start) * 1000, 3),
+                memo_hit=True,
+            )
+
+    module = importlib.import_module(module_path)
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    saved = (sys.stdin, sys.stdout, sys.stderr, sys.argv)
+
+    sys.stdin = io.StringIO(stdin)
+    sys.stdout = stdout
+    sys.stderr = stderr
+    sys.argv = [module_path, *(argv or [])]
+
+    start = time.perf_counter()
+    try:
+        with deadline_scope(hook_deadline(hook_name)):
+            exit_code = _exit_code(module.main())
+    except SystemExit as e:
+        exit_code = _exit_code(e.code)
+    except Exception:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        sys.stdin, sys.stdout, sys.stderr, sys.argv = saved
+
+    if memo_key is not None and exit_code == 0:
+        store_memo(
+            get_memo_dir(hook_name),
+            memo_key,
+            stdout.getvalue(),
+            int(get_memo_config().get("max_entries", DEFAULT_MAX_ENTRIES)),
+        )
+
+    return HookResult(
+        hook=hook_name,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        exit_code=exit_code,
+        duration_ms=round(duration_ms, 3),
+    )
@@ -0,0 +1,192 @@
+"""Unix domain socket server that runs hooks in a warm interpreter.
+
+Protocol: the client sends one JSON line ``{"hook", "argv", "stdin", "cwd",
+"env"}`` and the server answers with one JSON line carrying the captured
+HookResult. Hooks run in the client's working directory and environment,
+not the daemon's.
+
+Each connection is served by a forked child, which first answers
+``{"accepted": true}`` so the client knows the hook is running (and must
+not be run again). A child per request isolates the process-wide state a
+hook run swaps (stdio, argv, cwd, environment) and keeps one slow hook
+from holding up other sessions. The parent imports every registered
+entry point at startup, so children start warm.
+"""
+
+import fcntl
+import importlib
+import json
+import os
+import signal
+import socketserver
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from .registry import HOOK_MODULES
+from .runner import run_hook
+
+ACCEPTED = {"accepted": True}
+
+
+def handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Run the hook described by a decoded request.
+
+    Args:
+        request: Decoded request with 'hook', optional 'argv', 'stdin',
+            'cwd' and 'env'
+
+    Returns:
+        Response dict (HookResult fields)
+    """
+    hook_name = request.get("hook", "")
+    try:
+        result = run_hook(
+            hook_name,
+            request.get("stdin", ""),
+            request.get("argv") or [],
+            cwd=request.get("cwd"),
+            env=request.get("env"),
+        )
+        return asdict(result)
+    except Exception as e:
+        return {
+            "hook": hook_name,
+            "stdout": "",
+            "stderr": f"[hooks daemon] {e}\n",
+            "exit_code": 2,
+            "duration_ms": 0.0,
+        }
+
+
+class HookRequestHandler(socketserver.StreamRequestHandler):
+    """Read one request line, acknowledge it, run the hook, write the response."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {"hook": "", "stdout": "", "stderr": f"[hooks daemon] {e}\n", "exit_code": 2}
+        else:
+            self._send(ACCEPTED)
+            response = handle_request(request)
+
+        self._send(response)
+
+    def _send(self, message: dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class HookServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server forking a child per request, with idle shutdown."""
+
+    def __init__(self, socket_path: Path, idle_timeout: float):
+        self.idle_timeout = idle_timeout
+        self.last_activity = time.monotonic()
+        super().__init__(str(socket_path), HookRequestHandler)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self.last_activity = time.monotonic()
+        super().process_request(request, client_address)
+
+    def is_idle(self) -> bool:
+        """Check whether the server has been idle longer than its timeout.
+
+        Reaps finished children; a server with requests in flight is busy.
+        """
+        self.collect_children()
+        if self.active_children:
+            self.last_activity = time.monotonic()
+        if self.idle_timeout <= 0:
+            return False
+        return time.monotonic() - self.last_activity >= self.idle_timeout
+
+
+def preload_hooks() -> None:
+    """Import every registered entry point so forked children start warm."""
+    for module_path in HOOK_MODULES.values():
+        try:
+            importlib.import_module(module_path)
+        except Exception as e:
+            print(f"[hooks daemon] preload of {module_path} failed: {e}", file=sys.stderr)
+
+
+def acquire_lock(pid_path: Path) -> int | None:
+    """Take an exclusive lock on the pid file.
+
+    Args:
+        pid_path: Path to the pid/lock file
+
+    Returns:
+        Open file descriptor holding the lock, or None if another daemon holds it
+    """
+    pid_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(pid_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+
+    os.ftruncate(fd, 0)
+    os.write(fd, f"{os.getpid()}\n".encode())
+    return fd
+
+
+def read_pid(pid_path: Path) -> int | None:
+    """Read the daemon pid from the pid file, if any."""
+    try:
+        return int(pid_path.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def serve(socket_path: Path, pid_path: Path, idle_timeout: float) -> int:
+    """Serve hook requests until idle timeout or SIGTERM.
+
+    Args:
+        socket_path: Unix domain socket to listen on
+        pid_path: Pid/lock file guarding against concurrent daemons
+        idle_timeout: Seconds without requests before exiting (0 = never)
+
+    Returns:
+        Exit code (0 on clean shutdown, 1 if another daemon is running)
+    """
+    lock_fd = acquire_lock(pid_path)
+    if lock_fd is None:
+        print(f"[hooks daemon] already running ({pid_path})", file=sys.stderr)
+        return 1
+
+    def _terminate(signum: int, frame: Any) -> None:
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, _terminate)
+    preload_hooks()
+
+    socket_path.unlink(missing_ok=True)
+    server = HookServer(socket_path, idle_timeout)
+    # Wake up periodically to reap children and check for idleness
+    server.timeout = min(idle_timeout, 5.0) if idle_timeout > 0 else 5.0
+    print(f"[hooks daemon] listening on {socket_path} (pid {os.getpid()})", file=sys.stderr)
+
+    try:
+        while not server.is_idle():
+            server.handle_request()
+        print("[hooks daemon] idle timeout reached, exiting", file=sys.stderr)
+        return 0
+
+    except KeyboardInterrupt:
+        return 0
+
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+        pid_path.unlink(missing_ok=True)
+        os.close(lock_fd)
@@ -0,0 +1,4 @@
+"""Dispatch hook - runs every configured hook for one event in one process."""
+
+__all__ = ["config", "merger"]
+__version__ = "0.1.0"
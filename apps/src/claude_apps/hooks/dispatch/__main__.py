@@ -0,0 +1,140 @@
+"""Entry point for the dispatch hook.
+
+Reads one hook event from stdin, runs every hook configured for that event
+in this interpreter and prints a single merged response.
+
+Usage in settings.json (one command per event):
+    uv run --directory ${CLAUDE_PATH} python -m claude_apps.hooks.daemon.client dispatch
+"""
+
+import sys
+from typing import Any
+
+from claude_apps.hooks.daemon.runner import HookResult, run_hook
+from claude_apps.hooks.rules_loader.paths import get_session_dir
+from claude_apps.hooks.rules_loader.reinforcement import retract_trimmed
+from claude_apps.shared.config_helper import resolve_log_path
+from claude_apps.shared.context_budget import get_budget_config, record_usage
+from claude_apps.shared.hook_protocol import (
+    CONTINUE,
+    HookEvent,
+    iter_events,
+    read_stdin,
+    write_response,
+)
+
+from .config import get_config, get_hooks_for_event
+from .merger import budget_contexts, merge_responses, parse_responses
+
+
+def parse_event(raw_input: str) -> HookEvent | None:
+    """Parse the first hook event from raw stdin.
+
+    Accepts a single JSON document, newline-delimited events or an array.
+    Only routing fields are decoded; tool payloads stay as raw text.
+
+    Args:
+        raw_input: Raw stdin text
+
+    Returns:
+        First event, or None if nothing parseable was found
+    """
+    return next(iter_events(raw_input), None)
+
+
+def run_hooks(hook_names: list[str], raw_input: str) -> list[HookResult]:
+    """Run hooks in order, isolating failures.
+
+    Args:
+        hook_names: Hook names to run
+        raw_input: Raw event payload passed to each hook on stdin
+
+    Returns:
+        One HookResult per hook
+    """
+    results = []
+    for hook_name in hook_names:
+        try:
+            results.append(run_hook(hook_name, raw_input))
+        except Exception as e:
+            results.append(HookResult(hook=hook_name, stderr=f"{e}\n", exit_code=1))
+    return results
+
+
+def apply_context_budget(
+    event_name: str,
+    session_id: str,
+    hook_responses: list[tuple[str, list[dict[str, Any]]]],
+) -> None:
+    """Trim hook contexts to the event budget and record per-session usage.
+
+    Rules the budget cut are retracted from the rules_loader's session
+    state, so they are injected again on the next prompt. Budgeting is
+    best effort: without a readable config the responses are passed
+    through unchanged.
+    """
+    try:
+        budget = get_budget_config()
+        if not budget.get("enabled", True):
+            return
+        allocations = budget_contexts(event_name, hook_responses, budget)
+        if session_id:
+            for allocation in allocations:
+                if allocation.hook == "rules_loader" and allocation.trimmed:
+                    retract_trimmed(get_session_dir(session_id), allocation.text)
+        if allocations and session_id and budget.get("telemetry", True):
+            record_usage(resolve_log_path("context_budget") / session_id, event_name, allocations)
+    except OSError as e:
+        sys.stderr.write(f"[dispatch hook] Context budget skipped: {e}\n")
+
+
+def format_timings(event_name: str, results: list[HookResult]) -> str:
+    """Format per-hook timings as a single stderr line."""
+    parts = " ".join(f"{r.hook}={r.duration_ms:.1f}ms" for r in results)
+    total = sum(r.duration_ms for r in results)
+    return f"[dispatch] {event_name} total={total:.1f}ms {parts}"
+
+
+def main() -> int:
+    """Process hook event and run configured hooks."""
+    try:
+        raw_input = read_stdin()
+        event = parse_event(raw_input)
+        if event is None:
+            write_response(CONTINUE)
+            return 0
+
+        event_name = event.get("hook_event_name", "")
+        config = get_config()
+        hook_names = get_hooks_for_event(config, event_name, event.get("tool_name", ""))
+
+        results = run_hooks(hook_names, raw_input)
+
+        hook_responses = []
+        for result in results:
+            hook_responses.append((result.hook, parse_responses(result.stdout)))
+            if result.stderr:
+                sys.stderr.write(result.stderr)
+
+        apply_context_budget(event_name, event.get("session_id", ""), hook_responses)
+
+        responses = [response for _, parsed in hook_responses for response in parsed]
+
+        if config.get("log_timings", False):
+            sys.stderr.write(format_timings(event_name, results) + "\n")
+
+        write_response(merge_responses(event_name, responses))
+
+        return 2 if any(r.exit_code == 2 for r in results) else 0
+
+    except KeyboardInterrupt:
+        return 0
+
+    except Exception as e:
+        sys.stderr.write(f"[dispatch hook] Unexpected error: {e}\n")
+        write_response(CONTINUE)
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
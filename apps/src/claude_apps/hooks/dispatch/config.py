@@ -0,0 +1,69 @@
+"""Configuration for the dispatch hook."""
+
+from fnmatch import fnmatchcase
+from typing import Any
+
+from claude_apps.shared.config_helper import get_hook_config
+
+DEFAULT_EVENTS: dict[str, list[Any]] = {
+    "SessionStart": ["logger", "rules_loader", "cloud_auth_prompt", "session_context_injector"],
+    "UserPromptSubmit": ["logger", "rules_loader", "submodule_auto_updater"],
+    "PreToolUse": ["logger"],
+    "PostToolUse": [
+        {"hook": "plan_distributor", "matcher": "ExitPlanMode"},
+        {"hook": "playwright_healer", "matcher": "mcp__playwright__*"},
+        "logger",
+    ],
+    "Stop": ["logger"],
+    "SubagentStop": ["logger"],
+    "Notification": ["logger"],
+    "PreCompact": ["logger"],
+    "SessionEnd": ["logger"],
+    "PermissionRequest": ["logger"],
+}
+
+DEFAULT_CONFIG = {
+    "log_timings": False,
+    "events": DEFAULT_EVENTS,
+}
+
+
+def get_config() -> dict[str, Any]:
+    """Load hook configuration from global config.yml."""
+    config = DEFAULT_CONFIG.copy()
+    config.update(get_hook_config("dispatch"))
+    return config
+
+
+def get_hooks_for_event(
+    config: dict[str, Any],
+    event_name: str,
+    tool_name: str = "",
+) -> list[str]:
+    """Resolve the ordered hook list for an event.
+
+    Entries are either a hook name or a mapping with 'hook' and an optional
+    'matcher' glob that is tested against the event's tool_name, mirroring
+    settings.json matchers.
+
+    Args:
+        config: Dispatch configuration
+        event_name: The hook event name
+        tool_name: Tool name for tool events, empty otherwise
+
+    Returns:
+        Hook names to run, in configured order
+    """
+    entries = config.get("events", {}).get(event_name) or []
+
+    hooks = []
+    for entry in entries:
+        if isinstance(entry, str):
+            hooks.append(entry)
+            continue
+
+        matcher = entry.get("matcher", "*")
+        if matcher == "*" or fnmatchcase(tool_name, matcher):
+            hooks.append(entry["hook"])
+
+    return hooks
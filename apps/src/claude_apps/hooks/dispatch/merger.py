@@ -0,0 +1,132 @@
+"""Merge hook protocol responses from several hooks into one."""
+
+import json
+from typing import Any
+
+from claude_apps.shared.context_budget import (
+    Allocation,
+    Contribution,
+    allocate,
+    event_limit,
+    hook_priority,
+)
+
+
+def parse_responses(stdout: str) -> list[dict[str, Any]]:
+    """Parse JSON response objects from a hook's captured stdout.
+
+    Hooks print one JSON object per line; non-JSON lines are ignored.
+
+    Args:
+        stdout: Captured standard output
+
+    Returns:
+        List of response dicts
+    """
+    responses = []
+    for line in stdout.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            parsed = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            responses.append(parsed)
+    return responses
+
+
+def merge_responses(event_name: str, responses: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge several hook responses into a single response.
+
+    - continue: false if any hook asked to stop (first stopReason kept)
+    - suppressOutput: true if any hook asked for it
+    - systemMessage: joined with newlines
+    - additionalContext: non-empty contexts joined with blank lines
+    - other top-level and hookSpecificOutput fields: first value wins
+
+    Args:
+        event_name: The hook event name
+        responses: Responses in hook order
+
+    Returns:
+        Merged response dict
+    """
+    merged: dict[str, Any] = {"continue": True, "suppressOutput": False}
+    specific: dict[str, Any] = {}
+    contexts: list[str] = []
+    messages: list[str] = []
+
+    for response in responses:
+        for key, value in response.items():
+            if key == "continue":
+                if value is False:
+                    merged["continue"] = False
+            elif key == "suppressOutput":
+                merged["suppressOutput"] = merged["suppressOutput"] or bool(value)
+            elif key == "systemMessage":
+                if value:
+                    messages.append(str(value))
+            elif key == "hookSpecificOutput":
+                for sub_key, sub_value in (value or {}).items():
+                    if sub_key == "additionalContext":
+                        if sub_value:
+                            contexts.append(sub_value)
+                    elif sub_key != "hookEventName":
+                        specific.setdefault(sub_key, sub_value)
+            else:
+                merged.setdefault(key, value)
+
+    if messages:
+        merged["systemMessage"] = "\n".join(messages)
+
+    if contexts or specific:
+        merged["hookSpecificOutput"] = {
+            "hookEventName": event_name,
+            **specific,
+            "additionalContext": "\n\n".join(contexts),
+        }
+
+    return merged
+
+
+def budget_contexts(
+    event_name: str,
+    hook_responses: list[tuple[str, list[dict[str, Any]]]],
+    config: dict[str, Any],
+) -> list[Allocation]:
+    """Trim each hook's additionalContext to the event's shared budget.
+
+    A hook's contexts are joined into one contribution with the hook's
+    priority. The responses are rewritten in place: the hook's first
+    context carries what was kept and any others are emptied.
+
+    Args:
+        event_name: The hook event name
+        hook_responses: (hook name, parsed responses) in hook order
+        config: Context budget configuration
+
+    Returns:
+        One allocation per hook that offered context, in hook order
+    """
+    contributions = []
+    holders = []
+    for hook, responses in hook_responses:
+        specifics = [
+            r["hookSpecificOutput"]
+            for r in responses
+            if isinstance(r.get("hookSpecificOutput"), dict)
+            and r["hookSpecificOutput"].get("additionalContext")
+        ]
+        if not specifics:
+            continue
+        text = "\n\n".join(str(s["additionalContext"]) for s in specifics)
+        contributions.append(Contribution(hook, text, hook_priority(config, hook)))
+        holders.append(specifics)
+
+    allocations = allocate(contributions, event_limit(config, event_name))
+    for allocation, specifics in zip(allocations, holders):
+        for i, specific in enumerate(specifics):
+            specific["additionalContext"] = allocation.text if i == 0 else ""
+    return allocations
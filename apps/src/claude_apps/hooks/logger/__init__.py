@@ -1,4 +1,16 @@
 """Logger hook - logs Claude Code events to structured JSON files."""
 
-__all__ = ["cli", "paths", "reader", "writer"]
+__all__ = [
+    "cli",
+    "compact",
+    "export",
+    "index",
+    "log_policy",
+    "paths",
+    "query",
+    "reader",
+    "spool",
+    "tool_stats",
+    "writer",
+]
 __version__ = "0.1.0"
\ No newline at end of file
@@ -1,38 +1,100 @@
 import sys
-import json
 import traceback
 from typing import Dict, Any
 
+from claude_apps.shared.config_helper import resolve_log_path
+from claude_apps.shared.event_log import BLOB_DIR_NAME
+from claude_apps.shared.hook_protocol import CONTINUE, write_response
+
 from .cli import parse_args, show_help
+from .compact import compact_logs, format_report
+from .export import export_logs
+from .log_policy import apply_log_policy, resolve_policy
 from .reader import process_stdin
-from .writer import write_log_entry
-from .paths import get_log_path
+from .spool import flush_spool, get_spool_dir, spool_line, watch_spool
+from .tool_stats import record_tool_marks, run_tools_report, tool_mark
+from .writer import format_log_line, write_log_entry
+from .paths import get_config, get_log_base, get_segment_policy, get_session_log_dir
+
 
+def log_hook_event(hook_data: Dict[str, Any]) -> bool:
+    """Log one event directly or into the spool.
 
-def log_hook_event(hook_data: Dict[str, Any]) -> None:
+    Returns:
+        True when the logger is in spool mode and this event should
+        trigger a flush once the response has been written
+    """
     session_id = hook_data.get("session_id")
     hook_event_name = hook_data.get("hook_event_name")
 
     if not session_id or not hook_event_name:
-        return
+        return False
 
     try:
-        log_path = get_log_path(hook_event_name, session_id)
-        write_log_entry(log_path, hook_data)
+        config = get_config()
+        log_dir = get_session_log_dir(session_id, config)
+        mark = tool_mark(hook_data) if config.get("tool_summary", True) else None
+
+        policy = resolve_policy(
+            config.get("log_policies"), hook_event_name, hook_data.get("tool_name")
+        )
+        entry = apply_log_policy(hook_data, policy, log_dir.parent / BLOB_DIR_NAME)
+
+        if config.get("write_mode") == "spool":
+            # One write off the log volume; the flusher pairs tool events
+            if entry is not None or mark is not None:
+                line = format_log_line(entry) if entry is not None else ""
+                spool_line(get_spool_dir(config), session_id, line, mark)
+            return hook_event_name in config.get("spool_flush_events", ())
+
+        if entry is not None:
+            write_log_entry(log_dir, entry, get_segment_policy(config))
+        if mark is not None:
+            try:
+                record_tool_marks(log_dir, [mark])
+            except Exception as e:
+                # Rollups are best effort; the log line is already written
+                sys.stderr.write(f"[logger hook] Failed to update tool summary: {e}\n")
 
     except Exception as e:
         # Log to stderr so failures are visible without breaking hook protocol
         sys.stderr.write(f"[logger hook] Failed to log event: {e}\n")
         sys.stderr.flush()
+    return False
+
+
+def run_flush(watch: float | None = None, limit: int | None = None) -> int:
+    config = get_config()
+    spool_dir = get_spool_dir(config)
+    base = get_log_base(config)
+    policy = get_segment_policy(config)
+    if watch:
+        watch_spool(spool_dir, base, policy, watch)
+        return 0
+    stats = flush_spool(spool_dir, base, policy, limit=limit)
+    if stats.locked:
+        print("spool flush already running")
+    else:
+        print(
+            f"entries={stats.entries} sessions={stats.sessions} "
+            f"quarantined={stats.quarantined} "
+            f"bytes={stats.bytes} duration_ms={stats.duration_ms}"
+        )
+    return 0
+
+
+def run_compact(args) -> int:
+    config = get_config()
+    if args.compression:
+        config["segment_compression"] = args.compression
+    base = args.base or resolve_log_path("logger")
+    report = compact_logs(base, get_segment_policy(config), dry_run=args.dry_run)
+    print(format_report(report, dry_run=args.dry_run))
+    return 0
 
 
 def output_hook_response() -> None:
-    response = {
-        "continue": True,
-        "suppressOutput": False
-    }
-    print(json.dumps(response))
-    sys.stdout.flush()
+    write_response(CONTINUE)
 
 
 def main() -> int:
@@ -43,11 +105,53 @@ def main() -> int:
             show_help()
             return 0
 
+        if args.command == "export":
+            return export_logs(args.paths, args.output)
+
+        if args.command == "compact":
+            return run_compact(args)
+
+        if args.command == "query":
+            from .index import QueryFilter
+            from .query import run_query
+
+            where = QueryFilter(
+                session_id=args.session,
+                hook_event_name=args.event,
+                tool_name=args.tool,
+                kind=args.kind,
+                source=args.source,
+                since=args.since,
+                until=args.until,
+            )
+            return run_query(
+                where,
+                group_by=args.group_by,
+                limit=args.limit or None,
+                newest_first=args.newest,
+                with_records=args.records,
+                output_format=args.format,
+                update=not args.no_update,
+                db_path=args.db,
+            )
+
+        if args.command == "tools":
+            return run_tools_report(get_log_base(), args.session, args.format)
+
+        if args.command == "flush":
+            return run_flush(args.watch, args.limit)
+
+        flush_due = False
         for hook_data in process_stdin():
-            log_hook_event(hook_data)
+            flush_due = log_hook_event(hook_data) or flush_due
 
             output_hook_response()
 
+        # Flush only after answering, on events that are off the tool path
+        if flush_due:
+            config = get_config()
+            flush_spool(get_spool_dir(config), get_log_base(config), get_segment_policy(config))
+
         return 0
 
     except KeyboardInterrupt:
@@ -1,5 +1,6 @@
 import argparse
 import sys
+from pathlib import Path
 from typing import NoReturn
 
 
@@ -16,6 +17,98 @@ def parse_args() -> argparse.Namespace:
         help="Show help message and exit"
     )
 
+    subparsers = parser.add_subparsers(dest="command")
+
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Render NDJSON log files as one pretty-printed JSON array"
+    )
+    export_parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Log files or directories (searched recursively)"
+    )
+    export_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        help="Write to this file instead of stdout"
+    )
+
+    compact_parser = subparsers.add_parser(
+        "compact",
+        help="Migrate per-second log files into compressed session segments"
+    )
+    compact_parser.add_argument(
+        "--base",
+        type=Path,
+        help="Log base directory (default: logger log_base_path)"
+    )
+    compact_parser.add_argument(
+        "--compression",
+        choices=["gzip", "lzma", "none"],
+        help="Override segment_compression for this run"
+    )
+    compact_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without modifying files"
+    )
+
+    query_parser = subparsers.add_parser(
+        "query",
+        help="Query the SQLite index of logger, rules_loader and playwright_healer logs"
+    )
+    query_parser.add_argument("--session", help="Session id")
+    query_parser.add_argument("--event", help="Hook event name (e.g. PostToolUse)")
+    query_parser.add_argument("--tool", help="Tool name; '*' wildcards allowed")
+    query_parser.add_argument("--kind", help="Record kind (e.g. error, error_detected)")
+    query_parser.add_argument(
+        "--source",
+        choices=["logger", "rules_loader", "playwright_healer"],
+        help="Hook that wrote the records"
+    )
+    query_parser.add_argument("--since", help="Earliest logged_at (ISO date/time prefix)")
+    query_parser.add_argument("--until", help="Latest logged_at, exclusive")
+    query_parser.add_argument(
+        "--group-by",
+        choices=["session", "event", "tool", "kind", "source"],
+        help="Aggregate: count, bytes and time range per group"
+    )
+    query_parser.add_argument("--limit", type=int, default=100, help="Maximum rows (0 = all)")
+    query_parser.add_argument("--newest", action="store_true", help="Newest records first")
+    query_parser.add_argument(
+        "--records",
+        action="store_true",
+        help="Print the original records (NDJSON) instead of the index rows"
+    )
+    query_parser.add_argument("--format", choices=["text", "json"], default="text")
+    query_parser.add_argument(
+        "--no-update",
+        action="store_true",
+        help="Query the index as is, without ingesting new log data first"
+    )
+    query_parser.add_argument("--db", type=Path, help="Index database path")
+
+    tools_parser = subparsers.add_parser(
+        "tools",
+        help="Per-tool call counts, latency percentiles and response sizes"
+    )
+    tools_parser.add_argument("--session", help="One session (default: all sessions)")
+    tools_parser.add_argument("--format", choices=["text", "json"], default="text")
+
+    flush_parser = subparsers.add_parser(
+        "flush",
+        help="Merge spooled events (write_mode: spool) into session segments"
+    )
+    flush_parser.add_argument(
+        "--watch",
+        type=float,
+        metavar="SECONDS",
+        help="Keep running, flushing every SECONDS (background flusher)"
+    )
+    flush_parser.add_argument("--limit", type=int, help="Maximum entries to flush")
+
     return parser.parse_args()
 
 
@@ -24,6 +117,23 @@ def show_help() -> NoReturn:
     help_text = """
   # for settings.json setup
   uv run --directory /workspace/.claude/hooks/logger python -m src
+
+  # view NDJSON logs as a pretty JSON array
+  python -m claude_apps.hooks.logger export <file-or-dir>... [-o out.json]
+
+  # query the log index (updated incrementally on each call)
+  python -m claude_apps.hooks.logger query --session <id> --tool 'mcp__playwright__*'
+  python -m claude_apps.hooks.logger query --source playwright_healer \\
+      --kind error_detected --group-by session
+
+  # per-tool latency (p50/p95) and response bytes from session summaries
+  python -m claude_apps.hooks.logger tools [--session <id>] [--format json]
+
+  # merge spooled events into session segments (write_mode: spool)
+  python -m claude_apps.hooks.logger flush [--watch SECONDS]
+
+  # migrate per-second log files into compressed session segments
+  python -m claude_apps.hooks.logger compact [--base DIR] [--dry-run]
 """
     print(help_text)
     sys.exit(0)
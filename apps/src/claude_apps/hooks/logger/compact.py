@@ -0,0 +1,184 @@
+"""One-shot migration of per-second log files into session segments.
+
+Before segments, every event was written to
+``<session>/<event>/<YYYYmmdd_HHMMSS>.json`` (later ``.ndjson``). compact
+folds each session's files into sealed, compressed segments in time order,
+stamps each record with the time from its file name, and removes the old
+files and event directories. It also seals and compresses segments of
+sessions that have gone idle.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from claude_apps.shared.event_log import (
+    SegmentPolicy,
+    compress_segment,
+    encode_record,
+    iter_records,
+    maintain_session,
+)
+from claude_apps.shared.event_log.segments import SEGMENT_PREFIX, SEGMENT_SUFFIX, window_stamp
+
+LEGACY_SUFFIXES = (".json", ".ndjson")
+LEGACY_STAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+@dataclass
+class CompactionReport:
+    """Counts from a compaction run."""
+
+    sessions: int = 0
+    files_migrated: int = 0
+    records: int = 0
+    segments_written: int = 0
+    segments_sealed: int = 0
+    segments_compressed: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+
+def _parse_stamp(path: Path) -> datetime | None:
+    try:
+        return datetime.strptime(path.stem, LEGACY_STAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def find_legacy_files(session_dir: Path) -> List[Tuple[datetime, Path]]:
+    """Per-second log files of one session, oldest first."""
+    found = []
+    for event_dir in session_dir.iterdir():
+        if not event_dir.is_dir():
+            continue
+        for path in event_dir.iterdir():
+            stamp = _parse_stamp(path)
+            if stamp is not None and path.suffix in LEGACY_SUFFIXES and path.is_file():
+                found.append((stamp, path))
+    found.sort(key=lambda item: (item[0], item[1].parent.name, item[1].name))
+    return found
+
+
+def _stamp_record(record: Any, logged_at: str) -> Any:
+    if isinstance(record, dict) and "logged_at" not in record:
+        return {"logged_at": logged_at, **record}
+    return record
+
+
+def _write_segment(session_dir: Path, window: str, lines: List[str], policy: SegmentPolicy) -> Path:
+    sealed = session_dir / f"{SEGMENT_PREFIX}{window}.{time.time_ns()}{SEGMENT_SUFFIX}"
+    tmp = sealed.with_name(f"{sealed.name}.{os.getpid()}.tmp")
+    tmp.write_text("".join(lines), encoding="utf-8")
+    os.replace(tmp, sealed)
+    return compress_segment(sealed, policy.compression)
+
+
+def migrate_session(
+    session_dir: Path, policy: SegmentPolicy, dry_run: bool = False
+) -> Tuple[int, int, int]:
+    """Fold one session's per-second files into sealed segments.
+
+    Records are grouped by the policy's time window and split at max_bytes,
+    so migrated segments look like ones written live.
+
+    Returns:
+        Tuple of (files migrated, records, segments written)
+    """
+    legacy = find_legacy_files(session_dir)
+    if not legacy:
+        return 0, 0, 0
+
+    batches: Dict[str, List[List[str]]] = {}
+    sizes: Dict[str, int] = {}
+    records = 0
+    for stamp, path in legacy:
+        window = window_stamp(stamp.timestamp(), policy)
+        logged_at = stamp.isoformat(timespec="milliseconds")
+        chunks = batches.setdefault(window, [[]])
+        for record in iter_records(path):
+            line = encode_record(_stamp_record(record, logged_at)) + "\n"
+            size = len(line.encode("utf-8"))
+            if chunks[-1] and sizes.get(window, 0) + size > policy.max_bytes:
+                chunks.append([])
+                sizes[window] = 0
+            chunks[-1].append(line)
+            sizes[window] = sizes.get(window, 0) + size
+            records += 1
+
+    segments = sum(1 for chunks in batches.values() for chunk in chunks if chunk)
+    if dry_run:
+        return len(legacy), records, segments
+
+    for window in sorted(batches):
+        for chunk in batches[window]:
+            if chunk:
+                _write_segment(session_dir, window, chunk, policy)
+
+    # Only remove the old files once every segment is safely in place
+    for _, path in legacy:
+        path.unlink()
+    for event_dir in {path.parent for _, path in legacy}:
+        try:
+            event_dir.rmdir()
+        except OSError:
+            pass
+
+    return len(legacy), records, segments
+
+
+def _tree_size(root: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                pass
+    return total
+
+
+def compact_logs(base: Path, policy: SegmentPolicy, dry_run: bool = False) -> CompactionReport:
+    """Migrate and compact every session under a log base directory.
+
+    Args:
+        base: Logger log base (contains one directory per session)
+        policy: Rotation and compression settings for written segments
+        dry_run: Count what would change without touching any file
+
+    Returns:
+        CompactionReport
+    """
+    report = CompactionReport()
+    if not base.is_dir():
+        return report
+
+    report.bytes_before = _tree_size(base)
+    for session_dir in sorted(
+        p for p in base.iterdir() if p.is_dir() and not p.name.startswith(".")
+    ):
+        report.sessions += 1
+        files, records, segments = migrate_session(session_dir, policy, dry_run)
+        report.files_migrated += files
+        report.records += records
+        report.segments_written += segments
+        if not dry_run:
+            sealed, compressed = maintain_session(session_dir, policy, seal_idle=True)
+            report.segments_sealed += sealed
+            report.segments_compressed += compressed
+    report.bytes_after = report.bytes_before if dry_run else _tree_size(base)
+    return report
+
+
+def format_report(report: CompactionReport, dry_run: bool = False) -> str:
+    """Render a compaction report as text."""
+    prefix = "[dry run] " if dry_run else ""
+    return (
+        f"{prefix}sessions={report.sessions} files_migrated={report.files_migrated} "
+        f"records={report.records} segments_written={report.segments_written} "
+        f"sealed={report.segments_sealed} compressed={report.segments_compressed} "
+        f"bytes {report.bytes_before} -> {report.bytes_after}"
+    )
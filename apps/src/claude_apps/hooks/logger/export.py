@@ -0,0 +1,67 @@
+"""Export NDJSON hook logs as a pretty-printed JSON array."""
+
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+from claude_apps.shared.event_log import list_segments, render_json_array
+
+LEGACY_SUFFIXES = (".ndjson", ".json")
+
+
+def _directory_log_files(root: Path) -> List[Path]:
+    files: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        directory = Path(dirpath)
+        segments = list_segments(directory)
+        files.extend(segments)
+        seen = {p.name for p in segments}
+        files.extend(
+            directory / name
+            for name in sorted(filenames)
+            if name not in seen
+            and not name.startswith(".")
+            and Path(name).suffix in LEGACY_SUFFIXES
+        )
+    return files
+
+
+def collect_log_files(paths: List[Path]) -> List[Path]:
+    """Expand directories into their log files in write order.
+
+    Session segments are ordered by window and seal time; per-second files
+    from the older layout sort chronologically by their timestamped names.
+    """
+    files: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(_directory_log_files(path))
+        else:
+            files.append(path)
+    return files
+
+
+def export_logs(paths: List[Path], output: Path | None = None) -> int:
+    """Write the combined records of the given logs as a JSON array.
+
+    Args:
+        paths: Log files or directories
+        output: Destination file (default: stdout)
+
+    Returns:
+        Exit code (1 if no log files were found)
+    """
+    files = collect_log_files(paths)
+    if not files:
+        sys.stderr.write("[logger hook] No log files found\n")
+        return 1
+
+    text = render_json_array(files, resolve_blobs=True)
+    if output is None:
+        sys.stdout.write(text)
+    else:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(text, encoding="utf-8")
+    return 0
@@ -0,0 +1,424 @@
+"""Incremental SQLite index over hook logs.
+
+Indexes every record written by the logger, rules_loader and
+playwright_healer hooks (session, event, tool, kind, time, size and where
+the record lives) so that queries never walk or parse the log tree.
+
+Ingestion is incremental. For each log file the index remembers how many
+(uncompressed) bytes it has consumed; an update reads only what was
+appended since. Segment lifecycle moves are followed instead of
+re-ingested: an active segment renamed on sealing is matched by inode, and
+a compressed segment picks up the state of the file it was compressed
+from. Files that disappear (for example after ``logger compact``) take
+their rows with them, so the index always mirrors what is on disk.
+"""
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from claude_apps.shared.config_helper import get_data_path, resolve_log_path
+from claude_apps.shared.event_log import encode_record, iter_records, read_log_bytes
+from claude_apps.shared.hook_protocol import HookEvent
+
+SOURCES = ("logger", "rules_loader", "playwright_healer")
+LOG_SUFFIXES = (".ndjson", ".json", ".gz", ".xz")
+COMPRESSED_SUFFIXES = (".gz", ".xz")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    inode INTEGER,
+    size INTEGER NOT NULL DEFAULT 0,
+    mtime_ns INTEGER NOT NULL DEFAULT 0,
+    offset INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    offset INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    session_id TEXT,
+    hook_event_name TEXT,
+    tool_name TEXT,
+    kind TEXT,
+    logged_at TEXT,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_session ON events(session_id, logged_at);
+CREATE INDEX IF NOT EXISTS idx_events_tool ON events(tool_name);
+CREATE INDEX IF NOT EXISTS idx_events_event ON events(hook_event_name);
+CREATE INDEX IF NOT EXISTS idx_events_kind ON events(kind);
+CREATE INDEX IF NOT EXISTS idx_events_logged_at ON events(logged_at);
+CREATE INDEX IF NOT EXISTS idx_events_file ON events(file_id);
+"""
+
+GROUP_COLUMNS = {
+    "session": "session_id",
+    "event": "hook_event_name",
+    "tool": "tool_name",
+    "kind": "kind",
+    "source": "source",
+}
+
+
+def get_index_path() -> Path:
+    """Default location of the index database."""
+    return get_data_path("index") / "hook_logs.sqlite3"
+
+
+def get_log_roots() -> Dict[str, Path]:
+    """Log base directory of every indexed hook."""
+    return {source: resolve_log_path(source) for source in SOURCES}
+
+
+@dataclass
+class IndexStats:
+    """Counts from one index update."""
+
+    files_scanned: int = 0
+    files_updated: int = 0
+    files_moved: int = 0
+    files_removed: int = 0
+    events_added: int = 0
+    duration_ms: float = 0.0
+
+
+@dataclass
+class QueryFilter:
+    """Filters shared by record queries and aggregates.
+
+    Attributes:
+        session_id: Exact session id
+        hook_event_name: Exact hook event name
+        tool_name: Tool name; '*' wildcards are allowed
+        kind: Record kind (event/event_type field, e.g. "error")
+        source: Hook that wrote the record
+        since: Inclusive lower bound on logged_at (ISO prefix)
+        until: Exclusive upper bound on logged_at (ISO prefix)
+    """
+
+    session_id: Optional[str] = None
+    hook_event_name: Optional[str] = None
+    tool_name: Optional[str] = None
+    kind: Optional[str] = None
+    source: Optional[str] = None
+    since: Optional[str] = None
+    until: Optional[str] = None
+
+    def to_sql(self, prefix: str = "") -> Tuple[str, List[Any]]:
+        """Build a WHERE clause (empty when no filter is set) and its params."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column in ("session_id", "hook_event_name", "kind", "source"):
+            value = getattr(self, column)
+            if value is not None:
+                clauses.append(f"{prefix}{column} = ?")
+                params.append(value)
+        if self.tool_name is not None:
+            operator = "GLOB" if "*" in self.tool_name else "="
+            clauses.append(f"{prefix}tool_name {operator} ?")
+            params.append(self.tool_name)
+        if self.since is not None:
+            clauses.append(f"{prefix}logged_at >= ?")
+            params.append(self.since)
+        if self.until is not None:
+            clauses.append(f"{prefix}logged_at < ?")
+            params.append(self.until)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+
+def _legacy_stamp(path: Path) -> Optional[str]:
+    try:
+        return datetime.strptime(path.stem, "%Y%m%d_%H%M%S").isoformat(timespec="milliseconds")
+    except ValueError:
+        return None
+
+
+def _row(record: Any, source: str, session_hint: str, default_time: Optional[str]) -> Tuple:
+    get = record.get if hasattr(record, "get") else (lambda key, default=None: default)
+    logged_at = get("logged_at") or get("timestamp") or default_time
+    return (
+        source,
+        get("session_id") or session_hint,
+        get("hook_event_name"),
+        get("tool_name"),
+        get("event_type") or get("event"),
+        logged_at,
+    )
+
+
+def _iter_lines(data: bytes, start: int) -> Iterator[Tuple[int, bytes]]:
+    """Complete lines of data from start, with their byte offsets."""
+    pos = start
+    end = data.rfind(b"\n") + 1
+    while pos < end:
+        newline = data.index(b"\n", pos)
+        line = data[pos:newline]
+        if line.strip():
+            yield pos, line
+        pos = newline + 1
+
+
+class LogIndex:
+    """SQLite index of hook log records."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path is not None else get_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, timeout=5.0)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "LogIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -- ingestion ---------------------------------------------------------
+
+    def update(self, roots: Optional[Dict[str, Path]] = None) -> IndexStats:
+        """Bring the index up to date with the log directories.
+
+        Args:
+            roots: Source name to log base directory (default: configured
+                log paths of logger, rules_loader and playwright_healer)
+
+        Returns:
+            IndexStats for this update
+        """
+        started = time.perf_counter()
+        stats = IndexStats()
+        roots = roots if roots is not None else get_log_roots()
+
+        known = {row["path"]: row for row in self.conn.execute("SELECT * FROM files")}
+        found: Dict[str, Tuple[str, Path, os.stat_result, str]] = {}
+        for source, root in roots.items():
+            for path, session_hint in self._walk(root):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                found[str(path)] = (source, path, st, session_hint)
+        stats.files_scanned = len(found)
+
+        with self.conn:
+            self._follow_moves(known, found, stats)
+            for key, (source, path, st, session_hint) in found.items():
+                row = known.get(key)
+                if (
+                    row is not None
+                    and row["size"] == st.st_size
+                    and row["mtime_ns"] == st.st_mtime_ns
+                ):
+                    continue
+                added = self._ingest(path, source, session_hint, st, row)
+                stats.files_updated += 1
+                stats.events_added += added
+            for key, row in known.items():
+                if key not in found:
+                    self.conn.execute("DELETE FROM files WHERE id = ?", (row["id"],))
+                    stats.files_removed += 1
+
+        stats.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        return stats
+
+    def _walk(self, root: Path) -> Iterator[Tuple[Path, str]]:
+        if not root.is_dir():
+            return
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Dot directories (the .blobs store) hold no log records
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            relative = Path(dirpath).relative_to(root).parts
+            session_hint = relative[0] if relative else ""
+            for name in filenames:
+                # Dotfiles (e.g. .tool_summary.json) are state, not logs
+                if (
+                    name.endswith(LOG_SUFFIXES)
+                    and not name.endswith(".tmp")
+                    and not name.startswith(".")
+                ):
+                    yield Path(dirpath) / name, session_hint
+
+    def _follow_moves(
+        self,
+        known: Dict[str, sqlite3.Row],
+        found: Dict[str, Tuple[str, Path, os.stat_result, str]],
+        stats: IndexStats,
+    ) -> None:
+        """Carry state over from sealed (renamed) and compressed segments.
+
+        A known path that is gone, or now holds a different inode (a new
+        active segment after a size rotation), gives up its row: either to
+        the file its content moved to, or to deletion.
+        """
+        released = {
+            key: row
+            for key, row in known.items()
+            if key not in found or row["inode"] != found[key][2].st_ino
+        }
+        if not released:
+            return
+        by_inode = {
+            (str(Path(key).parent), row["inode"]): key
+            for key, row in released.items()
+            if Path(key).name.startswith("active.")
+        }
+
+        for key, (_, path, st, _) in found.items():
+            if key in known and key not in released:
+                continue
+            origin = None
+            if path.suffix in COMPRESSED_SUFFIXES:
+                origin = str(path.with_suffix(""))
+            elif path.name.startswith("segment."):
+                origin = by_inode.get((str(path.parent), st.st_ino))
+            if origin is None or origin not in released or origin == key:
+                continue
+            row = released.pop(origin)
+            del known[origin]
+            if key in released:
+                self.conn.execute("DELETE FROM files WHERE id = ?", (released.pop(key)["id"],))
+                del known[key]
+            # size = -1 forces _ingest to read anything appended after the move
+            self.conn.execute(
+                "UPDATE files SET path = ?, inode = ?, size = -1 WHERE id = ?",
+                (key, st.st_ino, row["id"]),
+            )
+            known[key] = self.conn.execute(
+                "SELECT * FROM files WHERE id = ?", (row["id"],)
+            ).fetchone()
+            stats.files_moved += 1
+
+        # Replaced in place with unrelated content: start that path over
+        for key, row in released.items():
+            if key in found:
+                self.conn.execute("DELETE FROM files WHERE id = ?", (row["id"],))
+                del known[key]
+                stats.files_removed += 1
+
+    def _ingest(
+        self,
+        path: Path,
+        source: str,
+        session_hint: str,
+        st: os.stat_result,
+        row: Optional[sqlite3.Row],
+    ) -> int:
+        if row is None:
+            file_id = self.conn.execute(
+                "INSERT INTO files (path, source, inode) VALUES (?, ?, ?)",
+                (str(path), source, st.st_ino),
+            ).lastrowid
+            offset = 0
+        else:
+            file_id = row["id"]
+            offset = row["offset"]
+
+        default_time = _legacy_stamp(path)
+        rows: List[Tuple] = []
+
+        try:
+            if path.suffix == ".json":
+                # Legacy pretty JSON arrays: small, and re-read whole
+                self.conn.execute("DELETE FROM events WHERE file_id = ?", (file_id,))
+                # Array items are addressed by position as offset -(i + 1)
+                for position, record in enumerate(iter_records(path)):
+                    size = len(encode_record(record).encode("utf-8"))
+                    fields = _row(record, source, session_hint, default_time)
+                    rows.append((file_id, -(position + 1), *fields, size))
+                offset = st.st_size
+            else:
+                if path.suffix in COMPRESSED_SUFFIXES:
+                    data, base = read_log_bytes(path), 0
+                    start = offset
+                else:
+                    if offset > st.st_size:
+                        # Truncated: re-read from the start
+                        self.conn.execute("DELETE FROM events WHERE file_id = ?", (file_id,))
+                        offset = 0
+                    with open(path, "rb") as f:
+                        f.seek(offset)
+                        data, base = f.read(), offset
+                    start = 0
+                for line_offset, line in _iter_lines(data, start):
+                    try:
+                        record = HookEvent.from_raw(line.decode("utf-8"))
+                    except (ValueError, UnicodeDecodeError):
+                        continue
+                    fields = _row(record, source, session_hint, default_time)
+                    rows.append((file_id, base + line_offset, *fields, len(line)))
+                # A trailing partial line is picked up by the next update
+                offset = base + max(data.rfind(b"\n") + 1, start)
+        except (OSError, EOFError):
+            return 0
+
+        self.conn.executemany(
+            "INSERT INTO events (file_id, offset, source, session_id, hook_event_name,"
+            " tool_name, kind, logged_at, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.conn.execute(
+            "UPDATE files SET size = ?, mtime_ns = ?, offset = ?, inode = ? WHERE id = ?",
+            (st.st_size, st.st_mtime_ns, offset, st.st_ino, file_id),
+        )
+        return len(rows)
+
+    # -- queries -----------------------------------------------------------
+
+    def records(
+        self, where: QueryFilter, limit: Optional[int] = 100, newest_first: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Indexed records matching a filter, ordered by time."""
+        clause, params = where.to_sql(prefix="e.")
+        order = "DESC" if newest_first else "ASC"
+        sql = (
+            "SELECT e.logged_at, e.source, e.session_id, e.hook_event_name, e.tool_name,"
+            " e.kind, e.size, f.path AS path, e.offset FROM events e JOIN files f"
+            f" ON f.id = e.file_id{clause} ORDER BY e.logged_at {order}, e.id {order}"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = [*params, limit]
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def aggregate(
+        self, where: QueryFilter, group_by: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Count, total size and time range per group.
+
+        Args:
+            where: Record filter
+            group_by: One of GROUP_COLUMNS
+            limit: Maximum number of groups (largest first)
+
+        Raises:
+            ValueError: If group_by is not a known column
+        """
+        if group_by not in GROUP_COLUMNS:
+            raise ValueError(f"Unknown group: {group_by}")
+        column = GROUP_COLUMNS[group_by]
+        clause, params = where.to_sql()
+        sql = (
+            f"SELECT {column} AS {group_by}, COUNT(*) AS events, SUM(size) AS bytes,"
+            f" MIN(logged_at) AS first, MAX(logged_at) AS last FROM events{clause}"
+            f" GROUP BY {column} ORDER BY events DESC, {column}"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = [*params, limit]
+        return [dict(row) for row in self.conn.execute(sql, params)]
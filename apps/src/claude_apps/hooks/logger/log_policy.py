@@ -0,0 +1,226 @@
+"""Per-event and per-tool sampling, field filtering and truncation.
+
+Policies come from ``hooks.logger.log_policies`` in config.yml::
+
+    log_policies:
+      default: {blob_min_bytes: 4096}
+      events:
+        PostToolUse: {max_payload_bytes: 16384}
+      tools:
+        "mcp__playwright__*": {sample_rate: 0.25, exclude_fields: [tool_response]}
+        Read: {exclude_fields: [tool_response.file.content]}
+
+For an event, the ``default`` policy is overridden by its ``events`` entry
+and then by the first matching ``tools`` entry (exact name or glob). Keys:
+
+    sample_rate        Fraction of events kept (0-1). Pre/Post events of
+                       one tool call share the decision (keyed on tool_use_id)
+    include_fields     Top-level members to keep (routing fields always kept)
+    exclude_fields     Members to drop; dotted paths reach into objects
+    blob_min_bytes     Members whose JSON is at least this large move to the
+                       content-addressed blob store under the log base and
+                       are logged as {"$blob": digest, "bytes": n}
+    max_payload_bytes  Members whose JSON exceeds this are replaced by their
+                       head and tail plus the full length and SHA-256
+
+Events that no policy changes are logged as received, without decoding.
+"""
+
+import fnmatch
+import hashlib
+import random
+import zlib
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from claude_apps.shared.event_log import encode_record, externalize
+
+# Always logged, whatever include_fields says
+ROUTING_FIELDS = ("session_id", "hook_event_name", "tool_name", "tool_use_id")
+POLICY_KEYS = (
+    "sample_rate",
+    "include_fields",
+    "exclude_fields",
+    "max_payload_bytes",
+    "blob_min_bytes",
+)
+
+
+@dataclass(frozen=True)
+class LogPolicy:
+    """Resolved logging policy for one event."""
+
+    sample_rate: float = 1.0
+    include_fields: Optional[Tuple[str, ...]] = None
+    exclude_fields: Tuple[str, ...] = ()
+    max_payload_bytes: Optional[int] = None
+    blob_min_bytes: Optional[int] = None
+
+    @property
+    def is_passthrough(self) -> bool:
+        """True if events are logged unchanged."""
+        return (
+            self.sample_rate >= 1
+            and self.include_fields is None
+            and not self.exclude_fields
+            and self.max_payload_bytes is None
+            and self.blob_min_bytes is None
+        )
+
+
+PASSTHROUGH = LogPolicy()
+
+
+def _override(policy: LogPolicy, settings: Any) -> LogPolicy:
+    if not isinstance(settings, Mapping):
+        return policy
+    changes: Dict[str, Any] = {}
+    for key in POLICY_KEYS:
+        if key not in settings:
+            continue
+        value = settings[key]
+        if key == "sample_rate":
+            value = min(1.0, max(0.0, float(value)))
+        elif key in ("max_payload_bytes", "blob_min_bytes"):
+            value = None if value is None else max(0, int(value))
+        elif key == "include_fields":
+            value = None if value is None else tuple(value)
+        else:
+            value = tuple(value or ())
+        changes[key] = value
+    return replace(policy, **changes) if changes else policy
+
+
+def resolve_policy(
+    policies: Optional[Mapping[str, Any]], event: Optional[str], tool: Optional[str]
+) -> LogPolicy:
+    """Resolve the policy for an event from the log_policies config.
+
+    Args:
+        policies: The log_policies mapping (None or empty for no policies)
+        event: hook_event_name
+        tool: tool_name, if any
+
+    Returns:
+        LogPolicy (PASSTHROUGH when nothing is configured)
+    """
+    if not policies:
+        return PASSTHROUGH
+    policy = _override(PASSTHROUGH, policies.get("default"))
+    policy = _override(policy, (policies.get("events") or {}).get(event))
+    if tool:
+        tools = policies.get("tools") or {}
+        settings = tools.get(tool)
+        if settings is None:
+            settings = next(
+                (v for pattern, v in tools.items() if fnmatch.fnmatchcase(tool, pattern)), None
+            )
+        policy = _override(policy, settings)
+    return policy
+
+
+def is_sampled(hook_data: Mapping[str, Any], rate: float) -> bool:
+    """Decide whether an event is kept at the given sample rate.
+
+    Events with a tool_use_id are decided by its hash, so a tool call's
+    PreToolUse and PostToolUse are kept or dropped together.
+    """
+    if rate >= 1:
+        return True
+    if rate <= 0:
+        return False
+    key = hook_data.get("tool_use_id")
+    if key:
+        return zlib.crc32(str(key).encode("utf-8")) / 2**32 < rate
+    return random.random() < rate
+
+
+def truncate_value(value: Any, max_bytes: int) -> Any:
+    """Replace a value whose JSON exceeds max_bytes with a summary.
+
+    Returns:
+        The value unchanged, or a dict with ``truncated``, ``bytes``,
+        ``sha256`` (of the full JSON text), ``head`` and ``tail``
+    """
+    text = encode_record(value)
+    data = text.encode("utf-8")
+    if len(data) <= max_bytes:
+        return value
+    half = max_bytes // 2
+    return {
+        "truncated": True,
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "head": data[:half].decode("utf-8", "ignore"),
+        "tail": data[len(data) - half :].decode("utf-8", "ignore") if half else "",
+    }
+
+
+def _drop_path(record: Dict[str, Any], path: str) -> None:
+    # Objects along the path are copied, so the event that other hooks and
+    # the tool summary see is never modified
+    parts = path.split(".")
+    target = record
+    for part in parts[:-1]:
+        child = target.get(part)
+        if not isinstance(child, dict):
+            return
+        target[part] = child = dict(child)
+        target = child
+    target.pop(parts[-1], None)
+
+
+def _size_limit(policy: LogPolicy, blob_store: Optional[Path]) -> Optional[int]:
+    limits = [policy.max_payload_bytes]
+    if blob_store is not None:
+        limits.append(policy.blob_min_bytes)
+    limits = [limit for limit in limits if limit is not None]
+    return min(limits) if limits else None
+
+
+def apply_log_policy(
+    hook_data: Mapping[str, Any], policy: LogPolicy, blob_store: Optional[Path] = None
+) -> Optional[Mapping[str, Any]]:
+    """Apply a policy to an event before it is logged.
+
+    Args:
+        hook_data: Hook event
+        policy: Resolved policy
+        blob_store: Blob store directory (blob_min_bytes is ignored without one)
+
+    Returns:
+        None if the event is sampled out; hook_data itself if nothing
+        changes (its raw text is then logged verbatim); else a new dict
+    """
+    if policy.is_passthrough:
+        return hook_data
+    if not is_sampled(hook_data, policy.sample_rate):
+        return None
+
+    raw = getattr(hook_data, "raw", "")
+    limit = _size_limit(policy, blob_store)
+    if (
+        policy.include_fields is None
+        and not policy.exclude_fields
+        and (limit is None or (raw and len(raw.encode("utf-8")) < limit))
+        and policy.sample_rate >= 1
+    ):
+        return hook_data
+
+    record = dict(hook_data)
+    if policy.include_fields is not None:
+        keep = set(policy.include_fields) | set(ROUTING_FIELDS)
+        record = {k: v for k, v in record.items() if k in keep}
+    for path in policy.exclude_fields:
+        _drop_path(record, path)
+    # Lossless first: what goes to the blob store is not truncated
+    if blob_store is not None and policy.blob_min_bytes is not None:
+        externalize(record, blob_store, policy.blob_min_bytes, skip=ROUTING_FIELDS)
+    if policy.max_payload_bytes is not None:
+        for key, value in record.items():
+            if key not in ROUTING_FIELDS and isinstance(value, (dict, list, str)):
+                record[key] = truncate_value(value, policy.max_payload_bytes)
+    if policy.sample_rate < 1:
+        record["sample_rate"] = policy.sample_rate
+    return record
@@ -1,16 +1,24 @@
 """Path utilities for logger hook."""
 
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from claude_apps.shared.config_helper import get_hook_config, resolve_log_path
+from claude_apps.shared.config_helper import get_claude_root, get_hook_config, resolve_log_path
+from claude_apps.shared.event_log import SegmentPolicy
 
 
 DEFAULT_CONFIG = {
     "log_base_path": ".data/logs/claude_hooks",
     "log_enabled": True,
     "log_level": "INFO",
+    "segment_max_bytes": 8 * 1024 * 1024,
+    "segment_max_age_seconds": 3600,
+    "segment_compression": "gzip",
+    "write_mode": "direct",
+    "spool_path": None,
+    "spool_flush_events": ["Stop", "SubagentStop", "SessionEnd", "PreCompact"],
+    "tool_summary": True,
+    "log_policies": {},
 }
 
 
@@ -21,9 +29,28 @@ def get_config() -> dict[str, Any]:
     return config
 
 
-def get_log_path(hook_event_name: str, session_id: str) -> Path:
-    """Get path for log file."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_base = resolve_log_path("logger")
-    log_dir = log_base / session_id / hook_event_name
-    return log_dir / f"{timestamp}.json"
+def get_segment_policy(config: dict[str, Any] | None = None) -> SegmentPolicy:
+    """Build the segment rotation policy from hook configuration."""
+    config = config if config is not None else get_config()
+    return SegmentPolicy(
+        max_bytes=int(config["segment_max_bytes"]),
+        max_age_seconds=int(config["segment_max_age_seconds"]),
+        compression=str(config["segment_compression"]),
+    )
+
+
+def get_session_log_dir(session_id: str, config: dict[str, Any] | None = None) -> Path:
+    """Get the segment directory for a session.
+
+    Pass the already loaded hook config to avoid reading config.yml again.
+    """
+    if config is None:
+        return resolve_log_path("logger") / session_id
+    return get_claude_root() / config["log_base_path"] / session_id
+
+
+def get_log_base(config: dict[str, Any] | None = None) -> Path:
+    """Get the logger log base directory (one subdirectory per session)."""
+    if config is None:
+        return resolve_log_path("logger")
+    return get_claude_root() / config["log_base_path"]
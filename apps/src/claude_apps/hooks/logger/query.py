@@ -0,0 +1,121 @@
+"""Query CLI over the hook log index."""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from claude_apps.shared.event_log import (
+    find_blob_store,
+    iter_records,
+    read_log_bytes,
+    rehydrate,
+)
+
+from .index import LogIndex, QueryFilter
+
+RECORD_COLUMNS = [
+    "logged_at",
+    "source",
+    "session_id",
+    "hook_event_name",
+    "tool_name",
+    "kind",
+    "size",
+]
+
+
+def load_record(path: str, offset: int, cache: Dict[Any, Any]) -> Any:
+    """Read the original record an index row points at.
+
+    Blob references in the record are replaced with the stored content.
+
+    Args:
+        path: Log file
+        offset: Byte offset of the line, or -(i + 1) for item i of a
+            legacy JSON array file
+        cache: Per-call cache of decompressed or parsed files
+
+    Returns:
+        The decoded record, or None if it can no longer be read
+    """
+    parent = str(Path(path).parent)
+    if ("blobs", parent) not in cache:
+        cache[("blobs", parent)] = find_blob_store(Path(path))
+    store = cache[("blobs", parent)]
+    return rehydrate(_load_raw_record(path, offset, cache), store)
+
+
+def _load_raw_record(path: str, offset: int, cache: Dict[Any, Any]) -> Any:
+    try:
+        if offset < 0:
+            if path not in cache:
+                cache[path] = list(iter_records(Path(path)))
+            return cache[path][-offset - 1]
+        if path.endswith((".gz", ".xz")):
+            if path not in cache:
+                cache[path] = read_log_bytes(Path(path))
+            data = cache[path]
+            line = data[offset : data.index(b"\n", offset)]
+        else:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                line = f.readline()
+        return json.loads(line)
+    except (OSError, EOFError, ValueError, IndexError):
+        return None
+
+
+def format_table(rows: List[Dict[str, Any]], columns: List[str]) -> str:
+    """Render rows as a plain-text table."""
+    if not rows:
+        return "(no results)"
+    cells = [[("" if row.get(c) is None else str(row.get(c))) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(columns, widths))]
+    lines.extend("  ".join(v.ljust(w) for v, w in zip(r, widths)) for r in cells)
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def run_query(
+    where: QueryFilter,
+    group_by: Optional[str] = None,
+    limit: Optional[int] = 100,
+    newest_first: bool = False,
+    with_records: bool = False,
+    output_format: str = "text",
+    update: bool = True,
+    db_path: Optional[Path] = None,
+) -> int:
+    """Refresh the index, run one query and print the result.
+
+    Returns:
+        Exit code
+    """
+    with LogIndex(db_path) as index:
+        if update:
+            stats = index.update()
+            sys.stderr.write(
+                f"[logger query] indexed +{stats.events_added} events from "
+                f"{stats.files_updated}/{stats.files_scanned} files in {stats.duration_ms:.1f} ms\n"
+            )
+
+        if group_by:
+            rows = index.aggregate(where, group_by, limit)
+            columns = [group_by, "events", "bytes", "first", "last"]
+        else:
+            rows = index.records(where, limit, newest_first)
+            columns = RECORD_COLUMNS
+            if with_records:
+                cache: Dict[str, Any] = {}
+                for row in rows:
+                    row["record"] = load_record(row["path"], row["offset"], cache)
+
+    if output_format == "json":
+        sys.stdout.write(json.dumps(rows, ensure_ascii=False, indent=2) + "\n")
+    elif with_records and not group_by:
+        for row in rows:
+            sys.stdout.write(json.dumps(row["record"], ensure_ascii=False) + "\n")
+    else:
+        sys.stdout.write(format_table(rows, columns) + "\n")
+    return 0
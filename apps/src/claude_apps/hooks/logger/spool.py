@@ -0,0 +1,270 @@
+"""Spool mode: hand events off instantly, merge them into segments later.
+
+In spool mode the hook writes each event as one small file and answers
+right away. The spool uses the maildir layout: the event is written to
+``tmp/`` and renamed into ``new/``, so a flusher only ever sees complete
+entries. Entry names start with a zero-padded nanosecond timestamp, so
+listing order is arrival order.
+
+A flusher moves spooled events into the session segments with one large
+sequential write per session. It runs on events that are not on the tool
+path (Stop, SessionEnd, ...), from ``python -m claude_apps.hooks.logger
+flush``, or continuously with ``flush --watch``. Delivery is at least once:
+entries are removed only after their segment write succeeded. Entries
+that cannot be decoded are moved to ``bad/`` rather than dropped; ones
+that cannot be read at all stay in ``new/`` for the next flush.
+
+A tool event's entry carries its tool mark (see tool_stats.py) as a
+second line, and the flusher applies each session's marks in one summary
+update. The hook itself then makes exactly one write per event. An
+entry whose event the log policy dropped holds only the mark.
+
+Spooled lines are not sent over the hooks daemon's socket instead. The
+daemon is optional, exits when idle and serves each event in a forked
+child that keeps no memory between events. A line sent to it would
+still have to land on disk before the hook answers, and any event that
+finds no daemon would need this spool anyway.
+"""
+
+import fcntl
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from claude_apps.shared.config_helper import get_claude_root, get_data_path
+from claude_apps.shared.event_log import SegmentPolicy, append_lines_to_session, encode_record
+
+from .tool_stats import record_tool_marks
+
+# Orphaned tmp/ entries (writer died before the rename) are removed after this
+STALE_TMP_SECONDS = 3600
+# Entries the flusher cannot parse are moved here instead of being dropped
+BAD_DIR = "bad"
+
+
+@dataclass
+class FlushStats:
+    """Counts from one spool flush."""
+
+    entries: int = 0
+    sessions: int = 0
+    tool_marks: int = 0
+    quarantined: int = 0
+    bytes: int = 0
+    locked: bool = False
+    duration_ms: float = 0.0
+
+
+def get_spool_dir(config: Mapping[str, Any]) -> Path:
+    """Spool directory from config (relative paths are under the claude root)."""
+    configured = config.get("spool_path")
+    if not configured:
+        return get_data_path("spool") / "logger"
+    path = Path(configured).expanduser()
+    return path if path.is_absolute() else get_claude_root() / path
+
+
+def spool_line(
+    spool_dir: Path,
+    session_id: str,
+    line: str,
+    tool_mark: Optional[Mapping[str, Any]] = None,
+) -> Path:
+    """Spool one serialized event.
+
+    Args:
+        spool_dir: Spool directory (tmp/ and new/ are created on first use)
+        session_id: Session the event belongs to
+        line: Serialized record; must not contain a newline. Empty when
+            only a tool mark is spooled
+        tool_mark: The event's tool mark, applied to the summary on flush
+
+    Returns:
+        Path of the entry in new/
+
+    Raises:
+        OSError: If the entry cannot be written
+    """
+    text = f"{line}\n" if tool_mark is None else f"{line}\n{encode_record(dict(tool_mark))}\n"
+    data = text.encode("utf-8")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+    stamp = time.time_ns()
+    while True:
+        name = f"{stamp:020d}.{os.getpid()}.{session_id}"
+        tmp = spool_dir / "tmp" / name
+        try:
+            fd = os.open(tmp, flags, 0o644)
+            break
+        except FileExistsError:
+            stamp += 1
+        except FileNotFoundError:
+            (spool_dir / "tmp").mkdir(parents=True, exist_ok=True)
+            (spool_dir / "new").mkdir(parents=True, exist_ok=True)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    entry = spool_dir / "new" / name
+    os.rename(tmp, entry)
+    return entry
+
+
+def _clean_stale_tmp(spool_dir: Path, now: float) -> None:
+    try:
+        entries = list(os.scandir(spool_dir / "tmp"))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if now - entry.stat().st_mtime > STALE_TMP_SECONDS:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def _parse_mark(parts: List[str]) -> Any:
+    """The tool mark on an entry's second line: None if absent, False if malformed."""
+    if len(parts) != 2:
+        return None
+    try:
+        mark = json.loads(parts[1])
+    except ValueError:
+        return False
+    return mark if isinstance(mark, dict) else False
+
+
+def _quarantine(spool_dir: Path, name: str) -> int:
+    """Move a malformed entry from new/ to bad/ for inspection; 1 if moved."""
+    try:
+        (spool_dir / BAD_DIR).mkdir(exist_ok=True)
+        os.rename(spool_dir / "new" / name, spool_dir / BAD_DIR / name)
+    except OSError:
+        return 0
+    return 1
+
+
+def flush_spool(
+    spool_dir: Path,
+    log_base: Path,
+    policy: SegmentPolicy,
+    limit: Optional[int] = None,
+) -> FlushStats:
+    """Merge spooled events into the session segments.
+
+    Only one flusher runs at a time; a concurrent call returns at once
+    with ``locked`` set.
+
+    Args:
+        spool_dir: Spool directory
+        log_base: Logger log base (session directories)
+        policy: Segment rotation and compression settings
+        limit: Maximum entries to flush in this call
+
+    Returns:
+        FlushStats
+    """
+    started = time.perf_counter()
+    stats = FlushStats()
+    new_dir = spool_dir / "new"
+    try:
+        names = sorted(os.listdir(new_dir))
+    except OSError:
+        return stats
+    if not names:
+        return stats
+
+    lock_fd = os.open(spool_dir / "flush.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            stats.locked = True
+            return stats
+
+        # Re-list under the lock: another flusher may have just finished
+        names = sorted(os.listdir(new_dir))
+        if limit is not None:
+            names = names[:limit]
+
+        by_session: Dict[str, List[str]] = {}
+        for name in names:
+            parts = name.split(".", 2)
+            if len(parts) == 3:
+                by_session.setdefault(parts[2], []).append(name)
+
+        for session_id, session_names in by_session.items():
+            lines = []
+            marks = []
+            flushed = []
+            for name in session_names:
+                try:
+                    with open(new_dir / name, encoding="utf-8") as f:
+                        parts = f.read().rstrip("\n").split("\n")
+                except UnicodeDecodeError:
+                    stats.quarantined += _quarantine(spool_dir, name)
+                    continue
+                except OSError:
+                    # Left in new/ for the next flush
+                    continue
+                mark = _parse_mark(parts)
+                if len(parts) > 2 or mark is False:
+                    stats.quarantined += _quarantine(spool_dir, name)
+                    continue
+                if parts[0]:
+                    lines.append(parts[0])
+                if mark is not None:
+                    marks.append(mark)
+                flushed.append(name)
+            session_dir = log_base / session_id
+            if lines:
+                stats.bytes += append_lines_to_session(session_dir, lines, policy)
+            if marks:
+                try:
+                    record_tool_marks(session_dir, marks)
+                    stats.tool_marks += len(marks)
+                except (OSError, KeyError, TypeError):
+                    # Rollups are best effort; never hold back the log lines
+                    pass
+            for name in flushed:
+                try:
+                    os.unlink(new_dir / name)
+                except FileNotFoundError:
+                    pass
+            if flushed:
+                stats.entries += len(flushed)
+                stats.sessions += 1
+
+        _clean_stale_tmp(spool_dir, time.time())
+    finally:
+        os.close(lock_fd)
+
+    stats.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+    return stats
+
+
+def watch_spool(
+    spool_dir: Path,
+    log_base: Path,
+    policy: SegmentPolicy,
+    interval: float,
+    iterations: Optional[int] = None,
+) -> int:
+    """Flush the spool every ``interval`` seconds (background flusher).
+
+    Args:
+        iterations: Stop after this many rounds (default: run until interrupted)
+
+    Returns:
+        Total entries flushed
+    """
+    total = 0
+    rounds = 0
+    while iterations is None or rounds < iterations:
+        total += flush_spool(spool_dir, log_base, policy).entries
+        rounds += 1
+        if iterations is None or rounds < iterations:
+            time.sleep(interval)
+    return total
@@ -0,0 +1,263 @@
+"""Per-session tool latency and payload rollups.
+
+Each PreToolUse is matched with its PostToolUse (or PostToolUseFailure)
+by ``tool_use_id``. The pair's duration and response size feed per-tool
+counters in ``<session>/.tool_summary.json``. Each update is a
+constant-size locked read-modify-write that replaces the file atomically
+(see shared.json_file). It never reads the raw logs.
+
+An event is first reduced to a tool mark: its event name, tool_use_id,
+tool name, payload size and arrival time. In direct mode the hook
+applies the mark at once. In spool mode it is spooled with the event
+and the flusher applies a session's marks in one update (see spool.py).
+
+Latency percentiles come from a log-scale histogram: bucket ``i`` holds
+durations up to ``BUCKET_BASE ** i`` milliseconds. A reported p50/p95 is
+the upper bound of its bucket, so it overstates the true value by at
+most 25%.
+
+Response size is the PostToolUse payload size minus the matching
+PreToolUse payload size. Both carry the same tool_input and session
+fields, so the difference is the tool_response, without decoding it.
+"""
+
+import json
+import math
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from claude_apps.shared.event_log import encode_record
+from claude_apps.shared.json_file import read_json_file, update_json_file
+
+SUMMARY_NAME = ".tool_summary.json"
+BUCKET_BASE = 1.25
+START_EVENTS = ("PreToolUse",)
+END_EVENTS = ("PostToolUse", "PostToolUseFailure")
+
+# Unmatched PreToolUse entries are dropped past this age or count
+PENDING_MAX_AGE_SECONDS = 3600
+PENDING_MAX = 256
+
+
+def _bucket(duration_ms: float) -> int:
+    if duration_ms <= 1:
+        return 0
+    return math.ceil(math.log(duration_ms, BUCKET_BASE))
+
+
+def bucket_upper_ms(index: int) -> float:
+    """Upper bound of a latency bucket in milliseconds."""
+    return BUCKET_BASE**index
+
+
+def percentile(histogram: Mapping[str, int], q: float) -> Optional[float]:
+    """Approximate the q-th percentile (0-100) from a latency histogram."""
+    total = sum(histogram.values())
+    if not total:
+        return None
+    rank = q / 100 * total
+    seen = 0
+    for index in sorted(histogram, key=int):
+        seen += histogram[index]
+        if seen >= rank:
+            return round(bucket_upper_ms(int(index)), 1)
+    return None
+
+
+def _payload_size(hook_data: Mapping[str, Any]) -> int:
+    raw = getattr(hook_data, "raw", "")
+    return len((raw or encode_record(dict(hook_data))).encode("utf-8"))
+
+
+def _empty_summary() -> Dict[str, Any]:
+    return {"pending": {}, "tools": {}}
+
+
+def _new_tool() -> Dict[str, Any]:
+    return {
+        "count": 0,
+        "failures": 0,
+        "total_ms": 0.0,
+        "max_ms": 0.0,
+        "response_bytes": 0,
+        "histogram": {},
+    }
+
+
+def tool_mark(
+    hook_data: Mapping[str, Any], now: Optional[float] = None
+) -> Optional[Dict[str, Any]]:
+    """What the summary needs from one event, or None for non-tool events.
+
+    Args:
+        hook_data: Hook event
+        now: Event arrival time (default: time.time())
+    """
+    event = hook_data.get("hook_event_name")
+    tool_use_id = hook_data.get("tool_use_id")
+    if (event not in START_EVENTS and event not in END_EVENTS) or not tool_use_id:
+        return None
+    return {
+        "event": event,
+        "tool_use_id": tool_use_id,
+        "tool_name": hook_data.get("tool_name") or "",
+        "size": _payload_size(hook_data),
+        "at": time.time() if now is None else now,
+    }
+
+
+def _apply(summary: Dict[str, Any], mark: Mapping[str, Any]) -> bool:
+    event = mark["event"]
+    tool_use_id = mark["tool_use_id"]
+    now = mark["at"]
+    pending = summary["pending"]
+
+    if event in START_EVENTS:
+        pending[tool_use_id] = [mark["tool_name"], now, mark["size"]]
+        if len(pending) > PENDING_MAX:
+            oldest = min(pending, key=lambda key: pending[key][1])
+            del pending[oldest]
+        return True
+
+    start = pending.pop(tool_use_id, None)
+    if start is None:
+        return False
+    tool_name, started_at, request_size = start
+    tool_name = mark["tool_name"] or tool_name
+    duration_ms = max(0.0, (now - started_at) * 1000)
+
+    stats = summary["tools"].setdefault(tool_name, _new_tool())
+    stats["count"] += 1
+    if event == "PostToolUseFailure":
+        stats["failures"] += 1
+    stats["total_ms"] = round(stats["total_ms"] + duration_ms, 3)
+    stats["max_ms"] = round(max(stats["max_ms"], duration_ms), 3)
+    stats["response_bytes"] += max(0, mark["size"] - request_size)
+    bucket = str(_bucket(duration_ms))
+    stats["histogram"][bucket] = stats["histogram"].get(bucket, 0) + 1
+
+    # Sweep abandoned starts (tool calls whose Post never arrived)
+    for key in [k for k, v in pending.items() if now - v[1] > PENDING_MAX_AGE_SECONDS]:
+        del pending[key]
+    return True
+
+
+def record_tool_marks(session_dir: Path, marks: List[Mapping[str, Any]]) -> bool:
+    """Apply tool marks, in order, to the session's summary in one update.
+
+    Returns:
+        True if the summary changed
+
+    Raises:
+        OSError: If the summary cannot be read or written
+    """
+    if not marks:
+        return False
+
+    def update(summary: Dict[str, Any]) -> bool:
+        changed = False
+        for mark in marks:
+            changed = _apply(summary, mark) or changed
+        return changed
+
+    return update_json_file(session_dir / SUMMARY_NAME, update, _empty_summary)
+
+
+def record_tool_event(
+    session_dir: Path, hook_data: Mapping[str, Any], now: Optional[float] = None
+) -> bool:
+    """Update the session's tool summary with one hook event.
+
+    Args:
+        session_dir: Session log directory
+        hook_data: Hook event; only PreToolUse/PostToolUse/PostToolUseFailure
+            events with a tool_use_id are used
+        now: Event arrival time (default: time.time())
+
+    Returns:
+        True if the summary changed
+
+    Raises:
+        OSError: If the summary file cannot be read or written
+    """
+    mark = tool_mark(hook_data, now)
+    return record_tool_marks(session_dir, [mark]) if mark is not None else False
+
+
+def load_summary(session_dir: Path) -> Dict[str, Any]:
+    """Read a session's tool summary (empty if there is none)."""
+    try:
+        return read_json_file(session_dir / SUMMARY_NAME, _empty_summary)
+    except OSError:
+        return _empty_summary()
+
+
+def merge_tools(summaries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Combine the per-tool counters of several session summaries."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for summary in summaries:
+        for tool_name, stats in summary.get("tools", {}).items():
+            total = merged.setdefault(tool_name, _new_tool())
+            for key in ("count", "failures", "response_bytes"):
+                total[key] += stats.get(key, 0)
+            total["total_ms"] = round(total["total_ms"] + stats.get("total_ms", 0.0), 3)
+            total["max_ms"] = max(total["max_ms"], stats.get("max_ms", 0.0))
+            for bucket, count in stats.get("histogram", {}).items():
+                total["histogram"][bucket] = total["histogram"].get(bucket, 0) + count
+    return merged
+
+
+def tool_rows(tools: Mapping[str, Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Report rows per tool, slowest total time first."""
+    rows = []
+    for tool_name, stats in tools.items():
+        count = stats["count"]
+        rows.append(
+            {
+                "tool": tool_name,
+                "count": count,
+                "failures": stats["failures"],
+                "total_ms": round(stats["total_ms"], 1),
+                "mean_ms": round(stats["total_ms"] / count, 1) if count else None,
+                "p50_ms": percentile(stats["histogram"], 50),
+                "p95_ms": percentile(stats["histogram"], 95),
+                "max_ms": round(stats["max_ms"], 1),
+                "response_bytes": stats["response_bytes"],
+            }
+        )
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+def run_tools_report(
+    base: Path, session_id: Optional[str] = None, output_format: str = "text"
+) -> int:
+    """Print per-tool latency and payload rollups.
+
+    Args:
+        base: Logger log base (one directory per session)
+        session_id: Report one session (default: all sessions combined)
+        output_format: "text" or "json"
+
+    Returns:
+        Exit code
+    """
+    from .query import format_table
+
+    if session_id:
+        session_dirs = [base / session_id]
+    else:
+        session_dirs = (
+            sorted(p for p in base.iterdir() if p.is_dir() and not p.name.startswith("."))
+            if base.is_dir()
+            else []
+        )
+    summaries = [load_summary(d) for d in session_dirs]
+    rows = tool_rows(merge_tools(summaries))
+
+    if output_format == "json":
+        print(json.dumps(rows, indent=2))
+    else:
+        print(format_table(rows, list(rows[0]) if rows else []))
+    return 0
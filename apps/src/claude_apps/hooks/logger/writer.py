@@ -1,7 +1,15 @@
 import sys
-import json
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping
+
+from claude_apps.shared.event_log import (
+    DEFAULT_POLICY,
+    SegmentPolicy,
+    append_to_session,
+    encode_record,
+    read_records,
+)
 
 
 def ensure_directory(file_path: Path) -> None:
@@ -13,33 +21,56 @@ def ensure_directory(file_path: Path) -> None:
 
 
 def read_existing_entries(file_path: Path) -> List[Dict[str, Any]]:
-    """Read existing JSON array from file, returning empty list on any error."""
-    if not file_path.exists():
-        return []
+    """Read entries from an NDJSON (or legacy JSON array) log file.
 
-    try:
-        content = file_path.read_text(encoding='utf-8').strip()
-        if not content:
-            return []
+    Returns an empty list for missing or unreadable files.
+    """
+    return read_records(file_path)
 
-        data = json.loads(content)
-        return data if isinstance(data, list) else [data]
-    except (json.JSONDecodeError, IOError):
-        return []
 
+def serialize_entry(hook_data: Mapping[str, Any]) -> str:
+    """Serialize an entry as one NDJSON line.
 
-def write_log_entry(file_path: Path, hook_data: Dict[str, Any]) -> None:
-    """Write a log entry to a JSON array file with pretty-printing."""
-    try:
-        ensure_directory(file_path)
+    Events read from stdin as a single compact line are written as
+    received, without decoding their payload.
+    """
+    raw = getattr(hook_data, "raw", "")
+    if raw and "\n" not in raw:
+        return raw
+    return encode_record(dict(hook_data))
+
+
+def stamp_line(line: str, logged_at: str) -> str:
+    """Insert a leading logged_at member into a serialized JSON object.
 
-        entries = read_existing_entries(file_path)
-        entries.append(hook_data)
+    Segments hold many events, so the time each was logged is recorded in
+    the entry itself. Lines that are not non-empty objects, or that already
+    carry logged_at, are returned unchanged.
+    """
+    if (
+        not line.startswith("{")
+        or line[1:].lstrip().startswith("}")
+        or '"logged_at"' in line
+    ):
+        return line
+    return f'{{"logged_at":"{logged_at}",{line[1:]}'
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(entries, f, ensure_ascii=False, indent=2)
-            f.write('\n')
+
+def format_log_line(hook_data: Mapping[str, Any]) -> str:
+    """Serialize an entry and stamp it with the current time."""
+    logged_at = datetime.now().isoformat(timespec="milliseconds")
+    return stamp_line(serialize_entry(hook_data), logged_at)
+
+
+def write_log_entry(
+    session_dir: Path,
+    hook_data: Mapping[str, Any],
+    policy: SegmentPolicy = DEFAULT_POLICY,
+) -> None:
+    """Append a log entry to the session's active log segment."""
+    try:
+        append_to_session(session_dir, format_log_line(hook_data), policy)
 
     except Exception as e:
-        sys.stderr.write(f"[logger hook] Failed to write log entry to {file_path}: {e}\n")
+        sys.stderr.write(f"[logger hook] Failed to write log entry to {session_dir}: {e}\n")
         sys.stderr.flush()
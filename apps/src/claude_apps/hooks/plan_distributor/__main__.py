@@ -11,6 +11,8 @@ import re
 import sys
 from typing import Any
 
+from claude_apps.shared.hook_protocol import HookEvent, read_events, write_response
+
 from .distributor import distribute_plan, get_distribution_summary
 
 
@@ -92,23 +94,15 @@ def process_hook_event(hook_data: dict[str, Any]) -> dict[str, Any]:
     return response
 
 
-def process_stdin() -> list[dict[str, Any]]:
-    """Read and parse JSON from stdin.
+def process_stdin() -> list[HookEvent]:
+    """Read hook events from stdin.
+
+    Accepts a single JSON object, NDJSON or a JSON array of objects.
 
     Returns:
-        List of parsed JSON objects
+        List of events (read-only mappings); empty for empty/invalid input
     """
-    data = sys.stdin.read().strip()
-    if not data:
-        return []
-
-    try:
-        parsed = json.loads(data)
-        if isinstance(parsed, list):
-            return parsed
-        return [parsed]
-    except json.JSONDecodeError:
-        return []
+    return read_events()
 
 
 def main() -> int:
@@ -118,8 +112,7 @@ def main() -> int:
     try:
         for hook_data in process_stdin():
             response = process_hook_event(hook_data)
-            print(json.dumps(response))
-            sys.stdout.flush()
+            write_response(response)
 
         return 0
 
@@ -1,7 +1,8 @@
 import sys
-import json
 from typing import Dict, Any
 
+from claude_apps.shared.hook_protocol import CONTINUE, write_response
+
 from .cli import parse_args, show_help
 from .reader import process_stdin
 from .detector import detect_browser_error, is_playwright_tool
@@ -17,12 +18,12 @@ def process_hook_event(hook_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     tool_name = hook_data.get("tool_name", "")
-    tool_response = hook_data.get("tool_response", [])
-    session_id = hook_data.get("session_id", "unknown")
-
     if not is_playwright_tool(tool_name):
         return response
 
+    tool_response = hook_data.get("tool_response", [])
+    session_id = hook_data.get("session_id", "unknown")
+
     error_info = detect_browser_error(tool_response)
 
     if error_info["detected"]:
@@ -72,8 +73,7 @@ def main() -> int:
 
         for hook_data in process_stdin():
             response = process_hook_event(hook_data)
-            print(json.dumps(response))
-            sys.stdout.flush()
+            write_response(response)
 
         return 0
 
@@ -82,7 +82,7 @@ def main() -> int:
 
     except Exception as e:
         log_error(str(e))
-        print(json.dumps({"continue": True, "suppressOutput": False}))
+        write_response(CONTINUE)
         return 0
 
 
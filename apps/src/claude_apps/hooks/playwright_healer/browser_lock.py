@@ -0,0 +1,206 @@
+"""Targeted recovery of Chromium profile locks.
+
+Chromium marks a profile directory as in use with a ``SingletonLock``
+symlink whose target is ``<hostname>-<pid>``. Instead of killing every
+mcp-chromium process and deleting every lock, recovery reads the lock of
+the profile named in the error and checks that one PID through /proc:
+
+- no such process, or a PID reused by something other than a browser on
+  this profile: the lock is stale and only it is removed
+- the browser is alive but orphaned (the MCP server that launched it has
+  exited): it is terminated and its lock removed
+- the browser is alive and its MCP server still runs: it belongs to
+  another session and is left alone
+- the lock was written on another host: the owner cannot be inspected
+  from here, the lock is removed as before
+"""
+
+import glob
+import os
+import re
+import signal
+import socket
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+LOCK_NAME = "SingletonLock"
+
+# Profile directories searched when the error does not name one
+DEFAULT_PROFILE_DIRS = [
+    "/usr/local/share/playwright/mcp-chromium-*",
+    "/tmp/.org.chromium.Chromium.*",
+]
+
+DEFAULT_GRACE_SECONDS = 2.0
+
+# "Browser is already in use for /path/to/profile, use --isolated ..."
+_PROFILE_IN_MESSAGE = re.compile(r"in use for (/[^\s,;'\"]+)")
+
+
+@dataclass(frozen=True)
+class LockOwner:
+    """Process recorded in a profile's SingletonLock."""
+
+    host: str
+    pid: int
+
+
+@dataclass
+class LockRecovery:
+    """What recovery found and did for one profile.
+
+    Attributes:
+        profile_dir: Profile directory
+        status: no_lock, foreign_host, dead_owner, pid_reused,
+            orphaned_owner or in_use
+        owner_pid: PID recorded in the lock
+        terminated: The owner was terminated
+        lock_removed: The lock was removed
+    """
+
+    profile_dir: str
+    status: str
+    owner_pid: Optional[int] = None
+    terminated: bool = False
+    lock_removed: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def profile_dir_from_message(message: Optional[str]) -> Optional[Path]:
+    """Profile directory named in a "Browser is already in use" error."""
+    match = _PROFILE_IN_MESSAGE.search(message or "")
+    return Path(match.group(1)) if match else None
+
+
+def candidate_profiles(
+    message: Optional[str], profile_dirs: Iterable[str] = DEFAULT_PROFILE_DIRS
+) -> List[Path]:
+    """Profiles to recover: the one in the error, else the configured ones."""
+    named = profile_dir_from_message(message)
+    if named is not None:
+        return [named]
+    found: List[Path] = []
+    for pattern in profile_dirs:
+        found.extend(Path(path) for path in sorted(glob.glob(pattern)))
+    return found
+
+
+def read_lock(profile_dir: Path) -> Optional[LockOwner]:
+    """Owner recorded in a profile's SingletonLock, or None if there is none."""
+    try:
+        target = os.readlink(profile_dir / LOCK_NAME)
+    except OSError:
+        return None
+    host, _, pid = target.rpartition("-")
+    if not host or not pid.isdigit():
+        return None
+    return LockOwner(host, int(pid))
+
+
+def proc_cmdline(pid: int) -> Optional[List[str]]:
+    """Arguments of a running process, or None if it does not exist."""
+    try:
+        raw = Path(f"/proc/{pid}/cmdline").read_bytes()
+    except OSError:
+        return None
+    return [arg.decode(errors="replace") for arg in raw.split(b"\0") if arg]
+
+
+def proc_ppid(pid: int) -> Optional[int]:
+    """Parent PID of a running process, or None if it does not exist."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+    # The command name in parentheses may contain spaces; fields follow it
+    fields = stat[stat.rfind(")") + 2 :].split()
+    return int(fields[1]) if len(fields) > 1 else None
+
+
+def owns_profile(cmdline: List[str], profile_dir: Path) -> bool:
+    """Whether a command line is a browser running on profile_dir."""
+    if not cmdline or "chrom" not in os.path.basename(cmdline[0]).lower():
+        return False
+    expected = os.path.realpath(profile_dir)
+    for arg in cmdline[1:]:
+        if arg.startswith("--user-data-dir="):
+            return os.path.realpath(arg.split("=", 1)[1]) == expected
+    return False
+
+
+def is_orphaned(pid: int) -> bool:
+    """Whether the process that launched pid has exited (pid was reparented)."""
+    ppid = proc_ppid(pid)
+    return ppid is not None and ppid <= 1
+
+
+def terminate(pid: int, grace_seconds: float = DEFAULT_GRACE_SECONDS) -> bool:
+    """SIGTERM pid, then SIGKILL if it outlives the grace period."""
+    try:
+        os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + grace_seconds
+        while time.monotonic() < deadline:
+            if proc_cmdline(pid) is None:
+                return True
+            time.sleep(0.05)
+        os.kill(pid, signal.SIGKILL)
+        return True
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False
+
+
+def _remove_lock(profile_dir: Path) -> bool:
+    try:
+        (profile_dir / LOCK_NAME).unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def recover_profile(
+    profile_dir: Path,
+    grace_seconds: float = DEFAULT_GRACE_SECONDS,
+    hostname: Optional[str] = None,
+) -> LockRecovery:
+    """Release a profile held by a stale owner; never touch a live session's browser."""
+    owner = read_lock(profile_dir)
+    if owner is None:
+        return LockRecovery(str(profile_dir), "no_lock")
+
+    result = LockRecovery(str(profile_dir), "dead_owner", owner.pid)
+    if owner.host != (hostname or socket.gethostname()):
+        result.status = "foreign_host"
+    else:
+        cmdline = proc_cmdline(owner.pid)
+        if cmdline is not None:
+            if not owns_profile(cmdline, profile_dir):
+                result.status = "pid_reused"
+            elif is_orphaned(owner.pid):
+                result.status = "orphaned_owner"
+                result.terminated = terminate(owner.pid, grace_seconds)
+                if not result.terminated:
+                    return result
+            else:
+                result.status = "in_use"
+                return result
+
+    result.lock_removed = _remove_lock(profile_dir)
+    return result
+
+
+def recover_browser_locks(
+    message: Optional[str],
+    profile_dirs: Iterable[str] = DEFAULT_PROFILE_DIRS,
+    grace_seconds: float = DEFAULT_GRACE_SECONDS,
+) -> List[LockRecovery]:
+    """Recover the profile named in an error (or each configured profile)."""
+    return [
+        recover_profile(profile, grace_seconds)
+        for profile in candidate_profiles(message, profile_dirs)
+    ]
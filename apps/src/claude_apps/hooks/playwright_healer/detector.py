@@ -1,6 +1,23 @@
-from typing import Dict, Any
+"""Browser error detection in Playwright MCP tool responses.
+
+All configured patterns are compiled into one regex, cached per version
+of config.yml. Only bounded regions of a response are scanned: error
+fields, and the first and last scan_window characters of each text (MCP
+reports errors at the start of a result, tracebacks end it), so
+detection cost does not grow with snapshot size.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from claude_apps.shared.config_helper import get_config_path, get_snapshot_key
+
 from .paths import get_config
 
+# Characters scanned at each end of a long response text
+DEFAULT_SCAN_WINDOW = 4096
+
 
 def is_playwright_tool(tool_name: str) -> bool:
     """Check if the tool is a Playwright MCP tool."""
@@ -34,6 +51,106 @@ def extract_response_text(tool_response: Any) -> str:
     return str(tool_response)
 
 
+def _bounded(text: str, window: int) -> List[str]:
+    if len(text) <= 2 * window:
+        return [text]
+    return [text[:window], text[-window:]]
+
+
+def response_regions(tool_response: Any, window: int = DEFAULT_SCAN_WINDOW) -> List[str]:
+    """Parts of a tool response that can carry an error message.
+
+    Mirrors extract_response_text, but every text is cut to its first and
+    last window characters instead of being joined in full.
+    """
+    if isinstance(tool_response, str):
+        return _bounded(tool_response, window)
+
+    if isinstance(tool_response, dict):
+        if "text" in tool_response:
+            return _bounded(str(tool_response["text"]), window)
+        if "error" in tool_response:
+            return _bounded(str(tool_response["error"]), window)
+        if "stdout" in tool_response or "stderr" in tool_response:
+            return _bounded(str(tool_response.get("stdout", "")), window) + _bounded(
+                str(tool_response.get("stderr", "")), window
+            )
+        return _bounded(str(tool_response), window)
+
+    if isinstance(tool_response, list):
+        regions: List[str] = []
+        for item in tool_response:
+            if isinstance(item, dict):
+                if item.get("type") == "text":
+                    regions += _bounded(str(item.get("text", "")), window)
+                elif "error" in item:
+                    regions += _bounded(str(item["error"]), window)
+        return regions
+
+    return _bounded(str(tool_response), window)
+
+
+@dataclass(frozen=True)
+class ErrorMatcher:
+    """Configured error patterns compiled into one regex.
+
+    Regions are lowercased and matched against the lowercased patterns,
+    the same comparison as ``pattern.lower() in text.lower()`` (and several
+    times faster than an IGNORECASE alternation).
+    """
+
+    patterns: Tuple[str, ...] = ()
+    scan_window: int = DEFAULT_SCAN_WINDOW
+    regex: Optional[re.Pattern] = field(default=None, compare=False)
+
+    @classmethod
+    def compile(
+        cls, patterns: Iterable[str], scan_window: int = DEFAULT_SCAN_WINDOW
+    ) -> "ErrorMatcher":
+        patterns = tuple(p for p in patterns if p)
+        regex = None
+        if patterns:
+            regex = re.compile("|".join(re.escape(p.lower()) for p in patterns))
+        return cls(patterns, scan_window, regex)
+
+    def search(self, regions: Iterable[str]) -> Optional[str]:
+        """The first configured pattern (in config order) found in any region."""
+        if self.regex is None:
+            return None
+        hits = [lowered for lowered in map(str.lower, regions) if self.regex.search(lowered)]
+        if not hits:
+            return None
+        # The alternation reports the leftmost match; an error response is
+        # rare, so resolve config-order precedence only then
+        for pattern in self.patterns:
+            if any(pattern.lower() in lowered for lowered in hits):
+                return pattern
+        return None
+
+
+_matcher: Optional[Tuple[Any, ErrorMatcher]] = None
+
+
+def get_matcher() -> ErrorMatcher:
+    """The compiled matcher, rebuilt only when config.yml changes."""
+    global _matcher
+    try:
+        config_path = get_config_path()
+        key: Any = (str(config_path), get_snapshot_key(config_path))
+    except OSError:
+        key = None
+    if key is not None and _matcher is not None and _matcher[0] == key:
+        return _matcher[1]
+
+    config = get_config()
+    matcher = ErrorMatcher.compile(
+        config.get("error_patterns", []),
+        int(config.get("scan_window", DEFAULT_SCAN_WINDOW)),
+    )
+    _matcher = (key, matcher) if key is not None else None
+    return matcher
+
+
 def categorize_error(pattern: str) -> str:
     """Categorize error for appropriate recovery strategy."""
     pattern_lower = pattern.lower()
@@ -59,21 +176,16 @@ def detect_browser_error(tool_response: Any) -> Dict[str, Any]:
             - message: str (full error message)
             - error_type: str (categorized error type)
     """
-    config = get_config()
-    error_patterns = config.get("error_patterns", [])
-
-    response_text = extract_response_text(tool_response)
-
-    for pattern in error_patterns:
-        if pattern.lower() in response_text.lower():
-            error_type = categorize_error(pattern)
-
-            return {
-                "detected": True,
-                "pattern": pattern,
-                "message": response_text[:500],
-                "error_type": error_type
-            }
+    matcher = get_matcher()
+    pattern = matcher.search(response_regions(tool_response, matcher.scan_window))
+
+    if pattern is not None:
+        return {
+            "detected": True,
+            "pattern": pattern,
+            "message": extract_response_text(tool_response)[:500],
+            "error_type": categorize_error(pattern)
+        }
 
     return {
         "detected": False,
@@ -1,24 +1,23 @@
-import subprocess
 import time
-import os
-import json
-import glob
-from typing import Dict, Any
-from pathlib import Path
-from .paths import get_config, get_state_path
+from typing import Dict, Any, Optional
+
+from claude_apps.shared.state_store import get_state_store
+
+from .browser_lock import DEFAULT_GRACE_SECONDS, DEFAULT_PROFILE_DIRS, recover_browser_locks
+from .paths import get_config
 from .logger import log_healing_event
 
+# Recovery state lives in the shared state store, one key per session
+STATE_NAMESPACE = "playwright_healer"
+# Sessions rarely outlive a day; their recovery state expires after that
+STATE_TTL_SECONDS = 86400
 
-def get_recovery_state(session_id: str) -> Dict[str, Any]:
-    """Get current recovery state for session."""
-    state_path = get_state_path(session_id)
 
-    if state_path.exists():
-        try:
-            return json.loads(state_path.read_text())
-        except Exception:
-            pass
+def _state_key(session_id: str) -> str:
+    return f"recovery:{session_id}"
+
 
+def _default_state() -> Dict[str, Any]:
     return {
         "attempt_count": 0,
         "last_attempt_time": 0,
@@ -26,18 +25,21 @@ def get_recovery_state(session_id: str) -> Dict[str, Any]:
     }
 
 
+def get_recovery_state(session_id: str) -> Dict[str, Any]:
+    """Get current recovery state for session."""
+    try:
+        state = get_state_store().get(STATE_NAMESPACE, _state_key(session_id))
+    except Exception:
+        state = None
+    return {**_default_state(), **state} if isinstance(state, dict) else _default_state()
+
+
 def save_recovery_state(session_id: str, state: Dict[str, Any]) -> None:
     """Save recovery state for session."""
-    state_path = get_state_path(session_id)
-    state_path.parent.mkdir(parents=True, exist_ok=True)
-    state_path.write_text(json.dumps(state, indent=2))
+    get_state_store().set(STATE_NAMESPACE, _state_key(session_id), state, ttl=STATE_TTL_SECONDS)
 
 
-def should_attempt_recovery(session_id: str, error_type: str) -> bool:
-    """Check if recovery should be attempted based on cooldown and max attempts."""
-    config = get_config()
-    state = get_recovery_state(session_id)
-
+def _may_attempt(state: Dict[str, Any], error_type: str, config: Dict[str, Any]) -> bool:
     max_attempts = config.get("max_recovery_attempts", 3)
     cooldown = config.get("recovery_cooldown_seconds", 5)
 
@@ -54,105 +56,112 @@ def should_attempt_recovery(session_id: str, error_type: str) -> bool:
     return True
 
 
-def kill_stale_browser_processes() -> Dict[str, Any]:
-    """Kill any stale chromium processes that may be holding locks."""
-    try:
-        result = subprocess.run(
-            ["pkill", "-f", "mcp-chromium"],
-            capture_output=True,
-            timeout=10
-        )
-
-        return {
-            "success": True,
-            "action": "kill_stale_processes",
-            "message": "Killed stale chromium processes"
-        }
-    except subprocess.TimeoutExpired:
-        return {
-            "success": False,
-            "action": "kill_stale_processes",
-            "error": "Timeout killing processes"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "action": "kill_stale_processes",
-            "error": str(e)
-        }
-
+def should_attempt_recovery(session_id: str, error_type: str) -> bool:
+    """Check if recovery should be attempted based on cooldown and max attempts."""
+    return _may_attempt(get_recovery_state(session_id), error_type, get_config())
 
-def remove_browser_lock_files() -> Dict[str, Any]:
-    """Remove browser lock files that may be causing conflicts."""
-    lock_patterns = [
-        "/usr/local/share/playwright/mcp-chromium-*/SingletonLock",
-        "/tmp/.org.chromium.Chromium.*/SingletonLock",
-    ]
 
-    removed = []
+def claim_recovery_attempt(session_id: str, error_type: str) -> bool:
+    """Check and record a recovery attempt as one compare-and-set.
 
+    Concurrent tool calls hitting the same error cannot both pass the
+    cooldown, and every attempt is counted against max_recovery_attempts.
+    """
+    config = get_config()
+    store = get_state_store()
+    key = _state_key(session_id)
+
+    while True:
+        entry = store.get_entry(STATE_NAMESPACE, key)
+        state = _default_state()
+        version: Optional[int] = None
+        if entry is not None:
+            version = entry.version
+            if isinstance(entry.value, dict):
+                state.update(entry.value)
+
+        if not _may_attempt(state, error_type, config):
+            return False
+
+        state["attempt_count"] += 1
+        state["last_attempt_time"] = time.time()
+        state["last_error_type"] = error_type
+        if store.compare_and_set(STATE_NAMESPACE, key, state, version, ttl=STATE_TTL_SECONDS):
+            return True
+
+
+def release_browser_locks(message: Optional[str]) -> Dict[str, Any]:
+    """Release profile locks held by stale browsers.
+
+    Only the profile named in the error (or, failing that, each configured
+    profile directory) is checked, and only a lock whose owner is dead or
+    orphaned is released; other sessions' browsers are never killed.
+    """
+    config = get_config()
     try:
-        for lock_pattern in lock_patterns:
-            for lock_file in glob.glob(lock_pattern):
-                try:
-                    os.remove(lock_file)
-                    removed.append(lock_file)
-                except Exception:
-                    pass
-
-        return {
-            "success": True,
-            "action": "remove_lock_files",
-            "message": f"Removed {len(removed)} lock files",
-            "files_removed": removed
-        }
+        recoveries = recover_browser_locks(
+            message,
+            config.get("profile_dirs", DEFAULT_PROFILE_DIRS),
+            config.get("terminate_grace_seconds", DEFAULT_GRACE_SECONDS),
+        )
     except Exception as e:
         return {
             "success": False,
-            "action": "remove_lock_files",
+            "action": "release_browser_locks",
             "error": str(e)
         }
 
+    released = [r for r in recoveries if r.lock_removed]
+    terminated = [r.owner_pid for r in recoveries if r.terminated]
+    held = [r for r in recoveries if r.status != "no_lock" and not r.lock_removed]
+    result: Dict[str, Any] = {
+        "success": not held,
+        "action": "release_browser_locks",
+        "profiles": [r.to_dict() for r in recoveries],
+    }
+    if held:
+        result["error"] = "; ".join(
+            f"{r.profile_dir} held by live browser pid {r.owner_pid} ({r.status})" for r in held
+        )
+    else:
+        result["message"] = (
+            f"Released {len(released)} stale lock(s), terminated {len(terminated)} orphaned browser(s)"
+        )
+    return result
+
 
 def attempt_recovery(session_id: str, tool_name: str, error_info: Dict[str, Any]) -> Dict[str, Any]:
     """
     Attempt to recover from browser error.
 
     Recovery strategies based on error type:
-    1. browser_lock: Kill stale processes, remove lock files
+    1. browser_lock: Release the named profile if its owner is stale
     2. browser_closed: Signal to reinitialize browser
-    3. connection_lost: Kill processes and clean up
+    3. connection_lost: Release profiles left locked by stale browsers
     """
     error_type = error_info.get("error_type", "unknown")
 
-    if not should_attempt_recovery(session_id, error_type):
+    if not claim_recovery_attempt(session_id, error_type):
         return {
             "success": False,
             "action": "skipped",
             "error": "Max recovery attempts reached or cooldown active"
         }
 
-    state = get_recovery_state(session_id)
-    state["attempt_count"] += 1
-    state["last_attempt_time"] = time.time()
-    state["last_error_type"] = error_type
-    save_recovery_state(session_id, state)
-
     if error_type == "browser_lock":
-        lock_result = remove_browser_lock_files()
-        kill_result = kill_stale_browser_processes()
+        lock_result = release_browser_locks(error_info.get("message"))
 
-        if lock_result["success"] or kill_result["success"]:
+        if lock_result["success"]:
             return {
                 "success": True,
                 "action": "browser_lock_recovery",
-                "message": f"Lock files: {lock_result.get('message', 'N/A')}, Processes: {kill_result.get('message', 'N/A')}"
+                "message": lock_result["message"]
             }
         else:
             return {
                 "success": False,
                 "action": "browser_lock_recovery",
-                "error": f"Lock removal: {lock_result.get('error', 'N/A')}, Process kill: {kill_result.get('error', 'N/A')}"
+                "error": lock_result["error"]
             }
 
     elif error_type == "browser_closed":
@@ -163,12 +172,12 @@ def attempt_recovery(session_id: str, tool_name: str, error_info: Dict[str, Any]
         }
 
     elif error_type == "connection_lost":
-        kill_result = kill_stale_browser_processes()
+        lock_result = release_browser_locks(error_info.get("message"))
 
         return {
             "success": True,
             "action": "connection_recovery",
-            "message": f"Connection recovery attempted. {kill_result.get('message', '')}"
+            "message": f"Connection recovery attempted. {lock_result.get('message', '')}"
         }
 
     else:
@@ -1,42 +1,18 @@
+from __future__ import annotations
+
 import sys
-import json
-import structlog
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Optional
 from datetime import datetime
 
-from .paths import get_config, get_log_path, get_error_log_path
-
-
-_logger = None
-
-
-def _read_existing_entries(file_path: Path) -> List[Dict[str, Any]]:
-    """Read existing JSON array from file, returning empty list on any error."""
-    if not file_path.exists():
-        return []
-
-    try:
-        content = file_path.read_text(encoding='utf-8').strip()
-        if not content:
-            return []
-
-        data = json.loads(content)
-        return data if isinstance(data, list) else [data]
-    except (json.JSONDecodeError, IOError):
-        return []
+from claude_apps.shared.event_log import append_record
 
+from .paths import get_config, get_log_path, get_error_log_path
 
-def _write_json_array_entry(file_path: Path, entry: Dict[str, Any]) -> None:
-    """Append an entry to a JSON array file with pretty-printing."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+if TYPE_CHECKING:
+    import structlog
 
-    entries = _read_existing_entries(file_path)
-    entries.append(entry)
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(entries, f, ensure_ascii=False, indent=2)
-        f.write('\n')
+_logger = None
 
 
 def setup_logger() -> Optional[structlog.BoundLogger]:
@@ -51,6 +27,8 @@ def setup_logger() -> Optional[structlog.BoundLogger]:
     if not config.get("log_enabled", True):
         return None
 
+    import structlog
+
     structlog.configure(
         processors=[
             structlog.stdlib.add_log_level,
@@ -91,7 +69,7 @@ def log_healing_event(
         }
 
         log_path = get_log_path(session_id, event_type)
-        _write_json_array_entry(log_path, log_entry)
+        append_record(log_path, log_entry)
 
     except Exception as e:
         sys.stderr.write(f"[playwright_healer] Failed to log healing event: {e}\n")
@@ -112,7 +90,7 @@ def log_error(error_message: str, session_id: str = "unknown", **context) -> Non
         }
 
         error_path = get_error_log_path(session_id)
-        _write_json_array_entry(error_path, log_entry)
+        append_record(error_path, log_entry)
 
     except Exception as e:
         sys.stderr.write(f"[playwright_healer] Failed to log error: {e}\n")
@@ -4,16 +4,21 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from claude_apps.shared.config_helper import get_hook_config, resolve_log_path
+from claude_apps.shared.config_helper import get_hook_config, get_validated_config, resolve_log_path
 
-from .schemas import PlaywrightHealerConfig
+
+def _validate(loaded: dict[str, Any]) -> dict[str, Any]:
+    from .schemas import PlaywrightHealerConfig
+
+    return PlaywrightHealerConfig(**loaded).model_dump()
 
 
 def get_config() -> dict[str, Any]:
     """Load and validate hook configuration from global config.yml."""
     loaded = get_hook_config("playwright_healer")
-    validated = PlaywrightHealerConfig(**loaded)
-    return validated.model_dump()
+    return get_validated_config(
+        "playwright_healer", loaded, _validate, Path(__file__).with_name("schemas.py")
+    )
 
 
 def get_log_base() -> Path:
@@ -25,17 +30,12 @@ def get_log_path(session_id: str, event_type: str) -> Path:
     """Get path for log file."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_dir = get_log_base() / session_id / event_type
-    return log_dir / f"{timestamp}.json"
+    return log_dir / f"{timestamp}.ndjson"
 
 
 def get_error_log_path(session_id: str) -> Path:
     """Get path for error log file."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_dir = get_log_base() / session_id / "errors"
-    return log_dir / f"{timestamp}.json"
-
+    return log_dir / f"{timestamp}.ndjson"
 
-def get_state_path(session_id: str) -> Path:
-    """Get path for recovery state file."""
-    state_dir = get_log_base() / session_id / "state"
-    return state_dir / "recovery_state.json"
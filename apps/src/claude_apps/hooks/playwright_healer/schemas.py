@@ -41,6 +41,24 @@ class PlaywrightHealerConfig(BaseModel):
         ],
         description="Patterns to detect browser errors in tool responses",
     )
+    scan_window: int = Field(
+        default=4096,
+        ge=256,
+        description="Characters scanned at each end of a response text for error patterns",
+    )
+    profile_dirs: list[str] = Field(
+        default=[
+            "/usr/local/share/playwright/mcp-chromium-*",
+            "/tmp/.org.chromium.Chromium.*",
+        ],
+        description="Browser profile directory globs checked when an error names no profile",
+    )
+    terminate_grace_seconds: float = Field(
+        default=2.0,
+        ge=0,
+        le=10,
+        description="Seconds an orphaned browser gets to exit after SIGTERM before SIGKILL",
+    )
     recoverable_tools: list[str] = Field(
         default=[],
         description="Tool names that support recovery (empty = all playwright tools)",
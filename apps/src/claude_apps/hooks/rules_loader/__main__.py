@@ -1,11 +1,15 @@
 import sys
-import json
 import time
-from .reader import process_stdin
-from .loader import load_rules, filter_rules_for_reinforcement
-from .formatter import format_to_hook_json
+from pathlib import Path
+
+from claude_apps.shared.hook_protocol import write_response
+
+from .bundle import load_bundle
+from .formatter import format_context_json, format_to_hook_json
 from .logger import log_directive_event, log_error, log_summary, setup_logger
-from .paths import get_rules_path, get_config
+from .paths import get_bundle_path, get_config, get_rules_path, get_session_dir
+from .reader import process_stdin
+from .reinforcement import ReinforcementPlan, reinforce
 
 
 def main() -> int:
@@ -33,46 +37,69 @@ def main() -> int:
 
             start_time = time.time()
 
-            # Load all rules from directory
-            all_rules = load_rules(rules_path)
+            # Load all rules from the compiled bundle (rebuilt only on change)
+            bundle = load_bundle(Path(rules_path), hook_config, get_bundle_path(rules_path))
 
             # Filter rules based on event and reinforcement config
-            rules = filter_rules_for_reinforcement(all_rules, hook_config, event_name)
+            rules = bundle.select(hook_config, event_name, hook_data)
+
+            # Skip rules the session already holds unchanged
+            plan = ReinforcementPlan(inject=rules)
+            if rules:
+                try:
+                    plan = reinforce(get_session_dir(session_id), rules, hook_config, event_name)
+                except OSError as e:
+                    log_error(
+                        f"Reinforcement state unavailable: {e}",
+                        session_id=session_id,
+                        event_name=event_name,
+                    )
+            rules = plan.inject
 
             load_time_ms = (time.time() - start_time) * 1000
 
-            if not rules:
+            if not rules and not plan.reminder:
                 # No rules to inject (either none found or filtered out)
                 if event_name == "UserPromptSubmit":
                     # Silent exit for UserPromptSubmit when no reinforcement configured
-                    print(json.dumps({"hookSpecificOutput": {"hookEventName": event_name, "additionalContext": ""}}))
-                    sys.stdout.flush()
+                    write_response(
+                        {
+                            "hookSpecificOutput": {
+                                "hookEventName": event_name,
+                                "additionalContext": "",
+                            }
+                        }
+                    )
                     continue
                 else:
                     print(f"No rules found in {rules_path}", file=sys.stderr)
 
-                log_directive_event(
-                    session_id=session_id,
-                    event_name=event_name,
-                    directive_count=0,
-                    directives=[],
-                    load_time_ms=load_time_ms,
-                    source_directory=rules_path
+            log_directive_event(
+                session_id=session_id,
+                event_name=event_name,
+                directive_count=len(rules),
+                directives=rules,
+                load_time_ms=load_time_ms,
+                source_directory=rules_path,
+                reminded=plan.reminded,
+                injected_tokens=plan.injected_tokens,
+                saved_tokens=plan.saved_tokens,
+            )
+
+            if rules == bundle.rules and not plan.reminder:
+                # Every rule, in order: the bundle has them joined already
+                output = format_context_json(bundle.context, event_name, pretty=False)
+            else:
+                output = format_to_hook_json(
+                    rules, event_name, pretty=False, reminder=plan.reminder
                 )
 
-            if rules:
-                log_directive_event(
-                    session_id=session_id,
-                    event_name=event_name,
-                    directive_count=len(rules),
-                    directives=rules,
-                    load_time_ms=load_time_ms,
-                    source_directory=rules_path
-                )
-
-            output = format_to_hook_json(rules, event_name, pretty=False)
-
-            log_summary(session_id=session_id, event_name=event_name, output_size=len(output), pretty=False)
+            log_summary(
+                session_id=session_id,
+                event_name=event_name,
+                output_size=len(output),
+                pretty=False,
+            )
 
             print(output)
             sys.stdout.flush()
@@ -86,7 +113,9 @@ def main() -> int:
         log_error(str(e), session_id=session_id, event_name=event_name)
         print(f"Fatal error: {e}", file=sys.stderr)
         # Use captured event_name instead of hardcoded "Unknown"
-        print(json.dumps({"hookSpecificOutput": {"hookEventName": event_name, "additionalContext": ""}}))
+        write_response(
+            {"hookSpecificOutput": {"hookEventName": event_name, "additionalContext": ""}}
+        )
         return 0
 
 
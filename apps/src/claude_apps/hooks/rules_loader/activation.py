@@ -0,0 +1,193 @@
+"""Relevance-scoped rule activation on UserPromptSubmit.
+
+A rule may declare when it is relevant, either under
+``hooks.rules_loader.rules.<name>.activation`` in config.yml or in YAML
+frontmatter at the top of its markdown file (config wins)::
+
+    ---
+    activation:
+      keywords: [python, pytest, uv]     # whole words in the prompt
+      patterns: ['\\bpip install\\b']     # regular expressions on the prompt
+      paths: ["*/apps/*"]                # globs matched against cwd
+      stacks: [python]                   # project stack detected in cwd
+    ---
+
+A rule with conditions is reinforced when any of them matches and ignores
+its ``reinforce`` flag; rules without conditions keep the flag.
+
+Every distinct keyword and pattern is compiled on its own. Those without
+groups are also joined into one alternation that serves as a prefilter:
+a prompt that matches none of them is scanned once however many rules
+there are. After a hit each alternative is confirmed with its own regex,
+so overlapping keywords all count. Patterns with groups (which may hold
+backreferences) stay out of the prefilter and are always searched.
+"""
+
+import fnmatch
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+CONDITION_KEYS = ("keywords", "patterns", "paths", "stacks")
+
+# Files whose presence in cwd marks a project stack
+STACK_MARKERS = {
+    "python": ("pyproject.toml", "setup.py", "setup.cfg", "requirements.txt", "uv.lock"),
+    "node": ("package.json",),
+    "go": ("go.mod",),
+    "rust": ("Cargo.toml",),
+    "java": ("pom.xml", "build.gradle", "build.gradle.kts"),
+    "docker": ("Dockerfile", "docker-compose.yml", "docker-compose.yaml", "compose.yml"),
+    "taskfile": ("Taskfile.yml", "Taskfile.yaml"),
+    "terraform": ("main.tf",),
+}
+
+
+def split_frontmatter(text: str) -> Tuple[Dict[str, Any], str]:
+    """Split YAML frontmatter off a rule file.
+
+    Returns:
+        (frontmatter mapping, remaining text); an empty mapping when the
+        file has no frontmatter or it is not a mapping
+    """
+    if not text.startswith("---"):
+        return {}, text
+    lines = text.split("\n")
+    if lines[0].strip() != "---":
+        return {}, text
+    for end in range(1, len(lines)):
+        if lines[end].strip() == "---":
+            break
+    else:
+        return {}, text
+
+    # Only rules that carry frontmatter pay for PyYAML
+    import yaml
+
+    try:
+        meta = yaml.safe_load("\n".join(lines[1:end]))
+    except yaml.YAMLError:
+        meta = None
+    return (meta if isinstance(meta, dict) else {}), "\n".join(lines[end + 1 :])
+
+
+def normalize_activation(settings: Any) -> Optional[Dict[str, Tuple[str, ...]]]:
+    """Activation conditions as tuples of strings, or None if there are none."""
+    if not isinstance(settings, Mapping):
+        return None
+    conditions = {}
+    for key in CONDITION_KEYS:
+        values = settings.get(key) or ()
+        if isinstance(values, str):
+            values = (values,)
+        conditions[key] = tuple(str(v) for v in values)
+    return conditions if any(conditions.values()) else None
+
+
+def rule_activation(
+    rule: Mapping[str, Any], hook_config: Mapping[str, Any]
+) -> Optional[Dict[str, Tuple[str, ...]]]:
+    """A rule's activation conditions, from config or else frontmatter."""
+    settings = (hook_config.get("rules") or {}).get(rule.get("name", "")) or {}
+    configured = normalize_activation(settings.get("activation"))
+    if configured is not None:
+        return configured
+    return normalize_activation(rule.get("activation"))
+
+
+def detect_stacks(cwd: Optional[str]) -> FrozenSet[str]:
+    """Stacks whose marker files are present in cwd."""
+    if not cwd:
+        return frozenset()
+    try:
+        names = set(os.listdir(cwd))
+    except OSError:
+        return frozenset()
+    return frozenset(
+        stack for stack, markers in STACK_MARKERS.items() if names.intersection(markers)
+    )
+
+
+@dataclass
+class RuleMatcher:
+    """Activation conditions of a rule set, compiled once."""
+
+    # Rule names without conditions; the reinforce flag decides for them
+    unconditional: FrozenSet[str] = frozenset()
+    # Alternation of prefiltered_checks; a prompt it misses matches none of them
+    prompt_prefilter: Optional[re.Pattern] = None
+    prefiltered_checks: List[Tuple[re.Pattern, FrozenSet[str]]] = field(default_factory=list)
+    # Patterns that cannot join the alternation, searched on every prompt
+    prompt_checks: List[Tuple[re.Pattern, FrozenSet[str]]] = field(default_factory=list)
+    path_globs: List[Tuple[re.Pattern, str]] = field(default_factory=list)
+    stack_rules: Dict[str, FrozenSet[str]] = field(default_factory=dict)
+
+    @classmethod
+    def compile(
+        cls, rules: List[Mapping[str, Any]], hook_config: Mapping[str, Any]
+    ) -> "RuleMatcher":
+        """Build a matcher for rules under a hook config.
+
+        Raises:
+            re.error: If an activation pattern is not a valid regex
+        """
+        unconditional = set()
+        alternatives: Dict[str, set] = {}
+        path_globs = []
+        stacks: Dict[str, set] = {}
+        for rule in rules:
+            name = rule.get("name", "")
+            conditions = rule_activation(rule, hook_config)
+            if conditions is None:
+                unconditional.add(name)
+                continue
+            for keyword in conditions["keywords"]:
+                alternatives.setdefault(rf"\b{re.escape(keyword)}\b", set()).add(name)
+            for pattern in conditions["patterns"]:
+                alternatives.setdefault(pattern, set()).add(name)
+            for glob in conditions["paths"]:
+                path_globs.append((re.compile(fnmatch.translate(glob)), name))
+            for stack in conditions["stacks"]:
+                stacks.setdefault(stack.lower(), set()).add(name)
+
+        prefiltered = []
+        always = []
+        for alternative, names in alternatives.items():
+            regex = re.compile(alternative, re.IGNORECASE)
+            (always if regex.groups else prefiltered).append((regex, frozenset(names)))
+        prefilter = None
+        if prefiltered:
+            try:
+                prefilter = re.compile(
+                    "|".join(f"(?:{regex.pattern})" for regex, _ in prefiltered), re.IGNORECASE
+                )
+            except re.error:
+                # e.g. inline flags that are only valid at the start of a pattern
+                always.extend(prefiltered)
+                prefiltered = []
+        return cls(
+            unconditional=frozenset(unconditional),
+            prompt_prefilter=prefilter,
+            prefiltered_checks=prefiltered,
+            prompt_checks=always,
+            path_globs=path_globs,
+            stack_rules={stack: frozenset(names) for stack, names in stacks.items()},
+        )
+
+    def active(self, prompt: str = "", cwd: Optional[str] = None) -> FrozenSet[str]:
+        """Names of conditional rules whose conditions match."""
+        matched: set = set()
+        if prompt:
+            checks = list(self.prompt_checks)
+            if self.prompt_prefilter is not None and self.prompt_prefilter.search(prompt):
+                checks.extend(self.prefiltered_checks)
+            for regex, names in checks:
+                if not names <= matched and regex.search(prompt):
+                    matched.update(names)
+        if cwd:
+            matched.update(name for regex, name in self.path_globs if regex.match(cwd))
+        if self.stack_rules:
+            for stack in detect_stacks(cwd):
+                matched.update(self.stack_rules.get(stack, ()))
+        return frozenset(matched)
@@ -0,0 +1,204 @@
+"""Compiled rules bundle, cached under .data/cache/rules_loader.
+
+Every SessionStart and UserPromptSubmit used to glob the rules directory,
+read each markdown file and join the result again. A bundle holds:
+
+- every rule as read (name, content without frontmatter, activation,
+  content digest), with the (mtime, size) of its file
+- the SessionStart context, already joined
+- the rules that pass the static reinforcement filter (reinforce flag,
+  no activation conditions), which depends on the hook config
+
+A bundle is valid while the rules directory listing (names, mtimes and
+sizes, from one scandir) and the digest of the hook config match. Then
+loading it is one read of one file. Otherwise only files whose mtime or
+size changed are read again; a config change alone re-reads none.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .loader import filter_rules_for_reinforcement, get_matcher, read_rule
+from .reinforcement import rule_digest
+
+BUNDLE_VERSION = 1
+
+_memo: Dict[str, Tuple[Tuple, "RulesBundle"]] = {}
+
+
+@dataclass
+class RulesBundle:
+    """Rules of one directory, compiled for one hook config."""
+
+    rules: List[Dict[str, Any]] = field(default_factory=list)
+    # filename -> [mtime_ns, size] of the file each rule came from
+    files: Dict[str, List[int]] = field(default_factory=dict)
+    context: str = ""
+    reinforced: List[str] = field(default_factory=list)
+    config_digest: str = ""
+
+    def select(
+        self,
+        hook_config: Mapping[str, Any],
+        event_name: str,
+        hook_data: Optional[Mapping[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Rules for an event; same result as filter_rules_for_reinforcement."""
+        if event_name == "SessionStart":
+            return self.rules
+        hook_data = hook_data or {}
+        active = get_matcher(self.rules, hook_config).active(
+            hook_data.get("prompt") or "", hook_data.get("cwd")
+        )
+        reinforced = set(self.reinforced)
+        return [r for r in self.rules if r["name"] in reinforced or r["name"] in active]
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": BUNDLE_VERSION,
+                "config": self.config_digest,
+                "files": self.files,
+                "rules": self.rules,
+                "context": self.context,
+                "reinforced": self.reinforced,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> Optional["RulesBundle"]:
+        data = json.loads(text)
+        if not isinstance(data, dict) or data.get("version") != BUNDLE_VERSION:
+            return None
+        return cls(
+            rules=data["rules"],
+            files=data["files"],
+            context=data["context"],
+            reinforced=data["reinforced"],
+            config_digest=data["config"],
+        )
+
+
+def config_digest(hook_config: Mapping[str, Any]) -> str:
+    """Digest of the hook config."""
+    raw = json.dumps(hook_config, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def scan_rules_dir(rules_dir: Path) -> Dict[str, List[int]]:
+    """(mtime_ns, size) of every .md file in the rules directory.
+
+    Raises:
+        OSError: If the directory cannot be listed
+    """
+    files = {}
+    with os.scandir(rules_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md") and entry.is_file():
+                stat = entry.stat()
+                files[entry.name] = [stat.st_mtime_ns, stat.st_size]
+    return dict(sorted(files.items()))
+
+
+def build_bundle(
+    rules_dir: Path,
+    hook_config: Mapping[str, Any],
+    files: Dict[str, List[int]],
+    previous: Optional[RulesBundle] = None,
+) -> RulesBundle:
+    """Compile a bundle, reusing rules of unchanged files from a previous one."""
+    reusable = {}
+    if previous is not None:
+        reusable = {
+            rule["filename"]: rule
+            for rule in previous.rules
+            if previous.files.get(rule["filename"]) == files.get(rule["filename"])
+        }
+
+    rules = []
+    read_files = {}
+    for filename, key in files.items():
+        rule = reusable.get(filename)
+        if rule is None:
+            rule = read_rule(rules_dir / filename)
+            if rule is None:
+                continue
+            rule["digest"] = rule_digest(rule["content"])
+        rules.append(rule)
+        read_files[filename] = key
+
+    static = filter_rules_for_reinforcement(rules, dict(hook_config), "UserPromptSubmit", {})
+    return RulesBundle(
+        rules=rules,
+        files=read_files,
+        context="\n\n".join(rule["content"] for rule in rules if rule.get("content")),
+        reinforced=[rule["name"] for rule in static],
+        config_digest=config_digest(hook_config),
+    )
+
+
+def _read_bundle(bundle_path: Path) -> Optional[RulesBundle]:
+    try:
+        return RulesBundle.from_json(bundle_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_bundle(bundle_path: Path, bundle: RulesBundle) -> None:
+    try:
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = bundle_path.with_name(f"{bundle_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(bundle.to_json(), encoding="utf-8")
+        tmp_path.replace(bundle_path)
+    except OSError:
+        pass
+
+
+def load_bundle(
+    rules_dir: Path, hook_config: Mapping[str, Any], bundle_path: Optional[Path] = None
+) -> RulesBundle:
+    """Load the rules bundle for a directory, rebuilding what changed.
+
+    Args:
+        rules_dir: Rules directory
+        hook_config: The rules_loader hook config
+        bundle_path: On-disk bundle (None keeps it in-process only)
+
+    Returns:
+        The bundle; empty if the directory cannot be listed
+    """
+    try:
+        files = scan_rules_dir(rules_dir)
+    except OSError:
+        return RulesBundle(config_digest=config_digest(hook_config))
+    digest = config_digest(hook_config)
+    key = (digest, tuple((name, *stat) for name, stat in files.items()))
+
+    memo = _memo.get(str(rules_dir))
+    if memo is not None and memo[0] == key:
+        return memo[1]
+
+    previous = memo[1] if memo is not None else None
+    if bundle_path is not None:
+        cached = _read_bundle(bundle_path)
+        if cached is not None and cached.config_digest == digest and cached.files == files:
+            _memo[str(rules_dir)] = (key, cached)
+            return cached
+        previous = cached or previous
+
+    bundle = build_bundle(rules_dir, hook_config, files, previous)
+    if bundle_path is not None:
+        _write_bundle(bundle_path, bundle)
+    _memo[str(rules_dir)] = (key, bundle)
+    return bundle
+
+
+def clear_bundles() -> None:
+    """Drop in-process bundles (on-disk bundles revalidate themselves)."""
+    _memo.clear()
@@ -2,16 +2,24 @@ import json
 from typing import List, Dict
 
 
-def format_to_hook_json(directives: List[Dict[str, str]], event_name: str = "UserPromptSubmit", pretty: bool = False) -> str:
+def format_to_hook_json(
+    directives: List[Dict[str, str]],
+    event_name: str = "UserPromptSubmit",
+    pretty: bool = False,
+    reminder: str = "",
+) -> str:
     combined_content = "\n\n".join(
-        directive["content"] for directive in directives
-        if directive.get("content")
+        [directive["content"] for directive in directives if directive.get("content")]
+        + ([reminder] if reminder else [])
     )
+    return format_context_json(combined_content, event_name, pretty)
 
+
+def format_context_json(context: str, event_name: str = "UserPromptSubmit", pretty: bool = False) -> str:
     hook_output = {
         "hookSpecificOutput": {
             "hookEventName": event_name,
-            "additionalContext": combined_content
+            "additionalContext": context
         }
     }
 
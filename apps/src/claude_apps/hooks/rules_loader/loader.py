@@ -1,7 +1,12 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 import sys
 
+from .activation import RuleMatcher, rule_activation, split_frontmatter
+
+# Last compiled matcher, keyed by the rule set's activation conditions
+_matcher_cache: Dict[tuple, RuleMatcher] = {}
+
 
 def load_rules(directory_path: str) -> List[Dict[str, str]]:
     """Load all rule markdown files from the specified directory."""
@@ -34,34 +39,55 @@ def load_rules(directory_path: str) -> List[Dict[str, str]]:
 def read_rule(file_path: Path) -> Optional[Dict[str, str]]:
     """Read a single rule file and return its content."""
     try:
-        content = file_path.read_text(encoding="utf-8").strip()
+        meta, text = split_frontmatter(file_path.read_text(encoding="utf-8"))
+        content = text.strip()
         # Extract rule name without extension (e.g., "000-directives" from "000-directives.md")
         rule_name = file_path.stem
-        return {
+        rule = {
             "filename": file_path.name,
             "name": rule_name,
             "content": content
         }
+        if meta.get("activation"):
+            rule["activation"] = meta["activation"]
+        return rule
     except Exception as e:
         print(f"Error reading rule {file_path}: {e}", file=sys.stderr)
         return None
 
 
+def get_matcher(rules: List[Dict[str, Any]], hook_config: Dict[str, Any]) -> RuleMatcher:
+    """Compiled activation matcher for a rule set, reused while it is unchanged."""
+    key = tuple(
+        (rule.get("name", ""), repr(rule_activation(rule, hook_config))) for rule in rules
+    )
+    matcher = _matcher_cache.get(key)
+    if matcher is None:
+        matcher = RuleMatcher.compile(rules, hook_config)
+        _matcher_cache.clear()
+        _matcher_cache[key] = matcher
+    return matcher
+
+
 def filter_rules_for_reinforcement(
     rules: List[Dict[str, str]],
     hook_config: Dict[str, Any],
-    event_name: str
+    event_name: str,
+    hook_data: Optional[Mapping[str, Any]] = None,
 ) -> List[Dict[str, str]]:
     """
     Filter rules based on reinforcement configuration.
 
     For SessionStart: return all rules
-    For UserPromptSubmit: return only rules with reinforcement enabled
+    For UserPromptSubmit: return rules whose activation conditions match
+    the prompt and cwd, plus rules without conditions that have
+    reinforcement enabled
 
     Args:
         rules: List of rule dictionaries
         hook_config: The rules_loader hook config (from hooks.rules_loader)
         event_name: The hook event name
+        hook_data: The hook event (prompt and cwd feed activation)
     """
     if event_name == "SessionStart":
         # Always load all rules on session start
@@ -71,13 +97,21 @@ def filter_rules_for_reinforcement(
     global_reinforce = hook_config.get("reinforcement_enabled", False)
     per_rule_config = hook_config.get("rules", {})
 
+    matcher = get_matcher(rules, hook_config)
+    hook_data = hook_data or {}
+    active = matcher.active(hook_data.get("prompt") or "", hook_data.get("cwd"))
+
     filtered = []
     for rule in rules:
         rule_name = rule.get("name", "")
         rule_settings = per_rule_config.get(rule_name, {})
 
-        # Use per-rule setting if specified, otherwise use global default
-        should_reinforce = rule_settings.get("reinforce", global_reinforce)
+        if rule_name not in matcher.unconditional:
+            # Activation conditions decide for rules that declare them
+            should_reinforce = rule_name in active
+        else:
+            # Use per-rule setting if specified, otherwise use global default
+            should_reinforce = rule_settings.get("reinforce", global_reinforce)
 
         if should_reinforce:
             filtered.append(rule)
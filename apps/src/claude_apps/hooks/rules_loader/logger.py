@@ -1,40 +1,16 @@
-import json
-import structlog
-from pathlib import Path
-from typing import Dict, Any, List
-
-from .paths import get_config, get_log_path, get_error_log_path
-
-
-_logger = None
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Dict, List
 
-def _read_existing_entries(file_path: Path) -> List[Dict[str, Any]]:
-    """Read existing JSON array from file, returning empty list on any error."""
-    if not file_path.exists():
-        return []
-
-    try:
-        content = file_path.read_text(encoding='utf-8').strip()
-        if not content:
-            return []
-
-        data = json.loads(content)
-        return data if isinstance(data, list) else [data]
-    except (json.JSONDecodeError, IOError):
-        return []
+from claude_apps.shared.event_log import append_record
 
+from .paths import get_config, get_log_path, get_error_log_path
 
-def _write_json_array_entry(file_path: Path, entry: Dict[str, Any]) -> None:
-    """Append an entry to a JSON array file with pretty-printing."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+if TYPE_CHECKING:
+    import structlog
 
-    entries = _read_existing_entries(file_path)
-    entries.append(entry)
 
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(entries, f, ensure_ascii=False, indent=2)
-        f.write('\n')
+_logger = None
 
 
 def setup_logger() -> structlog.BoundLogger | None:
@@ -49,6 +25,8 @@ def setup_logger() -> structlog.BoundLogger | None:
     if not config.get("log_enabled", True):
         return None
 
+    import structlog
+
     structlog.configure(
         processors=[
             structlog.stdlib.add_log_level,
@@ -75,7 +53,10 @@ def log_directive_event(
     directive_count: int,
     directives: List[Dict[str, str]],
     load_time_ms: float,
-    source_directory: str
+    source_directory: str,
+    reminded: List[Dict[str, str]] | None = None,
+    injected_tokens: int | None = None,
+    saved_tokens: int | None = None,
 ) -> None:
     try:
         logger = setup_logger()
@@ -92,9 +73,17 @@ def log_directive_event(
             "load_time_ms": round(load_time_ms, 2),
             "source_directory": source_directory
         }
+        # Delta reinforcement: rules only named in the reminder line, and
+        # the approximate token cost of what was sent and what was skipped
+        if reminded:
+            log_entry["reminded"] = [d["filename"] for d in reminded]
+        if injected_tokens is not None:
+            log_entry["injected_tokens_est"] = injected_tokens
+        if saved_tokens is not None:
+            log_entry["saved_tokens_est"] = saved_tokens
 
         log_path = get_log_path(session_id, event_name)
-        _write_json_array_entry(log_path, log_entry)
+        append_record(log_path, log_entry)
 
     except Exception:
         pass
@@ -115,7 +104,7 @@ def log_error(error_message: str, session_id: str = "unknown", event_name: str =
         }
 
         error_path = get_error_log_path(session_id)
-        _write_json_array_entry(error_path, log_entry)
+        append_record(error_path, log_entry)
 
     except Exception:
         pass
@@ -136,7 +125,7 @@ def log_summary(session_id: str, event_name: str, output_size: int, pretty: bool
         }
 
         log_path = get_log_path(session_id, event_name)
-        _write_json_array_entry(log_path, log_entry)
+        append_record(log_path, log_entry)
 
     except Exception:
         pass
@@ -1,19 +1,31 @@
 """Path utilities for rules_loader hook."""
 
+import hashlib
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from claude_apps.shared.config_helper import get_hook_config, get_claude_root, resolve_log_path
+from claude_apps.shared.config_helper import (
+    get_claude_root,
+    get_data_path,
+    get_hook_config,
+    get_validated_config,
+    resolve_log_path,
+)
 
-from .schemas import RulesLoaderConfig
+
+def _validate(loaded: dict[str, Any]) -> dict[str, Any]:
+    from .schemas import RulesLoaderConfig
+
+    return RulesLoaderConfig(**loaded).model_dump()
 
 
 def get_config() -> dict[str, Any]:
     """Load and validate hook configuration from global config.yml."""
     loaded = get_hook_config("rules_loader")
-    validated = RulesLoaderConfig(**loaded)
-    return validated.model_dump()
+    return get_validated_config(
+        "rules_loader", loaded, _validate, Path(__file__).with_name("schemas.py")
+    )
 
 
 def get_log_path(session_id: str, event_name: str) -> Path:
@@ -21,7 +33,12 @@ def get_log_path(session_id: str, event_name: str) -> Path:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_base = resolve_log_path("rules_loader")
     log_dir = log_base / session_id / event_name
-    return log_dir / f"{timestamp}.json"
+    return log_dir / f"{timestamp}.ndjson"
+
+
+def get_session_dir(session_id: str) -> Path:
+    """Get the log directory of a session (holds its reinforcement state)."""
+    return resolve_log_path("rules_loader") / session_id
 
 
 def get_error_log_path(session_id: str) -> Path:
@@ -29,7 +46,7 @@ def get_error_log_path(session_id: str) -> Path:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_base = resolve_log_path("rules_loader")
     log_dir = log_base / session_id / "errors"
-    return log_dir / f"{timestamp}.json"
+    return log_dir / f"{timestamp}.ndjson"
 
 
 def get_rules_path() -> str:
@@ -37,3 +54,13 @@ def get_rules_path() -> str:
     config = get_config()
     rules_path = config.get("rules_path", "rules/")
     return str(get_claude_root() / rules_path)
+
+
+def get_bundle_path(rules_path: str) -> Path:
+    """Get the compiled bundle location for a rules directory."""
+    digest = hashlib.sha1(str(Path(rules_path).resolve()).encode("utf-8")).hexdigest()[:12]
+    try:
+        cache_dir = get_data_path("cache/rules_loader")
+    except EnvironmentError:
+        cache_dir = Path(rules_path).parent / ".data" / "cache" / "rules_loader"
+    return cache_dir / f"bundle.{digest}.json"
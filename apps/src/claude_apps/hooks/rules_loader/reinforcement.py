@@ -0,0 +1,208 @@
+"""Per-session delta reinforcement of rules on UserPromptSubmit.
+
+The model already holds the text of every rule injected earlier in the
+session, so re-sending it on every prompt mostly costs tokens. Each
+session keeps ``<session>/.reinforcement.json`` with the digest of every
+rule it was given and the prompt number it was given at. On a prompt a
+candidate rule is injected in full only when it is new to the session,
+its content changed, or ``reinforce_every`` prompts have passed since it
+was last injected. The rest are named in a single reminder line.
+
+SessionStart (which also fires after /clear and compaction) injects every
+rule and starts the session's record over. The state file is updated with
+a locked read-modify-write and replaced atomically (shared.json_file).
+
+The state also keeps where each rule of the latest event sits in the
+hook's context. When the dispatcher's context budget cuts that context,
+``retract_trimmed`` forgets the rules that did not arrive whole, so the
+next prompt injects them again instead of only naming them.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from claude_apps.shared.json_file import update_json_file
+
+STATE_NAME = ".reinforcement.json"
+# Separator the formatter joins rule contents with
+SEPARATOR = "\n\n"
+
+# Rough size of a token in characters, for reporting only
+CHARS_PER_TOKEN = 4
+
+
+def rule_digest(content: str) -> str:
+    """Short content digest of a rule."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class ReinforcementPlan:
+    """What one event injects."""
+
+    prompt: int = 0
+    inject: List[Dict[str, str]] = field(default_factory=list)
+    reminded: List[Dict[str, str]] = field(default_factory=list)
+    reminder: str = ""
+
+    @property
+    def injected_tokens(self) -> int:
+        return sum(estimate_tokens(r.get("content", "")) for r in self.inject) + estimate_tokens(
+            self.reminder
+        )
+
+    @property
+    def saved_tokens(self) -> int:
+        """Tokens the reminded rules would have cost in full, minus the reminder."""
+        full = sum(estimate_tokens(r.get("content", "")) for r in self.reminded)
+        return max(0, full - estimate_tokens(self.reminder))
+
+
+def _digest_of(rule: Dict[str, str]) -> str:
+    # Bundled rules carry their digest already
+    return rule.get("digest") or rule_digest(rule.get("content", ""))
+
+
+def format_reminder(rules: List[Dict[str, str]]) -> str:
+    """One line naming rules that stay in effect without repeating them."""
+    if not rules:
+        return ""
+    names = ", ".join(f"{r['name']}@{_digest_of(r)}" for r in rules)
+    return f"Rules still in effect, unchanged since injected earlier this session: {names}"
+
+
+def _cadence(rule: Dict[str, str], hook_config: Dict[str, Any]) -> int:
+    settings = hook_config.get("rules", {}).get(rule.get("name", ""), {}) or {}
+    every = settings.get("reinforce_every")
+    if every is None:
+        every = hook_config.get("reinforce_every", 1)
+    return max(1, int(every))
+
+
+def plan_reinforcement(
+    state: Dict[str, Any],
+    rules: List[Dict[str, str]],
+    hook_config: Dict[str, Any],
+    event_name: str,
+    now: float,
+) -> ReinforcementPlan:
+    """Decide which rules to inject and update the session state in place.
+
+    Args:
+        state: Session state (as loaded; reset here on SessionStart)
+        rules: Candidate rules for the event
+        hook_config: The rules_loader hook config
+        event_name: The hook event name
+        now: Current time, stored as the injection time
+
+    Returns:
+        The plan for this event
+    """
+    if event_name == "SessionStart":
+        state.clear()
+        state.update({"prompt": 0, "rules": {}})
+        plan = ReinforcementPlan(inject=list(rules))
+    else:
+        state["prompt"] = int(state.get("prompt", 0)) + 1
+        state.setdefault("rules", {})
+        plan = ReinforcementPlan(prompt=state["prompt"])
+        for rule in rules:
+            seen = state["rules"].get(rule.get("name", ""))
+            if (
+                seen is None
+                or seen.get("digest") != _digest_of(rule)
+                or plan.prompt - int(seen.get("prompt", 0)) >= _cadence(rule, hook_config)
+            ):
+                plan.inject.append(rule)
+            else:
+                plan.reminded.append(rule)
+        if hook_config.get("reinforcement_reminder", True):
+            plan.reminder = format_reminder(plan.reminded)
+
+    # Where each rule's content lands in the context, for retract_trimmed
+    sent: Dict[str, List[int]] = {}
+    offset = 0
+    for rule in plan.inject:
+        state["rules"][rule.get("name", "")] = {
+            "digest": _digest_of(rule),
+            "prompt": plan.prompt,
+            "injected_at": round(now, 3),
+        }
+        content = rule.get("content", "")
+        if content:
+            sent[rule.get("name", "")] = [offset, offset + len(content)]
+            offset += len(content) + len(SEPARATOR)
+    state["sent"] = sent
+    return plan
+
+
+def reinforce(
+    session_dir: Path,
+    rules: List[Dict[str, str]],
+    hook_config: Dict[str, Any],
+    event_name: str,
+    now: Optional[float] = None,
+) -> ReinforcementPlan:
+    """Plan an event's injection against the session's stored state.
+
+    Args:
+        session_dir: Session log directory holding the state file
+        rules: Candidate rules for the event
+        hook_config: The rules_loader hook config
+        event_name: The hook event name
+        now: Current time (default: time.time())
+
+    Returns:
+        The plan for this event
+
+    Raises:
+        OSError: If the state file cannot be read or written
+    """
+    now = time.time() if now is None else now
+    plans = []
+
+    def update(state: Dict[str, Any]) -> bool:
+        plans.append(plan_reinforcement(state, rules, hook_config, event_name, now))
+        return True
+
+    update_json_file(session_dir / STATE_NAME, update)
+    return plans[0]
+
+
+def retract_trimmed(session_dir: Path, context: str) -> List[str]:
+    """Forget the latest event's rules that a context budget cut.
+
+    Args:
+        session_dir: Session log directory holding the state file
+        context: The rules_loader context as it was actually injected
+
+    Returns:
+        Names of the rules forgotten; they count as new on the next prompt
+
+    Raises:
+        OSError: If the state file cannot be read or written
+    """
+    retracted: List[str] = []
+
+    def update(state: Dict[str, Any]) -> bool:
+        rules = state.get("rules") or {}
+        sent = state.get("sent") or {}
+        for name, (start, end) in sent.items():
+            seen = rules.get(name)
+            if seen is not None and rule_digest(context[start:end]) != seen.get("digest"):
+                del rules[name]
+                retracted.append(name)
+        # One budget pass per event: a second call has nothing to retract
+        state["sent"] = {}
+        return bool(sent)
+
+    update_json_file(session_dir / STATE_NAME, update)
+    return retracted
@@ -3,6 +3,27 @@
 from pydantic import BaseModel, Field
 
 
+class ActivationSettings(BaseModel):
+    """Conditions under which a rule is relevant to a prompt."""
+
+    keywords: list[str] = Field(
+        default=[],
+        description="Whole words that activate the rule when present in the prompt",
+    )
+    patterns: list[str] = Field(
+        default=[],
+        description="Regular expressions matched (case-insensitively) against the prompt",
+    )
+    paths: list[str] = Field(
+        default=[],
+        description="Globs matched against the session cwd",
+    )
+    stacks: list[str] = Field(
+        default=[],
+        description="Project stacks detected in cwd (python, node, go, docker, ...)",
+    )
+
+
 class RuleSettings(BaseModel):
     """Per-rule configuration settings."""
 
@@ -10,6 +31,16 @@ class RuleSettings(BaseModel):
         default=False,
         description="Whether to include this rule in UserPromptSubmit events",
     )
+    reinforce_every: int | None = Field(
+        default=None,
+        ge=1,
+        description="Override of reinforce_every for this rule",
+    )
+    activation: ActivationSettings | None = Field(
+        default=None,
+        description="Reinforce only when one of these conditions matches "
+        "(overrides reinforce and any frontmatter activation)",
+    )
 
 
 class RulesLoaderConfig(BaseModel):
@@ -38,6 +69,16 @@ class RulesLoaderConfig(BaseModel):
         default=False,
         description="Global toggle for rule reinforcement on UserPromptSubmit",
     )
+    reinforce_every: int = Field(
+        default=10,
+        ge=1,
+        description="Re-inject an unchanged reinforced rule once this many prompts have "
+        "passed since the session last saw it (1 = every prompt)",
+    )
+    reinforcement_reminder: bool = Field(
+        default=True,
+        description="Name rules that are not re-injected in a one-line reminder",
+    )
     rules: dict[str, RuleSettings] = Field(
         default={},
         description="Per-rule settings keyed by rule name (e.g., '000-rule-follower')",
@@ -2,3 +2,6 @@
 
 __all__ = ["config", "prompt_builder", "schemas"]
 __version__ = "0.1.0"
+
+# Output depends only on the SessionStart source and config.yml (see shared.hook_memo)
+MEMO_INPUTS = {"events": ["SessionStart"], "fields": ["hook_event_name", "source"]}
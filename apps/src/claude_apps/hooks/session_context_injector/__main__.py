@@ -3,32 +3,24 @@
 import json
 import sys
 
-import structlog
+from claude_apps.shared.config_helper import get_lazy_logger
+from claude_apps.shared.hook_protocol import read_events
 
 from .config import load_session_config
 from .prompt_builder import build_agent_prompt
 
-structlog.configure(
-    processors=[
-        structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer(),
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(20),  # INFO level
-)
-
-log = structlog.get_logger()
+log = get_lazy_logger()
 
 
 def main() -> int:
     """Process SessionStart hook event and inject agent trigger prompt."""
     try:
         # Read hook event from stdin
-        raw_input = sys.stdin.read()
-        if not raw_input.strip():
+        events = read_events()
+        if not events:
             return 0
 
-        hook_data = json.loads(raw_input)
+        hook_data = events[0]
         event_name = hook_data.get("hook_event_name", "")
 
         # Only process SessionStart events
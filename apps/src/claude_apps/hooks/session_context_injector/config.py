@@ -1,14 +1,20 @@
 """Configuration loading for session_context_injector hook."""
 
+from pathlib import Path
 from typing import Any
 
-from claude_apps.shared.config_helper import get_hook_config
+from claude_apps.shared.config_helper import get_hook_config, get_validated_config
 
-from .schemas import SessionContextConfig
+
+def _validate(loaded: dict[str, Any]) -> dict[str, Any]:
+    from .schemas import SessionContextConfig
+
+    return SessionContextConfig(**loaded).model_dump()
 
 
 def load_session_config() -> dict[str, Any]:
     """Load and validate session_context config from hooks.session_context in config.yml."""
     hook_config = get_hook_config("session_context")
-    validated = SessionContextConfig(**hook_config)
-    return validated.model_dump()
+    return get_validated_config(
+        "session_context", hook_config, _validate, Path(__file__).with_name("schemas.py")
+    )
@@ -1,40 +1,86 @@
-"""Entry point for submodule_auto_updater hook."""
+"""Entry point for submodule_auto_updater hook.
+
+The check runs under the hook's deadline. If the deadline cuts it short
+the hook responds without context and finishes the check in a detached
+``--continue`` run; an update applied there is announced on the next
+prompt.
+"""
 
 import json
 import sys
-from pathlib import Path
 
-import structlog
+from claude_apps.shared.config_helper import get_lazy_logger
+from claude_apps.shared.deadline import (
+    DeadlineExceededError,
+    continue_in_background,
+    current_deadline,
+    release_continuation,
+)
+from claude_apps.shared.hook_protocol import read_events
 
 from .config import get_log_path
 from .formatter import format_update_notification
-from .state_manager import mark_notified, should_check, should_notify, write_check_state
-from .updater import check_and_update
-
-# Configure structlog
-LOG_PATH = get_log_path()
-LOG_PATH.mkdir(parents=True, exist_ok=True)
-
-structlog.configure(
-    processors=[
-        structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer(),
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(20),
+from .state_manager import (
+    claim_check,
+    mark_notified,
+    should_notify,
+    take_pending_update,
+    write_check_state,
 )
+from .updater import UpdateResult, check_and_update
+
+log = get_lazy_logger()
+
+CONTINUATION = "submodule_auto_updater"
 
-log = structlog.get_logger()
+
+def run_check() -> UpdateResult | None:
+    """Run the update check within the deadline.
+
+    Returns:
+        The result, or None when the check was handed to a continuation
+    """
+    try:
+        result = check_and_update(current_deadline())
+    except DeadlineExceededError:
+        # Record the check now so other prompts do not start another one
+        write_check_state(None)
+        started = continue_in_background(
+            CONTINUATION,
+            "claude_apps.hooks.submodule_auto_updater",
+            ["--continue"],
+            get_log_path() / "continuation.log",
+        )
+        log.info("update_check_deferred", continuation_started=started)
+        return None
+
+    # Always update check state (even if no update performed)
+    write_check_state(result if result.updated else None)
+    return result
+
+
+def run_continuation() -> int:
+    """Finish a deferred check without a deadline (``--continue``)."""
+    try:
+        result = check_and_update()
+        write_check_state(result if result.updated else None, pending=result.updated)
+        log.info("continuation_finished", updated=result.updated, error=result.error)
+    finally:
+        release_continuation(CONTINUATION)
+    return 0
 
 
 def main() -> int:
     """Process hook event and auto-update submodule if needed."""
+    if "--continue" in sys.argv[1:]:
+        return run_continuation()
+
     try:
-        raw_input = sys.stdin.read()
-        if not raw_input.strip():
+        events = read_events()
+        if not events:
             return 0
 
-        hook_data = json.loads(raw_input)
+        hook_data = events[0]
         event_name = hook_data.get("hook_event_name", "")
         session_id = hook_data.get("session_id", "unknown")
 
@@ -51,34 +97,25 @@ def main() -> int:
             print(json.dumps(output))
             return 0
 
-        # Check if we should run the update check
-        if not should_check():
-            log.debug("skipping_check", reason="interval_not_elapsed")
-            output = {
-                "hookSpecificOutput": {
-                    "hookEventName": event_name,
-                    "additionalContext": "",
-                }
-            }
-            print(json.dumps(output))
-            return 0
-
-        # Run the check and update
-        log.info("running_update_check")
-        result = check_and_update()
-
-        # Always update check state (even if no update performed)
-        write_check_state(result if result.updated else None)
+        # Run the update check if the interval has passed and no other
+        # session claimed it first
+        result = None
+        if claim_check():
+            log.info("running_update_check")
+            result = run_check()
 
-        # Determine notification
+        # Determine notification (an update from a continuation counts too)
         additional_context = ""
-        if result.updated and should_notify(session_id):
-            additional_context = format_update_notification(result)
-            mark_notified(session_id)
-            log.info(
-                "notification_injected",
-                commits_pulled=result.commits_behind,
-            )
+        if should_notify(session_id):
+            if result is None or not result.updated:
+                result = take_pending_update()
+            if result is not None and result.updated:
+                additional_context = format_update_notification(result)
+                mark_notified(session_id)
+                log.info(
+                    "notification_injected",
+                    commits_pulled=result.commits_behind,
+                )
 
         output = {
             "hookSpecificOutput": {
@@ -1,61 +1,64 @@
-"""State file management for submodule auto-updater."""
+"""State management for submodule auto-updater.
+
+Check and notification state live in the shared state store (namespace
+``submodule_auto_updater``), so sessions starting together do not lose
+each other's writes.
+"""
 
-import json
-import os
 import time
-from dataclasses import asdict
-from pathlib import Path
 from typing import Any
 
-import structlog
+from claude_apps.shared.config_helper import get_lazy_logger
+from claude_apps.shared.state_store import get_state_store
 
 from .config import get_check_interval_seconds
 from .updater import UpdateResult
 
-log = structlog.get_logger()
-
-DATA_DIR = Path(os.environ.get("CLAUDE_DATA_PATH", "/workspace/.claude/.data"))
-
-CHECK_STATE_FILE = DATA_DIR / "submodule_check_state.json"
-NOTIFY_STATE_FILE = DATA_DIR / "submodule_notify_state.json"
+log = get_lazy_logger()
 
-
-def ensure_data_dir() -> None:
-    """Ensure the data directory exists."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+# Keys in the shared state store
+NAMESPACE = "submodule_auto_updater"
+CHECK_KEY = "check"
+NOTIFY_KEY = "notify"
 
 
 def read_check_state() -> dict[str, Any]:
-    """Read the check state file."""
-    if not CHECK_STATE_FILE.exists():
-        return {}
+    """Read the check state."""
     try:
-        return json.loads(CHECK_STATE_FILE.read_text())
+        return get_state_store().get(NAMESPACE, CHECK_KEY, {})
     except Exception as e:
         log.warning("failed_to_read_check_state", error=str(e))
         return {}
 
 
-def write_check_state(update_result: UpdateResult | None = None) -> None:
-    """Write the check state file with current time and optional update result."""
-    ensure_data_dir()
-
-    state = read_check_state()
-    state["last_check_time"] = time.time()
-    state["last_check_iso"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
-
-    if update_result and update_result.updated:
-        state["last_update_time"] = time.time()
-        state["last_update_result"] = {
-            "updated": update_result.updated,
-            "old_commit": update_result.old_commit,
-            "new_commit": update_result.new_commit,
-            "commits_behind": update_result.commits_behind,
-            "commits_pulled": update_result.commits_pulled or [],
-        }
+def write_check_state(update_result: UpdateResult | None = None, pending: bool = False) -> None:
+    """Record the current time and optional update result in the check state.
+
+    Args:
+        update_result: Result of the check, recorded if it updated
+        pending: The update still has to be announced (it was applied by a
+            background continuation, after the hook had responded)
+    """
+
+    def record(state: dict[str, Any]) -> dict[str, Any]:
+        state["last_check_time"] = time.time()
+        state["last_check_iso"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+
+        if update_result and update_result.updated:
+            state["last_update_time"] = time.time()
+            state["last_update_result"] = {
+                "updated": update_result.updated,
+                "old_commit": update_result.old_commit,
+                "new_commit": update_result.new_commit,
+                "commits_behind": update_result.commits_behind,
+                "commits_pulled": update_result.commits_pulled or [],
+            }
+            if pending:
+                state["pending_notification"] = True
+        return state
 
     try:
-        CHECK_STATE_FILE.write_text(json.dumps(state, indent=2))
+        get_state_store().update(NAMESPACE, CHECK_KEY, record, default={})
     except Exception as e:
         log.error("failed_to_write_check_state", error=str(e))
 
@@ -77,12 +80,59 @@ def should_check() -> bool:
     return should
 
 
+def claim_check() -> bool:
+    """Claim the next update check if the interval has passed.
+
+    The claim stamps last_check_time with a compare-and-set, so of the
+    sessions that find the interval elapsed at the same time exactly one
+    runs the check.
+    """
+    try:
+        store = get_state_store()
+        entry = store.get_entry(NAMESPACE, CHECK_KEY)
+        state = {} if entry is None else dict(entry.value)
+        elapsed = time.time() - state.get("last_check_time", 0)
+        if elapsed < get_check_interval_seconds():
+            log.debug("skipping_check", reason="interval_not_elapsed")
+            return False
+        state["last_check_time"] = time.time()
+        claimed = store.compare_and_set(
+            NAMESPACE, CHECK_KEY, state, None if entry is None else entry.version
+        )
+    except Exception as e:
+        log.warning("failed_to_claim_check", error=str(e))
+        return True
+    if not claimed:
+        log.debug("skipping_check", reason="claimed_by_other_session")
+    return claimed
+
+
+def take_pending_update() -> UpdateResult | None:
+    """Return an update applied in the background and not yet announced.
+
+    The pending flag is cleared in the same transaction, so each such
+    update is announced once even when sessions start together.
+    """
+    taken: dict[str, Any] = {}
+
+    def take(state: dict[str, Any]) -> dict[str, Any]:
+        if state.pop("pending_notification", False):
+            taken.update(state.get("last_update_result", {}))
+            taken["checked"] = True
+        return state
+
+    try:
+        get_state_store().update(NAMESPACE, CHECK_KEY, take, default={})
+    except Exception as e:
+        log.error("failed_to_write_check_state", error=str(e))
+        return None
+    return UpdateResult(**taken) if taken else None
+
+
 def read_notify_state() -> dict[str, Any]:
-    """Read the notification state file."""
-    if not NOTIFY_STATE_FILE.exists():
-        return {}
+    """Read the notification state."""
     try:
-        return json.loads(NOTIFY_STATE_FILE.read_text())
+        return get_state_store().get(NAMESPACE, NOTIFY_KEY, {})
     except Exception as e:
         log.warning("failed_to_read_notify_state", error=str(e))
         return {}
@@ -103,8 +153,6 @@ def should_notify(session_id: str) -> bool:
 
 def mark_notified(session_id: str) -> None:
     """Record that we notified in this session."""
-    ensure_data_dir()
-
     state = {
         "last_notified_session": session_id,
         "last_notified_time": time.time(),
@@ -112,6 +160,6 @@ def mark_notified(session_id: str) -> None:
     }
 
     try:
-        NOTIFY_STATE_FILE.write_text(json.dumps(state, indent=2))
+        get_state_store().set(NAMESPACE, NOTIFY_KEY, state)
     except Exception as e:
         log.error("failed_to_write_notify_state", error=str(e))
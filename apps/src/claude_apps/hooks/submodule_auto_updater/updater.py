@@ -5,12 +5,13 @@ import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
-import structlog
+from claude_apps.shared.config_helper import get_lazy_logger
+from claude_apps.shared.deadline import Deadline, DeadlineExceededError, run_within
 
-log = structlog.get_logger()
+log = get_lazy_logger()
 
-WORKSPACE_PATH = os.environ.get("WORKSPACE_PATH")
-CLAUDE_PATH = os.environ.get("CLAUDE_PATH")
+# Timeout of a single git command
+GIT_TIMEOUT = 30
 
 
 @dataclass
@@ -27,8 +28,12 @@ class UpdateResult:
 
 
 def get_submodule_path() -> Path:
-    """Get the path to the .claude submodule."""
-    return Path(f"{CLAUDE_PATH}")
+    """Get the path to the .claude submodule.
+
+    Read per call: in the hooks daemon the environment is the requesting
+    session's, which may differ from the one this module was imported in.
+    """
+    return Path(f"{os.environ.get('CLAUDE_PATH')}")
 
 
 def is_git_repo(path: Path) -> bool:
@@ -37,27 +42,44 @@ def is_git_repo(path: Path) -> bool:
     return git_dir.exists() or (path / "HEAD").exists()
 
 
-def run_git_command(args: list[str], cwd: Path) -> tuple[bool, str]:
-    """Run a git command and return success status and output."""
+def run_git_command(
+    args: list[str], cwd: Path, deadline: Deadline | None = None
+) -> tuple[bool, str]:
+    """Run a git command and return success status and output.
+
+    With a deadline the command gets at most the time left; running out
+    raises DeadlineExceededError instead of reporting a failure.
+    """
     try:
-        result = subprocess.run(
+        result = run_within(
             ["git", *args],
+            deadline or Deadline(),
+            GIT_TIMEOUT,
             cwd=cwd,
             capture_output=True,
             text=True,
-            timeout=30,
         )
         if result.returncode == 0:
             return True, result.stdout.strip()
         return False, result.stderr.strip()
+    except DeadlineExceededError:
+        raise
     except subprocess.TimeoutExpired:
         return False, "Command timed out"
     except Exception as e:
         return False, str(e)
 
 
-def check_and_update() -> UpdateResult:
-    """Check for updates and apply them if available."""
+def check_and_update(deadline: Deadline | None = None) -> UpdateResult:
+    """Check for updates and apply them if available.
+
+    The deadline bounds the read-only steps (fetch and inspection). Once
+    the reset starts it runs to completion, so a deadline never leaves
+    the checkout half updated.
+
+    Raises:
+        DeadlineExceededError: If the deadline ran out before the reset
+    """
     result = UpdateResult()
     submodule_path = get_submodule_path()
 
@@ -72,7 +94,7 @@ def check_and_update() -> UpdateResult:
         return result
 
     # Fetch from origin
-    success, output = run_git_command(["fetch", "origin", "--quiet"], submodule_path)
+    success, output = run_git_command(["fetch", "origin", "--quiet"], submodule_path, deadline)
     if not success:
         log.error("git_fetch_failed", error=output)
         result.error = f"Git fetch failed: {output}"
@@ -81,7 +103,7 @@ def check_and_update() -> UpdateResult:
     result.checked = True
 
     # Get current HEAD
-    success, local_commit = run_git_command(["rev-parse", "HEAD"], submodule_path)
+    success, local_commit = run_git_command(["rev-parse", "HEAD"], submodule_path, deadline)
     if not success:
         result.error = f"Failed to get HEAD: {local_commit}"
         return result
@@ -89,7 +111,7 @@ def check_and_update() -> UpdateResult:
 
     # Get origin/main
     success, remote_commit = run_git_command(
-        ["rev-parse", "origin/main"], submodule_path
+        ["rev-parse", "origin/main"], submodule_path, deadline
     )
     if not success:
         result.error = f"Failed to get origin/main: {remote_commit}"
@@ -104,7 +126,7 @@ def check_and_update() -> UpdateResult:
     # CRITICAL: Check for unpushed local commits before resetting
     # Count commits that exist locally but not on origin/main
     success, ahead_count_str = run_git_command(
-        ["rev-list", "--count", "origin/main..HEAD"], submodule_path
+        ["rev-list", "--count", "origin/main..HEAD"], submodule_path, deadline
     )
     commits_ahead = int(ahead_count_str) if success and ahead_count_str else 0
 
@@ -122,14 +144,14 @@ def check_and_update() -> UpdateResult:
 
     # Get commits behind count
     success, count_str = run_git_command(
-        ["rev-list", "--count", "HEAD..origin/main"], submodule_path
+        ["rev-list", "--count", "HEAD..origin/main"], submodule_path, deadline
     )
     if success:
         result.commits_behind = int(count_str)
 
     # Get commit log for what we're pulling
     success, commit_log = run_git_command(
-        ["log", "--oneline", "HEAD..origin/main"], submodule_path
+        ["log", "--oneline", "HEAD..origin/main"], submodule_path, deadline
     )
     if success:
         result.commits_pulled = commit_log.split("\n") if commit_log else []
@@ -1,7 +1,29 @@
-"""Shared utilities for Claude Code hooks and skills."""
+"""Shared utilities for Claude Code hooks and skills.
 
-from claude_apps.shared import aws_utils
-from claude_apps.shared import config_helper
-from claude_apps.shared import subprocess_helper
+Subpackages are imported on first attribute access so that hooks which only
+need config_helper do not pay for boto3/pydantic (aws_utils) or structlog
+(subprocess_helper) at startup.
+"""
 
-__all__ = ["aws_utils", "config_helper", "subprocess_helper"]
+import importlib
+from typing import Any
+
+__all__ = [
+    "aws_utils",
+    "config_helper",
+    "context_budget",
+    "deadline",
+    "event_log",
+    "hook_memo",
+    "hook_protocol",
+    "state_store",
+    "subprocess_helper",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,7 @@ from pathlib import Path
 import yaml
 from loguru import logger
 
+from ...config_helper import load_config_snapshot
 from ..core.schemas import AccountInventory, AccountsConfig
 
 
@@ -19,11 +20,7 @@ def _get_claude_path() -> Path:
 
 def _get_global_config() -> dict:
     """Load global config.yml from .claude directory."""
-    config_path = _get_claude_path() / "config.yml"
-    if config_path.exists():
-        with open(config_path) as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    return load_config_snapshot(_get_claude_path() / "config.yml")
 
 
 def get_aws_data_path() -> Path:
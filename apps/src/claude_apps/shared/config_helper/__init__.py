@@ -1,6 +1,10 @@
 """Configuration helper utilities for Claude Code.
 
-Core modules (config, paths, yaml_utils) use only stdlib + pyyaml.
+Core modules (config, paths, snapshot, yaml_utils) use only stdlib + pyyaml,
+and import pyyaml only when a file is parsed; config.yml is served from a
+cached snapshot while it is unchanged. lazy_logger and validation defer
+structlog and pydantic the same way.
+
 The logging module requires loguru and must be imported explicitly:
 
     from .logging import setup_logger, get_logger
@@ -14,7 +18,10 @@ from .config import (
     get_workspace_root,
     resolve_log_path,
 )
+from .lazy_logger import configure_structlog, get_lazy_logger
 from .paths import ensure_directory, get_data_path, get_logs_path
+from .snapshot import clear_config_snapshots, get_snapshot_key, load_config_snapshot
+from .validation import get_validated_config
 from .yaml_utils import safe_dump, safe_load
 
 # Note: logging module requires loguru, import explicitly if needed:
@@ -28,6 +35,15 @@ __all__ = [
     "get_global_config",
     "get_hook_config",
     "resolve_log_path",
+    # lazy_logger
+    "configure_structlog",
+    "get_lazy_logger",
+    # snapshot
+    "load_config_snapshot",
+    "clear_config_snapshots",
+    "get_snapshot_key",
+    # validation
+    "get_validated_config",
     # paths
     "get_data_path",
     "get_logs_path",
@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 from typing import Any
 
-import yaml
+from .snapshot import load_config_snapshot
 
 
 def get_config_path() -> Path:
@@ -29,14 +29,12 @@ def get_workspace_root() -> Path:
 
 
 def get_global_config() -> dict[str, Any]:
-    """Load the global config.yml."""
-    config_path = get_config_path()
+    """Load the global config.yml.
 
-    if not config_path.exists():
-        return {}
-
-    with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+    Served from a snapshot that is reparsed only when the file's mtime or
+    size changes, so repeated calls within an event are cheap.
+    """
+    return load_config_snapshot(get_config_path())
 
 
 def get_hook_config(hook_name: str) -> dict[str, Any]:
@@ -0,0 +1,109 @@
+"""Deferred structlog loggers for hook entry points.
+
+Importing structlog is a sizeable share of a hook's startup time. A
+LazyLogger stands in for ``structlog.get_logger()``: calls below its level
+are dropped without importing anything, and structlog is only imported and
+configured on the first call that is actually emitted.
+"""
+
+import sys
+from typing import Any
+
+_LEVELS = {
+    "debug": 10,
+    "info": 20,
+    "warning": 30,
+    "warn": 30,
+    "error": 40,
+    "exception": 40,
+    "critical": 50,
+    "fatal": 50,
+}
+
+_configured = False
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+def _stderr_logger_factory(*args: Any) -> Any:
+    """Create a PrintLogger bound to the current sys.stderr.
+
+    Resolving sys.stderr per call keeps output on the right stream when a
+    hook runs inside the dispatcher or daemon with captured stdio.
+    """
+    import structlog
+
+    return structlog.PrintLogger(file=sys.stderr)
+
+
+def configure_structlog(json_output: bool = False, level: str = "INFO") -> None:
+    """Configure structlog to render to stderr, once per process.
+
+    Hooks must only write JSON responses to stdout, so all logging goes to
+    stderr.
+
+    Args:
+        json_output: Render JSON lines instead of the console format
+        level: Minimum level name to emit
+    """
+    global _configured
+
+    if _configured:
+        return
+
+    import structlog
+
+    renderer = (
+        structlog.processors.JSONRenderer() if json_output else structlog.dev.ConsoleRenderer()
+    )
+    structlog.configure(
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            renderer,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(_LEVELS.get(level.lower(), 20)),
+        context_class=dict,
+        logger_factory=_stderr_logger_factory,
+        cache_logger_on_first_use=False,
+    )
+    _configured = True
+
+
+class LazyLogger:
+    """Proxy that imports and configures structlog on first emitted call."""
+
+    def __init__(self, json_output: bool = False, level: str = "INFO"):
+        self._json_output = json_output
+        self._level_name = level
+        self._level = _LEVELS.get(level.lower(), 20)
+        self._logger: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        method_level = _LEVELS.get(name)
+        if method_level is not None and method_level < self._level:
+            return _noop
+        return getattr(self._resolve(), name)
+
+    def _resolve(self) -> Any:
+        if self._logger is None:
+            import structlog
+
+            configure_structlog(self._json_output, self._level_name)
+            self._logger = structlog.get_logger()
+        return self._logger
+
+
+def get_lazy_logger(json_output: bool = False, level: str = "INFO") -> LazyLogger:
+    """Get a logger that defers importing structlog until it is used.
+
+    Args:
+        json_output: Render JSON lines instead of the console format
+        level: Minimum level name to emit; lower calls are free no-ops
+
+    Returns:
+        LazyLogger usable wherever a structlog logger is expected
+    """
+    return LazyLogger(json_output=json_output, level=level)
@@ -0,0 +1,154 @@
+"""Compiled, mtime-validated snapshots of YAML config files.
+
+config.yml is read several times per hook event (hook config, log paths,
+validation). A snapshot is parsed once and reused while the file's
+(mtime, size) is unchanged:
+
+- in-process, as JSON text so every caller gets an independent copy
+- on disk, as JSON under .data/cache, so new processes skip PyYAML
+- when a parse is unavoidable, with the LibYAML C loader if available
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from .paths import get_data_path
+
+_memo: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def _stat_key(config_path: Path) -> tuple[int, int] | None:
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_snapshot_key(config_path: Path) -> tuple[int, int] | None:
+    """Version of a config file as the snapshot cache sees it.
+
+    Values derived from a config (compiled patterns, for example) can be
+    cached under this key; it changes whenever the snapshot is reparsed.
+
+    Returns:
+        (mtime_ns, size), or None if the file is missing
+    """
+    return _stat_key(config_path)
+
+
+def get_snapshot_path(config_path: Path) -> Path:
+    """Get the on-disk snapshot location for a config file.
+
+    Snapshots live in the data cache directory; when no data path can be
+    resolved from the environment, next to the config in .data/cache.
+
+    Args:
+        config_path: YAML config file
+
+    Returns:
+        Path of the JSON snapshot file
+    """
+    try:
+        cache_dir = get_data_path("cache")
+    except EnvironmentError:
+        cache_dir = config_path.parent / ".data" / "cache"
+    digest = hashlib.sha1(str(config_path.resolve()).encode("utf-8")).hexdigest()[:12]
+    return cache_dir / f"{config_path.stem}.{digest}.snapshot.json"
+
+
+def _read_snapshot(config_path: Path, key: tuple[int, int]) -> str | None:
+    try:
+        with open(get_snapshot_path(config_path), encoding="utf-8") as f:
+            header = f.readline()
+            meta = json.loads(header)
+            if meta.get("path") != str(config_path) or tuple(meta.get("key", ())) != key:
+                return None
+            return f.read()
+    except (OSError, ValueError):
+        return None
+
+
+def _write_snapshot(config_path: Path, key: tuple[int, int], text: str) -> None:
+    try:
+        snapshot_path = get_snapshot_path(config_path)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        header = json.dumps({"path": str(config_path), "key": list(key)})
+        tmp_path.write_text(f"{header}\n{text}", encoding="utf-8")
+        tmp_path.replace(snapshot_path)
+    except OSError:
+        pass
+
+
+def parse_yaml_file(config_path: Path) -> Any:
+    """Parse a YAML file with the C LibYAML loader when available.
+
+    Args:
+        config_path: YAML file to parse
+
+    Returns:
+        Parsed content, or an empty dict for an empty document
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, "rb") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+def _to_json(data: Any) -> str | None:
+    """Serialize data only if it survives a JSON round trip unchanged."""
+    try:
+        text = json.dumps(data, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return text if json.loads(text) == data else None
+
+
+def load_config_snapshot(config_path: Path) -> dict[str, Any]:
+    """Load a YAML config through the snapshot cache.
+
+    Args:
+        config_path: YAML config file
+
+    Returns:
+        Parsed config (a fresh copy on every call), empty dict if missing
+
+    Raises:
+        yaml.YAMLError: If the file has to be parsed and is malformed
+    """
+    key = _stat_key(config_path)
+    if key is None:
+        return {}
+
+    cache_key = str(config_path)
+    memo = _memo.get(cache_key)
+    if memo is not None and memo[0] == key:
+        return json.loads(memo[1])
+
+    text = _read_snapshot(config_path, key)
+    if text is not None:
+        try:
+            data = json.loads(text)
+        except ValueError:
+            text = None
+
+    if text is None:
+        data = parse_yaml_file(config_path)
+        text = _to_json(data)
+        if text is None:
+            # Dates or non-string keys: correct but not cacheable as JSON
+            return data
+        _write_snapshot(config_path, key, text)
+
+    _memo[cache_key] = (key, text)
+    return data
+
+
+def clear_config_snapshots() -> None:
+    """Drop in-process snapshots (on-disk snapshots revalidate themselves)."""
+    _memo.clear()
@@ -0,0 +1,87 @@
+"""Cached validation of hook configuration sections.
+
+Validating with pydantic means importing it, which dominates startup for
+small hooks. Validated results are memoized in-process and stored under
+.data/cache/config keyed by a digest of the raw section, so pydantic is
+only imported when a section actually changed.
+"""
+
+import copy
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+from .paths import get_data_path
+
+_memo: dict[str, tuple[str, dict[str, Any]]] = {}
+
+
+def _digest(loaded: dict[str, Any], schema_file: Path | None) -> str:
+    import hashlib
+
+    raw = json.dumps(loaded, sort_keys=True, default=str)
+    if schema_file is not None:
+        try:
+            stat = schema_file.stat()
+            raw += f"|{schema_file}|{stat.st_mtime_ns}|{stat.st_size}"
+        except OSError:
+            raw += f"|{schema_file}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _read_cached(name: str, digest: str) -> dict[str, Any] | None:
+    try:
+        cache_file = get_data_path("cache/config") / f"{name}.json"
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError, EnvironmentError):
+        return None
+
+    if cached.get("digest") != digest:
+        return None
+    return cached.get("config")
+
+
+def _write_cached(name: str, digest: str, config: dict[str, Any]) -> None:
+    try:
+        cache_dir = get_data_path("cache/config")
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_dir / f"{name}.json.{os.getpid()}.tmp"
+        tmp_file.write_text(json.dumps({"digest": digest, "config": config}), encoding="utf-8")
+        tmp_file.replace(cache_dir / f"{name}.json")
+    except (OSError, TypeError, ValueError, EnvironmentError):
+        pass
+
+
+def get_validated_config(
+    name: str,
+    loaded: dict[str, Any],
+    validate: Callable[[dict[str, Any]], dict[str, Any]],
+    schema_file: Path | None = None,
+) -> dict[str, Any]:
+    """Validate a config section, reusing earlier results for identical input.
+
+    Args:
+        name: Cache key, typically the hook name
+        loaded: Raw config section from config.yml
+        validate: Callable returning the validated dict; should import its
+            pydantic schema lazily so cache hits skip the import
+        schema_file: Module defining the schema; its mtime and size are part
+            of the cache key so schema edits invalidate cached results
+
+    Returns:
+        Validated configuration dictionary
+    """
+    digest = _digest(loaded, schema_file)
+
+    memo = _memo.get(name)
+    if memo is not None and memo[0] == digest:
+        return copy.deepcopy(memo[1])
+
+    config = _read_cached(name, digest)
+    if config is None:
+        config = validate(loaded)
+        _write_cached(name, digest, config)
+
+    _memo[name] = (digest, config)
+    return copy.deepcopy(config)
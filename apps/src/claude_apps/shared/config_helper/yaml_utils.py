@@ -3,8 +3,6 @@
 from pathlib import Path
 from typing import Any, Optional, Union
 
-import yaml
-
 
 def safe_load(source: Union[str, Path, Any]) -> Any:
     """Safely load YAML content from a string, file path, or file object.
@@ -19,22 +17,26 @@ def safe_load(source: Union[str, Path, Any]) -> Any:
         FileNotFoundError: If path doesn't exist
         yaml.YAMLError: If YAML is malformed
     """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     if isinstance(source, Path):
         if not source.exists():
             raise FileNotFoundError(f"YAML file not found: {source}")
         with open(source) as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=loader) or {}
     elif isinstance(source, str):
         # Check if it's a file path string
         path = Path(source)
         if path.exists() and path.is_file():
             with open(path) as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=loader) or {}
         # Otherwise treat as YAML content
-        return yaml.safe_load(source) or {}
+        return yaml.load(source, Loader=loader) or {}
     else:
         # Assume file-like object
-        return yaml.safe_load(source) or {}
+        return yaml.load(source, Loader=loader) or {}
 
 
 def safe_dump(
@@ -58,6 +60,8 @@ def safe_dump(
     Returns:
         YAML string if dest is None, otherwise None
     """
+    import yaml
+
     kwargs = {
         "default_flow_style": default_flow_style,
         "allow_unicode": allow_unicode,
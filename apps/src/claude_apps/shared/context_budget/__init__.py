@@ -0,0 +1,38 @@
+"""Context budget - bounding the additionalContext injected per event.
+
+Hooks that run for the same event (rules_loader, session_context_injector,
+cloud_auth_prompt, changelog_monitor, submodule_auto_updater, ...) each
+contribute context independently. The dispatcher registers every hook's
+contribution with its configured priority, trims the lower-priority ones
+to the event's budget, and records per-session telemetry of what each
+hook offered and what was injected.
+"""
+
+from .budget import (
+    CHARS_PER_TOKEN,
+    Allocation,
+    Contribution,
+    allocate,
+    event_limit,
+    get_budget_config,
+    hook_priority,
+    trim_context,
+)
+from .usage import load_usage, record_usage
+
+__all__ = [
+    # budget
+    "CHARS_PER_TOKEN",
+    "Allocation",
+    "Contribution",
+    "allocate",
+    "event_limit",
+    "get_budget_config",
+    "hook_priority",
+    "trim_context",
+    # usage
+    "load_usage",
+    "record_usage",
+]
+
+__version__ = "1.0.0"
@@ -0,0 +1,155 @@
+"""Allocating an event's additionalContext budget between hooks.
+
+Every hook contributes its context with a priority (lower is more
+important, like rule numbers). Contributions are served in priority
+order while the budget lasts; the first that does not fit is cut at a
+line boundary and ends with a note of how much was omitted, and the
+ones after it get only that note if it still fits. The output keeps the
+hooks' original order.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+from claude_apps.shared.config_helper import get_hook_config
+
+# Rough size of a token in characters, used to turn max_tokens into chars
+CHARS_PER_TOKEN = 4
+# Separator the dispatcher joins contexts with
+SEPARATOR = "\n\n"
+# Below this many characters of room a contribution is dropped, not cut
+MIN_KEEP_CHARS = 80
+
+DEFAULT_CONFIG: dict[str, Any] = {
+    "enabled": True,
+    "max_chars": None,
+    "max_tokens": None,
+    "events": {},
+    "priorities": {},
+    "default_priority": 50,
+    "telemetry": True,
+}
+
+
+@dataclass
+class Contribution:
+    """One hook's context for an event."""
+
+    hook: str
+    text: str
+    priority: int = 50
+
+
+@dataclass
+class Allocation:
+    """What was kept of a contribution."""
+
+    hook: str
+    text: str
+    offered_chars: int
+    priority: int = 50
+
+    @property
+    def injected_chars(self) -> int:
+        return len(self.text)
+
+    @property
+    def trimmed(self) -> bool:
+        return self.injected_chars < self.offered_chars
+
+
+def get_budget_config() -> dict[str, Any]:
+    """Load the budget configuration (hooks.context_budget in config.yml)."""
+    config = DEFAULT_CONFIG.copy()
+    config.update(get_hook_config("context_budget"))
+    return config
+
+
+def _limit_of(settings: Mapping[str, Any]) -> Optional[int]:
+    limits = []
+    if settings.get("max_chars") is not None:
+        limits.append(int(settings["max_chars"]))
+    if settings.get("max_tokens") is not None:
+        limits.append(int(settings["max_tokens"]) * CHARS_PER_TOKEN)
+    return max(0, min(limits)) if limits else None
+
+
+def event_limit(config: Mapping[str, Any], event_name: str) -> Optional[int]:
+    """Character budget for an event (None when unbounded).
+
+    ``events.<name>`` may set max_chars/max_tokens for one event; otherwise
+    the top-level values apply. When both are set the smaller wins.
+    """
+    settings = (config.get("events") or {}).get(event_name)
+    if isinstance(settings, Mapping):
+        limit = _limit_of(settings)
+        if limit is not None:
+            return limit
+    return _limit_of(config)
+
+
+def hook_priority(config: Mapping[str, Any], hook: str) -> int:
+    """Priority of a hook's contribution (lower is served first)."""
+    return int((config.get("priorities") or {}).get(hook, config.get("default_priority", 50)))
+
+
+def trim_context(text: str, limit: int, hook: str = "") -> str:
+    """Cut a context to at most limit characters.
+
+    Args:
+        text: Context text
+        limit: Maximum length of the result
+        hook: Hook name for the omission note
+
+    Returns:
+        The text if it fits; otherwise its head, cut at a line boundary
+        when one is close, plus a note of what was omitted; or just the
+        note, or "" when not even that fits
+    """
+    if len(text) <= limit:
+        return text
+    source = f" from {hook}" if hook else ""
+
+    def note(omitted: int) -> str:
+        return f"[context budget: {omitted} of {len(text)} chars{source} omitted]"
+
+    room = limit - len(note(len(text))) - 1
+    if room < MIN_KEEP_CHARS:
+        dropped = note(len(text))
+        return dropped if len(dropped) <= limit else ""
+    cut = text.rfind("\n", 0, room)
+    if cut < room // 2:
+        cut = room
+    head = text[:cut].rstrip()
+    return f"{head}\n{note(len(text) - len(head))}"
+
+
+def allocate(contributions: list[Contribution], limit: Optional[int]) -> list[Allocation]:
+    """Share a character budget between contributions by priority.
+
+    Args:
+        contributions: Non-empty contexts in output order
+        limit: Budget for the joined result (None for no limit)
+
+    Returns:
+        One allocation per contribution, in the same order; dropped
+        contributions have empty text
+    """
+    allocations = [
+        Allocation(hook=c.hook, text=c.text, offered_chars=len(c.text), priority=c.priority)
+        for c in contributions
+    ]
+    if limit is None:
+        return allocations
+
+    remaining = limit
+    kept = False
+    for i in sorted(range(len(contributions)), key=lambda i: contributions[i].priority):
+        # Every kept contribution after the first costs a separator
+        room = remaining - (len(SEPARATOR) if kept else 0)
+        allocation = allocations[i]
+        allocation.text = trim_context(contributions[i].text, max(0, room), contributions[i].hook)
+        if allocation.text:
+            remaining = room - len(allocation.text)
+            kept = True
+    return allocations
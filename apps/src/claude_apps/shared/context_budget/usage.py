@@ -0,0 +1,69 @@
+"""Per-session telemetry of injected context.
+
+Totals per hook and per event are kept in ``<session>/.context_usage.json``
+under the context_budget log base: how many events a hook contributed
+to, the characters it offered and injected, and how often it was
+trimmed or dropped. Each update is a constant-size locked
+read-modify-write that replaces the file atomically (see
+shared.json_file).
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+from claude_apps.shared.json_file import read_json_file, update_json_file
+
+from .budget import Allocation
+
+USAGE_NAME = ".context_usage.json"
+
+_COUNTERS = ("events", "offered_chars", "injected_chars", "trimmed", "dropped")
+
+
+def _empty_usage() -> Dict[str, Any]:
+    return {"version": 1, "hooks": {}, "events": {}}
+
+
+def _add(totals: Dict[str, int], offered: int, injected: int) -> None:
+    for key in _COUNTERS:
+        totals.setdefault(key, 0)
+    totals["events"] += 1
+    totals["offered_chars"] += offered
+    totals["injected_chars"] += injected
+    totals["trimmed"] += int(0 < injected < offered)
+    totals["dropped"] += int(offered > 0 and injected == 0)
+
+
+def record_usage(session_dir: Path, event_name: str, allocations: Iterable[Allocation]) -> None:
+    """Add one event's allocations to the session's totals.
+
+    Raises:
+        OSError: If the usage file cannot be read or written
+    """
+    allocations = list(allocations)
+    if not allocations:
+        return
+
+    def update(usage: Dict[str, Any]) -> bool:
+        for allocation in allocations:
+            _add(
+                usage["hooks"].setdefault(allocation.hook, {}),
+                allocation.offered_chars,
+                allocation.injected_chars,
+            )
+        _add(
+            usage["events"].setdefault(event_name, {}),
+            sum(a.offered_chars for a in allocations),
+            sum(a.injected_chars for a in allocations),
+        )
+        return True
+
+    update_json_file(session_dir / USAGE_NAME, update, _empty_usage)
+
+
+def load_usage(session_dir: Path) -> Dict[str, Any]:
+    """Read a session's context usage (empty if there is none)."""
+    try:
+        return read_json_file(session_dir / USAGE_NAME, _empty_usage)
+    except OSError:
+        return _empty_usage()
@@ -0,0 +1,45 @@
+"""Deadline - bounding how long a hook keeps Claude Code waiting.
+
+Each hook run gets a time budget from config.yml. Blocking steps take
+their timeouts from the budget, child processes inherit what is left,
+and work the budget does not cover is handed to a detached continuation
+while the hook responds with what it has.
+"""
+
+from .background import (
+    claim_continuation,
+    continue_in_background,
+    get_claim_path,
+    release_continuation,
+)
+from .deadline import (
+    ENV_VAR,
+    Deadline,
+    DeadlineExceededError,
+    current_deadline,
+    deadline_scope,
+    get_deadline_config,
+    hook_budget,
+    hook_deadline,
+    run_within,
+)
+
+__all__ = [
+    # background
+    "claim_continuation",
+    "continue_in_background",
+    "get_claim_path",
+    "release_continuation",
+    # deadline
+    "ENV_VAR",
+    "Deadline",
+    "DeadlineExceededError",
+    "current_deadline",
+    "deadline_scope",
+    "get_deadline_config",
+    "hook_budget",
+    "hook_deadline",
+    "run_within",
+]
+
+__version__ = "1.0.0"
@@ -0,0 +1,102 @@
+"""Continuing a hook's unfinished work after it has responded.
+
+When a deadline cuts a hook short it responds with what it has and
+starts ``python -m <module> <args>`` as a detached process to finish
+the job without a deadline. A claim file under
+``.data/cache/deadline/`` keeps concurrent sessions from starting the
+same continuation twice; the continuation releases it when done. A
+stale claim is checked and replaced under a flock on the matching
+``.lock`` file, so only one of several sessions can take it over.
+"""
+
+import fcntl
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+from claude_apps.shared.config_helper import get_data_path
+from claude_apps.shared.json_file import lock_path
+
+from .deadline import ENV_VAR
+
+# A claim older than this is assumed to belong to a continuation that died
+DEFAULT_STALE_SECONDS = 600
+
+
+def get_claim_path(name: str) -> Path:
+    """Claim file of a named continuation."""
+    return get_data_path("cache/deadline") / f"{name}.claim"
+
+
+def claim_continuation(name: str, stale_seconds: float = DEFAULT_STALE_SECONDS) -> bool:
+    """Claim a continuation; False if a live one already holds the claim."""
+    path = get_claim_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path(path), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if time.time() - path.stat().st_mtime < stale_seconds:
+                return False
+        except FileNotFoundError:
+            pass
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(str(os.getpid()))
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+    return True
+
+
+def release_continuation(name: str) -> None:
+    """Release a continuation's claim (called by the continuation itself)."""
+    try:
+        get_claim_path(name).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def continue_in_background(
+    name: str,
+    module: str,
+    args: Sequence[str] = (),
+    log_file: Optional[Path] = None,
+) -> bool:
+    """Start a detached ``python -m module args`` unless one is running.
+
+    The child does not inherit the hook's deadline.
+
+    Args:
+        name: Continuation name for the claim file
+        module: Module to run
+        args: Its arguments
+        log_file: File receiving the child's stdout and stderr
+
+    Returns:
+        True if a continuation was started
+    """
+    try:
+        if not claim_continuation(name):
+            return False
+        env = dict(os.environ)
+        env.pop(ENV_VAR, None)
+        if log_file is not None:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_file if log_file is not None else os.devnull, "ab") as log:
+            subprocess.Popen(
+                [sys.executable, "-m", module, *args],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                env=env,
+                start_new_session=True,
+                close_fds=True,
+            )
+        return True
+    except OSError:
+        release_continuation(name)
+        return False
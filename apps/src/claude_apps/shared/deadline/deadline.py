@@ -0,0 +1,196 @@
+"""Time budgets for hook runs.
+
+The runner gives every hook a deadline from ``hooks.deadline`` in
+config.yml. Hooks read it with current_deadline() and bound blocking
+work with Deadline.timeout(); child processes started through
+run_within() inherit what is left through CLAUDE_HOOK_DEADLINE (an
+absolute epoch time, so it means the same thing in every process).
+"""
+
+import contextvars
+import os
+import subprocess
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping, Optional
+
+from claude_apps.shared.config_helper import get_hook_config
+
+ENV_VAR = "CLAUDE_HOOK_DEADLINE"
+
+DEFAULT_CONFIG: dict[str, Any] = {
+    "enabled": True,
+    "default_seconds": None,
+    "hooks": {},
+    # Time kept back for writing the response once blocking work is cut
+    "margin_seconds": 0.25,
+}
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a hook's time budget does not cover the next step."""
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Point in (epoch) time by which a hook must respond.
+
+    Attributes:
+        expires_at: Epoch seconds, or None for no deadline
+        margin: Seconds kept back from every timeout()
+    """
+
+    expires_at: Optional[float] = None
+    margin: float = 0.0
+
+    @classmethod
+    def after(cls, seconds: float, margin: float = 0.0) -> "Deadline":
+        """Deadline the given number of seconds from now."""
+        return cls(time.time() + seconds, margin)
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "Deadline":
+        """Deadline inherited from a parent process (none if unset or invalid)."""
+        value = (os.environ if env is None else env).get(ENV_VAR)
+        try:
+            return cls(float(value)) if value else cls()
+        except ValueError:
+            return cls()
+
+    @property
+    def bounded(self) -> bool:
+        return self.expires_at is not None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None when unbounded."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.time())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def within(self, seconds: Optional[float], margin: Optional[float] = None) -> "Deadline":
+        """The earlier of this deadline and one the given seconds from now."""
+        margin = self.margin if margin is None else margin
+        if seconds is None:
+            return Deadline(self.expires_at, margin)
+        expires_at = time.time() + seconds
+        if self.expires_at is not None:
+            expires_at = min(expires_at, self.expires_at)
+        return Deadline(expires_at, margin)
+
+    def timeout(self, cap: Optional[float] = None) -> Optional[float]:
+        """Timeout for the next blocking step.
+
+        Args:
+            cap: The step's own timeout, if it has one
+
+        Returns:
+            The smaller of cap and the time left minus the margin
+
+        Raises:
+            DeadlineExceededError: If no time is left for the step
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return cap
+        remaining -= self.margin
+        if remaining <= 0:
+            raise DeadlineExceededError("hook deadline reached")
+        return remaining if cap is None else min(cap, remaining)
+
+    def binds(self, cap: Optional[float]) -> bool:
+        """Whether the deadline, not cap, limits a step started now."""
+        remaining = self.remaining()
+        return remaining is not None and (cap is None or remaining - self.margin < cap)
+
+    def env(self, base: Optional[Mapping[str, str]] = None) -> dict[str, str]:
+        """Environment for a child process that inherits this deadline."""
+        env = dict(os.environ if base is None else base)
+        if self.expires_at is None:
+            env.pop(ENV_VAR, None)
+        else:
+            env[ENV_VAR] = f"{self.expires_at:.3f}"
+        return env
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "hook_deadline", default=None
+)
+
+
+def current_deadline() -> Deadline:
+    """Deadline of the running hook (inherited from the environment if unset)."""
+    deadline = _current.get()
+    return deadline if deadline is not None else Deadline.from_env()
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline) -> Iterator[Deadline]:
+    """Make deadline the current one for the duration of the block."""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def get_deadline_config() -> dict[str, Any]:
+    """Load deadline settings (hooks.deadline in config.yml)."""
+    config = DEFAULT_CONFIG.copy()
+    config.update(get_hook_config("deadline"))
+    return config
+
+
+def hook_budget(config: Mapping[str, Any], hook: str) -> Optional[float]:
+    """Seconds a hook may run (None when unbounded)."""
+    seconds = (config.get("hooks") or {}).get(hook, config.get("default_seconds"))
+    return None if seconds is None else float(seconds)
+
+
+def hook_deadline(hook: str) -> Deadline:
+    """Deadline for a run of hook: its budget, capped by any inherited one.
+
+    Without a readable config only the inherited deadline applies.
+    """
+    inherited = Deadline.from_env()
+    try:
+        config = get_deadline_config()
+    except OSError:
+        return inherited
+    if not config.get("enabled", True):
+        return inherited
+    return inherited.within(hook_budget(config, hook), float(config.get("margin_seconds", 0.0)))
+
+
+def run_within(
+    cmd: list[str],
+    deadline: Deadline,
+    cap: Optional[float] = None,
+    **kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """subprocess.run bounded by a deadline the child inherits.
+
+    Args:
+        cmd: Command and arguments
+        deadline: Deadline of the calling hook
+        cap: The command's own timeout, if any
+        **kwargs: Passed to subprocess.run (env is extended, not replaced)
+
+    Raises:
+        DeadlineExceededError: If no time is left, or the command was cut off
+            by the deadline rather than by cap
+        subprocess.TimeoutExpired: If cap was reached first
+    """
+    timeout = deadline.timeout(cap)
+    binding = deadline.binds(cap)
+    kwargs["env"] = deadline.env(kwargs.get("env"))
+    try:
+        return subprocess.run(cmd, timeout=timeout, **kwargs)
+    except subprocess.TimeoutExpired as e:
+        if binding:
+            raise DeadlineExceededError(f"{cmd[0]} cut off by hook deadline") from e
+        raise
@@ -0,0 +1,76 @@
+"""Event log - append-only NDJSON files for hook logs.
+
+Every record is one JSON line appended with a single write() on an
+O_APPEND descriptor, so concurrent hook processes never lose or interleave
+each other's records and writing costs the same regardless of file size.
+The reader also accepts the older pretty-printed JSON array files and can
+render any log as that array on demand.
+
+Long-running writers (the logger hook) append to per-session segments that
+rotate by size and time and are compressed once sealed; see segments.
+Large members can be moved to a content-addressed blob store; see blobs.
+"""
+
+from .blobs import (
+    BLOB_DIR_NAME,
+    externalize,
+    find_blob_store,
+    get_blob,
+    is_blob_ref,
+    put_blob,
+    rehydrate,
+)
+from .reader import (
+    iter_records,
+    read_log_bytes,
+    read_log_text,
+    read_records,
+    render_json_array,
+)
+from .segments import (
+    DEFAULT_POLICY,
+    SegmentPolicy,
+    active_segment_path,
+    append_lines_to_session,
+    append_to_session,
+    compress_segment,
+    iter_session_records,
+    list_segments,
+    maintain_session,
+    seal_segment,
+)
+from .writer import append_line, append_record, encode_record
+
+__all__ = [
+    # blobs
+    "BLOB_DIR_NAME",
+    "externalize",
+    "find_blob_store",
+    "get_blob",
+    "is_blob_ref",
+    "put_blob",
+    "rehydrate",
+    # writer
+    "append_line",
+    "append_record",
+    "encode_record",
+    # reader
+    "iter_records",
+    "read_log_bytes",
+    "read_log_text",
+    "read_records",
+    "render_json_array",
+    # segments
+    "DEFAULT_POLICY",
+    "SegmentPolicy",
+    "active_segment_path",
+    "append_lines_to_session",
+    "append_to_session",
+    "compress_segment",
+    "iter_session_records",
+    "list_segments",
+    "maintain_session",
+    "seal_segment",
+]
+
+__version__ = "1.0.0"
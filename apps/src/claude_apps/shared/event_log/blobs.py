@@ -0,0 +1,121 @@
+"""Content-addressed store for large record members.
+
+A member moved to the store is replaced in its record by a reference:
+
+    {"$blob": "<sha256 of the member's compact JSON>", "bytes": <length>}
+
+and its JSON is written once, gzip-compressed, to
+``<store>/<first two hex digits>/<digest>.json.gz``. Identical payloads
+(the same file read twice, an unchanged page snapshot) share one blob, so
+a repeat costs a hash and a stat. The store lives in a ``.blobs``
+directory under a log base; readers locate it from a log file's path.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from .writer import encode_record
+
+BLOB_DIR_NAME = ".blobs"
+BLOB_KEY = "$blob"
+BLOB_SUFFIX = ".json.gz"
+
+# Blobs are written once on the hook path; favour speed over ratio
+COMPRESS_LEVEL = 1
+
+
+def blob_path(store: Path, digest: str) -> Path:
+    """Path of a blob in a store."""
+    return store / digest[:2] / f"{digest}{BLOB_SUFFIX}"
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Whether a value is a blob reference."""
+    return isinstance(value, dict) and len(value) == 2 and BLOB_KEY in value and "bytes" in value
+
+
+def _store_bytes(store: Path, data: bytes) -> dict[str, Any]:
+    digest = hashlib.sha256(data).hexdigest()
+    path = blob_path(store, digest)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(gzip.compress(data, compresslevel=COMPRESS_LEVEL, mtime=0))
+        os.replace(tmp, path)
+    return {BLOB_KEY: digest, "bytes": len(data)}
+
+
+def put_blob(store: Path, value: Any) -> dict[str, Any]:
+    """Store a value (if not already present) and return its reference.
+
+    Raises:
+        OSError: If the blob cannot be written
+    """
+    return _store_bytes(store, encode_record(value).encode("utf-8"))
+
+
+def get_blob(store: Path, digest: str) -> Any:
+    """Load a blob's value.
+
+    Raises:
+        OSError: If the blob is missing or unreadable
+        ValueError: If its content is not valid JSON
+    """
+    with gzip.open(blob_path(store, digest), "rb") as f:
+        return json.loads(f.read())
+
+
+def externalize(record: dict[str, Any], store: Path, min_bytes: int, skip: tuple = ()) -> int:
+    """Move top-level members of min_bytes or more into the store.
+
+    Args:
+        record: Record to rewrite in place
+        store: Blob store directory
+        min_bytes: Size of a member's compact JSON from which it is stored
+        skip: Members that always stay inline
+
+    Returns:
+        Number of members moved
+    """
+    moved = 0
+    for key, value in record.items():
+        if key in skip or not isinstance(value, (dict, list, str)) or is_blob_ref(value):
+            continue
+        # Upper bound on the encoded size (6 bytes for a \uXXXX escape)
+        # skips short strings without encoding them
+        if isinstance(value, str) and len(value) * 6 + 2 < min_bytes:
+            continue
+        data = encode_record(value).encode("utf-8")
+        if len(data) >= min_bytes:
+            record[key] = _store_bytes(store, data)
+            moved += 1
+    return moved
+
+
+def find_blob_store(log_path: Path) -> Path | None:
+    """Find the blob store for a log file (nearest ``.blobs`` above it)."""
+    for parent in Path(log_path).resolve().parents:
+        candidate = parent / BLOB_DIR_NAME
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+def rehydrate(record: Any, store: Path | None) -> Any:
+    """Replace blob references in a record's top-level members.
+
+    References whose blob cannot be read are left as they are.
+    """
+    if store is None or not isinstance(record, dict):
+        return record
+    for key, value in record.items():
+        if is_blob_ref(value):
+            try:
+                record[key] = get_blob(store, value[BLOB_KEY])
+            except (OSError, EOFError, ValueError):
+                pass
+    return record
@@ -0,0 +1,116 @@
+"""Reading NDJSON event logs and rendering them as JSON arrays."""
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from .blobs import find_blob_store, rehydrate
+
+_DECODER = json.JSONDecoder()
+
+
+def _iter_text(text: str) -> Iterator[Any]:
+    start = len(text) - len(text.lstrip())
+    if text.startswith("[", start):
+        # Pretty JSON array written before logs were NDJSON; lines appended
+        # to such a file afterwards follow the array.
+        try:
+            items, end = _DECODER.raw_decode(text, start)
+        except ValueError:
+            return
+        yield from items if isinstance(items, list) else [items]
+        text = text[end:]
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            # Torn or foreign line; keep reading the rest of the log
+            continue
+
+
+def read_log_bytes(file_path: Path) -> bytes:
+    """Read a log file's content, decompressing .gz and .xz segments.
+
+    Raises:
+        OSError: If the file cannot be read
+        EOFError: If a compressed file is truncated
+    """
+    path = Path(file_path)
+    if path.suffix == ".gz":
+        import gzip
+
+        with gzip.open(path, "rb") as f:
+            return f.read()
+    if path.suffix == ".xz":
+        import lzma
+
+        with lzma.open(path, "rb") as f:
+            return f.read()
+    return path.read_bytes()
+
+
+def read_log_text(file_path: Path) -> str:
+    """Read a log file as text (see read_log_bytes).
+
+    Raises:
+        OSError: If the file cannot be read
+        EOFError: If a compressed file is truncated
+        UnicodeDecodeError: If the content is not UTF-8
+    """
+    return read_log_bytes(file_path).decode("utf-8")
+
+
+def iter_records(file_path: Path) -> Iterator[Any]:
+    """Yield records from an NDJSON (or legacy JSON array) log file.
+
+    Compressed segments (.gz, .xz) are read transparently. Unreadable files
+    yield nothing; malformed lines are skipped.
+
+    Args:
+        file_path: Log file
+
+    Yields:
+        Decoded records in file order
+    """
+    try:
+        text = read_log_text(file_path)
+    except (OSError, EOFError, UnicodeDecodeError):
+        return
+    yield from _iter_text(text)
+
+
+def read_records(file_path: Path) -> list[Any]:
+    """Read all records from a log file (see iter_records)."""
+    return list(iter_records(file_path))
+
+
+def render_json_array(
+    file_paths: Iterable[Path], indent: int | None = 2, resolve_blobs: bool = False
+) -> str:
+    """Render one or more log files as a single pretty JSON array.
+
+    This is the view the logs used to be stored as.
+
+    Args:
+        file_paths: Log files, concatenated in the given order
+        indent: JSON indentation (None for compact)
+        resolve_blobs: Replace blob references with their stored content
+
+    Returns:
+        JSON array text ending with a newline
+    """
+    records = []
+    stores: dict[Path, Path | None] = {}
+    for path in file_paths:
+        store = None
+        if resolve_blobs:
+            if path.parent not in stores:
+                stores[path.parent] = find_blob_store(path)
+            store = stores[path.parent]
+        records.extend(rehydrate(record, store) for record in iter_records(path))
+    return json.dumps(records, ensure_ascii=False, indent=indent) + "\n"
@@ -0,0 +1,305 @@
+"""Per-session rotating log segments.
+
+A session directory holds at most one active segment per time window and
+any number of sealed ones:
+
+    <session>/active.<window>.ndjson              records are appended here
+    <session>/segment.<window>.<sealed_ns>.ndjson sealed, not yet compressed
+    <session>/segment.<window>.<sealed_ns>.ndjson.gz (or .xz)
+
+The active segment name is derived from the clock, so writers need no
+shared state: a new window starts a new file. A segment is sealed when the
+window ends or when an append would take it past max_bytes. Sealing is a
+rename to a unique name, so concurrent writers cannot overwrite each
+other's segments; a writer still holding the old descriptor finishes its
+single write into the sealed file. Sealed segments are compressed only
+once they have been idle for grace_seconds, which leaves every in-flight
+write time to land first.
+"""
+
+import os
+import shutil
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .reader import iter_records
+from .writer import open_append, write_record_bytes
+
+ACTIVE_PREFIX = "active."
+SEGMENT_PREFIX = "segment."
+SEGMENT_SUFFIX = ".ndjson"
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "lzma": ".xz", "none": ""}
+
+
+@dataclass(frozen=True)
+class SegmentPolicy:
+    """Rotation and compression settings for session segments.
+
+    Attributes:
+        max_bytes: Seal the active segment before it grows past this size
+        max_age_seconds: Length of a time window (one active segment each)
+        compression: "gzip", "lzma" or "none" for sealed segments
+        grace_seconds: Idle time before a sealed segment is compressed
+    """
+
+    max_bytes: int = 8 * 1024 * 1024
+    max_age_seconds: int = 3600
+    compression: str = "gzip"
+    grace_seconds: int = 60
+
+    def __post_init__(self) -> None:
+        if self.compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression: {self.compression}")
+        if self.max_bytes <= 0 or self.max_age_seconds <= 0:
+            raise ValueError("max_bytes and max_age_seconds must be positive")
+
+
+DEFAULT_POLICY = SegmentPolicy()
+
+
+def window_stamp(now: float, policy: SegmentPolicy = DEFAULT_POLICY) -> str:
+    """Local-time stamp of the window containing ``now``."""
+    start = int(now) // policy.max_age_seconds * policy.max_age_seconds
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime(start))
+
+
+def active_segment_path(
+    session_dir: Path, now: float | None = None, policy: SegmentPolicy = DEFAULT_POLICY
+) -> Path:
+    """Path of the active segment for the current time window."""
+    stamp = window_stamp(time.time() if now is None else now, policy)
+    return session_dir / f"{ACTIVE_PREFIX}{stamp}{SEGMENT_SUFFIX}"
+
+
+def _window_of(path: Path) -> str:
+    # active.<window>.ndjson / segment.<window>.<ns>.ndjson[.gz]
+    return path.name.split(".")[1]
+
+
+def seal_segment(active_path: Path) -> Path | None:
+    """Rename an active segment to a unique sealed name.
+
+    Returns:
+        The sealed path, or None if another writer sealed it first
+    """
+    sealed = active_path.with_name(
+        f"{SEGMENT_PREFIX}{_window_of(active_path)}.{time.time_ns()}{SEGMENT_SUFFIX}"
+    )
+    try:
+        os.rename(active_path, sealed)
+    except FileNotFoundError:
+        return None
+    return sealed
+
+
+def _open_compressed(path: Path, compression: str) -> Any:
+    if compression == "gzip":
+        import gzip
+
+        return gzip.open(path, "wb", compresslevel=6)
+    import lzma
+
+    return lzma.open(path, "wb", preset=6)
+
+
+def compress_segment(sealed_path: Path, compression: str) -> Path:
+    """Compress a sealed segment and remove the uncompressed file.
+
+    The compressed file is written under a temporary name and renamed into
+    place, so readers never see a partial archive.
+
+    Returns:
+        Path of the compressed segment (the input path for "none")
+    """
+    suffix = COMPRESSION_SUFFIXES[compression]
+    if not suffix:
+        return sealed_path
+    target = sealed_path.with_name(sealed_path.name + suffix)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with open(sealed_path, "rb") as src, _open_compressed(tmp, compression) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+    os.replace(tmp, target)
+    sealed_path.unlink()
+    return target
+
+
+def maintain_session(
+    session_dir: Path,
+    policy: SegmentPolicy = DEFAULT_POLICY,
+    now: float | None = None,
+    seal_idle: bool = False,
+) -> tuple[int, int]:
+    """Seal finished windows and compress idle sealed segments.
+
+    Args:
+        session_dir: Session log directory
+        policy: Rotation and compression settings
+        now: Current time (default: time.time())
+        seal_idle: Also seal the current window's segment when it has not
+            been written for max_age_seconds (ended sessions)
+
+    Returns:
+        Tuple of (segments sealed, segments compressed)
+    """
+    now = time.time() if now is None else now
+    current = window_stamp(now, policy)
+    sealed = compressed = 0
+
+    try:
+        entries = list(os.scandir(session_dir))
+    except OSError:
+        return 0, 0
+
+    for entry in entries:
+        name = entry.name
+        if not name.endswith(SEGMENT_SUFFIX) or not entry.is_file():
+            continue
+        path = Path(entry.path)
+        if name.startswith(ACTIVE_PREFIX):
+            stale = _window_of(path) != current
+            if not stale and seal_idle:
+                stale = now - entry.stat().st_mtime >= policy.max_age_seconds
+            if not stale:
+                continue
+            path = seal_segment(path)
+            if path is None:
+                continue
+            sealed += 1
+        if not path.name.startswith(SEGMENT_PREFIX) or policy.compression == "none":
+            continue
+        try:
+            last_write = path.stat().st_mtime
+        except FileNotFoundError:
+            continue
+        # Idle since both the last write and the seal, so a writer that
+        # opened the segment just before it was renamed has finished
+        sealed_at = int(path.name.split(".")[2]) / 1e9
+        if now - max(last_write, sealed_at) >= policy.grace_seconds:
+            try:
+                compress_segment(path, policy.compression)
+            except FileNotFoundError:
+                # Compressed concurrently by another writer
+                continue
+            compressed += 1
+
+    return sealed, compressed
+
+
+def _append_data(session_dir: Path, data: bytes, policy: SegmentPolicy, now: float) -> Path:
+    path = active_segment_path(session_dir, now, policy)
+
+    fd = open_append(path)
+    try:
+        size = os.fstat(fd).st_size
+        if size and size + len(data) > policy.max_bytes:
+            os.close(fd)
+            fd = -1
+            seal_segment(path)
+            fd = open_append(path)
+            size = os.fstat(fd).st_size
+        write_record_bytes(fd, data)
+    finally:
+        if fd >= 0:
+            os.close(fd)
+
+    if size == 0:
+        maintain_session(session_dir, policy, now)
+    return path
+
+
+def append_to_session(
+    session_dir: Path,
+    line: str,
+    policy: SegmentPolicy = DEFAULT_POLICY,
+    now: float | None = None,
+) -> Path:
+    """Append one NDJSON line to the session's active segment.
+
+    Rotation work (sealing, compression) only runs when this append starts
+    a new segment, so ordinary appends cost one open, fstat and write.
+
+    Args:
+        session_dir: Session log directory (created on first use)
+        line: Serialized record; must not contain a newline
+        policy: Rotation and compression settings
+        now: Current time (default: time.time())
+
+    Returns:
+        The segment the line was written to
+
+    Raises:
+        OSError: If the segment cannot be opened or written
+    """
+    now = time.time() if now is None else now
+    return _append_data(session_dir, f"{line}\n".encode("utf-8"), policy, now)
+
+
+def append_lines_to_session(
+    session_dir: Path,
+    lines: list[str],
+    policy: SegmentPolicy = DEFAULT_POLICY,
+    now: float | None = None,
+) -> int:
+    """Append many NDJSON lines with as few large writes as possible.
+
+    Lines are packed into chunks of at most max_bytes (a longer line goes
+    alone); each chunk is one O_APPEND write, so it lands contiguously.
+
+    Args:
+        session_dir: Session log directory (created on first use)
+        lines: Serialized records; none may contain a newline
+        policy: Rotation and compression settings
+        now: Current time (default: time.time())
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        OSError: If a segment cannot be opened or written
+    """
+    now = time.time() if now is None else now
+    written = 0
+    chunk: list[bytes] = []
+    chunk_size = 0
+    for line in lines:
+        data = f"{line}\n".encode("utf-8")
+        if chunk and chunk_size + len(data) > policy.max_bytes:
+            _append_data(session_dir, b"".join(chunk), policy, now)
+            written += chunk_size
+            chunk, chunk_size = [], 0
+        chunk.append(data)
+        chunk_size += len(data)
+    if chunk:
+        _append_data(session_dir, b"".join(chunk), policy, now)
+        written += chunk_size
+    return written
+
+
+def _segment_sort_key(path: Path) -> tuple[str, int, str]:
+    parts = path.name.split(".")
+    if path.name.startswith(SEGMENT_PREFIX):
+        return parts[1], 0, parts[2]
+    return parts[1], 1, ""
+
+
+def list_segments(session_dir: Path) -> list[Path]:
+    """Segments of a session in write order (sealed first within a window)."""
+    try:
+        names = os.listdir(session_dir)
+    except OSError:
+        return []
+    paths = [
+        session_dir / name
+        for name in names
+        if name.startswith((ACTIVE_PREFIX, SEGMENT_PREFIX)) and ".tmp" not in name
+    ]
+    return sorted(paths, key=_segment_sort_key)
+
+
+def iter_session_records(session_dir: Path) -> Iterator[Any]:
+    """Yield every record of a session across sealed and active segments."""
+    for path in list_segments(session_dir):
+        yield from iter_records(path)
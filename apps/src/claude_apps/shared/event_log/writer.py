@@ -0,0 +1,74 @@
+"""Append-only NDJSON writer."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+
+def encode_record(record: Any) -> str:
+    """Serialize a record as one compact JSON line (without the newline).
+
+    Raises:
+        TypeError: If the record is not JSON serializable
+    """
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def open_append(file_path: Path) -> int:
+    """Open a log file for O_APPEND writes, creating parents on first use.
+
+    Returns:
+        Raw file descriptor (caller closes)
+    """
+    try:
+        return os.open(file_path, _FLAGS, 0o644)
+    except FileNotFoundError:
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        return os.open(file_path, _FLAGS, 0o644)
+
+
+def write_record_bytes(fd: int, data: bytes) -> None:
+    """Write an encoded record with one write() call.
+
+    The kernel positions every O_APPEND write at the current end of file,
+    so records from concurrent writers land whole and in arrival order.
+    Regular files only return short on ENOSPC-like conditions; the rest is
+    then written rather than leaving a torn line.
+    """
+    written = os.write(fd, data)
+    while written < len(data):
+        written += os.write(fd, data[written:])
+
+
+def append_line(file_path: Path, line: str) -> None:
+    """Append one line to a log file with a single O_APPEND write.
+
+    Args:
+        file_path: Log file
+        line: Serialized record; must not contain a newline
+
+    Raises:
+        OSError: If the file cannot be opened or written
+    """
+    fd = open_append(file_path)
+    try:
+        write_record_bytes(fd, f"{line}\n".encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def append_record(file_path: Path, record: Any) -> None:
+    """Append a record to an NDJSON log file.
+
+    Args:
+        file_path: Log file
+        record: JSON-serializable record
+
+    Raises:
+        OSError: If the file cannot be opened or written
+        TypeError: If the record is not JSON serializable
+    """
+    append_line(file_path, encode_record(record))
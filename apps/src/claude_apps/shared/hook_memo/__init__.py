@@ -0,0 +1,32 @@
+"""Hook memo - replaying responses of hooks whose output is pure.
+
+Hooks declare the event fields and files their response depends on in
+``MEMO_INPUTS`` in their package ``__init__``; the runner looks up a
+digest of those inputs before importing the hook's entry point.
+"""
+
+from .memo import (
+    DEFAULT_MAX_ENTRIES,
+    MemoSpec,
+    get_memo_config,
+    get_memo_dir,
+    get_memo_spec,
+    load_memo,
+    memo_key,
+    memo_lookup,
+    store_memo,
+)
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "MemoSpec",
+    "get_memo_config",
+    "get_memo_dir",
+    "get_memo_spec",
+    "load_memo",
+    "memo_key",
+    "memo_lookup",
+    "store_memo",
+]
+
+__version__ = "1.0.0"
@@ -0,0 +1,214 @@
+"""Memoized responses of pure hooks.
+
+A hook whose output is a function of a few event fields and files
+declares them in its package ``__init__``::
+
+    MEMO_INPUTS = {
+        "events": ["SessionStart"],     # events that may be memoized (all if omitted)
+        "fields": ["hook_event_name", "source"],
+        "files": ["docs/ROADMAP.md"],   # relative to the .claude root, or absolute
+        "data_files": ["cache/x.md"],   # relative to the data directory
+        "ttl_seconds": 3600,            # optional upper bound on an entry's age
+    }
+
+The key is a digest of the hook name, those fields, the (mtime, size) of
+config.yml, of each file (the listing, for a directory) and of the hook
+package's own modules. A hit replays the stored stdout without importing the hook's
+entry point. Entries live in ``.data/cache/hook_memo/<hook>/<key>.json``;
+only clean runs (exit code 0) are stored.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+from claude_apps.shared.config_helper import (
+    get_claude_root,
+    get_config_path,
+    get_data_path,
+    get_hook_config,
+)
+from claude_apps.shared.hook_protocol import iter_events
+
+DEFAULT_MAX_ENTRIES = 16
+
+
+@dataclass(frozen=True)
+class MemoSpec:
+    """Inputs a hook's output depends on."""
+
+    fields: tuple[str, ...] = ("hook_event_name",)
+    files: tuple[str, ...] = ()
+    events: Optional[tuple[str, ...]] = None
+    ttl_seconds: Optional[float] = None
+    data_files: tuple[str, ...] = ()
+
+    @classmethod
+    def from_mapping(cls, inputs: Mapping[str, Any]) -> "MemoSpec":
+        events = inputs.get("events")
+        ttl = inputs.get("ttl_seconds")
+        return cls(
+            fields=tuple(inputs.get("fields", ("hook_event_name",))),
+            files=tuple(inputs.get("files", ())),
+            events=None if events is None else tuple(events),
+            ttl_seconds=None if ttl is None else float(ttl),
+            data_files=tuple(inputs.get("data_files", ())),
+        )
+
+
+def get_memo_spec(package: str) -> Optional[MemoSpec]:
+    """The memo declaration of a hook package, or None if it has none.
+
+    Args:
+        package: Dotted hook package (its ``__init__`` is imported, not
+            the entry point)
+    """
+    try:
+        inputs = getattr(importlib.import_module(package), "MEMO_INPUTS", None)
+    except ImportError:
+        return None
+    return MemoSpec.from_mapping(inputs) if isinstance(inputs, Mapping) else None
+
+
+def _stat_entry(path: Path) -> list[Any]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return [str(path), None]
+    entry: list[Any] = [str(path), stat.st_mtime_ns, stat.st_size]
+    if path.is_dir():
+        # A directory's own mtime misses in-place edits of its files
+        try:
+            with os.scandir(path) as entries:
+                entry.append(
+                    sorted(
+                        (e.name, e.stat().st_mtime_ns, e.stat().st_size)
+                        for e in entries
+                        if e.is_file()
+                    )
+                )
+        except OSError:
+            pass
+    return entry
+
+
+def memo_key(
+    hook_name: str,
+    spec: MemoSpec,
+    stdin: str,
+    root: Path,
+    code_dir: Optional[Path] = None,
+) -> Optional[str]:
+    """Digest of everything a hook's response depends on.
+
+    Args:
+        hook_name: Registered hook name
+        spec: The hook's memo declaration
+        stdin: Raw hook event
+        root: Directory relative file inputs are resolved against
+        code_dir: The hook package directory (its modules' stats are
+            part of the key)
+
+    Returns:
+        The key, or None when the event cannot be memoized
+    """
+    try:
+        event = next(iter_events(stdin), None)
+    except ValueError:
+        return None
+    if event is None:
+        return None
+    if spec.events is not None and event.get("hook_event_name") not in spec.events:
+        return None
+
+    parts: list[Any] = [hook_name, [event.get(name) for name in spec.fields]]
+    parts.extend(
+        _stat_entry(Path(name) if os.path.isabs(name) else root / name) for name in spec.files
+    )
+    if code_dir is not None:
+        parts.append(_stat_entry(code_dir))
+    raw = json.dumps(parts, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def get_memo_dir(hook_name: str) -> Path:
+    """Directory holding a hook's memoized responses."""
+    return get_data_path("cache/hook_memo") / hook_name
+
+
+def load_memo(memo_dir: Path, key: str, ttl_seconds: Optional[float] = None) -> Optional[str]:
+    """Stored stdout for a key, or None if absent or older than ttl_seconds."""
+    try:
+        entry = json.loads((memo_dir / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("stdout"), str):
+        return None
+    if ttl_seconds is not None and time.time() - entry.get("stored_at", 0) > ttl_seconds:
+        return None
+    return entry["stdout"]
+
+
+def store_memo(
+    memo_dir: Path, key: str, stdout: str, max_entries: int = DEFAULT_MAX_ENTRIES
+) -> None:
+    """Store a response, keeping at most max_entries per hook (newest win)."""
+    try:
+        memo_dir.mkdir(parents=True, exist_ok=True)
+        path = memo_dir / f"{key}.json"
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"stored_at": time.time(), "stdout": stdout}), encoding="utf-8"
+        )
+        tmp_path.replace(path)
+
+        entries = sorted(memo_dir.glob("*.json"), key=lambda p: p.stat().st_mtime_ns)
+        for stale in entries[: max(0, len(entries) - max_entries)]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def get_memo_config() -> dict[str, Any]:
+    """Memo settings from hooks.hook_memo in config.yml."""
+    config = {"enabled": True, "max_entries": DEFAULT_MAX_ENTRIES}
+    config.update(get_hook_config("hook_memo"))
+    return config
+
+
+def memo_lookup(hook_name: str, package: str, stdin: str) -> tuple[Optional[str], Optional[str]]:
+    """Look a hook invocation up in the memo.
+
+    Args:
+        hook_name: Registered hook name
+        package: Dotted hook package declaring MEMO_INPUTS
+        stdin: Raw hook event
+
+    Returns:
+        (stored stdout or None, key to store the response under or None
+        when the hook or event is not memoizable)
+    """
+    spec = get_memo_spec(package)
+    if spec is None:
+        return None, None
+    try:
+        if not get_memo_config().get("enabled", True):
+            return None, None
+        code_dir = Path(importlib.import_module(package).__file__).parent
+        data_files = (str(get_data_path(name)) for name in spec.data_files)
+        spec = replace(
+            spec,
+            files=(str(get_config_path().resolve()), *spec.files, *data_files),
+            data_files=(),
+        )
+        key = memo_key(hook_name, spec, stdin, get_claude_root(), code_dir)
+        if key is None:
+            return None, None
+        return load_memo(get_memo_dir(hook_name), key, spec.ttl_seconds), key
+    except OSError:
+        return None, None
@@ -0,0 +1,51 @@
+"""Hook protocol - reading events from stdin and writing responses.
+
+One implementation of the stdin/stdout contract shared by every hook:
+a single buffered read, NDJSON or single-document input, slotted event
+objects that decode heavy fields (tool_input, tool_response) only on
+access, and a response serializer.
+"""
+
+from .events import (
+    EVENT_TYPES,
+    HookEvent,
+    PromptEvent,
+    SessionEvent,
+    ToolEvent,
+    scan_head,
+    scan_tail,
+)
+from .reader import (
+    iter_events,
+    process_stdin,
+    read_events,
+    read_hook_event,
+    read_stdin,
+    split_documents,
+)
+from .response import CONTINUE, build_response, dump_response, write_response
+
+__all__ = [
+    # events
+    "EVENT_TYPES",
+    "HookEvent",
+    "PromptEvent",
+    "SessionEvent",
+    "ToolEvent",
+    "scan_head",
+    "scan_tail",
+    # reader
+    "iter_events",
+    "process_stdin",
+    "read_events",
+    "read_hook_event",
+    "read_stdin",
+    "split_documents",
+    # response
+    "CONTINUE",
+    "build_response",
+    "dump_response",
+    "write_response",
+]
+
+__version__ = "1.0.0"
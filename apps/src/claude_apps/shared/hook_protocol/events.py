@@ -0,0 +1,260 @@
+"""Hook event types with lazily decoded payloads.
+
+Small events are decoded immediately; json.loads is cheapest there. Large
+events (file reads, MCP snapshots) keep the raw JSON text instead. Routing fields
+(hook_event_name, session_id, tool_name, ...) are taken from the document
+head (the top-level scalar members before the first object or array value)
+and tail (simple scalar members after the last one, such as tool_use_id).
+Hooks that only look at those never build tool_input/tool_response. The
+full document is decoded on first access to anything else and cached.
+"""
+
+import json
+import re
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from json.decoder import scanstring
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_MISSING = object()
+
+# Trailing `, "name": scalar` members right before the final closing brace.
+# Strings containing quotes or escapes are not matched, which keeps every
+# match outside any string literal and therefore at the top level.
+_TAIL_MEMBER = (
+    r'"([A-Za-z_][A-Za-z0-9_]*)"\s*:\s*'
+    r'("[^"\\]*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null)'
+)
+_TAIL = re.compile(rf"\s*(?:,\s*{_TAIL_MEMBER}\s*)+}}\s*\Z")
+_TAIL_PAIR = re.compile(_TAIL_MEMBER)
+_TAIL_WINDOW = 1024
+
+# Documents shorter than this are decoded eagerly
+LAZY_THRESHOLD = 4096
+
+
+def scan_head(raw: str) -> tuple[dict[str, Any], bool]:
+    """Decode the leading top-level scalar members of a JSON object.
+
+    Args:
+        raw: JSON document text
+
+    Returns:
+        Tuple of (decoded members, whether the whole object was scanned)
+
+    Raises:
+        ValueError: If the text does not start with a well-formed object head
+    """
+    ws = _WHITESPACE.match
+    head: dict[str, Any] = {}
+    try:
+        idx = ws(raw, 0).end()
+        if raw[idx] != "{":
+            raise ValueError("hook event must be a JSON object")
+        idx = ws(raw, idx + 1).end()
+        if raw[idx] == "}":
+            return head, True
+
+        while True:
+            if raw[idx] != '"':
+                raise ValueError(f"expected member name at offset {idx}")
+            key, idx = scanstring(raw, idx + 1)
+            idx = ws(raw, idx).end()
+            if raw[idx] != ":":
+                raise ValueError(f"expected ':' at offset {idx}")
+            idx = ws(raw, idx + 1).end()
+            if raw[idx] in "{[":
+                return head, False
+            head[key], idx = _DECODER.raw_decode(raw, idx)
+            idx = ws(raw, idx).end()
+            if raw[idx] == ",":
+                idx = ws(raw, idx + 1).end()
+            elif raw[idx] == "}":
+                return head, True
+            else:
+                raise ValueError(f"expected ',' or '}}' at offset {idx}")
+    except IndexError:
+        raise ValueError("truncated hook event") from None
+
+
+def scan_tail(raw: str) -> dict[str, Any]:
+    """Decode simple scalar members that end a JSON object.
+
+    Only the text after the last '}' or ']' before the closing brace is
+    examined, with a single anchored match.
+
+    Args:
+        raw: JSON document text
+
+    Returns:
+        Decoded trailing members (empty if none qualify)
+    """
+    window = raw[-_TAIL_WINDOW:].rstrip()
+    closing = len(window) - 1
+    start = max(window.rfind("}", 0, closing), window.rfind("]", 0, closing)) + 1
+    if start == 0 or _TAIL.match(window, start) is None:
+        return {}
+    return {key: json.loads(value) for key, value in _TAIL_PAIR.findall(window, start)}
+
+
+@dataclass(slots=True, eq=False)
+class HookEvent(Mapping):
+    """A hook event read from stdin.
+
+    Behaves as a read-only mapping of the event's top-level members, so it
+    can be passed wherever a hook expects the decoded dict.
+
+    Attributes:
+        raw: JSON text of this event (empty when built from a dict)
+    """
+
+    raw: str = ""
+    _head: dict[str, Any] | None = None
+    _complete: bool = False
+    _data: dict[str, Any] | None = None
+    _tail: dict[str, Any] | None = None
+
+    @classmethod
+    def from_raw(cls, raw: str) -> "HookEvent":
+        """Create the event type matching a raw document's hook_event_name.
+
+        Raises:
+            ValueError: If the document (or, for large documents, its head)
+                is not a well-formed object
+        """
+        if len(raw) < LAZY_THRESHOLD:
+            data = json.loads(raw)
+            if not isinstance(data, dict):
+                raise ValueError("hook event must be a JSON object")
+            event_type = EVENT_TYPES.get(data.get("hook_event_name"), HookEvent)
+            return event_type(raw=raw, _head=data, _complete=True, _data=data)
+
+        head, complete = scan_head(raw)
+        event_type = EVENT_TYPES.get(head.get("hook_event_name"), HookEvent)
+        return event_type(raw=raw, _head=head, _complete=complete)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "HookEvent":
+        """Wrap an already decoded event."""
+        event_type = EVENT_TYPES.get(data.get("hook_event_name"), HookEvent)
+        return event_type(_head=data, _complete=True, _data=data)
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The fully decoded event (decoded once, on first access)."""
+        if self._data is None:
+            decoded = json.loads(self.raw)
+            if not isinstance(decoded, dict):
+                raise ValueError("hook event must be a JSON object")
+            self._data = decoded
+        return self._data
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the decoded event as a plain dict."""
+        return self.data
+
+    def to_json(self) -> str:
+        """Return the event's JSON text, re-encoding only if there is none."""
+        return self.raw or json.dumps(self.data)
+
+    def _lookup(self, key: str) -> Any:
+        head = self._head or {}
+        if key in head:
+            return head[key]
+        if self._complete:
+            return _MISSING
+        if self._data is None:
+            if self._tail is None:
+                self._tail = scan_tail(self.raw)
+            if key in self._tail:
+                return self._tail[key]
+        return self.data.get(key, _MISSING)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._lookup(key) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._head if self._complete and self._head is not None else self.data)
+
+    def __len__(self) -> int:
+        return len(self._head if self._complete and self._head is not None else self.data)
+
+    @property
+    def hook_event_name(self) -> str:
+        return self.get("hook_event_name") or ""
+
+    @property
+    def session_id(self) -> str:
+        return self.get("session_id") or "unknown"
+
+    @property
+    def cwd(self) -> str:
+        return self.get("cwd") or ""
+
+    @property
+    def transcript_path(self) -> str:
+        return self.get("transcript_path") or ""
+
+
+@dataclass(slots=True, eq=False)
+class ToolEvent(HookEvent):
+    """PreToolUse / PostToolUse event; tool_input and tool_response are lazy."""
+
+    @property
+    def tool_name(self) -> str:
+        return self.get("tool_name") or ""
+
+    @property
+    def tool_use_id(self) -> str:
+        return self.get("tool_use_id") or ""
+
+    @property
+    def tool_input(self) -> Any:
+        return self.get("tool_input", {})
+
+    @property
+    def tool_response(self) -> Any:
+        return self.get("tool_response", [])
+
+
+@dataclass(slots=True, eq=False)
+class PromptEvent(HookEvent):
+    """UserPromptSubmit event."""
+
+    @property
+    def prompt(self) -> str:
+        return self.get("prompt") or ""
+
+
+@dataclass(slots=True, eq=False)
+class SessionEvent(HookEvent):
+    """SessionStart / SessionEnd event."""
+
+    @property
+    def source(self) -> str:
+        return self.get("source") or ""
+
+    @property
+    def reason(self) -> str:
+        return self.get("reason") or ""
+
+
+EVENT_TYPES: dict[Any, type[HookEvent]] = {
+    "PreToolUse": ToolEvent,
+    "PostToolUse": ToolEvent,
+    "UserPromptSubmit": PromptEvent,
+    "SessionStart": SessionEvent,
+    "SessionEnd": SessionEvent,
+}
@@ -0,0 +1,142 @@
+"""Reading hook events from stdin.
+
+stdin is read in a single buffered call and split into documents without
+decoding them. Accepted layouts:
+
+- one JSON object, compact or pretty-printed (what Claude Code sends)
+- NDJSON batches, one object per line, ending at EOF, a blank line or the
+  first line that is not an object
+- a JSON array of objects
+"""
+
+import json
+import sys
+from collections.abc import Iterator
+from typing import IO, Any
+
+from .events import HookEvent
+
+
+def read_stdin(stream: IO[Any] | None = None) -> str:
+    """Read all of stdin in one call.
+
+    Reads the underlying binary buffer when there is one, so the payload
+    is decoded once instead of line by line.
+
+    Args:
+        stream: Stream to read (default: sys.stdin)
+
+    Returns:
+        The decoded text
+    """
+    stream = stream if stream is not None else sys.stdin
+    buffer = getattr(stream, "buffer", None)
+    if buffer is not None:
+        return buffer.read().decode("utf-8", errors="replace")
+    return stream.read()
+
+
+def _looks_like_object(line: str) -> bool:
+    return line.startswith("{") and line.endswith("}")
+
+
+def split_documents(raw: str) -> list[str]:
+    """Split stdin text into raw JSON object documents.
+
+    Args:
+        raw: Text read from stdin
+
+    Returns:
+        Raw document strings; array input is returned as one document
+    """
+    text = raw.strip()
+    if not text:
+        return []
+    if "\n" not in text:
+        return [text]
+
+    lines = text.split("\n")
+    if not _looks_like_object(lines[0].strip()):
+        # A pretty-printed single document
+        return [text]
+
+    documents = []
+    for line in lines:
+        line = line.strip()
+        if not _looks_like_object(line):
+            break
+        documents.append(line)
+    return documents
+
+
+def iter_events(raw: str) -> Iterator[HookEvent]:
+    """Yield hook events from stdin text.
+
+    Only each document's head is decoded here; iteration stops at the first
+    document whose head is malformed. Errors later in a document surface as
+    ValueError when a field past the head is first accessed.
+
+    Args:
+        raw: Text read from stdin
+
+    Yields:
+        HookEvent (or a ToolEvent/PromptEvent/SessionEvent subclass)
+    """
+    text = raw.lstrip()
+    if text.startswith("["):
+        try:
+            items = json.loads(text)
+        except ValueError:
+            return
+        for item in items:
+            if not isinstance(item, dict):
+                return
+            yield HookEvent.from_dict(item)
+        return
+
+    for document in split_documents(text):
+        try:
+            yield HookEvent.from_raw(document)
+        except ValueError:
+            return
+
+
+def read_events(stream: IO[Any] | None = None) -> list[HookEvent]:
+    """Read and split all hook events from stdin.
+
+    Args:
+        stream: Stream to read (default: sys.stdin)
+
+    Returns:
+        Events in input order
+    """
+    return list(iter_events(read_stdin(stream)))
+
+
+def process_stdin(stream: IO[Any] | None = None) -> Iterator[HookEvent]:
+    """Yield hook events from stdin (the per-hook reader entry point).
+
+    Args:
+        stream: Stream to read (default: sys.stdin)
+
+    Yields:
+        HookEvent objects, usable as read-only dicts
+    """
+    yield from iter_events(read_stdin(stream))
+
+
+def read_hook_event(stream: IO[Any] | None = None) -> dict[str, Any] | None:
+    """Read the first hook event from stdin as a plain dict.
+
+    Args:
+        stream: Stream to read (default: sys.stdin)
+
+    Returns:
+        The decoded event, or None for empty or invalid input
+    """
+    for event in process_stdin(stream):
+        try:
+            return event.to_dict()
+        except ValueError:
+            return None
+    return None
@@ -0,0 +1,60 @@
+"""Serializing hook responses to stdout."""
+
+import json
+import sys
+from typing import IO, Any
+
+_ENCODER = json.JSONEncoder()
+
+CONTINUE = {"continue": True, "suppressOutput": False}
+CONTINUE_JSON = _ENCODER.encode(CONTINUE)
+
+
+def build_response(
+    event_name: str = "",
+    additional_context: str = "",
+    continue_: bool = True,
+    suppress_output: bool = False,
+    system_message: str = "",
+) -> dict[str, Any]:
+    """Build a hook response dict.
+
+    Args:
+        event_name: hookEventName for hookSpecificOutput
+        additional_context: Context injected into the conversation; omitted
+            together with hookSpecificOutput when empty
+        continue_: Whether Claude should continue
+        suppress_output: Hide the hook output from the transcript
+        system_message: Optional message shown to the user
+
+    Returns:
+        Response dictionary in the hook protocol shape
+    """
+    response: dict[str, Any] = {"continue": continue_, "suppressOutput": suppress_output}
+    if system_message:
+        response["systemMessage"] = system_message
+    if additional_context:
+        response["hookSpecificOutput"] = {
+            "hookEventName": event_name,
+            "additionalContext": additional_context,
+        }
+    return response
+
+
+def dump_response(response: dict[str, Any]) -> str:
+    """Serialize a response; the plain continue response is precomputed."""
+    if response == CONTINUE:
+        return CONTINUE_JSON
+    return _ENCODER.encode(response)
+
+
+def write_response(response: dict[str, Any], stream: IO[str] | None = None) -> None:
+    """Write one response line and flush.
+
+    Args:
+        response: Response dictionary
+        stream: Output stream (default: sys.stdout at call time)
+    """
+    stream = stream if stream is not None else sys.stdout
+    stream.write(dump_response(response) + "\n")
+    stream.flush()
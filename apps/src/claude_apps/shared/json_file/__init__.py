@@ -0,0 +1,17 @@
+"""JSON file - per-session JSON state updated by concurrent hooks.
+
+Small JSON files that reports read directly (tool summary, rule
+reinforcement state, context usage) are changed with a read-modify-write
+under a sibling lock file and replaced atomically, so readers need no
+lock and never see a partial file.
+"""
+
+from .locked import lock_path, read_json_file, update_json_file
+
+__all__ = [
+    "lock_path",
+    "read_json_file",
+    "update_json_file",
+]
+
+__version__ = "1.0.0"
@@ -0,0 +1,80 @@
+"""Locked read-modify-write of a JSON object file.
+
+An update holds an exclusive flock on a sibling ``.lock`` file; the new
+content is written to a per-process temp file and renamed over the old
+one. Readers never see a partial file and need no lock, and a crash
+mid-write leaves the previous content.
+
+The lock lives in its own file because the rename replaces the data
+file's inode, so a lock held on the data file would not exclude a
+writer that opened it after the rename.
+"""
+
+import fcntl
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+State = Dict[str, Any]
+
+
+def lock_path(path: Path) -> Path:
+    """Lock file guarding updates of path (same name, ``.lock`` suffix)."""
+    return path.with_suffix(".lock")
+
+
+def read_json_file(path: Path, empty: Callable[[], State] = dict) -> State:
+    """A JSON object file's content, or empty() if missing or not an object.
+
+    Raises:
+        OSError: If the file exists but cannot be read
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.loads(f.read() or "null")
+    except (FileNotFoundError, ValueError):
+        return empty()
+    return state if isinstance(state, dict) else empty()
+
+
+def update_json_file(
+    path: Path, update: Callable[[State], bool], empty: Callable[[], State] = dict
+) -> bool:
+    """Apply update to a JSON object file under its lock; save if it returns True.
+
+    Args:
+        path: The JSON file (its directory is created on first use)
+        update: Changes the loaded state in place; returns whether to save
+        empty: Initial state when the file is missing or invalid
+
+    Returns:
+        What update returned
+
+    Raises:
+        OSError: If the file cannot be read or written
+        TypeError: If the updated state is not JSON serializable
+    """
+    flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+    try:
+        lock_fd = os.open(lock_path(path), flags, 0o644)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lock_fd = os.open(lock_path(path), flags, 0o644)
+
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        state = read_json_file(path, empty)
+        if not update(state):
+            return False
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(json.dumps(state, ensure_ascii=False, separators=(",", ":")))
+            os.replace(tmp, path)
+        except (OSError, TypeError):
+            tmp.unlink(missing_ok=True)
+            raise
+        return True
+    finally:
+        os.close(lock_fd)
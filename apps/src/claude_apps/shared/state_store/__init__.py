@@ -0,0 +1,26 @@
+"""State store - transactional state shared by concurrent hook sessions.
+
+Hooks keep small JSON values between runs in one SQLite database (WAL
+mode) with versioned compare-and-set, single-transaction updates and
+expiring keys, instead of rewriting JSON files without locking.
+"""
+
+from .store import (
+    BUSY_TIMEOUT,
+    Entry,
+    StateStore,
+    StateStoreError,
+    get_state_path,
+    get_state_store,
+)
+
+__all__ = [
+    "BUSY_TIMEOUT",
+    "Entry",
+    "StateStore",
+    "StateStoreError",
+    "get_state_path",
+    "get_state_store",
+]
+
+__version__ = "1.0.0"
@@ -0,0 +1,284 @@
+"""Transactional key-value state shared by hooks.
+
+State that hooks keep between runs (recovery counters, last-check times,
+cache metadata) lives in one SQLite database in WAL mode,
+``.data/state/hooks.sqlite3``, instead of JSON files that every session
+reads and rewrites without locking. Values are JSON, addressed by
+(namespace, key), and carry a version that grows on every write:
+
+- update() runs a read-modify-write in a single write transaction, so
+  concurrent sessions never lose each other's changes
+- compare_and_set() writes only if the entry is still at the version the
+  caller read, for decisions made outside the transaction
+- entries written with a ttl read as absent once it has passed
+
+Writers are serialized by ``BEGIN IMMEDIATE`` and wait up to the busy
+timeout for each other; WAL lets readers proceed alongside a writer.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from claude_apps.shared.config_helper import get_data_path
+
+# Seconds a writer waits for another session's transaction
+BUSY_TIMEOUT = 5.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    expires_at REAL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_state_expires ON state(expires_at)
+    WHERE expires_at IS NOT NULL;
+"""
+
+
+class StateStoreError(Exception):
+    """Raised when the state database cannot be opened, read or written."""
+
+
+@dataclass(frozen=True)
+class Entry:
+    """A stored value with its version.
+
+    Attributes:
+        value: Decoded JSON value
+        version: Write counter of the key, for compare_and_set
+        expires_at: Epoch seconds after which the entry reads as absent
+    """
+
+    value: Any
+    version: int
+    expires_at: Optional[float] = None
+
+
+def get_state_path() -> Path:
+    """Default location of the state database."""
+    return get_data_path("state") / "hooks.sqlite3"
+
+
+def _expires_at(ttl: Optional[float]) -> Optional[float]:
+    return None if ttl is None else time.time() + ttl
+
+
+class StateStore:
+    """SQLite-backed state shared by concurrent hook sessions."""
+
+    def __init__(self, db_path: Optional[Path] = None, timeout: float = BUSY_TIMEOUT):
+        self.db_path = Path(db_path) if db_path is not None else get_state_path()
+        self._lock = threading.Lock()
+        with self._errors():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit; write transactions are opened explicitly below
+            self.conn = sqlite3.connect(
+                self.db_path, timeout=timeout, isolation_level=None, check_same_thread=False
+            )
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "StateStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @contextmanager
+    def _errors(self) -> Iterator[None]:
+        try:
+            yield
+        except (sqlite3.Error, OSError) as e:
+            raise StateStoreError(f"{self.db_path}: {e}") from e
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """One write transaction, holding the database's write lock throughout."""
+        with self._lock, self._errors():
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def _read(self, conn: sqlite3.Connection, namespace: str, key: str) -> Optional[Entry]:
+        row = conn.execute(
+            "SELECT value, version, expires_at FROM state WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+        if row is None:
+            return None
+        value, version, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return Entry(json.loads(value), version, expires_at)
+
+    def _store(
+        self,
+        conn: sqlite3.Connection,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float],
+    ) -> int:
+        # Versions keep counting across expiry (until the row is purged), so
+        # a version read before the entry expired does not match its successor
+        (version,) = conn.execute(
+            "SELECT COALESCE(MAX(version), 0) + 1 FROM state WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+        conn.execute(
+            "INSERT OR REPLACE INTO state (namespace, key, value, version, expires_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (namespace, key, json.dumps(value), version, _expires_at(ttl), time.time()),
+        )
+        return version
+
+    # -- reads -------------------------------------------------------------
+
+    def get_entry(self, namespace: str, key: str) -> Optional[Entry]:
+        """The live entry of a key, or None if it is absent or expired."""
+        with self._lock, self._errors():
+            return self._read(self.conn, namespace, key)
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """The live value of a key, or default."""
+        entry = self.get_entry(namespace, key)
+        return default if entry is None else entry.value
+
+    def get_namespace(self, namespace: str) -> Dict[str, Any]:
+        """All live values of a namespace, by key."""
+        with self._lock, self._errors():
+            rows = self.conn.execute(
+                "SELECT key, value FROM state WHERE namespace = ?"
+                " AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, time.time()),
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    # -- writes ------------------------------------------------------------
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> int:
+        """Store a value unconditionally.
+
+        Args:
+            namespace: Owner of the key (usually the hook name)
+            key: Key within the namespace
+            value: JSON-serializable value
+            ttl: Seconds until the entry expires (None: never)
+
+        Returns:
+            The entry's new version
+        """
+        with self._write() as conn:
+            return self._store(conn, namespace, key, value, ttl)
+
+    def compare_and_set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        version: Optional[int],
+        ttl: Optional[float] = None,
+    ) -> bool:
+        """Store a value only if the key is still at the given version.
+
+        Args:
+            namespace: Owner of the key
+            key: Key within the namespace
+            value: JSON-serializable value
+            version: Version the caller read, or None if it read no entry
+            ttl: Seconds until the new entry expires (None: never)
+
+        Returns:
+            True if the value was stored, False if another writer got there first
+        """
+        with self._write() as conn:
+            current = self._read(conn, namespace, key)
+            if (None if current is None else current.version) != version:
+                return False
+            self._store(conn, namespace, key, value, ttl)
+            return True
+
+    def update(
+        self,
+        namespace: str,
+        key: str,
+        fn: Callable[[Any], Any],
+        default: Any = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Replace a value with fn(value) in one transaction.
+
+        Args:
+            namespace: Owner of the key
+            key: Key within the namespace
+            fn: Called with the current value (default if absent); returns
+                the value to store
+            default: Value passed to fn when the key is absent or expired
+            ttl: Seconds until the new entry expires (None: never)
+
+        Returns:
+            The stored value
+        """
+        with self._write() as conn:
+            current = self._read(conn, namespace, key)
+            value = fn(default if current is None else current.value)
+            self._store(conn, namespace, key, value, ttl)
+            return value
+
+    def delete(self, namespace: str, key: str) -> bool:
+        """Remove a key; True if a live entry was removed."""
+        with self._write() as conn:
+            live = self._read(conn, namespace, key) is not None
+            conn.execute("DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key))
+            return live
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns how many were removed."""
+        with self._write() as conn:
+            return conn.execute(
+                "DELETE FROM state WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            ).rowcount
+
+
+_stores: Dict[Path, StateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(db_path: Optional[Path] = None) -> StateStore:
+    """The process-wide store for a database (default: get_state_path()).
+
+    Opened once per process; expired entries are purged on open.
+
+    Raises:
+        StateStoreError: If the database cannot be located or opened
+    """
+    try:
+        path = Path(db_path) if db_path is not None else get_state_path()
+    except OSError as e:
+        raise StateStoreError(str(e)) from e
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = StateStore(path)
+            store.purge_expired()
+            _stores[path] = store
+        return store
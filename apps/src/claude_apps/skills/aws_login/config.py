@@ -13,6 +13,8 @@ from typing import Any
 import yaml
 import structlog
 
+from claude_apps.shared.config_helper import load_config_snapshot
+
 logger = structlog.get_logger()
 
 # Add aws_utils to path using CLAUDE_PATH env var for reliable resolution
@@ -29,11 +31,7 @@ def get_claude_path() -> Path:
 
 def get_global_config() -> dict[str, Any]:
     """Load global config.yml from .claude directory."""
-    config_path = get_claude_path() / "config.yml"
-    if config_path.exists():
-        with open(config_path) as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    return load_config_snapshot(get_claude_path() / "config.yml")
 
 
 def get_aws_data_path() -> Path:
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Batch screenshot utility for Playwright automation.
+Usage: python batch_screenshot.py <manifest.json> [--concurrency 4] [--output-dir DIR] [--cold]
+
+Output: /workspace/.claude/.data/playwright/screencaps/batch_<timestamp>/
+        One PNG per capture plus report.json with per-capture timing.
+
+Captures run concurrently as pages of one browser (the warm browser
+server, see browser_pool.py, unless --cold or CLAUDE_BROWSER_POOL=0),
+at most --concurrency at a time. Each capture gets its own context with
+its viewport. A failed capture is recorded in the report and does not
+stop the others.
+
+Manifest (JSON) - every URL is captured at every viewport and full_page
+value, plus any explicit captures:
+    {
+      "urls": ["https://example.com", "https://example.com/pricing"],
+      "viewports": ["1920x1080", "768x1024", {"width": 390, "height": 844}],
+      "full_page": [true, false],
+      "captures": [{"url": "https://example.com/login", "viewport": "1280x720",
+                    "full_page": false, "output": "login.png"}],
+      "wait_until": "domcontentloaded",
+      "timeout": 30000,
+      "settle_ms": 2000
+    }
+
+An explicit output is a path inside the batch directory; absolute paths,
+".." and outputs shared by two captures are rejected.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from urllib.parse import urlparse
+
+import structlog
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+
+from claude_apps.skills.playwright_automation.browser_pool import open_async_browser, touch
+
+# Use CLAUDE_PATH environment variable with fallback
+CLAUDE_PATH = os.environ.get("CLAUDE_PATH", "/workspace/.claude")
+SCREENCAP_DIR = os.path.join(CLAUDE_PATH, ".data/playwright/screencaps")
+LOG_DIR = os.path.join(CLAUDE_PATH, ".data/logs/playwright")
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_VIEWPORT = "1920x1080"
+WAIT_STRATEGIES = ("domcontentloaded", "load", "networkidle")
+
+# Ensure log directory exists
+os.makedirs(LOG_DIR, exist_ok=True)
+
+# Configure structlog
+structlog.configure(
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.dev.ConsoleRenderer(),
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(20),  # INFO+
+)
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class Capture:
+    """One screenshot to take."""
+
+    url: str
+    width: int
+    height: int
+    full_page: bool = True
+    output: str | None = None
+
+
+@dataclass
+class Manifest:
+    """Captures and the navigation options shared by all of them."""
+
+    captures: list[Capture] = field(default_factory=list)
+    wait_until: str = "domcontentloaded"
+    timeout: int = 30000
+    settle_ms: int = 2000
+
+
+@dataclass
+class CaptureResult:
+    """Outcome and timing of one capture (times in milliseconds).
+
+    Attributes:
+        queued_ms: Time waiting for a concurrency slot
+        navigate_ms: Context creation and navigation
+        screenshot_ms: Taking the screenshot (after settle_ms)
+        total_ms: From getting a slot to closing the context
+    """
+
+    url: str
+    viewport: str
+    full_page: bool
+    output: str
+    status: str = "error"
+    error: str | None = None
+    queued_ms: float = 0.0
+    navigate_ms: float = 0.0
+    screenshot_ms: float = 0.0
+    total_ms: float = 0.0
+
+
+def parse_viewport(value: str | dict) -> tuple[int, int]:
+    """(width, height) from "1920x1080" or {"width": 1920, "height": 1080}.
+
+    Raises:
+        ValueError: If value is not a viewport
+    """
+    try:
+        if isinstance(value, dict):
+            width, height = int(value["width"]), int(value["height"])
+        else:
+            width, height = (int(part) for part in str(value).lower().split("x"))
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Invalid viewport {value!r}, expected WIDTHxHEIGHT") from None
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Invalid viewport {value!r}, expected WIDTHxHEIGHT")
+    return width, height
+
+
+def _as_list(value: object) -> list:
+    return value if isinstance(value, list) else [value]
+
+
+def _check_output(output: object) -> None:
+    """Reject an explicit output that would be written outside the batch directory."""
+    if not isinstance(output, str) or not output:
+        raise ValueError(f"Invalid output {output!r}, expected a file name")
+    if os.path.isabs(output) or ".." in output.replace("\\", "/").split("/"):
+        raise ValueError(f"Invalid output {output!r}, must be relative to the batch directory")
+
+
+def parse_manifest(data: dict) -> Manifest:
+    """Expand a manifest into captures (urls x viewports x full_page, then captures).
+
+    Raises:
+        ValueError: If the manifest is malformed, or an output is absolute,
+            contains "..", or is used by more than one capture
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Manifest must be a JSON object")
+    wait_until = data.get("wait_until", "domcontentloaded")
+    if wait_until not in WAIT_STRATEGIES:
+        raise ValueError(f"Invalid wait_until {wait_until!r}")
+
+    viewports = [parse_viewport(v) for v in _as_list(data.get("viewports", DEFAULT_VIEWPORT))]
+    full_pages = [bool(v) for v in _as_list(data.get("full_page", True))]
+    captures = [
+        Capture(url, width, height, full_page)
+        for url in _as_list(data.get("urls", []))
+        for width, height in viewports
+        for full_page in full_pages
+    ]
+    for entry in data.get("captures", []):
+        if not isinstance(entry, dict) or "url" not in entry:
+            raise ValueError(f"Invalid capture {entry!r}, expected an object with a url")
+        width, height = parse_viewport(entry.get("viewport", DEFAULT_VIEWPORT))
+        if entry.get("output") is not None:
+            _check_output(entry["output"])
+        captures.append(
+            Capture(
+                entry["url"],
+                width,
+                height,
+                bool(entry.get("full_page", True)),
+                entry.get("output"),
+            )
+        )
+    if not captures:
+        raise ValueError("Manifest has no urls or captures")
+    names = Counter(os.path.normpath(output_name(i, c)) for i, c in enumerate(captures))
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Output used by more than one capture: {', '.join(duplicates)}")
+
+    return Manifest(
+        captures=captures,
+        wait_until=wait_until,
+        timeout=int(data.get("timeout", 30000)),
+        settle_ms=int(data.get("settle_ms", 2000)),
+    )
+
+
+def load_manifest(path: str) -> Manifest:
+    """Read and expand a manifest file."""
+    with open(path) as f:
+        try:
+            return parse_manifest(json.load(f))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Manifest is not valid JSON: {e}") from None
+
+
+def output_name(index: int, capture: Capture) -> str:
+    """Filename for a capture; the index keeps URLs of one domain apart."""
+    if capture.output:
+        return capture.output
+    domain = urlparse(capture.url).netloc.replace(".", "-").replace(":", "-") or "page"
+    suffix = "_full" if capture.full_page else ""
+    return f"{index:03d}_{domain}_{capture.width}x{capture.height}{suffix}.png"
+
+
+def _ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+async def _goto(page, url: str, wait_until: str, timeout: int) -> None:
+    try:
+        await page.goto(url, wait_until=wait_until, timeout=timeout)
+    except PlaywrightTimeoutError:
+        # Fallback to domcontentloaded if original strategy times out
+        if wait_until == "domcontentloaded":
+            raise
+        logger.warning(f"Timeout with {wait_until} for {url}, falling back to domcontentloaded")
+        await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+
+
+async def _capture(
+    browser,
+    capture: Capture,
+    output_path: str,
+    manifest: Manifest,
+    slots: asyncio.Semaphore,
+) -> CaptureResult:
+    result = CaptureResult(
+        url=capture.url,
+        viewport=f"{capture.width}x{capture.height}",
+        full_page=capture.full_page,
+        output=output_path,
+    )
+    queued = time.perf_counter()
+    async with slots:
+        start = time.perf_counter()
+        result.queued_ms = round((start - queued) * 1000, 1)
+        context = None
+        try:
+            context = await browser.new_context(
+                viewport={"width": capture.width, "height": capture.height}
+            )
+            page = await context.new_page()
+            await _goto(page, capture.url, manifest.wait_until, manifest.timeout)
+            result.navigate_ms = _ms(start)
+            if manifest.settle_ms:
+                await page.wait_for_timeout(manifest.settle_ms)
+            shot = time.perf_counter()
+            await page.screenshot(path=output_path, full_page=capture.full_page)
+            result.screenshot_ms = _ms(shot)
+            result.status = "ok"
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            logger.error(f"Capture failed: {capture.url} at {result.viewport}: {result.error}")
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+            # Each capture counts as use, so a long batch keeps the warm server up
+            touch()
+            result.total_ms = _ms(start)
+    return result
+
+
+async def capture_all(
+    manifest: Manifest,
+    output_dir: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    warm: bool = True,
+) -> list[CaptureResult]:
+    """Take every capture in one browser, at most concurrency at a time."""
+    slots = asyncio.Semaphore(max(1, concurrency))
+    async with async_playwright() as p, open_async_browser(p, warm=warm) as browser:
+        return list(
+            await asyncio.gather(
+                *(
+                    _capture(
+                        browser,
+                        capture,
+                        os.path.join(output_dir, output_name(index, capture)),
+                        manifest,
+                        slots,
+                    )
+                    for index, capture in enumerate(manifest.captures)
+                )
+            )
+        )
+
+
+def run_batch(
+    manifest: Manifest,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    output_dir: str | None = None,
+    warm: bool = True,
+) -> dict:
+    """Take a batch of screenshots and write report.json next to them.
+
+    Args:
+        manifest: Captures to take
+        concurrency: Maximum captures in flight (default 4)
+        output_dir: Directory for screenshots and report, relative to the
+            screencaps directory (batch_<timestamp> if None)
+        warm: Use the warm browser server
+
+    Returns:
+        The report (also written to <output_dir>/report.json)
+    """
+    if output_dir is None:
+        output_dir = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    output_dir = os.path.join(SCREENCAP_DIR, output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    logger.info(f"Capturing {len(manifest.captures)} screenshots with concurrency={concurrency}")
+    started_at = datetime.now().isoformat()
+    start = time.perf_counter()
+    results = asyncio.run(capture_all(manifest, output_dir, concurrency, warm))
+
+    ok = sum(1 for r in results if r.status == "ok")
+    report = {
+        "started_at": started_at,
+        "output_dir": output_dir,
+        "concurrency": concurrency,
+        "wait_until": manifest.wait_until,
+        "settle_ms": manifest.settle_ms,
+        "total_ms": _ms(start),
+        "capture_ms_sum": round(sum(r.total_ms for r in results), 1),
+        "ok": ok,
+        "failed": len(results) - ok,
+        "captures": [asdict(r) for r in results],
+    }
+    report_path = os.path.join(output_dir, "report.json")
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    logger.info(f"Batch done: {ok}/{len(results)} ok in {report['total_ms']}ms")
+    print(f"Batch report saved: {report_path}")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Take a batch of website screenshots")
+    parser.add_argument("manifest", help="Manifest JSON file (see module docstring)")
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum captures in flight (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        help="Output directory, relative to the screencaps directory",
+    )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="Launch a fresh browser instead of using the warm browser server",
+    )
+
+    args = parser.parse_args()
+    try:
+        manifest = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    report = run_batch(manifest, args.concurrency, args.output_dir, warm=not args.cold)
+    sys.exit(1 if report["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Warm browser server and context pool for Playwright automation.
+Usage: python browser_pool.py serve [--idle-timeout 300]
+       python browser_pool.py status | stop
+       python browser_pool.py bench [--runs 5]
+
+Launching Chromium dominates the time of a single screenshot. A detached
+server keeps one headless Chromium running with a CDP endpoint on
+127.0.0.1; screenshot.py, video_recorder.py and batch_screenshot.py
+connect to it instead of launching their own browser. Clients health-check the endpoint before
+connecting and start a new server when it does not answer. The server
+exits when its browser dies or after idle-timeout seconds without a
+client (each connect and context release counts as use). A client that
+still has pages open keeps the server up however long it has been since
+its last use.
+
+Set CLAUDE_BROWSER_POOL=0 (or pass --cold) to launch a browser per call.
+
+State: /workspace/.claude/.data/playwright/browser_pool.json
+Log:   /workspace/.claude/.data/logs/playwright/browser_pool.log
+"""
+
+import argparse
+import asyncio
+import fcntl
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Iterator
+
+import structlog
+
+ENV_VAR = "CLAUDE_BROWSER_POOL"
+DEFAULT_IDLE_TIMEOUT = 300  # seconds without a client before the server exits
+STARTUP_TIMEOUT = 20  # seconds a client waits for a new server
+HEALTH_TIMEOUT = 1.0  # seconds for the endpoint health check
+POLL_INTERVAL = 1.0  # seconds between the server's idle/health checks
+MAX_IDLE_CONTEXTS = 4  # contexts kept for reuse per pool
+
+logger = structlog.get_logger()
+
+
+class PoolUnavailableError(RuntimeError):
+    """Raised when no warm browser server can be reached or started."""
+
+
+@dataclass(frozen=True)
+class ServerState:
+    """Running server, as recorded in the state file."""
+
+    pid: int
+    endpoint: str
+    started_at: float
+
+
+def get_pool_dir() -> str:
+    """Directory holding the server's state and lock files."""
+    claude_path = os.environ.get("CLAUDE_PATH", "/workspace/.claude")
+    return os.path.join(claude_path, ".data/playwright")
+
+
+def get_state_path() -> str:
+    return os.path.join(get_pool_dir(), "browser_pool.json")
+
+
+def get_log_path() -> str:
+    claude_path = os.environ.get("CLAUDE_PATH", "/workspace/.claude")
+    return os.path.join(claude_path, ".data/logs/playwright/browser_pool.log")
+
+
+def pool_enabled() -> bool:
+    """Whether calls should use the warm server (CLAUDE_BROWSER_POOL != 0)."""
+    return os.environ.get(ENV_VAR, "1").lower() not in ("0", "false", "no", "off")
+
+
+def read_state() -> ServerState | None:
+    """The recorded server, or None if there is none."""
+    try:
+        with open(get_state_path()) as f:
+            return ServerState(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def write_state(state: ServerState) -> None:
+    path = get_state_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(asdict(state), f)
+    os.replace(tmp, path)
+
+
+def clear_state(pid: int | None = None) -> None:
+    """Remove the state file (only if it belongs to pid, when given)."""
+    state = read_state()
+    if pid is not None and (state is None or state.pid != pid):
+        return
+    try:
+        os.unlink(get_state_path())
+    except FileNotFoundError:
+        pass
+
+
+def touch() -> None:
+    """Record use of the server (the state file's mtime is its last use)."""
+    try:
+        os.utime(get_state_path())
+    except OSError:
+        pass
+
+
+def idle_seconds() -> float:
+    try:
+        return time.time() - os.stat(get_state_path()).st_mtime
+    except OSError:
+        return 0.0
+
+
+def is_server(pid: int) -> bool:
+    """Whether pid is a running browser_pool server (not a reused PID)."""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            args = f.read().split(b"\0")
+    except OSError:
+        return False
+    named = any(arg.endswith((b"browser_pool", b"browser_pool.py")) for arg in args)
+    return named and b"serve" in args
+
+
+def is_healthy(endpoint: str, timeout: float = HEALTH_TIMEOUT) -> bool:
+    """Whether the CDP endpoint answers /json/version."""
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=timeout) as response:
+            return response.status == 200 and "webSocketDebuggerUrl" in json.load(response)
+    except (OSError, ValueError):
+        return False
+
+
+def has_clients(endpoint: str, timeout: float = HEALTH_TIMEOUT) -> bool:
+    """Whether a client has pages open in the browser (CDP /json/list)."""
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/list", timeout=timeout) as response:
+            targets = json.load(response)
+    except (OSError, ValueError):
+        return False
+    return any(isinstance(t, dict) and t.get("type") == "page" for t in targets)
+
+
+@contextmanager
+def _pool_lock() -> Iterator[None]:
+    """Serialize server startup across concurrent clients."""
+    path = os.path.join(get_pool_dir(), "browser_pool.lock")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def serve(idle_timeout: float = DEFAULT_IDLE_TIMEOUT, poll_interval: float = POLL_INTERVAL) -> int:
+    """Run the warm browser until it is idle for idle_timeout seconds or dies."""
+    from playwright.sync_api import sync_playwright
+
+    port = _free_port()
+    endpoint = f"http://127.0.0.1:{port}"
+    # SIGTERM (stop, or a client replacing an unhealthy server) exits cleanly
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(
+            headless=True,
+            args=[f"--remote-debugging-port={port}", "--remote-debugging-address=127.0.0.1"],
+        )
+        write_state(ServerState(os.getpid(), endpoint, time.time()))
+        logger.info(f"Browser server ready at {endpoint}")
+        try:
+            while browser.is_connected():
+                if idle_seconds() > idle_timeout:
+                    if has_clients(endpoint):
+                        # A long capture is still running: not idle
+                        touch()
+                    else:
+                        logger.info(f"Browser server idle for {idle_timeout}s, shutting down")
+                        break
+                time.sleep(poll_interval)
+            else:
+                logger.warning("Browser disconnected, shutting down")
+        finally:
+            clear_state(os.getpid())
+            browser.close()
+    return 0
+
+
+def ensure_server(
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT, startup_timeout: float = STARTUP_TIMEOUT
+) -> str:
+    """CDP endpoint of a healthy warm server, starting one if needed.
+
+    Raises:
+        PoolUnavailableError: If no server could be started in time
+    """
+    with _pool_lock():
+        state = read_state()
+        if state is not None and is_server(state.pid):
+            if is_healthy(state.endpoint):
+                touch()
+                return state.endpoint
+            logger.warning(f"Browser server {state.pid} failed health check, replacing it")
+            os.kill(state.pid, signal.SIGTERM)
+        clear_state()
+
+        log_path = get_log_path()
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        with open(log_path, "ab") as log:
+            process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "claude_apps.skills.playwright_automation.browser_pool",
+                    "serve",
+                    "--idle-timeout",
+                    str(idle_timeout),
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                start_new_session=True,
+            )
+
+        deadline = time.monotonic() + startup_timeout
+        while time.monotonic() < deadline:
+            state = read_state()
+            if state is not None and state.pid == process.pid and is_healthy(state.endpoint):
+                return state.endpoint
+            if process.poll() is not None:
+                raise PoolUnavailableError(f"browser server exited with {process.returncode}")
+            time.sleep(0.1)
+        process.terminate()
+        raise PoolUnavailableError(f"browser server not ready after {startup_timeout}s")
+
+
+def stop_server() -> bool:
+    """Stop the running server; False if there was none."""
+    state = read_state()
+    if state is None or not is_server(state.pid):
+        clear_state()
+        return False
+    os.kill(state.pid, signal.SIGTERM)
+    return True
+
+
+@contextmanager
+def open_browser(playwright: Any, warm: bool = True) -> Iterator[Any]:
+    """A browser for one call: the warm server's, or a fresh launch.
+
+    Falls back to launching Chromium if the warm server is disabled or
+    cannot be reached. Closing a connected browser only disconnects.
+    """
+    browser = None
+    if warm and pool_enabled():
+        try:
+            browser = playwright.chromium.connect_over_cdp(ensure_server())
+        except Exception as e:
+            logger.warning(f"Warm browser unavailable ({e}), launching Chromium")
+    if browser is None:
+        browser = playwright.chromium.launch(headless=True)
+    try:
+        yield browser
+    finally:
+        browser.close()
+        touch()
+
+
+@asynccontextmanager
+async def open_async_browser(playwright: Any, warm: bool = True) -> AsyncIterator[Any]:
+    """open_browser for the async API (playwright from async_playwright())."""
+    browser = None
+    if warm and pool_enabled():
+        try:
+            endpoint = await asyncio.to_thread(ensure_server)
+            browser = await playwright.chromium.connect_over_cdp(endpoint)
+        except Exception as e:
+            logger.warning(f"Warm browser unavailable ({e}), launching Chromium")
+    if browser is None:
+        browser = await playwright.chromium.launch(headless=True)
+    try:
+        yield browser
+    finally:
+        await browser.close()
+        touch()
+
+
+class BrowserPool:
+    """Reusable browser contexts on one browser.
+
+    A released context has its pages closed and cookies cleared and is
+    handed out again for the same options. Contexts recording video are
+    never reused (their video is written when they close).
+    """
+
+    def __init__(self, browser: Any, max_idle: int = MAX_IDLE_CONTEXTS):
+        self.browser = browser
+        self.max_idle = max_idle
+        self._idle: dict[str, list[Any]] = {}
+
+    @staticmethod
+    def _key(options: dict[str, Any]) -> str:
+        return json.dumps(options, sort_keys=True, default=str)
+
+    @contextmanager
+    def context(self, **options: Any) -> Iterator[Any]:
+        """Lease a context created with options (see Browser.new_context)."""
+        key = self._key(options)
+        reusable = "record_video_dir" not in options
+        idle = self._idle.get(key, [])
+        context = idle.pop() if reusable and idle else self.browser.new_context(**options)
+        ok = False
+        try:
+            yield context
+            ok = True
+        finally:
+            self._release(key, context, reusable and ok)
+
+    def _release(self, key: str, context: Any, reuse: bool) -> None:
+        idle = self._idle.setdefault(key, [])
+        if reuse and sum(len(v) for v in self._idle.values()) < self.max_idle:
+            try:
+                for page in context.pages:
+                    page.close()
+                context.clear_cookies()
+                idle.append(context)
+                touch()
+                return
+            except Exception:
+                pass
+        context.close()
+        touch()
+
+    def close(self) -> None:
+        """Close every idle context."""
+        for contexts in self._idle.values():
+            for context in contexts:
+                context.close()
+        self._idle.clear()
+
+
+def bench(runs: int = 5) -> dict[str, dict[str, float]]:
+    """Time screenshots of a local file:// page with and without the warm server.
+
+    Each capture starts its own Playwright driver, as a screenshot.py
+    invocation does; only browser acquisition differs.
+    """
+    from playwright.sync_api import sync_playwright
+
+    from claude_apps.skills.playwright_automation.screenshot import take_screenshot
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        page = os.path.join(tmp, "page.html")
+        with open(page, "w") as f:
+            f.write("<html><body><h1>browser_pool bench</h1>" + "<p>row</p>" * 200)
+        url = f"file://{page}"
+        for mode, warm in (("cold", False), ("warm", True)):
+            if warm:
+                ensure_server()
+            samples = []
+            for i in range(runs):
+                start = time.perf_counter()
+                with sync_playwright() as p, open_browser(p, warm=warm) as browser:
+                    pool = BrowserPool(browser)
+                    take_screenshot(url, output=f"bench_{mode}_{i}.png", settle_ms=0, pool=pool)
+                    pool.close()
+                samples.append((time.perf_counter() - start) * 1000)
+            results[mode] = {
+                "p50_ms": round(statistics.median(samples), 1),
+                "min_ms": round(min(samples), 1),
+                "max_ms": round(max(samples), 1),
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Warm browser server for Playwright automation")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_parser = sub.add_parser("serve", help="Run the browser server (started on demand)")
+    serve_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help=f"Seconds without a client before exiting (default: {DEFAULT_IDLE_TIMEOUT})",
+    )
+    sub.add_parser("status", help="Show the running server")
+    sub.add_parser("stop", help="Stop the running server")
+    bench_parser = sub.add_parser("bench", help="Compare cold and warm screenshots of a local page")
+    bench_parser.add_argument("--runs", "-r", type=int, default=5, help="Captures per mode")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        sys.exit(serve(args.idle_timeout))
+    elif args.command == "status":
+        state = read_state()
+        if state is None or not is_server(state.pid):
+            print("No browser server running")
+            return
+        health = "healthy" if is_healthy(state.endpoint) else "unhealthy"
+        print(f"pid {state.pid} at {state.endpoint} ({health}, idle {idle_seconds():.0f}s)")
+    elif args.command == "stop":
+        print("Stopped" if stop_server() else "No browser server running")
+    elif args.command == "bench":
+        for mode, stats in bench(args.runs).items():
+            print(
+                f"{mode:5} p50 {stats['p50_ms']:8.1f} ms"
+                f"  min {stats['min_ms']:8.1f}  max {stats['max_ms']:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
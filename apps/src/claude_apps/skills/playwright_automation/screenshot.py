@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """
 Screenshot utility for Playwright automation.
-Usage: python screenshot.py <url> [--full-page] [--wait-until STRATEGY] [--timeout MS] [--output filename.png]
+Usage: python screenshot.py <url> [--full-page] [--wait-until STRATEGY] [--timeout MS] [--output filename.png] [--cold]
 
 Output: /workspace/.claude/.data/playwright/screencaps/
+
+Captures use the warm browser server (see browser_pool.py) unless --cold
+is given or CLAUDE_BROWSER_POOL=0.
 """
 import argparse
 import os
@@ -14,6 +17,8 @@ import structlog
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
+from claude_apps.skills.playwright_automation.browser_pool import BrowserPool, open_browser
+
 # Use CLAUDE_PATH environment variable with fallback
 CLAUDE_PATH = os.environ.get("CLAUDE_PATH", "/workspace/.claude")
 SCREENCAP_DIR = os.path.join(CLAUDE_PATH, ".data/playwright/screencaps")
@@ -34,12 +39,56 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
+def _capture(
+    pool: BrowserPool,
+    url: str,
+    output_path: str,
+    full_page: bool,
+    wait_until: str,
+    timeout: int,
+    settle_ms: int,
+) -> None:
+    with pool.context(viewport={"width": 1920, "height": 1080}) as context:
+        page = context.new_page()
+
+        try:
+            # Attempt navigation with specified strategy
+            page.goto(url, wait_until=wait_until, timeout=timeout)
+            logger.info(f"Navigation successful with {wait_until}")
+
+        except PlaywrightTimeoutError:
+            # Fallback to domcontentloaded if original strategy times out
+            if wait_until != "domcontentloaded":
+                logger.warning(
+                    f"Timeout with {wait_until}, falling back to domcontentloaded"
+                )
+                try:
+                    page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+                    logger.info("Fallback navigation successful")
+                except PlaywrightTimeoutError:
+                    logger.error(f"Navigation failed even with fallback: {url}")
+                    raise
+            else:
+                logger.error(f"Navigation timeout: {url}")
+                raise
+
+        # Additional wait for dynamic content
+        if settle_ms:
+            page.wait_for_timeout(settle_ms)
+
+        # Take screenshot
+        page.screenshot(path=output_path, full_page=full_page)
+
+
 def take_screenshot(
     url: str,
     full_page: bool = True,
     output: str | None = None,
     wait_until: str = "domcontentloaded",
     timeout: int = 30000,
+    settle_ms: int = 2000,
+    pool: BrowserPool | None = None,
+    warm: bool = True,
 ) -> str:
     """Take a screenshot of a URL and return the file path.
 
@@ -49,6 +98,9 @@ def take_screenshot(
         output: Output filename (auto-generated if None)
         wait_until: Wait strategy - domcontentloaded (default), load, or networkidle
         timeout: Navigation timeout in milliseconds (default 30000)
+        settle_ms: Extra wait for dynamic content after navigation (default 2000)
+        pool: Context pool to capture with (a browser is opened if None)
+        warm: Use the warm browser server when opening a browser
 
     Returns:
         Path to saved screenshot
@@ -64,43 +116,19 @@ def take_screenshot(
     output_path = os.path.join(SCREENCAP_DIR, output)
     logger.info(f"Taking screenshot of {url} with wait_until={wait_until}, timeout={timeout}ms")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(viewport={"width": 1920, "height": 1080})
-        page = context.new_page()
+    if pool is not None:
+        _capture(pool, url, output_path, full_page, wait_until, timeout, settle_ms)
+    else:
+        with sync_playwright() as p, open_browser(p, warm=warm) as browser:
+            own_pool = BrowserPool(browser)
+            try:
+                _capture(own_pool, url, output_path, full_page, wait_until, timeout, settle_ms)
+            finally:
+                own_pool.close()
 
-        try:
-            # Attempt navigation with specified strategy
-            page.goto(url, wait_until=wait_until, timeout=timeout)
-            logger.info(f"Navigation successful with {wait_until}")
-
-        except PlaywrightTimeoutError:
-            # Fallback to domcontentloaded if original strategy times out
-            if wait_until != "domcontentloaded":
-                logger.warning(
-                    f"Timeout with {wait_until}, falling back to domcontentloaded"
-                )
-                try:
-                    page.goto(url, wait_until="domcontentloaded", timeout=timeout)
-                    logger.info("Fallback navigation successful")
-                except PlaywrightTimeoutError:
-                    logger.error(f"Navigation failed even with fallback: {url}")
-                    raise
-            else:
-                logger.error(f"Navigation timeout: {url}")
-                raise
-
-        # Additional wait for dynamic content
-        page.wait_for_timeout(2000)
-
-        # Take screenshot
-        page.screenshot(path=output_path, full_page=full_page)
-        logger.info(f"Screenshot saved: {output_path}")
-        print(f"Screenshot saved: {output_path}")
-
-        context.close()
-        browser.close()
-        return output_path
+    logger.info(f"Screenshot saved: {output_path}")
+    print(f"Screenshot saved: {output_path}")
+    return output_path
 
 
 def main() -> None:
@@ -127,9 +155,21 @@ def main() -> None:
         default=30000,
         help="Navigation timeout in ms (default: 30000)",
     )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="Launch a fresh browser instead of using the warm browser server",
+    )
 
     args = parser.parse_args()
-    take_screenshot(args.url, args.full_page, args.output, args.wait_until, args.timeout)
+    take_screenshot(
+        args.url,
+        args.full_page,
+        args.output,
+        args.wait_until,
+        args.timeout,
+        warm=not args.cold,
+    )
 
 
 if __name__ == "__main__":
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """
 Video recording utility for Playwright automation.
-Usage: python video_recorder.py <url> [--duration 10] [--wait-until STRATEGY] [--timeout MS] [--output filename]
+Usage: python video_recorder.py <url> [--duration 10] [--wait-until STRATEGY] [--timeout MS] [--output filename] [--cold]
 
 Output: /workspace/.claude/.data/playwright/videos/
         Produces both .webm (native) and .mp4 (converted) formats.
+
+Recordings use the warm browser server (see browser_pool.py) in a fresh
+context unless --cold is given or CLAUDE_BROWSER_POOL=0.
 """
 import argparse
 import os
@@ -17,6 +20,8 @@ import structlog
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
+from claude_apps.skills.playwright_automation.browser_pool import open_browser
+
 # Use CLAUDE_PATH environment variable with fallback
 CLAUDE_PATH = os.environ.get("CLAUDE_PATH", "/workspace/.claude")
 VIDEO_DIR = os.path.join(CLAUDE_PATH, ".data/playwright/videos")
@@ -87,6 +92,7 @@ def record_video(
     height: int = 720,
     wait_until: str = "domcontentloaded",
     timeout: int = 30000,
+    warm: bool = True,
 ) -> tuple[str, str]:
     """Record a video of a URL and return paths to both WebM and MP4 files.
 
@@ -98,6 +104,7 @@ def record_video(
         height: Video height
         wait_until: Wait strategy - domcontentloaded (default), load, or networkidle
         timeout: Navigation timeout in milliseconds (default 30000)
+        warm: Use the warm browser server instead of launching a browser
 
     Returns:
         Tuple of (webm_path, mp4_path)
@@ -107,8 +114,7 @@ def record_video(
 
     logger.info(f"Recording video of {url} for {duration}s with wait_until={wait_until}")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+    with sync_playwright() as p, open_browser(p, warm=warm) as browser:
         context = browser.new_context(
             viewport={"width": 1920, "height": 1080},
             record_video_dir=VIDEO_DIR,
@@ -149,9 +155,8 @@ def record_video(
         # Now safe to close
         page.close()
 
-        # Close context first - video is only fully written after context.close()
+        # Video is only fully written after context.close()
         context.close()
-        browser.close()
 
         # Rename if custom output specified
         if video_path and output:
@@ -202,6 +207,11 @@ def main() -> None:
         default=30000,
         help="Navigation timeout in ms (default: 30000)",
     )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="Launch a fresh browser instead of using the warm browser server",
+    )
 
     args = parser.parse_args()
     record_video(
@@ -212,6 +222,7 @@ def main() -> None:
         args.height,
         args.wait_until,
         args.timeout,
+        warm=not args.cold,
     )
 
 
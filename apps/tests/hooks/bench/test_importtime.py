@@ -0,0 +1,133 @@
+"""Tests for bench importtime module."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from claude_apps.hooks.bench.importtime import (
+    ImportEntry,
+    ImportReport,
+    format_report,
+    parse_importtime,
+    profile_hooks,
+    strip_startup,
+)
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | site
+import time:        50 |         50 |     json.decoder
+import time:       200 |        250 |   json
+import time:       100 |        350 | claude_apps.hooks.logger.__main__
+Traceback (most recent call last):
+"""
+
+
+class TestParseImporttime:
+    """Tests for parse_importtime function."""
+
+    def test_parses_entries_and_depth(self):
+        """Test entries carry timings and nesting depth."""
+        entries = parse_importtime(SAMPLE)
+
+        assert [e.module for e in entries] == [
+            "_io",
+            "site",
+            "json.decoder",
+            "json",
+            "claude_apps.hooks.logger.__main__",
+        ]
+        assert entries[2].depth == 2
+        assert entries[3].depth == 1
+        assert entries[4].self_us == 100
+        assert entries[4].cumulative_us == 350
+
+    def test_skips_header_and_other_lines(self):
+        """Test the header row and non-importtime lines are ignored."""
+        entries = parse_importtime(SAMPLE)
+
+        assert all(e.module != "imported package" for e in entries)
+        assert len(entries) == 5
+
+
+class TestStripStartup:
+    """Tests for strip_startup function."""
+
+    def test_drops_entries_up_to_site(self):
+        """Test interpreter startup imports are removed."""
+        entries = strip_startup(parse_importtime(SAMPLE))
+
+        assert [e.module for e in entries][-1] == "claude_apps.hooks.logger.__main__"
+        assert "site" not in [e.module for e in entries]
+
+    def test_keeps_all_without_site(self):
+        """Test output without a site entry is returned unchanged."""
+        entries = [ImportEntry("json", 1, 1, 0)]
+
+        assert strip_startup(entries) == entries
+
+
+class TestImportReport:
+    """Tests for ImportReport class."""
+
+    def test_total_sums_top_level(self):
+        """Test total counts only depth-0 entries."""
+        report = ImportReport(
+            hook="logger",
+            module="m",
+            entries=[ImportEntry("a", 1, 5, 1), ImportEntry("b", 2, 10, 0)],
+        )
+
+        assert report.total_us == 10
+        assert report.top(1)[0].module == "b"
+
+    def test_format_report_lists_hooks(self):
+        """Test text report includes hook name and modules."""
+        report = ImportReport(
+            hook="logger", module="m", entries=[ImportEntry("json", 100, 2000, 0)]
+        )
+
+        text = format_report([report], 5)
+
+        assert "logger: 2.0 ms" in text
+        assert "json" in text
+
+
+class TestProfileHooks:
+    """Tests for profile_hooks function."""
+
+    def test_unknown_hook_raises(self):
+        """Test unregistered hook names are rejected."""
+        with pytest.raises(ValueError, match="Unknown hook"):
+            profile_hooks(["nope"])
+
+
+class TestColdImports:
+    """Hot-path hooks must not import heavy packages at module load."""
+
+    HEAVY = ("structlog", "pydantic", "boto3", "yaml")
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "claude_apps.hooks.logger.__main__",
+            "claude_apps.hooks.rules_loader.__main__",
+            "claude_apps.hooks.dispatch.__main__",
+            "claude_apps.hooks.playwright_healer.__main__",
+        ],
+    )
+    def test_no_heavy_imports(self, module: str):
+        """Test importing the entry point leaves heavy packages unloaded."""
+        code = (
+            f"import sys, {module}\nprint(','.join(m for m in {self.HEAVY!r} if m in sys.modules))"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, timeout=60, env=env
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
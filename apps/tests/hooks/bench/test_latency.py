@@ -0,0 +1,180 @@
+"""Tests for bench latency module."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.hooks.bench import latency
+from claude_apps.hooks.bench.latency import (
+    compare,
+    list_fixtures,
+    load_fixture,
+    percentile,
+    run_case,
+    sandbox,
+    summarize,
+)
+from claude_apps.hooks.daemon.runner import HookResult
+
+
+class TestFixtures:
+    """Tests for recorded event fixtures."""
+
+    def test_covers_core_events(self):
+        """Test fixtures exist for the events on the critical path."""
+        names = list_fixtures()
+
+        for name in ("session_start", "user_prompt_submit", "pre_tool_use", "post_tool_use"):
+            assert name in names
+
+    @pytest.mark.parametrize("name", list_fixtures())
+    def test_fixture_is_single_line_event(self, name: str):
+        """Test each fixture loads as one JSON line with the event fields."""
+        payload = load_fixture(name)
+        event = json.loads(payload)
+
+        assert payload.count("\n") == 1
+        assert event["session_id"]
+        assert event["hook_event_name"]
+
+    def test_unknown_fixture_raises(self):
+        """Test loading a missing fixture raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown fixture"):
+            load_fixture("nope")
+
+    def test_default_cases_reference_fixtures(self):
+        """Test every default case names an existing fixture."""
+        names = set(list_fixtures())
+
+        for fixtures in latency.DEFAULT_CASES.values():
+            assert set(fixtures) <= names
+
+
+class TestPercentile:
+    """Tests for percentile and summarize functions."""
+
+    def test_nearest_rank(self):
+        """Test nearest-rank percentiles over 1..100."""
+        samples = [float(i) for i in range(100, 0, -1)]
+
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 95) == 95.0
+        assert percentile(samples, 99) == 99.0
+
+    def test_empty_samples(self):
+        """Test empty input yields zero."""
+        assert percentile([], 50) == 0.0
+
+    def test_summarize(self):
+        """Test summary carries sizes and counts."""
+        stats = summarize([1.0, 2.0, 3.0], stdout_bytes=10, disk_bytes=20, errors=1)
+
+        assert stats.p50_ms == 2.0
+        assert stats.max_ms == 3.0
+        assert stats.mean_ms == 2.0
+        assert stats.iterations == 3
+        assert stats.errors == 1
+
+
+class TestSandbox:
+    """Tests for sandbox context manager."""
+
+    def test_redirects_and_restores_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test env points into the temp root and is restored afterwards."""
+        config = tmp_path / "config.yml"
+        config.write_text("hooks:\n  logger:\n    enabled: true\n")
+        (tmp_path / "rules").mkdir()
+        monkeypatch.setenv("CLAUDE_CONFIG_YML_PATH", str(config))
+        monkeypatch.delenv("CLAUDE_DATA_PATH", raising=False)
+
+        with sandbox() as root:
+            assert os.environ["CLAUDE_CONFIG_YML_PATH"] == str(root / "config.yml")
+            assert os.environ["CLAUDE_DATA_PATH"] == str(root / ".data")
+            assert (root / "config.yml").read_text() == config.read_text()
+            assert (root / "rules").is_symlink()
+
+        assert os.environ["CLAUDE_CONFIG_YML_PATH"] == str(config)
+        assert "CLAUDE_DATA_PATH" not in os.environ
+        assert not root.exists()
+
+    def test_works_without_config(self, monkeypatch: pytest.MonkeyPatch):
+        """Test a minimal config is written when none is configured."""
+        monkeypatch.delenv("CLAUDE_CONFIG_YML_PATH", raising=False)
+
+        with sandbox() as root:
+            assert (root / "config.yml").read_text() == "hooks: {}\n"
+
+
+class TestRunCase:
+    """Tests for run_case function."""
+
+    def test_inprocess_collects_samples(self, monkeypatch: pytest.MonkeyPatch):
+        """Test in-process runs record timings, output and disk growth."""
+        monkeypatch.delenv("CLAUDE_CONFIG_YML_PATH", raising=False)
+
+        def fake_run_hook(hook, stdin):
+            log = Path(os.environ["CLAUDE_DATA_PATH"]) / "out.log"
+            log.parent.mkdir(parents=True, exist_ok=True)
+            with open(log, "a") as f:
+                f.write("x" * 10)
+            return HookResult(hook=hook, stdout="{}\n", duration_ms=2.0)
+
+        with sandbox(), patch.object(latency, "run_hook", side_effect=fake_run_hook) as mock_run:
+            stats = run_case("logger", "session_start", "inprocess", iterations=4, warmup=1)
+
+        assert mock_run.call_count == 5
+        assert stats.iterations == 4
+        assert stats.p50_ms == 2.0
+        assert stats.stdout_bytes == 3
+        assert stats.disk_bytes == 10
+        assert stats.errors == 0
+
+    def test_counts_errors(self, monkeypatch: pytest.MonkeyPatch):
+        """Test non-zero exit codes are counted."""
+        monkeypatch.delenv("CLAUDE_CONFIG_YML_PATH", raising=False)
+        result = HookResult(hook="logger", exit_code=1, duration_ms=1.0)
+
+        with sandbox(), patch.object(latency, "run_hook", return_value=result):
+            stats = run_case("logger", "session_start", "inprocess", iterations=2, warmup=0)
+
+        assert stats.errors == 2
+
+    def test_rejects_unknown_mode(self):
+        """Test invalid mode raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown mode"):
+            run_case("logger", "session_start", "threaded", iterations=1)
+
+
+class TestCompare:
+    """Tests for compare function."""
+
+    def _report(self, p50: float, import_ms: float = 10.0) -> dict:
+        stats = {"p50_ms": p50, "p95_ms": p50}
+        return {
+            "results": {
+                "logger": {"import_ms": import_ms, "cases": {"session_start": {"inprocess": stats}}}
+            }
+        }
+
+    def test_flags_regression(self):
+        """Test growth over threshold and min delta is a regression."""
+        rows = compare(self._report(20.0), self._report(10.0))
+
+        regressed = {r["key"] for r in rows if r["regressed"]}
+        assert "logger.session_start.inprocess.p50_ms" in regressed
+        assert "logger.import_ms" not in regressed
+
+    def test_ignores_small_absolute_change(self):
+        """Test sub-millisecond growth is not a regression."""
+        rows = compare(self._report(0.4), self._report(0.2))
+
+        assert not any(r["regressed"] for r in rows)
+
+    def test_skips_cases_missing_from_baseline(self):
+        """Test metrics absent from the baseline are not compared."""
+        rows = compare(self._report(10.0), {"results": {}})
+
+        assert rows == []
@@ -0,0 +1,134 @@
+"""Tests for bench __main__ module."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from claude_apps.hooks.bench.__main__ import main
+
+REPORT = {
+    "meta": {},
+    "results": {
+        "logger": {
+            "import_ms": 5.0,
+            "cases": {
+                "session_start": {
+                    "inprocess": {
+                        "p50_ms": 2.0,
+                        "p95_ms": 3.0,
+                        "p99_ms": 4.0,
+                        "stdout_bytes": 44,
+                        "disk_bytes": 100,
+                        "errors": 0,
+                    }
+                }
+            },
+        }
+    },
+}
+
+
+class TestLatencyCommand:
+    """Tests for the latency subcommand."""
+
+    def test_saves_baseline(self, tmp_path: Path, capsys):
+        """Test --save-baseline writes the report."""
+        baseline = tmp_path / "baseline.json"
+
+        with patch("claude_apps.hooks.bench.latency.run_suite", return_value=REPORT) as mock_run:
+            code = main(
+                [
+                    "latency",
+                    "logger",
+                    "--mode",
+                    "inprocess",
+                    "--baseline",
+                    str(baseline),
+                    "--save-baseline",
+                ]
+            )
+
+        assert code == 0
+        assert json.loads(baseline.read_text())["results"] == REPORT["results"]
+        assert mock_run.call_args.kwargs["modes"] == ("inprocess",)
+        assert "session_start [inprocess]" in capsys.readouterr().out
+
+    def test_regression_exits_nonzero(self, tmp_path: Path):
+        """Test a regression against the baseline returns 1."""
+        baseline = tmp_path / "baseline.json"
+        slow = json.loads(json.dumps(REPORT))
+        slow["results"]["logger"]["cases"]["session_start"]["inprocess"]["p50_ms"] = 20.0
+        baseline.write_text(json.dumps(REPORT))
+
+        with patch("claude_apps.hooks.bench.latency.run_suite", return_value=slow):
+            code = main(["latency", "--baseline", str(baseline), "--format", "json"])
+
+        assert code == 1
+
+    def test_fixture_selection(self, tmp_path: Path):
+        """Test --fixture overrides the default cases."""
+        with patch("claude_apps.hooks.bench.latency.run_suite", return_value=REPORT) as mock_run:
+            main(
+                [
+                    "latency",
+                    "rules_loader",
+                    "--fixture",
+                    "pre_tool_use",
+                    "--baseline",
+                    str(tmp_path / "b.json"),
+                ]
+            )
+
+        assert mock_run.call_args.args[0] == {"rules_loader": ["pre_tool_use"]}
+
+
+class TestStressCommand:
+    """Tests for the stress subcommand."""
+
+    def _report(self, lost: int) -> dict:
+        return {
+            "load": {
+                "mode": "hooks",
+                "sessions": 2,
+                "rounds": 1,
+                "events": 10,
+                "calls": 12,
+                "wall_s": 1.0,
+                "events_per_s": 10.0,
+                "calls_per_s": 12.0,
+            },
+            "latency": {},
+            "integrity": {
+                "errors": 0,
+                "expected_records": 10,
+                "found_records": 10 - lost,
+                "lost_records": lost,
+                "expected_tool_calls": 2,
+                "found_tool_calls": 2,
+                "lost_tool_calls": 0,
+                "corrupt_files": [],
+                "corrupt_lines": 0,
+            },
+        }
+
+    def test_passes_options(self, capsys):
+        """Test options reach run_stress and a clean run exits 0."""
+        with patch(
+            "claude_apps.hooks.bench.stress.run_stress", return_value=self._report(0)
+        ) as mock_run:
+            code = main(["stress", "logger", "-s", "2", "-r", "1", "--mode", "dispatch"])
+
+        assert code == 0
+        assert mock_run.call_args.kwargs == {
+            "sessions": 2,
+            "rounds": 1,
+            "hooks": ["logger"],
+            "mode": "dispatch",
+            "seed": 0,
+        }
+        assert "records 10/10 (lost 0)" in capsys.readouterr().out
+
+    def test_lost_records_exit_nonzero(self):
+        """Test lost records fail the run."""
+        with patch("claude_apps.hooks.bench.stress.run_stress", return_value=self._report(3)):
+            assert main(["stress", "--format", "json"]) == 1
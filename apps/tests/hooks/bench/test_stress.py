@@ -0,0 +1,153 @@
+"""Tests for bench stress module."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.hooks.bench import stress
+from claude_apps.hooks.bench.stress import (
+    Call,
+    is_clean,
+    route,
+    run_stress,
+    session_events,
+    summarize_calls,
+)
+from claude_apps.hooks.dispatch.config import DEFAULT_CONFIG
+
+
+@pytest.fixture
+def no_config(monkeypatch: pytest.MonkeyPatch):
+    """Sandbox with the minimal config (default routing and logger settings)."""
+    monkeypatch.delenv("CLAUDE_CONFIG_YML_PATH", raising=False)
+
+
+def _logger_invoke(drop_every: int = 0):
+    """Stand-in for a hook process: logs logger events in-process."""
+    from claude_apps.hooks.logger.__main__ import log_hook_event
+
+    sent = []
+
+    def invoke(session, target, event_name, payload, env):
+        sent.append(target)
+        if target == "logger" and not (drop_every and len(sent) % drop_every == 0):
+            log_hook_event(json.loads(payload))
+        return Call(session, target, event_name, 1.0, True)
+
+    return invoke
+
+
+class TestSessionEvents:
+    """Tests for session_events function."""
+
+    def test_sequence_shape(self):
+        """Test a session starts, pairs every tool call and stops."""
+        events = session_events("abcd1234", rounds=3, seed=1)
+        names = [e["hook_event_name"] for e in events]
+
+        assert names[0] == "SessionStart"
+        assert names[-1] == "Stop"
+        assert names.count("UserPromptSubmit") == 3
+        assert names.count("PreToolUse") == names.count("PostToolUse") >= 3
+        assert {e["session_id"] for e in events} == {"abcd1234"}
+
+    def test_tool_pairs_match(self):
+        """Test each PostToolUse has a preceding PreToolUse with its id and tool."""
+        events = session_events("abcd1234", rounds=5, seed=2)
+        pre = {
+            e["tool_use_id"]: e["tool_name"] for e in events if e["hook_event_name"] == "PreToolUse"
+        }
+        post = {
+            e["tool_use_id"]: e["tool_name"]
+            for e in events
+            if e["hook_event_name"] == "PostToolUse"
+        }
+
+        assert pre == post
+        assert len(pre) == len(set(pre))
+
+    def test_seeded(self):
+        """Test the same seed gives the same tool mix."""
+        assert session_events("a", 4, seed=7) == session_events("a", 4, seed=7)
+
+
+class TestRoute:
+    """Tests for route function."""
+
+    def test_hooks_mode_filters_routing(self):
+        """Test only selected hooks routed for the event are targets."""
+        event = {"hook_event_name": "PostToolUse", "tool_name": "mcp__playwright__browser_snapshot"}
+
+        assert route(event, "hooks", ["logger", "playwright_healer"], DEFAULT_CONFIG) == [
+            "playwright_healer",
+            "logger",
+        ]
+        read = {"hook_event_name": "PostToolUse", "tool_name": "Read"}
+        assert route(read, "hooks", ["playwright_healer"], DEFAULT_CONFIG) == []
+
+    def test_dispatch_mode(self):
+        """Test dispatch mode sends every event to the dispatcher."""
+        assert route({"hook_event_name": "Stop"}, "dispatch", [], DEFAULT_CONFIG) == ["dispatch"]
+
+
+class TestRunStress:
+    """Tests for run_stress function."""
+
+    def test_clean_run(self, no_config):
+        """Test every logged event and tool pair is found after concurrent sessions."""
+        with patch.object(stress, "_invoke", side_effect=_logger_invoke()):
+            report = run_stress(sessions=4, rounds=3, hooks=["logger"], seed=3)
+
+        integrity = report["integrity"]
+        assert integrity["expected_records"] == report["load"]["events"]
+        assert integrity["found_records"] == integrity["expected_records"]
+        assert integrity["found_tool_calls"] == integrity["expected_tool_calls"] > 0
+        assert is_clean(report)
+
+    def test_reports_lost_records(self, no_config):
+        """Test events the logger never wrote count as lost."""
+        with patch.object(stress, "_invoke", side_effect=_logger_invoke(drop_every=5)):
+            report = run_stress(sessions=2, rounds=2, hooks=["logger"])
+
+        assert report["integrity"]["lost_records"] > 0
+        assert not is_clean(report)
+
+    def test_reports_corrupt_state(self, no_config):
+        """Test a torn JSON state file is reported."""
+
+        def invoke(session, target, event_name, payload, env):
+            state = os.path.join(os.environ["CLAUDE_DATA_PATH"], "state.json")
+            os.makedirs(os.path.dirname(state), exist_ok=True)
+            with open(state, "w") as f:
+                f.write('{"torn": ')
+            return Call(session, target, event_name, 1.0, True)
+
+        with patch.object(stress, "_invoke", side_effect=invoke):
+            report = run_stress(sessions=1, rounds=1, hooks=["rules_loader"])
+
+        assert report["integrity"]["corrupt_files"][0].endswith("state.json")
+        assert not is_clean(report)
+
+    def test_rejects_unknown_hook_and_mode(self):
+        """Test invalid arguments raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown hook"):
+            run_stress(hooks=["nope"])
+        with pytest.raises(ValueError, match="Unknown mode"):
+            run_stress(mode="nope")
+
+
+class TestSummarizeCalls:
+    """Tests for summarize_calls function."""
+
+    def test_per_target_stats(self):
+        """Test calls are grouped per target with errors and percentiles."""
+        calls = [Call("s", "logger", "Stop", float(ms), ms != 4) for ms in range(1, 5)]
+
+        summary = summarize_calls(calls)
+
+        assert summary["logger"]["calls"] == 4
+        assert summary["logger"]["errors"] == 1
+        assert summary["logger"]["p50_ms"] == 2.0
+        assert summary["logger"]["max_ms"] == 4.0
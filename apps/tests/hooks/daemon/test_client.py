@@ -0,0 +1,139 @@
+"""Tests for hooks daemon thin client."""
+
+import json
+import socket
+import threading
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.hooks.daemon.client import main, request_hook
+
+
+@pytest.fixture
+def stalled_daemon(tmp_path):
+    """A socket that reads the request, sends the given lines, then stalls."""
+    socket_path = tmp_path / "stalled.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+    replies: list[bytes] = []
+    done = threading.Event()
+
+    def serve():
+        conn, _ = listener.accept()
+        with conn:
+            conn.makefile("rb").readline()
+            for reply in replies:
+                conn.sendall(reply)
+            done.wait(5)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield socket_path, replies
+    done.set()
+    thread.join()
+    listener.close()
+
+
+class TestRequestHook:
+    """Tests for request_hook function."""
+
+    def test_returns_none_when_socket_missing(self, tmp_path):
+        """Test returns None so the caller can fall back."""
+        assert request_hook(tmp_path / "missing.sock", "logger", "") is None
+
+    def test_returns_none_when_not_accepted(self, stalled_daemon):
+        """Test a request the daemon never started is left to the fallback."""
+        socket_path, _ = stalled_daemon
+
+        assert request_hook(socket_path, "logger", "", accept_timeout=0.2) is None
+
+    def test_accepted_request_is_not_retried(self, stalled_daemon):
+        """Test a timeout after acceptance yields an error response, not None."""
+        socket_path, replies = stalled_daemon
+        replies.append(b'{"accepted": true}\n')
+
+        response = request_hook(socket_path, "logger", "", timeout=0.2)
+
+        assert response["exit_code"] == 0
+        assert "daemon request failed" in response["stderr"]
+
+
+class TestMain:
+    """Tests for client main function."""
+
+    def test_requires_hook_name(self, capsys):
+        """Test prints usage when no hook is given."""
+        assert main([]) == 2
+        assert "usage" in capsys.readouterr().err
+
+    def test_replays_daemon_response(self, capsys):
+        """Test writes daemon stdout/stderr and returns its exit code."""
+        response = {"stdout": '{"continue": true}\n', "stderr": "note\n", "exit_code": 0}
+
+        with (
+            patch("sys.stdin", StringIO("{}")),
+            patch("claude_apps.hooks.daemon.client.get_socket_path"),
+            patch(
+                "claude_apps.hooks.daemon.client.request_hook", return_value=response
+            ) as mock_request,
+        ):
+            exit_code = main(["logger"])
+
+        captured = capsys.readouterr()
+        assert exit_code == 0
+        assert json.loads(captured.out) == {"continue": True}
+        assert captured.err == "note\n"
+        assert mock_request.call_args.args[1:3] == ("logger", "{}")
+
+    def test_falls_back_in_process(self, capsys):
+        """Test runs the hook locally when the daemon is down."""
+        fallback = {"stdout": "local\n", "stderr": "", "exit_code": 0}
+
+        with (
+            patch("sys.stdin", StringIO("{}")),
+            patch("claude_apps.hooks.daemon.client.get_socket_path"),
+            patch("claude_apps.hooks.daemon.client.request_hook", return_value=None),
+            patch(
+                "claude_apps.hooks.daemon.client.run_fallback", return_value=fallback
+            ) as mock_fallback,
+        ):
+            main(["logger", "--flag"])
+
+        mock_fallback.assert_called_once_with("logger", "{}", ["--flag"])
+        assert capsys.readouterr().out == "local\n"
+
+    def test_fallback_spawns_daemon_when_autostart(self):
+        """Test fallback starts a daemon when autostart is enabled."""
+        from claude_apps.hooks.daemon.client import run_fallback
+        from claude_apps.hooks.daemon.runner import HookResult
+
+        with (
+            patch("claude_apps.hooks.daemon.client.get_config", return_value={"autostart": True}),
+            patch("claude_apps.hooks.daemon.client.spawn_daemon") as mock_spawn,
+            patch(
+                "claude_apps.hooks.daemon.runner.run_hook", return_value=HookResult(hook="logger")
+            ),
+        ):
+            result = run_fallback("logger", "{}", [])
+
+        mock_spawn.assert_called_once()
+        assert result["hook"] == "logger"
+
+    def test_fallback_skips_spawn_when_disabled(self):
+        """Test fallback does not start a daemon when autostart is off."""
+        from claude_apps.hooks.daemon.client import run_fallback
+        from claude_apps.hooks.daemon.runner import HookResult
+
+        with (
+            patch("claude_apps.hooks.daemon.client.get_config", return_value={"autostart": False}),
+            patch("claude_apps.hooks.daemon.client.spawn_daemon") as mock_spawn,
+            patch(
+                "claude_apps.hooks.daemon.runner.run_hook", return_value=HookResult(hook="logger")
+            ),
+        ):
+            run_fallback("logger", "{}", [])
+
+        mock_spawn.assert_not_called()
@@ -0,0 +1,167 @@
+"""Tests for hooks daemon in-process runner."""
+
+import os
+import sys
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.hooks.daemon.registry import get_hook_module
+from claude_apps.hooks.daemon.runner import HookResult, run_hook
+
+
+def _fake_module(main) -> ModuleType:
+    module = ModuleType("fake_hook")
+    module.main = main
+    return module
+
+
+class TestGetHookModule:
+    """Tests for get_hook_module function."""
+
+    def test_returns_module_path(self):
+        """Test returns dotted path for registered hook."""
+        assert get_hook_module("logger") == "claude_apps.hooks.logger.__main__"
+
+    def test_raises_for_unknown_hook(self):
+        """Test raises ValueError for unregistered hook."""
+        with pytest.raises(ValueError, match="Unknown hook"):
+            get_hook_module("nope")
+
+
+class TestRunHook:
+    """Tests for run_hook function."""
+
+    def _run(self, main, stdin="", argv=None, **kwargs) -> HookResult:
+        with patch(
+            "claude_apps.hooks.daemon.runner.importlib.import_module",
+            return_value=_fake_module(main),
+        ):
+            return run_hook("logger", stdin, argv, **kwargs)
+
+    def test_captures_stdout_and_stdin(self):
+        """Test feeds stdin and captures stdout."""
+
+        def main():
+            print(sys.stdin.read().upper())
+            return 0
+
+        result = self._run(main, stdin="event")
+
+        assert result.stdout == "EVENT\n"
+        assert result.exit_code == 0
+        assert result.hook == "logger"
+
+    def test_captures_stderr(self):
+        """Test captures stderr separately."""
+
+        def main():
+            sys.stderr.write("oops\n")
+            return 0
+
+        result = self._run(main)
+
+        assert result.stderr == "oops\n"
+        assert result.stdout == ""
+
+    def test_sets_argv(self):
+        """Test exposes hook arguments through sys.argv."""
+
+        def main():
+            print(" ".join(sys.argv[1:]))
+            return 0
+
+        result = self._run(main, argv=["--help"])
+
+        assert result.stdout == "--help\n"
+
+    def test_restores_stdio(self):
+        """Test restores process stdio after the run."""
+        before = (sys.stdin, sys.stdout, sys.stderr, sys.argv)
+
+        self._run(lambda: 0)
+
+        assert (sys.stdin, sys.stdout, sys.stderr, sys.argv) == before
+
+    def test_handles_system_exit(self):
+        """Test converts SystemExit into an exit code."""
+
+        def main():
+            sys.exit(3)
+
+        result = self._run(main)
+
+        assert result.exit_code == 3
+
+    def test_isolates_exceptions(self):
+        """Test reports exceptions as exit code 1 with traceback."""
+
+        def main():
+            raise RuntimeError("boom")
+
+        result = self._run(main)
+
+        assert result.exit_code == 1
+        assert "RuntimeError: boom" in result.stderr
+
+    def test_runs_in_client_cwd_and_env(self, tmp_path):
+        """Test the hook sees the client's cwd and environment, restored after."""
+        before = (os.getcwd(), dict(os.environ))
+
+        def main():
+            print(os.getcwd(), os.environ.get("CLAUDE_DATA_PATH"), "HOME" in os.environ)
+            return 0
+
+        result = self._run(
+            main, argv=["x"], cwd=str(tmp_path), env={"CLAUDE_DATA_PATH": "/session/data"}
+        )
+
+        assert result.stdout == f"{tmp_path} /session/data False\n"
+        assert (os.getcwd(), dict(os.environ)) == before
+
+    def test_records_duration(self):
+        """Test records non-negative duration."""
+        result = self._run(lambda: 0)
+
+        assert result.duration_ms >= 0
+
+
+class TestRunHookMemo:
+    """Tests for hook memo lookups in run_hook."""
+
+    def test_hit_skips_import(self):
+        """Test a memoized response is returned without importing the hook."""
+        with (
+            patch("claude_apps.hooks.daemon.runner.memo_lookup", return_value=("cached\n", "k")),
+            patch("claude_apps.hooks.daemon.runner.importlib.import_module") as import_module,
+        ):
+            result = run_hook("session_context_injector", "event")
+
+        import_module.assert_not_called()
+        assert result.stdout == "cached\n"
+        assert result.memo_hit
+
+    def test_miss_stores_clean_run(self, tmp_path):
+        """Test a clean run is stored under the lookup key, a failing one is not."""
+
+        def run(main):
+            with (
+                patch("claude_apps.hooks.daemon.runner.memo_lookup", return_value=(None, "k")),
+                patch("claude_apps.hooks.daemon.runner.get_memo_dir", return_value=tmp_path),
+                patch("claude_apps.hooks.daemon.runner.get_memo_config", return_value={}),
+                patch("claude_apps.hooks.daemon.runner.store_memo") as store,
+                patch(
+                    "claude_apps.hooks.daemon.runner.importlib.import_module",
+                    return_value=_fake_module(main),
+                ),
+            ):
+                result = run_hook("session_context_injector", "event")
+            return result, store
+
+        result, store = run(lambda: print("fresh"))
+        store.assert_called_once_with(tmp_path, "k", "fresh\n", 16)
+        assert not result.memo_hit
+
+        _, store = run(lambda: 1)
+        store.assert_not_called()
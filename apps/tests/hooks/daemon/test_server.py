@@ -0,0 +1,196 @@
+"""Tests for hooks daemon socket server."""
+
+import json
+import os
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.hooks.daemon.client import request_hook
+from claude_apps.hooks.daemon.registry import HOOK_MODULES
+from claude_apps.hooks.daemon.runner import HookResult
+from claude_apps.hooks.daemon.server import (
+    HookServer,
+    acquire_lock,
+    handle_request,
+    preload_hooks,
+    read_pid,
+)
+
+
+class TestHandleRequest:
+    """Tests for handle_request function."""
+
+    def test_returns_hook_result_fields(self):
+        """Test returns captured result as dict."""
+        with patch(
+            "claude_apps.hooks.daemon.server.run_hook",
+            return_value=HookResult(hook="logger", stdout="{}\n"),
+        ) as mock_run:
+            response = handle_request({"hook": "logger", "stdin": "x", "argv": ["-h"]})
+
+            mock_run.assert_called_once_with("logger", "x", ["-h"], cwd=None, env=None)
+            assert response["stdout"] == "{}\n"
+            assert response["exit_code"] == 0
+
+    def test_unknown_hook_returns_error(self):
+        """Test unknown hook yields exit code 2 and message."""
+        response = handle_request({"hook": "missing"})
+
+        assert response["exit_code"] == 2
+        assert "Unknown hook" in response["stderr"]
+
+
+class TestPreloadHooks:
+    """Tests for preload_hooks function."""
+
+    def test_imports_every_hook_and_survives_failures(self, capsys):
+        """Test every entry point is imported and a broken one is only reported."""
+        with patch(
+            "claude_apps.hooks.daemon.server.importlib.import_module",
+            side_effect=[ImportError("broken")] + [None] * 20,
+        ) as import_module:
+            preload_hooks()
+
+        assert import_module.call_count == len(HOOK_MODULES)
+        assert "preload of" in capsys.readouterr().err
+
+
+class TestLocking:
+    """Tests for pid file locking."""
+
+    def test_acquire_writes_pid(self, tmp_path):
+        """Test lock file contains the current pid."""
+        pid_path = tmp_path / "run" / "hooks.pid"
+
+        fd = acquire_lock(pid_path)
+
+        try:
+            assert fd is not None
+            assert read_pid(pid_path) is not None
+        finally:
+            os.close(fd)
+
+    def test_second_acquire_fails(self, tmp_path):
+        """Test a second daemon cannot take the lock."""
+        pid_path = tmp_path / "hooks.pid"
+        fd = acquire_lock(pid_path)
+
+        try:
+            assert acquire_lock(pid_path) is None
+        finally:
+            os.close(fd)
+
+    def test_read_pid_missing(self, tmp_path):
+        """Test read_pid returns None for missing file."""
+        assert read_pid(tmp_path / "missing.pid") is None
+
+
+class TestHookServer:
+    """Round-trip tests over a real Unix socket."""
+
+    @pytest.fixture
+    def server(self, tmp_path):
+        socket_path = tmp_path / "hooks.sock"
+        server = HookServer(socket_path, idle_timeout=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server, socket_path
+        server.shutdown()
+        server.server_close()
+
+    def test_round_trip(self, server):
+        """Test client receives the hook output through the socket."""
+        _, socket_path = server
+
+        with patch(
+            "claude_apps.hooks.daemon.server.run_hook",
+            return_value=HookResult(hook="logger", stdout='{"continue": true}\n'),
+        ):
+            response = request_hook(socket_path, "logger", '{"session_id": "s"}')
+
+        assert response["stdout"] == '{"continue": true}\n'
+
+    def test_forwards_client_cwd_and_env(self, server, monkeypatch, tmp_path):
+        """Test the hook is run with the requesting client's cwd and environment."""
+        _, socket_path = server
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("CLAUDE_DATA_PATH", "/session/data")
+
+        def run(hook, stdin, argv, cwd, env):
+            return HookResult(hook=hook, stdout=json.dumps([cwd, env["CLAUDE_DATA_PATH"]]))
+
+        with patch("claude_apps.hooks.daemon.server.run_hook", side_effect=run):
+            response = request_hook(socket_path, "logger", "")
+
+        assert json.loads(response["stdout"]) == [str(tmp_path), "/session/data"]
+
+    def test_slow_hook_does_not_block_others(self, server):
+        """Test requests are served concurrently (one child per request)."""
+        _, socket_path = server
+
+        def run(hook, *args, **kwargs):
+            if hook == "slow":
+                time.sleep(2)
+            return HookResult(hook=hook, stdout=hook)
+
+        with patch("claude_apps.hooks.daemon.server.run_hook", side_effect=run):
+            slow = threading.Thread(target=request_hook, args=(socket_path, "slow", ""))
+            slow.start()
+            time.sleep(0.2)
+            start = time.monotonic()
+            response = request_hook(socket_path, "fast", "")
+            elapsed = time.monotonic() - start
+            slow.join()
+
+        assert response["stdout"] == "fast"
+        assert elapsed < 1.5
+
+    def test_invalid_json_request(self, server):
+        """Test malformed request line yields an error response."""
+        _, socket_path = server
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(b"not json\n")
+            response = json.loads(sock.makefile().readline())
+
+        assert response["exit_code"] == 2
+
+    def test_updates_last_activity(self, server):
+        """Test handled requests reset the idle clock."""
+        hook_server, socket_path = server
+        hook_server.last_activity = 0
+
+        with patch(
+            "claude_apps.hooks.daemon.server.run_hook",
+            return_value=HookResult(hook="logger"),
+        ):
+            request_hook(socket_path, "logger", "")
+
+        assert hook_server.last_activity > 0
+
+
+class TestIdle:
+    """Tests for idle detection."""
+
+    def test_zero_timeout_never_idle(self, tmp_path):
+        """Test idle timeout of 0 disables idle shutdown."""
+        server = HookServer(tmp_path / "a.sock", idle_timeout=0)
+        try:
+            server.last_activity = time.monotonic() - 10_000
+            assert server.is_idle() is False
+        finally:
+            server.server_close()
+
+    def test_idle_after_timeout(self, tmp_path):
+        """Test reports idle once the timeout has elapsed."""
+        server = HookServer(tmp_path / "b.sock", idle_timeout=1)
+        try:
+            server.last_activity = time.monotonic() - 2
+            assert server.is_idle() is True
+        finally:
+            server.server_close()
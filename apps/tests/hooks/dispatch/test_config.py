@@ -0,0 +1,65 @@
+"""Tests for dispatch hook configuration."""
+
+from unittest.mock import patch
+
+from claude_apps.hooks.dispatch.config import (
+    DEFAULT_EVENTS,
+    get_config,
+    get_hooks_for_event,
+)
+
+
+class TestGetConfig:
+    """Tests for get_config function."""
+
+    def test_applies_defaults(self):
+        """Test falls back to default event map."""
+        with patch("claude_apps.hooks.dispatch.config.get_hook_config", return_value={}):
+            config = get_config()
+
+        assert config["events"] == DEFAULT_EVENTS
+        assert config["log_timings"] is False
+
+    def test_overrides_events(self):
+        """Test config.yml events replace defaults."""
+        with patch(
+            "claude_apps.hooks.dispatch.config.get_hook_config",
+            return_value={"events": {"Stop": ["logger"]}},
+        ):
+            config = get_config()
+
+        assert config["events"] == {"Stop": ["logger"]}
+
+
+class TestGetHooksForEvent:
+    """Tests for get_hooks_for_event function."""
+
+    def test_plain_names(self):
+        """Test returns plain hook names in order."""
+        config = {"events": {"UserPromptSubmit": ["logger", "rules_loader"]}}
+
+        assert get_hooks_for_event(config, "UserPromptSubmit") == ["logger", "rules_loader"]
+
+    def test_unknown_event(self):
+        """Test returns empty list for unconfigured event."""
+        assert get_hooks_for_event({"events": {}}, "Stop") == []
+
+    def test_matcher_selects_tool(self):
+        """Test matcher entries only apply to matching tools."""
+        config = {"events": {"PostToolUse": DEFAULT_EVENTS["PostToolUse"]}}
+
+        assert get_hooks_for_event(config, "PostToolUse", "Bash") == ["logger"]
+        assert get_hooks_for_event(config, "PostToolUse", "ExitPlanMode") == [
+            "plan_distributor",
+            "logger",
+        ]
+        assert get_hooks_for_event(config, "PostToolUse", "mcp__playwright__browser_click") == [
+            "playwright_healer",
+            "logger",
+        ]
+
+    def test_wildcard_matcher(self):
+        """Test '*' matcher applies to every tool."""
+        config = {"events": {"PreToolUse": [{"hook": "logger", "matcher": "*"}]}}
+
+        assert get_hooks_for_event(config, "PreToolUse", "Read") == ["logger"]
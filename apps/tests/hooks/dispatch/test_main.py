@@ -0,0 +1,190 @@
+"""Tests for dispatch hook main module."""
+
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from claude_apps.hooks.daemon.runner import HookResult
+from claude_apps.hooks.dispatch.__main__ import (
+    apply_context_budget,
+    format_timings,
+    main,
+    parse_event,
+    run_hooks,
+)
+
+
+class TestParseEvent:
+    """Tests for parse_event function."""
+
+    def test_single_document(self):
+        """Test parses a pretty-printed single document."""
+        assert parse_event('{\n  "hook_event_name": "Stop"\n}\n') == {"hook_event_name": "Stop"}
+
+    def test_ndjson_takes_first(self):
+        """Test takes the first event from NDJSON input."""
+        raw = '{"hook_event_name": "A"}\n{"hook_event_name": "B"}\n'
+
+        assert parse_event(raw) == {"hook_event_name": "A"}
+
+    def test_list_takes_first(self):
+        """Test takes the first element of a JSON array."""
+        assert parse_event('[{"a": 1}, {"a": 2}]') == {"a": 1}
+
+    def test_invalid_returns_none(self):
+        """Test returns None for unparseable input."""
+        assert parse_event("nope") is None
+        assert parse_event("") is None
+
+
+class TestRunHooks:
+    """Tests for run_hooks function."""
+
+    def test_isolates_failures(self):
+        """Test a failing hook does not stop the others."""
+
+        def fake_run(hook_name, raw):
+            if hook_name == "bad":
+                raise ValueError("Unknown hook: bad")
+            return HookResult(hook=hook_name, stdout="{}\n")
+
+        with patch("claude_apps.hooks.dispatch.__main__.run_hook", side_effect=fake_run):
+            results = run_hooks(["bad", "logger"], "{}")
+
+        assert [r.hook for r in results] == ["bad", "logger"]
+        assert results[0].exit_code == 1
+        assert results[1].exit_code == 0
+
+
+class TestFormatTimings:
+    """Tests for format_timings function."""
+
+    def test_includes_each_hook(self):
+        """Test lists total and per-hook durations."""
+        results = [
+            HookResult(hook="logger", duration_ms=1.25),
+            HookResult(hook="rules_loader", duration_ms=2.0),
+        ]
+
+        line = format_timings("UserPromptSubmit", results)
+
+        assert line == "[dispatch] UserPromptSubmit total=3.2ms logger=1.2ms rules_loader=2.0ms"
+
+
+class TestApplyContextBudget:
+    """Tests for apply_context_budget function."""
+
+    def _responses(self, text):
+        return [
+            {"hookSpecificOutput": {"hookEventName": "SessionStart", "additionalContext": text}}
+        ]
+
+    def test_retracts_trimmed_rules(self, tmp_path):
+        """Test a cut rules_loader context is reported back to its session state."""
+        hook_responses = [
+            ("session_context_injector", self._responses("S" * 100)),
+            ("rules_loader", self._responses("R" * 1000)),
+        ]
+        budget = {"enabled": True, "max_chars": 600, "telemetry": False}
+        budget["priorities"] = {"session_context_injector": 10, "rules_loader": 20}
+
+        with (
+            patch("claude_apps.hooks.dispatch.__main__.get_budget_config", return_value=budget),
+            patch("claude_apps.hooks.dispatch.__main__.get_session_dir", return_value=tmp_path),
+            patch("claude_apps.hooks.dispatch.__main__.retract_trimmed") as retract,
+        ):
+            apply_context_budget("SessionStart", "s1", hook_responses)
+
+        kept = hook_responses[1][1][0]["hookSpecificOutput"]["additionalContext"]
+        assert len(kept) < 1000
+        retract.assert_called_once_with(tmp_path, kept)
+
+    def test_untrimmed_rules_are_not_retracted(self):
+        """Test nothing is retracted when the rules fit the budget."""
+        budget = {"enabled": True, "max_chars": 600, "telemetry": False}
+
+        with (
+            patch("claude_apps.hooks.dispatch.__main__.get_budget_config", return_value=budget),
+            patch("claude_apps.hooks.dispatch.__main__.retract_trimmed") as retract,
+        ):
+            apply_context_budget("SessionStart", "s1", [("rules_loader", self._responses("R"))])
+
+        retract.assert_not_called()
+
+
+class TestMain:
+    """Tests for dispatch main function."""
+
+    def test_merges_hook_outputs(self, capsys):
+        """Test runs configured hooks and prints one merged response."""
+        event = {"session_id": "s", "hook_event_name": "UserPromptSubmit"}
+        results = [
+            HookResult(hook="logger", stdout='{"continue": true, "suppressOutput": false}\n'),
+            HookResult(
+                hook="rules_loader",
+                stdout=json.dumps(
+                    {
+                        "hookSpecificOutput": {
+                            "hookEventName": "UserPromptSubmit",
+                            "additionalContext": "R",
+                        }
+                    }
+                ),
+            ),
+        ]
+
+        with (
+            patch("sys.stdin", StringIO(json.dumps(event))),
+            patch(
+                "claude_apps.hooks.dispatch.__main__.get_config",
+                return_value={"events": {"UserPromptSubmit": ["logger", "rules_loader"]}},
+            ),
+            patch(
+                "claude_apps.hooks.dispatch.__main__.run_hooks", return_value=results
+            ) as mock_run,
+        ):
+            assert main() == 0
+
+        mock_run.assert_called_once_with(["logger", "rules_loader"], json.dumps(event))
+        output = json.loads(capsys.readouterr().out)
+        assert output["continue"] is True
+        assert output["hookSpecificOutput"]["additionalContext"] == "R"
+
+    def test_logs_timings_when_enabled(self, capsys):
+        """Test writes timing line to stderr when log_timings is set."""
+        with (
+            patch("sys.stdin", StringIO('{"hook_event_name": "Stop"}')),
+            patch(
+                "claude_apps.hooks.dispatch.__main__.get_config",
+                return_value={"log_timings": True, "events": {"Stop": ["logger"]}},
+            ),
+            patch(
+                "claude_apps.hooks.dispatch.__main__.run_hooks",
+                return_value=[HookResult(hook="logger", duration_ms=1.0)],
+            ),
+        ):
+            main()
+
+        assert "[dispatch] Stop" in capsys.readouterr().err
+
+    def test_propagates_blocking_exit_code(self):
+        """Test exit code 2 from any hook is returned."""
+        with (
+            patch("sys.stdin", StringIO('{"hook_event_name": "PreToolUse"}')),
+            patch(
+                "claude_apps.hooks.dispatch.__main__.get_config",
+                return_value={"events": {"PreToolUse": ["logger"]}},
+            ),
+            patch(
+                "claude_apps.hooks.dispatch.__main__.run_hooks",
+                return_value=[HookResult(hook="logger", stderr="blocked\n", exit_code=2)],
+            ),
+        ):
+            assert main() == 2
+
+    def test_invalid_input_continues(self, capsys):
+        """Test unparseable input still yields a continue response."""
+        with patch("sys.stdin", StringIO("garbage")):
+            assert main() == 0
+
+        assert json.loads(capsys.readouterr().out) == {"continue": True, "suppressOutput": False}
@@ -0,0 +1,119 @@
+"""Tests for dispatch hook response merging."""
+
+from claude_apps.hooks.dispatch.merger import budget_contexts, merge_responses, parse_responses
+
+
+class TestParseResponses:
+    """Tests for parse_responses function."""
+
+    def test_parses_json_lines(self):
+        """Test parses one object per line."""
+        stdout = '{"continue": true}\n{"hookSpecificOutput": {}}\n'
+
+        assert parse_responses(stdout) == [{"continue": True}, {"hookSpecificOutput": {}}]
+
+    def test_skips_non_json_lines(self):
+        """Test ignores blank and non-JSON lines."""
+        assert parse_responses("\nhello\n[1, 2]\n{}\n") == [{}]
+
+
+class TestMergeResponses:
+    """Tests for merge_responses function."""
+
+    def test_empty_defaults(self):
+        """Test empty input yields a continue response."""
+        assert merge_responses("Stop", []) == {"continue": True, "suppressOutput": False}
+
+    def test_joins_additional_context(self):
+        """Test joins non-empty contexts in hook order."""
+        responses = [
+            {"hookSpecificOutput": {"hookEventName": "SessionStart", "additionalContext": "rules"}},
+            {"hookSpecificOutput": {"hookEventName": "SessionStart", "additionalContext": ""}},
+            {"hookSpecificOutput": {"hookEventName": "SessionStart", "additionalContext": "auth"}},
+        ]
+
+        merged = merge_responses("SessionStart", responses)
+
+        assert merged["hookSpecificOutput"] == {
+            "hookEventName": "SessionStart",
+            "additionalContext": "rules\n\nauth",
+        }
+
+    def test_omits_empty_hook_specific_output(self):
+        """Test no hookSpecificOutput when every context is empty."""
+        responses = [{"hookSpecificOutput": {"hookEventName": "X", "additionalContext": ""}}]
+
+        assert "hookSpecificOutput" not in merge_responses("X", responses)
+
+    def test_continue_false_wins(self):
+        """Test any hook can stop processing."""
+        responses = [
+            {"continue": True},
+            {"continue": False, "stopReason": "blocked"},
+            {"continue": True, "stopReason": "other"},
+        ]
+
+        merged = merge_responses("Stop", responses)
+
+        assert merged["continue"] is False
+        assert merged["stopReason"] == "blocked"
+
+    def test_suppress_output_any(self):
+        """Test suppressOutput is true if any hook sets it."""
+        merged = merge_responses("Stop", [{"suppressOutput": False}, {"suppressOutput": True}])
+
+        assert merged["suppressOutput"] is True
+
+    def test_first_specific_field_wins(self):
+        """Test non-context hookSpecificOutput fields keep first value."""
+        responses = [
+            {"hookSpecificOutput": {"permissionDecision": "deny"}},
+            {"hookSpecificOutput": {"permissionDecision": "allow"}},
+        ]
+
+        merged = merge_responses("PreToolUse", responses)
+
+        assert merged["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    def test_joins_system_messages(self):
+        """Test system messages are concatenated."""
+        merged = merge_responses("Stop", [{"systemMessage": "a"}, {"systemMessage": "b"}])
+
+        assert merged["systemMessage"] == "a\nb"
+
+
+def _context(text):
+    return {"hookSpecificOutput": {"hookEventName": "SessionStart", "additionalContext": text}}
+
+
+class TestBudgetContexts:
+    """Tests for budget_contexts function."""
+
+    def test_trims_lowest_priority_first(self):
+        """Test the higher-priority hook keeps its context in full."""
+        hook_responses = [
+            ("session_context_injector", [_context("s" * 500)]),
+            ("logger", [{"continue": True}]),
+            ("rules_loader", [_context("r" * 300)]),
+        ]
+        config = {"max_chars": 600, "priorities": {"rules_loader": 10}, "default_priority": 50}
+
+        allocations = budget_contexts("SessionStart", hook_responses, config)
+
+        assert [a.hook for a in allocations] == ["session_context_injector", "rules_loader"]
+        assert allocations[1].text == "r" * 300
+        assert allocations[0].trimmed
+        merged = merge_responses("SessionStart", [r for _, rs in hook_responses for r in rs])
+        context = merged["hookSpecificOutput"]["additionalContext"]
+        assert len(context) <= 600
+        assert context.endswith("r" * 300)
+        assert "from session_context_injector omitted]" in context
+
+    def test_joins_multiple_contexts_of_one_hook(self):
+        """Test a hook's several responses count as one contribution."""
+        responses = [_context("a"), _context("b")]
+
+        [allocation] = budget_contexts("SessionStart", [("hook", responses)], {})
+
+        assert allocation.text == "a\n\nb"
+        assert [r["hookSpecificOutput"]["additionalContext"] for r in responses] == ["a\n\nb", ""]
@@ -0,0 +1,13 @@
+"""Fixtures for logger hook tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_claude_root(tmp_path_factory, monkeypatch):
+    """Point config and data paths at a temp dir so no test writes real logs."""
+    root = tmp_path_factory.mktemp("claude")
+    (root / "config.yml").write_text("hooks: {}\n")
+    monkeypatch.setenv("CLAUDE_CONFIG_YML_PATH", str(root / "config.yml"))
+    monkeypatch.setenv("CLAUDE_DATA_PATH", str(root / ".data"))
+    return root
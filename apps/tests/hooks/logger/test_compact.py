@@ -0,0 +1,124 @@
+"""Tests for logger hook log compaction."""
+
+import json
+import sys
+from unittest.mock import patch
+
+from claude_apps.hooks.logger.__main__ import main
+from claude_apps.hooks.logger.compact import compact_logs, find_legacy_files, migrate_session
+from claude_apps.shared.event_log import SegmentPolicy, iter_session_records, list_segments
+
+
+def _legacy_tree(base):
+    """Two sessions in the per-second layout."""
+    files = {
+        "s1/SessionStart/20250101_100000.json": [{"hook_event_name": "SessionStart", "n": 1}],
+        "s1/PreToolUse/20250101_100005.ndjson": [{"hook_event_name": "PreToolUse", "n": 2}],
+        "s1/PreToolUse/20250101_100010.json": [{"hook_event_name": "PreToolUse", "n": 3}],
+        "s2/Stop/20250101_110000.json": [{"hook_event_name": "Stop", "n": 4}],
+    }
+    for relative, records in files.items():
+        path = base / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".json":
+            path.write_text(json.dumps(records, indent=2) + "\n")
+        else:
+            path.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+
+class TestFindLegacyFiles:
+    """Tests for find_legacy_files function."""
+
+    def test_orders_by_timestamp_across_events(self, tmp_path):
+        """Test files from every event directory are merged in time order."""
+        _legacy_tree(tmp_path)
+
+        found = find_legacy_files(tmp_path / "s1")
+
+        assert [p.name for _, p in found] == [
+            "20250101_100000.json",
+            "20250101_100005.ndjson",
+            "20250101_100010.json",
+        ]
+
+
+class TestMigrateSession:
+    """Tests for migrate_session function."""
+
+    def test_folds_files_into_compressed_segment(self, tmp_path):
+        """Test records move into one segment and old files are removed."""
+        _legacy_tree(tmp_path)
+        session_dir = tmp_path / "s1"
+
+        files, records, segments = migrate_session(session_dir, SegmentPolicy())
+
+        assert (files, records, segments) == (3, 3, 1)
+        assert [p.suffix for p in list_segments(session_dir)] == [".gz"]
+        assert not (session_dir / "PreToolUse").exists()
+        migrated = list(iter_session_records(session_dir))
+        assert [r["n"] for r in migrated] == [1, 2, 3]
+        assert migrated[0]["logged_at"] == "2025-01-01T10:00:00.000"
+
+    def test_splits_at_max_bytes(self, tmp_path):
+        """Test large sessions produce several segments."""
+        _legacy_tree(tmp_path)
+
+        _, _, segments = migrate_session(tmp_path / "s1", SegmentPolicy(max_bytes=100))
+
+        assert segments == 3
+
+    def test_dry_run_changes_nothing(self, tmp_path):
+        """Test dry run only counts."""
+        _legacy_tree(tmp_path)
+        before = sorted(p.name for p in (tmp_path / "s1").rglob("*"))
+
+        assert migrate_session(tmp_path / "s1", SegmentPolicy(), dry_run=True) == (3, 3, 1)
+        assert sorted(p.name for p in (tmp_path / "s1").rglob("*")) == before
+
+
+class TestCompactLogs:
+    """Tests for compact_logs function."""
+
+    def test_compacts_every_session(self, tmp_path):
+        """Test all sessions are migrated and reported."""
+        _legacy_tree(tmp_path)
+
+        report = compact_logs(tmp_path, SegmentPolicy(compression="lzma"))
+
+        assert (report.sessions, report.files_migrated, report.records) == (2, 4, 4)
+        assert report.segments_written == 2
+        assert all(p.suffix == ".xz" for p in tmp_path.rglob("segment.*"))
+
+    def test_seals_idle_active_segments(self, tmp_path):
+        """Test an ended session's active segment is sealed and compressed."""
+        session_dir = tmp_path / "s3"
+        session_dir.mkdir()
+        active = session_dir / "active.20200101_000000.ndjson"
+        active.write_text('{"n":1}\n')
+
+        report = compact_logs(tmp_path, SegmentPolicy(grace_seconds=0))
+
+        assert report.segments_sealed == 1
+        assert not active.exists()
+        assert [r["n"] for r in iter_session_records(session_dir)] == [1]
+
+    def test_missing_base_is_empty_report(self, tmp_path):
+        """Test a base directory that does not exist."""
+        assert compact_logs(tmp_path / "missing", SegmentPolicy()).sessions == 0
+
+    def test_main_compact_subcommand(self, tmp_path, capsys):
+        """Test `python -m claude_apps.hooks.logger compact --base`."""
+        _legacy_tree(tmp_path)
+
+        with patch.object(sys, "argv", ["logger", "compact", "--base", str(tmp_path)]):
+            with patch(
+                "claude_apps.hooks.logger.__main__.get_config",
+                return_value={
+                    "segment_max_bytes": 1024 * 1024,
+                    "segment_max_age_seconds": 3600,
+                    "segment_compression": "gzip",
+                },
+            ):
+                assert main() == 0
+
+        assert "files_migrated=4" in capsys.readouterr().out
@@ -0,0 +1,73 @@
+"""Tests for logger hook log export."""
+
+import json
+import sys
+from unittest.mock import patch
+
+from claude_apps.hooks.logger.__main__ import main
+from claude_apps.hooks.logger.export import collect_log_files, export_logs
+from claude_apps.shared.event_log import (
+    SegmentPolicy,
+    append_to_session,
+    maintain_session,
+    render_json_array,
+)
+
+
+class TestCollectLogFiles:
+    """Tests for collect_log_files function."""
+
+    def test_expands_directories_in_path_order(self, tmp_path):
+        """Test directories are searched recursively and sorted."""
+        event_dir = tmp_path / "session" / "PreToolUse"
+        event_dir.mkdir(parents=True)
+        (event_dir / "20250102_000000.ndjson").write_text("")
+        (event_dir / "20250101_000000.ndjson").write_text("")
+        (event_dir / "notes.txt").write_text("")
+
+        files = collect_log_files([tmp_path])
+
+        assert [f.name for f in files] == ["20250101_000000.ndjson", "20250102_000000.ndjson"]
+
+    def test_orders_segments_sealed_before_active(self, tmp_path):
+        """Test compressed sealed segments come before the active one."""
+        session_dir = tmp_path / "session"
+        policy = SegmentPolicy(max_bytes=40, grace_seconds=0)
+        for i in range(3):
+            append_to_session(session_dir, json.dumps({"i": i}) + " " * 20, policy)
+        maintain_session(session_dir, policy)
+
+        files = collect_log_files([tmp_path])
+
+        assert any(f.suffix == ".gz" for f in files)
+        assert files[-1].name.startswith("active.")
+        records = json.loads(render_json_array(files))
+        assert [r["i"] for r in records] == [0, 1, 2]
+
+
+class TestExportLogs:
+    """Tests for export_logs function."""
+
+    def test_writes_pretty_array_to_output(self, tmp_path):
+        """Test records are written as an indented JSON array."""
+        log = tmp_path / "log.ndjson"
+        log.write_text('{"n":1}\n{"n":2}\n')
+        output = tmp_path / "out" / "view.json"
+
+        assert export_logs([log], output) == 0
+        assert output.read_text() == json.dumps([{"n": 1}, {"n": 2}], indent=2) + "\n"
+
+    def test_returns_error_when_nothing_found(self, tmp_path, capsys):
+        """Test an empty directory is reported."""
+        assert export_logs([tmp_path]) == 1
+        assert "No log files" in capsys.readouterr().err
+
+    def test_main_export_subcommand(self, tmp_path, capsys):
+        """Test `python -m claude_apps.hooks.logger export` prints the array."""
+        log = tmp_path / "log.ndjson"
+        log.write_text('{"n":1}\n')
+
+        with patch.object(sys, "argv", ["logger", "export", str(log)]):
+            assert main() == 0
+
+        assert json.loads(capsys.readouterr().out) == [{"n": 1}]
@@ -0,0 +1,198 @@
+"""Tests for logger hook log index."""
+
+import json
+
+import pytest
+
+from claude_apps.hooks.logger.compact import compact_logs
+from claude_apps.hooks.logger.index import LogIndex, QueryFilter
+from claude_apps.shared.event_log import (
+    SegmentPolicy,
+    append_record,
+    append_to_session,
+    compress_segment,
+    list_segments,
+    seal_segment,
+)
+
+
+def _event(session, event, tool=None, n=0, at="2025-01-01T10:00:00.000"):
+    record = {"logged_at": at, "session_id": session, "hook_event_name": event, "n": n}
+    if tool:
+        record["tool_name"] = tool
+    return json.dumps(record)
+
+
+@pytest.fixture
+def roots(tmp_path):
+    return {
+        "logger": tmp_path / "claude_hooks",
+        "rules_loader": tmp_path / "rules_loader",
+        "playwright_healer": tmp_path / "playwright_healer",
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    with LogIndex(tmp_path / "index.sqlite3") as idx:
+        yield idx
+
+
+def _count(index):
+    return index.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+class TestUpdate:
+    """Tests for incremental ingestion."""
+
+    def test_ingests_only_appended_lines(self, index, roots):
+        """Test a second update reads only what was appended."""
+        session = roots["logger"] / "s1"
+        policy = SegmentPolicy(compression="none")
+        append_to_session(session, _event("s1", "SessionStart"), policy)
+
+        assert index.update(roots).events_added == 1
+
+        append_to_session(session, _event("s1", "PreToolUse", "Read"), policy)
+        stats = index.update(roots)
+
+        assert stats.events_added == 1
+        assert _count(index) == 2
+        assert index.update(roots).files_updated == 0
+
+    def test_partial_line_waits_for_newline(self, index, roots):
+        """Test a torn trailing line is ingested once complete."""
+        path = roots["logger"] / "s1" / "active.20250101_100000.ndjson"
+        path.parent.mkdir(parents=True)
+        line = _event("s1", "Stop")
+        path.write_text(line[:10])
+
+        assert index.update(roots).events_added == 0
+
+        path.write_text(line + "\n")
+        assert index.update(roots).events_added == 1
+
+    def test_follows_seal_and_compression_without_duplicates(self, index, roots):
+        """Test sealed and compressed segments keep their ingested state."""
+        session = roots["logger"] / "s1"
+        policy = SegmentPolicy(compression="none")
+        active = append_to_session(session, _event("s1", "PreToolUse", n=1), policy)
+        index.update(roots)
+
+        sealed = seal_segment(active)
+        append_record(sealed, json.loads(_event("s1", "PostToolUse", n=2)))
+        stats = index.update(roots)
+        assert (stats.files_moved, stats.events_added) == (1, 1)
+
+        compress_segment(sealed, "gzip")
+        stats = index.update(roots)
+        assert (stats.files_moved, stats.events_added) == (1, 0)
+        assert _count(index) == 2
+
+    def test_size_rotation_reusing_active_name(self, index, roots):
+        """Test a new active segment with the old name is ingested from scratch."""
+        session = roots["logger"] / "s1"
+        policy = SegmentPolicy(max_bytes=150, compression="none")
+        for n in range(2):
+            append_to_session(session, _event("s1", "PreToolUse", n=n), policy)
+        index.update(roots)
+
+        for n in range(2, 6):
+            append_to_session(session, _event("s1", "PreToolUse", n=n), policy)
+        index.update(roots)
+
+        distinct = index.conn.execute(
+            "SELECT COUNT(DISTINCT file_id || ':' || offset) FROM events"
+        ).fetchone()[0]
+        assert len(list_segments(session)) > 2
+        assert _count(index) == distinct == 6
+
+    def test_compaction_replaces_legacy_rows(self, index, roots):
+        """Test migrated per-second files do not leave duplicate rows."""
+        legacy = roots["logger"] / "s1" / "PreToolUse" / "20250101_100000.json"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps([{"session_id": "s1", "hook_event_name": "PreToolUse"}]))
+        index.update(roots)
+        assert _count(index) == 1
+
+        compact_logs(roots["logger"], SegmentPolicy())
+        stats = index.update(roots)
+
+        assert stats.files_removed == 1
+        assert _count(index) == 1
+        [row] = index.records(QueryFilter())
+        assert row["logged_at"] == "2025-01-01T10:00:00.000"
+
+    def test_indexes_other_hook_logs(self, index, roots):
+        """Test rules_loader and playwright_healer records carry their kind."""
+        append_record(
+            roots["playwright_healer"] / "s1" / "error_detected" / "20250101_100000.ndjson",
+            {
+                "timestamp": "2025-01-01T10:00:00",
+                "session_id": "s1",
+                "event_type": "error_detected",
+                "tool_name": "mcp__playwright__browser_click",
+            },
+        )
+        append_record(
+            roots["rules_loader"] / "s2" / "SessionStart" / "20250101_100000.ndjson",
+            {"event": "directives_loaded", "session_id": "s2", "hook_event_name": "SessionStart"},
+        )
+        index.update(roots)
+
+        [healer] = index.records(QueryFilter(source="playwright_healer"))
+        [rules] = index.records(QueryFilter(source="rules_loader"))
+        assert healer["kind"] == "error_detected"
+        assert rules["logged_at"] == "2025-01-01T10:00:00.000"
+
+    def test_skips_state_dotfiles(self, index, roots):
+        """Test per-session state such as .tool_summary.json is not indexed."""
+        session = roots["logger"] / "s1"
+        session.mkdir(parents=True)
+        (session / ".tool_summary.json").write_text('{"pending": {}, "tools": {}}')
+
+        assert index.update(roots).events_added == 0
+
+
+class TestQueries:
+    """Tests for record queries and aggregates."""
+
+    @pytest.fixture
+    def populated(self, index, roots):
+        policy = SegmentPolicy(compression="none")
+        rows = [
+            ("s1", "PreToolUse", "Read", "2025-01-01T10:00:00.000"),
+            ("s1", "PreToolUse", "mcp__playwright__browser_click", "2025-01-01T10:01:00.000"),
+            ("s2", "PreToolUse", "mcp__playwright__browser_snapshot", "2025-01-02T09:00:00.000"),
+            ("s2", "Stop", None, "2025-01-02T09:05:00.000"),
+        ]
+        for n, (session, event, tool, at) in enumerate(rows):
+            line = _event(session, event, tool, n, at)
+            append_to_session(roots["logger"] / session, line, policy)
+        index.update(roots)
+        return index
+
+    def test_filters_by_tool_glob(self, populated):
+        """Test '*' tool filters match by glob."""
+        rows = populated.records(QueryFilter(tool_name="mcp__playwright__*"))
+
+        assert [r["session_id"] for r in rows] == ["s1", "s2"]
+
+    def test_filters_by_time_range(self, populated):
+        """Test since/until bound logged_at."""
+        rows = populated.records(QueryFilter(since="2025-01-02", until="2025-01-02T09:01"))
+
+        assert [r["tool_name"] for r in rows] == ["mcp__playwright__browser_snapshot"]
+
+    def test_aggregate_by_session(self, populated):
+        """Test grouping returns counts and time range."""
+        groups = populated.aggregate(QueryFilter(hook_event_name="PreToolUse"), "session")
+
+        assert [(g["session"], g["events"]) for g in groups] == [("s1", 2), ("s2", 1)]
+        assert groups[0]["first"] == "2025-01-01T10:00:00.000"
+        assert groups[0]["bytes"] > 0
+
+    def test_rejects_unknown_group(self, populated):
+        """Test unknown group columns raise ValueError."""
+        with pytest.raises(ValueError):
+            populated.aggregate(QueryFilter(), "path")
@@ -0,0 +1,196 @@
+"""Tests for logger hook sampling, field filtering, truncation and blobs."""
+
+import hashlib
+import json
+from unittest.mock import patch
+
+from claude_apps.hooks.logger.__main__ import log_hook_event
+from claude_apps.hooks.logger.log_policy import (
+    PASSTHROUGH,
+    LogPolicy,
+    apply_log_policy,
+    is_sampled,
+    resolve_policy,
+    truncate_value,
+)
+from claude_apps.shared.event_log import get_blob, is_blob_ref, iter_session_records
+from claude_apps.shared.hook_protocol import HookEvent
+
+POLICIES = {
+    "default": {"max_payload_bytes": 1000},
+    "events": {"PostToolUse": {"max_payload_bytes": 500}},
+    "tools": {
+        "Read": {"exclude_fields": ["tool_response.file.content"]},
+        "mcp__playwright__*": {"sample_rate": 0.5},
+    },
+}
+
+
+def _event(event="PostToolUse", tool="Read", **extra):
+    data = {"session_id": "s1", "hook_event_name": event, "tool_name": tool}
+    data.update(extra)
+    return data
+
+
+class TestResolvePolicy:
+    """Tests for resolve_policy function."""
+
+    def test_no_config_is_passthrough(self):
+        """Test an empty config logs everything unchanged."""
+        assert resolve_policy({}, "PostToolUse", "Read") is PASSTHROUGH
+
+    def test_layers_default_event_and_tool(self):
+        """Test event and tool settings override the default."""
+        policy = resolve_policy(POLICIES, "PostToolUse", "Read")
+
+        assert policy.max_payload_bytes == 500
+        assert policy.exclude_fields == ("tool_response.file.content",)
+
+    def test_tool_glob(self):
+        """Test tool patterns match by glob."""
+        policy = resolve_policy(POLICIES, "PreToolUse", "mcp__playwright__browser_click")
+
+        assert (policy.sample_rate, policy.max_payload_bytes) == (0.5, 1000)
+
+
+class TestIsSampled:
+    """Tests for is_sampled function."""
+
+    def test_pre_and_post_share_decision(self):
+        """Test events with the same tool_use_id get the same decision."""
+        for n in range(50):
+            pre = _event("PreToolUse", tool_use_id=f"toolu_{n}")
+            post = _event("PostToolUse", tool_use_id=f"toolu_{n}")
+            assert is_sampled(pre, 0.3) == is_sampled(post, 0.3)
+
+    def test_rate_is_respected(self):
+        """Test roughly the configured fraction is kept."""
+        kept = sum(is_sampled({"tool_use_id": f"t{n}"}, 0.25) for n in range(4000))
+
+        assert 800 < kept < 1200
+
+
+class TestApplyLogPolicy:
+    """Tests for apply_log_policy function."""
+
+    def test_passthrough_returns_event(self):
+        """Test unchanged events are returned as is."""
+        event = HookEvent.from_raw(json.dumps(_event(tool_response="x")))
+
+        assert apply_log_policy(event, PASSTHROUGH) is event
+
+    def test_small_lazy_event_is_not_decoded(self):
+        """Test events under max_payload_bytes are logged verbatim."""
+        event = HookEvent.from_raw(json.dumps(_event(tool_response="x" * 4500)))
+
+        assert apply_log_policy(event, LogPolicy(max_payload_bytes=8192)) is event
+        assert event._data is None
+
+    def test_truncates_large_members(self):
+        """Test oversized members keep head, tail, length and hash."""
+        response = {"stdout": "a" * 3000}
+        record = apply_log_policy(_event(tool_response=response), LogPolicy(max_payload_bytes=100))
+
+        full = json.dumps(response, separators=(",", ":")).encode()
+        truncated = record["tool_response"]
+        assert truncated["bytes"] == len(full)
+        assert truncated["sha256"] == hashlib.sha256(full).hexdigest()
+        assert truncated["head"] == full[:50].decode()
+        assert truncated["tail"] == full[-50:].decode()
+        assert record["tool_name"] == "Read"
+
+    def test_exclude_nested_field_does_not_modify_event(self):
+        """Test dotted excludes drop nested members from a copy."""
+        event = _event(tool_response={"file": {"path": "a.py", "content": "x"}})
+        policy = LogPolicy(exclude_fields=("tool_response.file.content",))
+
+        record = apply_log_policy(event, policy)
+
+        assert record["tool_response"] == {"file": {"path": "a.py"}}
+        assert event["tool_response"]["file"]["content"] == "x"
+
+    def test_include_fields_keep_routing(self):
+        """Test an allowlist always keeps the routing fields."""
+        record = apply_log_policy(
+            _event(tool_use_id="t1", cwd="/w", tool_input={"a": 1}),
+            LogPolicy(include_fields=("tool_input",)),
+        )
+
+        assert set(record) == {
+            "session_id",
+            "hook_event_name",
+            "tool_name",
+            "tool_use_id",
+            "tool_input",
+        }
+
+    def test_sampled_out(self):
+        """Test a zero sample rate drops the event."""
+        assert apply_log_policy(_event(), LogPolicy(sample_rate=0)) is None
+
+    def test_moves_large_members_to_blob_store(self, tmp_path):
+        """Test blob_min_bytes stores members whole instead of truncating them."""
+        response = {"stdout": "a" * 3000}
+        policy = LogPolicy(max_payload_bytes=100, blob_min_bytes=1000)
+
+        record = apply_log_policy(_event(tool_response=response), policy, tmp_path)
+
+        assert is_blob_ref(record["tool_response"])
+        assert get_blob(tmp_path, record["tool_response"]["$blob"]) == response
+
+    def test_blob_min_bytes_needs_store(self):
+        """Test events are logged verbatim when no store is given."""
+        event = HookEvent.from_raw(json.dumps(_event(tool_response="x" * 4500)))
+
+        assert apply_log_policy(event, LogPolicy(blob_min_bytes=1000)) is event
+
+    def test_truncate_value_keeps_small_values(self):
+        """Test values within the limit are returned unchanged."""
+        assert truncate_value({"a": 1}, 100) == {"a": 1}
+
+
+class TestHookIntegration:
+    """Tests for policies applied in log_hook_event."""
+
+    def test_logs_truncated_entry(self, tmp_path):
+        """Test the written record carries the truncated payload."""
+        config = {
+            "log_base_path": "logs",
+            "segment_max_bytes": 1024 * 1024,
+            "segment_max_age_seconds": 3600,
+            "segment_compression": "none",
+            "tool_summary": False,
+            "log_policies": {"default": {"max_payload_bytes": 64}},
+        }
+        with (
+            patch("claude_apps.hooks.logger.__main__.get_config", return_value=config),
+            patch("claude_apps.hooks.logger.paths.get_claude_root", return_value=tmp_path),
+        ):
+            log_hook_event(_event(tool_response="y" * 10_000))
+
+        [record] = iter_session_records(tmp_path / "logs" / "s1")
+        assert record["tool_response"]["truncated"] is True
+        assert "logged_at" in record
+
+    def test_logs_blob_reference(self, tmp_path):
+        """Test large payloads land in the .blobs store under the log base."""
+        config = {
+            "log_base_path": "logs",
+            "segment_max_bytes": 1024 * 1024,
+            "segment_max_age_seconds": 3600,
+            "segment_compression": "none",
+            "tool_summary": False,
+            "log_policies": {"default": {"blob_min_bytes": 1024}},
+        }
+        with (
+            patch("claude_apps.hooks.logger.__main__.get_config", return_value=config),
+            patch("claude_apps.hooks.logger.paths.get_claude_root", return_value=tmp_path),
+        ):
+            log_hook_event(_event(tool_response="y" * 10_000))
+            log_hook_event(_event(tool_response="y" * 10_000))
+
+        records = list(iter_session_records(tmp_path / "logs" / "s1"))
+        assert records[0]["tool_response"] == records[1]["tool_response"]
+        assert get_blob(tmp_path / "logs" / ".blobs", records[0]["tool_response"]["$blob"]) == (
+            "y" * 10_000
+        )
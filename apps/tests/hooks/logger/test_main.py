@@ -13,6 +13,7 @@ from claude_apps.hooks.logger.__main__ import (
     main,
     output_hook_response,
 )
+from claude_apps.shared.event_log import SegmentPolicy
 
 
 class TestLogHookEvent:
@@ -23,7 +24,7 @@ class TestLogHookEvent:
         hook_data = {"hook_event_name": "SessionStart"}
 
         with patch(
-            "claude_apps.hooks.logger.__main__.get_log_path"
+            "claude_apps.hooks.logger.__main__.get_session_log_dir"
         ) as mock_path:
             log_hook_event(hook_data)
 
@@ -34,7 +35,7 @@ class TestLogHookEvent:
         hook_data = {"session_id": "abc123"}
 
         with patch(
-            "claude_apps.hooks.logger.__main__.get_log_path"
+            "claude_apps.hooks.logger.__main__.get_session_log_dir"
         ) as mock_path:
             log_hook_event(hook_data)
 
@@ -42,7 +43,8 @@ class TestLogHookEvent:
 
     def test_writes_log_entry(self, tmp_path):
         """Test writes log entry for valid hook data."""
-        log_file = tmp_path / "log.json"
+        log_dir = tmp_path / "abc123"
+        policy = SegmentPolicy()
         hook_data = {
             "session_id": "abc123",
             "hook_event_name": "SessionStart",
@@ -50,15 +52,21 @@ class TestLogHookEvent:
         }
 
         with patch(
-            "claude_apps.hooks.logger.__main__.get_log_path",
-            return_value=log_file,
+            "claude_apps.hooks.logger.__main__.get_config",
+            return_value={},
+        ), patch(
+            "claude_apps.hooks.logger.__main__.get_session_log_dir",
+            return_value=log_dir,
+        ), patch(
+            "claude_apps.hooks.logger.__main__.get_segment_policy",
+            return_value=policy,
         ):
             with patch(
                 "claude_apps.hooks.logger.__main__.write_log_entry"
             ) as mock_write:
                 log_hook_event(hook_data)
 
-                mock_write.assert_called_once_with(log_file, hook_data)
+                mock_write.assert_called_once_with(log_dir, hook_data, policy)
 
     def test_handles_write_error(self, capsys):
         """Test handles write error gracefully."""
@@ -68,7 +76,7 @@ class TestLogHookEvent:
         }
 
         with patch(
-            "claude_apps.hooks.logger.__main__.get_log_path",
+            "claude_apps.hooks.logger.__main__.get_session_log_dir",
             side_effect=Exception("Write failed"),
         ):
             # Should not raise
@@ -78,6 +86,38 @@ class TestLogHookEvent:
         captured = capsys.readouterr()
         assert "Failed to log event" in captured.err
 
+    def test_summary_failure_keeps_log_line(self, tmp_path, capsys):
+        """Test a failing tool summary update does not drop the event's log line."""
+        hook_data = {
+            "session_id": "abc123",
+            "hook_event_name": "PreToolUse",
+            "tool_name": "Bash",
+            "tool_use_id": "t1",
+        }
+
+        with (
+            patch("claude_apps.hooks.logger.__main__.get_config", return_value={}),
+            patch(
+                "claude_apps.hooks.logger.__main__.get_session_log_dir",
+                return_value=tmp_path / "abc123",
+            ),
+            patch(
+                "claude_apps.hooks.logger.__main__.get_segment_policy",
+                return_value=SegmentPolicy(),
+            ),
+            patch(
+                "claude_apps.hooks.logger.__main__.record_tool_marks",
+                side_effect=OSError(28, "ENOSPC"),
+            ),
+            patch("claude_apps.hooks.logger.__main__.write_log_entry") as mock_write,
+        ):
+            log_hook_event(hook_data)
+
+        mock_write.assert_called_once()
+        err = capsys.readouterr().err
+        assert "Failed to update tool summary" in err
+        assert "Failed to log event" not in err
+
 
 class TestOutputHookResponse:
     """Tests for output_hook_response function."""
@@ -142,8 +182,8 @@ class TestMain:
         with patch("sys.stdin", StringIO(input_data)):
             with patch.object(sys, "argv", ["logger"]):
                 with patch(
-                    "claude_apps.hooks.logger.__main__.get_log_path",
-                    return_value=Path("/tmp/log.json"),
+                    "claude_apps.hooks.logger.__main__.get_session_log_dir",
+                    return_value=Path("/tmp/session"),
                 ):
                     with patch(
                         "claude_apps.hooks.logger.__main__.write_log_entry"
@@ -190,8 +230,8 @@ class TestMain:
         with patch("sys.stdin", StringIO(input_data)):
             with patch.object(sys, "argv", ["logger"]):
                 with patch(
-                    "claude_apps.hooks.logger.__main__.get_log_path",
-                    return_value=Path("/tmp/log.json"),
+                    "claude_apps.hooks.logger.__main__.get_session_log_dir",
+                    return_value=Path("/tmp/session"),
                 ):
                     with patch(
                         "claude_apps.hooks.logger.__main__.write_log_entry"
@@ -1,12 +1,16 @@
 """Tests for logger hook path utilities."""
 
-import re
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from claude_apps.hooks.logger.paths import DEFAULT_CONFIG, get_config, get_log_path
+from claude_apps.hooks.logger.paths import (
+    DEFAULT_CONFIG,
+    get_config,
+    get_segment_policy,
+    get_session_log_dir,
+)
 
 
 class TestDefaultConfig:
@@ -64,70 +68,56 @@ class TestGetConfig:
             assert config["log_enabled"] is False
 
 
-class TestGetLogPath:
-    """Tests for get_log_path function."""
+class TestGetSessionLogDir:
+    """Tests for get_session_log_dir function."""
 
-    def test_returns_path_object(self):
-        """Test returns Path object."""
+    def test_is_session_directory_under_base(self):
+        """Test returns base / session_id."""
         with patch(
             "claude_apps.hooks.logger.paths.resolve_log_path",
             return_value=Path("/logs"),
         ):
-            result = get_log_path("SessionStart", "session123")
+            result = get_session_log_dir("session123")
 
-            assert isinstance(result, Path)
+            assert result == Path("/logs/session123")
 
-    def test_includes_session_id_in_path(self):
-        """Test includes session ID in path."""
+    def test_uses_loaded_config(self):
+        """Test a passed config is used instead of reading config.yml."""
         with patch(
-            "claude_apps.hooks.logger.paths.resolve_log_path",
-            return_value=Path("/logs"),
-        ):
-            result = get_log_path("SessionStart", "session123")
+            "claude_apps.hooks.logger.paths.get_claude_root",
+            return_value=Path("/root"),
+        ), patch("claude_apps.hooks.logger.paths.resolve_log_path") as mock_resolve:
+            result = get_session_log_dir("s1", {"log_base_path": "logs/hooks"})
 
-            assert "session123" in str(result)
+            assert result == Path("/root/logs/hooks/s1")
+            mock_resolve.assert_not_called()
 
-    def test_includes_hook_event_name_in_path(self):
-        """Test includes hook event name in path."""
-        with patch(
-            "claude_apps.hooks.logger.paths.resolve_log_path",
-            return_value=Path("/logs"),
-        ):
-            result = get_log_path("UserPromptSubmit", "session123")
 
-            assert "UserPromptSubmit" in str(result)
+class TestGetSegmentPolicy:
+    """Tests for get_segment_policy function."""
 
-    def test_includes_timestamp_in_filename(self):
-        """Test includes timestamp in filename."""
-        with patch(
-            "claude_apps.hooks.logger.paths.resolve_log_path",
-            return_value=Path("/logs"),
-        ):
-            result = get_log_path("SessionStart", "session123")
+    def test_defaults(self):
+        """Test default rotation and compression settings."""
+        policy = get_segment_policy(dict(DEFAULT_CONFIG))
 
-            # Check filename matches timestamp pattern
-            filename = result.name
-            assert re.match(r"^\d{8}_\d{6}\.json$", filename)
+        assert policy.max_bytes == 8 * 1024 * 1024
+        assert policy.max_age_seconds == 3600
+        assert policy.compression == "gzip"
 
-    def test_file_extension_is_json(self):
-        """Test file has .json extension."""
-        with patch(
-            "claude_apps.hooks.logger.paths.resolve_log_path",
-            return_value=Path("/logs"),
-        ):
-            result = get_log_path("SessionStart", "session123")
+    def test_reads_config(self):
+        """Test overrides come from hook configuration."""
+        config = {
+            **DEFAULT_CONFIG,
+            "segment_max_bytes": 1024,
+            "segment_max_age_seconds": 60,
+            "segment_compression": "lzma",
+        }
 
-            assert result.suffix == ".json"
+        policy = get_segment_policy(config)
 
-    def test_path_structure(self):
-        """Test path follows expected structure."""
-        with patch(
-            "claude_apps.hooks.logger.paths.resolve_log_path",
-            return_value=Path("/logs"),
-        ):
-            result = get_log_path("SessionStart", "abc123")
+        assert (policy.max_bytes, policy.max_age_seconds, policy.compression) == (1024, 60, "lzma")
 
-            # Structure: base / session_id / hook_event_name / timestamp.json
-            parts = result.parts
-            assert "abc123" in parts
-            assert "SessionStart" in parts
+    def test_rejects_unknown_compression(self):
+        """Test an invalid compression setting raises ValueError."""
+        with pytest.raises(ValueError):
+            get_segment_policy({**DEFAULT_CONFIG, "segment_compression": "zip"})
@@ -0,0 +1,106 @@
+"""Tests for logger hook query CLI."""
+
+import json
+import sys
+from unittest.mock import patch
+
+from claude_apps.hooks.logger.__main__ import main
+from claude_apps.hooks.logger.query import format_table, load_record
+from claude_apps.shared.event_log import (
+    BLOB_DIR_NAME,
+    SegmentPolicy,
+    append_record,
+    append_to_session,
+    compress_segment,
+    put_blob,
+)
+
+
+class TestLoadRecord:
+    """Tests for load_record function."""
+
+    def test_reads_plain_compressed_and_legacy(self, tmp_path):
+        """Test records are rehydrated from every file kind."""
+        plain = tmp_path / "segment.20250101_000000.1.ndjson"
+        plain.write_text('{"n":1}\n{"n":2}\n')
+        legacy = tmp_path / "20250101_000000.json"
+        legacy.write_text(json.dumps([{"n": 3}, {"n": 4}]))
+        cache = {}
+
+        assert load_record(str(plain), 8, cache) == {"n": 2}
+        assert load_record(str(legacy), -2, cache) == {"n": 4}
+        compressed = compress_segment(plain, "gzip")
+        assert load_record(str(compressed), 8, cache) == {"n": 2}
+
+    def test_resolves_blob_references(self, tmp_path):
+        """Test blob references are replaced with the stored payload."""
+        ref = put_blob(tmp_path / BLOB_DIR_NAME, {"stdout": "z" * 100})
+        log = tmp_path / "s1" / "active.20250101_000000.ndjson"
+        append_record(log, {"n": 1, "tool_response": ref})
+
+        assert load_record(str(log), 0, {}) == {"n": 1, "tool_response": {"stdout": "z" * 100}}
+
+    def test_missing_file_is_none(self, tmp_path):
+        """Test unreadable records come back as None."""
+        assert load_record(str(tmp_path / "missing.ndjson"), 0, {}) is None
+
+
+class TestFormatTable:
+    """Tests for format_table function."""
+
+    def test_aligns_columns(self):
+        """Test columns are padded to the widest value."""
+        text = format_table([{"a": "x", "b": None}, {"a": "long", "b": 2}], ["a", "b"])
+
+        assert text.splitlines() == ["a     b", "x", "long  2"]
+
+    def test_empty(self):
+        """Test empty results are reported."""
+        assert format_table([], ["a"]) == "(no results)"
+
+
+class TestQueryCommand:
+    """Tests for `python -m claude_apps.hooks.logger query`."""
+
+    def test_prints_records(self, tmp_path, capsys):
+        """Test --records prints the original events."""
+        logs = tmp_path / "logs"
+        event = {"session_id": "s1", "hook_event_name": "PreToolUse", "tool_name": "Read"}
+        append_to_session(logs / "s1", json.dumps(event), SegmentPolicy(compression="none"))
+
+        argv = ["logger", "query", "--tool", "Read", "--records", "--db", str(tmp_path / "i.db")]
+        with (
+            patch.object(sys, "argv", argv),
+            patch("claude_apps.hooks.logger.index.get_log_roots", return_value={"logger": logs}),
+        ):
+            assert main() == 0
+
+        captured = capsys.readouterr()
+        assert json.loads(captured.out) == event
+        assert "indexed +1 events" in captured.err
+
+    def test_group_by_json(self, tmp_path, capsys):
+        """Test aggregates in JSON format."""
+        logs = tmp_path / "logs"
+        for session in ("s1", "s1", "s2"):
+            line = json.dumps({"session_id": session, "hook_event_name": "Stop"})
+            append_to_session(logs / session, line, SegmentPolicy(compression="none"))
+
+        argv = [
+            "logger",
+            "query",
+            "--group-by",
+            "session",
+            "--format",
+            "json",
+            "--db",
+            str(tmp_path / "i.db"),
+        ]
+        with (
+            patch.object(sys, "argv", argv),
+            patch("claude_apps.hooks.logger.index.get_log_roots", return_value={"logger": logs}),
+        ):
+            assert main() == 0
+
+        groups = json.loads(capsys.readouterr().out)
+        assert [(g["session"], g["events"]) for g in groups] == [("s1", 2), ("s2", 1)]
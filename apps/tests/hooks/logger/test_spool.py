@@ -0,0 +1,243 @@
+"""Tests for logger hook spool mode."""
+
+import json
+import os
+import time
+from io import StringIO
+from unittest.mock import patch
+
+from claude_apps.hooks.logger.__main__ import log_hook_event, main
+from claude_apps.hooks.logger.spool import flush_spool, get_spool_dir, spool_line
+from claude_apps.hooks.logger.tool_stats import load_summary
+from claude_apps.shared.event_log import SegmentPolicy, iter_session_records
+
+POLICY = SegmentPolicy(compression="none")
+
+
+def _line(session, n):
+    return json.dumps({"session_id": session, "hook_event_name": "PreToolUse", "n": n})
+
+
+class TestSpoolLine:
+    """Tests for spool_line function."""
+
+    def test_entry_is_renamed_into_new(self, tmp_path):
+        """Test a spooled entry ends up complete in new/ with tmp/ empty."""
+        entry = spool_line(tmp_path, "s1", _line("s1", 0))
+
+        assert entry.parent == tmp_path / "new"
+        assert entry.read_text() == _line("s1", 0) + "\n"
+        assert os.listdir(tmp_path / "tmp") == []
+
+    def test_names_sort_in_arrival_order(self, tmp_path):
+        """Test entry names keep order even within the same nanosecond."""
+        with patch("claude_apps.hooks.logger.spool.time.time_ns", return_value=1):
+            first = spool_line(tmp_path, "s1", _line("s1", 0))
+            second = spool_line(tmp_path, "s1", _line("s1", 1))
+
+        assert sorted([second.name, first.name]) == [first.name, second.name]
+
+
+class TestFlushSpool:
+    """Tests for flush_spool function."""
+
+    def test_flushes_per_session_in_order(self, tmp_path):
+        """Test spooled events land in their sessions and leave the spool."""
+        spool, base = tmp_path / "spool", tmp_path / "logs"
+        for n in range(3):
+            spool_line(spool, "s1", _line("s1", n))
+        spool_line(spool, "s2", _line("s2", 0))
+
+        stats = flush_spool(spool, base, POLICY)
+
+        assert (stats.entries, stats.sessions) == (4, 2)
+        assert [r["n"] for r in iter_session_records(base / "s1")] == [0, 1, 2]
+        assert len(list(iter_session_records(base / "s2"))) == 1
+        assert os.listdir(spool / "new") == []
+
+    def test_limit(self, tmp_path):
+        """Test limit leaves the newest entries for the next flush."""
+        spool, base = tmp_path / "spool", tmp_path / "logs"
+        for n in range(3):
+            spool_line(spool, "s1", _line("s1", n))
+
+        assert flush_spool(spool, base, POLICY, limit=2).entries == 2
+        assert flush_spool(spool, base, POLICY).entries == 1
+        assert [r["n"] for r in iter_session_records(base / "s1")] == [0, 1, 2]
+
+    def test_returns_locked_when_another_flusher_runs(self, tmp_path):
+        """Test a concurrent flush does not touch the spool."""
+        import fcntl
+
+        spool = tmp_path / "spool"
+        spool_line(spool, "s1", _line("s1", 0))
+        fd = os.open(spool / "flush.lock", os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            stats = flush_spool(spool, tmp_path / "logs", POLICY)
+        finally:
+            os.close(fd)
+
+        assert stats.locked
+        assert len(os.listdir(spool / "new")) == 1
+
+    def test_removes_stale_tmp_entries(self, tmp_path):
+        """Test orphaned tmp/ entries are cleaned up."""
+        spool = tmp_path / "spool"
+        spool_line(spool, "s1", _line("s1", 0))
+        orphan = spool / "tmp" / "orphan"
+        orphan.write_text("{")
+        old = time.time() - 7200
+        os.utime(orphan, (old, old))
+
+        flush_spool(spool, tmp_path / "logs", POLICY)
+
+        assert not orphan.exists()
+
+    def test_malformed_entries_are_quarantined(self, tmp_path):
+        """Test undecodable entries move to bad/ and are not counted as flushed."""
+        spool, base = tmp_path / "spool", tmp_path / "logs"
+        spool_line(spool, "s1", _line("s1", 0))
+        too_long = spool_line(spool, "s1", _line("s1", 1))
+        too_long.write_text("a\nb\nc\n")
+        bad_mark = spool_line(spool, "s1", _line("s1", 2))
+        bad_mark.write_text(_line("s1", 2) + "\n{not json\n")
+        binary = spool_line(spool, "s1", _line("s1", 3))
+        binary.write_bytes(b"\xff\xfe\n")
+
+        stats = flush_spool(spool, base, POLICY)
+
+        assert (stats.entries, stats.quarantined) == (1, 3)
+        assert [r["n"] for r in iter_session_records(base / "s1")] == [0]
+        assert os.listdir(spool / "new") == []
+        assert sorted(os.listdir(spool / "bad")) == sorted(
+            [too_long.name, bad_mark.name, binary.name]
+        )
+
+    def test_unreadable_entry_stays_for_next_flush(self, tmp_path):
+        """Test an entry that cannot be opened is neither removed nor counted."""
+        spool, base = tmp_path / "spool", tmp_path / "logs"
+        entry = spool_line(spool, "s1", _line("s1", 0))
+        real_open = open
+
+        def failing_open(path, *args, **kwargs):
+            if str(path) == str(entry):
+                raise PermissionError(13, "denied")
+            return real_open(path, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=failing_open):
+            stats = flush_spool(spool, base, POLICY)
+
+        assert (stats.entries, stats.sessions, stats.quarantined) == (0, 0, 0)
+        assert os.listdir(spool / "new") == [entry.name]
+        assert flush_spool(spool, base, POLICY).entries == 1
+
+    def test_empty_spool(self, tmp_path):
+        """Test a missing spool directory flushes nothing."""
+        assert flush_spool(tmp_path / "spool", tmp_path / "logs", POLICY).entries == 0
+
+
+class TestGetSpoolDir:
+    """Tests for get_spool_dir function."""
+
+    def test_absolute_path(self, tmp_path):
+        """Test an absolute spool_path is used as is."""
+        assert get_spool_dir({"spool_path": str(tmp_path)}) == tmp_path
+
+    def test_default(self, tmp_path, monkeypatch):
+        """Test the default lives under the data directory."""
+        monkeypatch.setenv("CLAUDE_DATA_PATH", str(tmp_path))
+
+        assert get_spool_dir({"spool_path": None}) == tmp_path / "spool" / "logger"
+
+
+class TestSpoolMode:
+    """Tests for the hook in spool mode."""
+
+    def _config(self, tmp_path):
+        return {
+            "log_base_path": "logs",
+            "write_mode": "spool",
+            "spool_path": str(tmp_path / "spool"),
+            "spool_flush_events": ["Stop"],
+            "segment_max_bytes": 1024 * 1024,
+            "segment_max_age_seconds": 3600,
+            "segment_compression": "none",
+            "tool_summary": False,
+        }
+
+    def test_tool_events_are_spooled(self, tmp_path):
+        """Test PreToolUse is spooled, not written to the session."""
+        hook_data = {"session_id": "s1", "hook_event_name": "PreToolUse"}
+
+        with (
+            patch(
+                "claude_apps.hooks.logger.__main__.get_config",
+                return_value=self._config(tmp_path),
+            ),
+            patch("claude_apps.hooks.logger.paths.get_claude_root", return_value=tmp_path),
+        ):
+            assert log_hook_event(hook_data) is False
+
+        [entry] = os.listdir(tmp_path / "spool" / "new")
+        assert entry.endswith(".s1")
+        assert not (tmp_path / "logs").exists()
+
+    def test_tool_pairing_is_left_to_the_flusher(self, tmp_path):
+        """Test spool mode writes one entry per event and pairs tools on flush."""
+        config = {**self._config(tmp_path), "tool_summary": True}
+        pre = {"session_id": "s1", "hook_event_name": "PreToolUse"}
+        pre.update(tool_name="Bash", tool_use_id="t1")
+        post = {**pre, "hook_event_name": "PostToolUse", "tool_response": "x" * 500}
+
+        with (
+            patch("claude_apps.hooks.logger.__main__.get_config", return_value=config),
+            patch("claude_apps.hooks.logger.paths.get_claude_root", return_value=tmp_path),
+        ):
+            log_hook_event(pre)
+            log_hook_event(post)
+
+        assert len(os.listdir(tmp_path / "spool" / "new")) == 2
+        assert not (tmp_path / "logs").exists()
+
+        stats = flush_spool(tmp_path / "spool", tmp_path / "logs", POLICY)
+
+        assert stats.tool_marks == 2
+        bash = load_summary(tmp_path / "logs" / "s1")["tools"]["Bash"]
+        assert bash["count"] == 1
+        assert bash["response_bytes"] >= 500
+
+    def test_mark_without_record(self, tmp_path):
+        """Test an entry the log policy dropped still feeds the summary."""
+        spool, base = tmp_path / "spool", tmp_path / "logs"
+        mark = {"event": "PreToolUse", "tool_use_id": "t1", "tool_name": "Bash"}
+        spool_line(spool, "s1", "", {**mark, "size": 10, "at": 0.0})
+
+        flush_spool(spool, base, POLICY)
+
+        assert list(iter_session_records(base / "s1")) == []
+        assert "t1" in load_summary(base / "s1")["pending"]
+
+    def test_flush_event_flushes_after_response(self, tmp_path, capsys):
+        """Test a Stop event merges the spool into the session log."""
+        events = [
+            {"session_id": "s1", "hook_event_name": "PreToolUse"},
+            {"session_id": "s1", "hook_event_name": "Stop"},
+        ]
+        stdin = StringIO("\n".join(json.dumps(e) for e in events))
+
+        with (
+            patch(
+                "claude_apps.hooks.logger.__main__.get_config",
+                return_value=self._config(tmp_path),
+            ),
+            patch("claude_apps.hooks.logger.paths.get_claude_root", return_value=tmp_path),
+            patch("sys.argv", ["logger"]),
+            patch("sys.stdin", stdin),
+        ):
+            assert main() == 0
+
+        records = list(iter_session_records(tmp_path / "logs" / "s1"))
+        assert [r["hook_event_name"] for r in records] == ["PreToolUse", "Stop"]
+        assert all("logged_at" in r for r in records)
+        assert os.listdir(tmp_path / "spool" / "new") == []
@@ -0,0 +1,198 @@
+"""Tests for logger hook tool latency rollups."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.hooks.logger.__main__ import log_hook_event
+from claude_apps.hooks.logger.tool_stats import (
+    PENDING_MAX_AGE_SECONDS,
+    SUMMARY_NAME,
+    load_summary,
+    merge_tools,
+    percentile,
+    record_tool_event,
+    record_tool_marks,
+    run_tools_report,
+    tool_mark,
+    tool_rows,
+)
+from claude_apps.shared.hook_protocol import HookEvent
+
+
+def _pre(tool_use_id, tool="Bash", tool_input=None):
+    return {
+        "session_id": "s1",
+        "hook_event_name": "PreToolUse",
+        "tool_name": tool,
+        "tool_input": tool_input or {"command": "ls"},
+        "tool_use_id": tool_use_id,
+    }
+
+
+def _post(tool_use_id, tool="Bash", response="", event="PostToolUse"):
+    data = _pre(tool_use_id, tool)
+    data["hook_event_name"] = event
+    data["tool_response"] = {"stdout": response}
+    data["tool_use_id"] = data.pop("tool_use_id")
+    return data
+
+
+class TestRecordToolEvent:
+    """Tests for record_tool_event function."""
+
+    def test_pairs_pre_and_post(self, tmp_path):
+        """Test a matched pair records duration and response size."""
+        record_tool_event(tmp_path, _pre("t1"), now=100.0)
+        record_tool_event(tmp_path, _post("t1", response="x" * 1000), now=100.25)
+
+        summary = load_summary(tmp_path)
+        stats = summary["tools"]["Bash"]
+        assert summary["pending"] == {}
+        assert stats["count"] == 1
+        assert stats["total_ms"] == 250.0
+        assert 1000 < stats["response_bytes"] < 1100
+
+    def test_interleaved_calls(self, tmp_path):
+        """Test concurrent tool calls are matched by tool_use_id."""
+        record_tool_event(tmp_path, _pre("a", "Read"), now=0.0)
+        record_tool_event(tmp_path, _pre("b", "Grep"), now=0.1)
+        record_tool_event(tmp_path, _post("b", "Grep"), now=0.2)
+        record_tool_event(tmp_path, _post("a", "Read"), now=1.0)
+
+        tools = load_summary(tmp_path)["tools"]
+        assert tools["Read"]["total_ms"] == 1000.0
+        assert round(tools["Grep"]["total_ms"]) == 100
+
+    def test_failure_counts(self, tmp_path):
+        """Test PostToolUseFailure closes the pair as a failure."""
+        record_tool_event(tmp_path, _pre("t1"), now=0.0)
+        record_tool_event(tmp_path, _post("t1", event="PostToolUseFailure"), now=0.5)
+
+        stats = load_summary(tmp_path)["tools"]["Bash"]
+        assert (stats["count"], stats["failures"]) == (1, 1)
+
+    def test_ignores_unmatched_and_other_events(self, tmp_path):
+        """Test a Post without Pre and non-tool events change nothing."""
+        assert not record_tool_event(tmp_path, _post("t1"), now=0.0)
+        assert not record_tool_event(
+            tmp_path, {"session_id": "s1", "hook_event_name": "Stop"}, now=0.0
+        )
+
+        assert load_summary(tmp_path)["tools"] == {}
+
+    def test_expires_abandoned_starts(self, tmp_path):
+        """Test a Pre whose Post never came is dropped."""
+        record_tool_event(tmp_path, _pre("lost"), now=0.0)
+        record_tool_event(tmp_path, _pre("t1"), now=PENDING_MAX_AGE_SECONDS + 10)
+        record_tool_event(tmp_path, _post("t1"), now=PENDING_MAX_AGE_SECONDS + 11)
+
+        assert load_summary(tmp_path)["pending"] == {}
+
+    def test_lazy_events(self, tmp_path):
+        """Test large events are paired without decoding their payloads."""
+        pre = HookEvent.from_raw(json.dumps(_pre("t1", tool_input={"c": "y" * 5000})))
+        post = _post("t1", response="z" * 8000)
+        post["tool_input"] = {"c": "y" * 5000}
+        post["tool_use_id"] = post.pop("tool_use_id")
+        post = HookEvent.from_raw(json.dumps(post))
+
+        record_tool_event(tmp_path, pre, now=0.0)
+        record_tool_event(tmp_path, post, now=0.01)
+
+        assert post._data is None
+        assert 8000 < load_summary(tmp_path)["tools"]["Bash"]["response_bytes"] < 8100
+
+    def test_recovers_from_corrupt_summary(self, tmp_path):
+        """Test a damaged summary file is started over."""
+        (tmp_path / SUMMARY_NAME).write_text("{not json")
+
+        assert record_tool_event(tmp_path, _pre("t1"), now=0.0)
+        assert "t1" in load_summary(tmp_path)["pending"]
+
+    def test_failed_write_keeps_previous_summary(self, tmp_path):
+        """Test a write that fails midway leaves the last complete summary."""
+        record_tool_event(tmp_path, _pre("t1"), now=0.0)
+
+        with patch(
+            "claude_apps.shared.json_file.locked.os.replace", side_effect=OSError(28, "ENOSPC")
+        ):
+            with pytest.raises(OSError):
+                record_tool_event(tmp_path, _pre("t2"), now=1.0)
+
+        assert list(load_summary(tmp_path)["pending"]) == ["t1"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+            [".tool_summary.lock", SUMMARY_NAME]
+        )
+
+    def test_marks_applied_in_one_update(self, tmp_path):
+        """Test a batch of marks (as the spool flusher passes) pairs in order."""
+        marks = [
+            tool_mark(_pre("a"), now=0.0),
+            tool_mark(_pre("b", "Read"), now=0.5),
+            tool_mark(_post("a"), now=1.0),
+            tool_mark(_post("b", "Read"), now=2.0),
+        ]
+
+        assert record_tool_marks(tmp_path, marks)
+
+        tools = load_summary(tmp_path)["tools"]
+        assert (tools["Bash"]["total_ms"], tools["Read"]["total_ms"]) == (1000.0, 1500.0)
+        assert tool_mark({"hook_event_name": "Stop", "tool_use_id": "x"}) is None
+
+
+class TestReport:
+    """Tests for percentiles and the tools report."""
+
+    def test_percentile_bounds(self):
+        """Test percentiles are bucket upper bounds."""
+        histogram = {"0": 50, "20": 45, "30": 5}
+
+        assert percentile(histogram, 50) == 1.0
+        assert percentile(histogram, 95) == round(1.25**20, 1)
+        assert percentile({}, 50) is None
+
+    def test_merges_sessions(self, tmp_path):
+        """Test the report combines sessions, slowest tool first."""
+        for session, seconds in (("s1", 0.5), ("s2", 2.0)):
+            record_tool_event(tmp_path / session, _pre("t1"), now=0.0)
+            record_tool_event(tmp_path / session, _post("t1"), now=seconds)
+        record_tool_event(tmp_path / "s1", _pre("r1", "Read"), now=0.0)
+        record_tool_event(tmp_path / "s1", _post("r1", "Read"), now=0.01)
+
+        rows = tool_rows(merge_tools([load_summary(tmp_path / s) for s in ("s1", "s2")]))
+
+        assert [(r["tool"], r["count"]) for r in rows] == [("Bash", 2), ("Read", 1)]
+        assert rows[0]["mean_ms"] == 1250.0
+
+    def test_run_tools_report_json(self, tmp_path, capsys):
+        """Test the CLI report prints JSON rows."""
+        record_tool_event(tmp_path / "s1", _pre("t1"), now=0.0)
+        record_tool_event(tmp_path / "s1", _post("t1"), now=0.1)
+
+        assert run_tools_report(tmp_path, "s1", "json") == 0
+
+        [row] = json.loads(capsys.readouterr().out)
+        assert row["tool"] == "Bash"
+
+
+class TestHookIntegration:
+    """Tests for the summary update in log_hook_event."""
+
+    def test_log_hook_event_updates_summary(self, tmp_path):
+        """Test logging a pair updates the session summary."""
+        config = {
+            "log_base_path": "logs",
+            "segment_max_bytes": 1024 * 1024,
+            "segment_max_age_seconds": 3600,
+            "segment_compression": "none",
+        }
+        with (
+            patch("claude_apps.hooks.logger.__main__.get_config", return_value=config),
+            patch("claude_apps.hooks.logger.paths.get_claude_root", return_value=tmp_path),
+        ):
+            log_hook_event(_pre("t1"))
+            log_hook_event(_post("t1"))
+
+        assert load_summary(tmp_path / "logs" / "s1")["tools"]["Bash"]["count"] == 1
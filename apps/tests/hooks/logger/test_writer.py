@@ -1,6 +1,7 @@
 """Tests for logger hook file writer."""
 
 import json
+import threading
 from pathlib import Path
 
 import pytest
@@ -8,8 +9,11 @@ import pytest
 from claude_apps.hooks.logger.writer import (
     ensure_directory,
     read_existing_entries,
+    stamp_line,
     write_log_entry,
 )
+from claude_apps.shared.event_log import SegmentPolicy, iter_session_records, list_segments
+from claude_apps.shared.hook_protocol import HookEvent
 
 
 class TestEnsureDirectory:
@@ -108,82 +112,110 @@ class TestReadExistingEntries:
         assert result == []
 
 
+class TestStampLine:
+    """Tests for stamp_line function."""
+
+    def test_inserts_leading_member(self):
+        """Test logged_at becomes the first member."""
+        line = stamp_line('{"a":1}', "2025-01-01T00:00:00.000")
+
+        assert line == '{"logged_at":"2025-01-01T00:00:00.000","a":1}'
+        assert json.loads(line)["a"] == 1
+
+    def test_leaves_empty_and_stamped_objects(self):
+        """Test empty objects and existing stamps are unchanged."""
+        assert stamp_line("{}", "t") == "{}"
+        assert stamp_line('{"logged_at":"x"}', "t") == '{"logged_at":"x"}'
+
+
 class TestWriteLogEntry:
     """Tests for write_log_entry function."""
 
+    def _entries(self, session_dir):
+        return list(iter_session_records(session_dir))
+
     def test_writes_first_entry(self, tmp_path):
-        """Test writes first entry to new file."""
-        file_path = tmp_path / "log.json"
+        """Test writes first entry to a new session directory."""
+        session_dir = tmp_path / "abc"
         entry = {"session_id": "abc", "event": "test"}
 
-        write_log_entry(file_path, entry)
+        write_log_entry(session_dir, entry)
 
-        content = json.loads(file_path.read_text())
-        assert content == [entry]
+        [written] = self._entries(session_dir)
+        assert written["event"] == "test"
+        assert "logged_at" in written
 
-    def test_appends_to_existing_entries(self, tmp_path):
-        """Test appends to existing entries."""
-        file_path = tmp_path / "log.json"
-        existing = [{"event": "first"}]
-        file_path.write_text(json.dumps(existing))
+    def test_appends_one_line_per_entry_to_one_segment(self, tmp_path):
+        """Test entries share the active segment, one compact line each."""
+        session_dir = tmp_path / "abc"
 
-        new_entry = {"event": "second"}
-        write_log_entry(file_path, new_entry)
+        write_log_entry(session_dir, {"event": "first"})
+        write_log_entry(session_dir, {"event": "second"})
 
-        content = json.loads(file_path.read_text())
-        assert len(content) == 2
-        assert content[0] == existing[0]
-        assert content[1] == new_entry
+        [segment] = list(session_dir.iterdir())
+        assert segment.name.startswith("active.")
+        events = [json.loads(line)["event"] for line in segment.read_text().splitlines()]
+        assert events == ["first", "second"]
 
-    def test_creates_parent_directories(self, tmp_path):
-        """Test creates parent directories."""
-        file_path = tmp_path / "nested" / "deep" / "log.json"
-        entry = {"event": "test"}
+    def test_rotates_by_size(self, tmp_path):
+        """Test the active segment is sealed before exceeding max_bytes."""
+        session_dir = tmp_path / "abc"
+        policy = SegmentPolicy(max_bytes=300, compression="none")
 
-        write_log_entry(file_path, entry)
+        for i in range(10):
+            write_log_entry(session_dir, {"i": i, "pad": "x" * 80}, policy)
 
-        assert file_path.exists()
-        content = json.loads(file_path.read_text())
-        assert content == [entry]
+        segments = list_segments(session_dir)
+        assert len(segments) > 1
+        assert all(p.stat().st_size <= 300 for p in segments)
+        assert [e["i"] for e in self._entries(session_dir)] == list(range(10))
 
-    def test_pretty_prints_json(self, tmp_path):
-        """Test output is pretty-printed."""
-        file_path = tmp_path / "log.json"
-        entry = {"event": "test", "data": "value"}
+    def test_preserves_unicode(self, tmp_path):
+        """Test preserves unicode characters."""
+        session_dir = tmp_path / "abc"
 
-        write_log_entry(file_path, entry)
+        write_log_entry(session_dir, {"text": "日本語 emoji: 🚀"})
 
-        content = file_path.read_text()
-        # Should contain newlines and indentation
-        assert "\n" in content
-        assert "  " in content
+        assert self._entries(session_dir)[0]["text"] == "日本語 emoji: 🚀"
 
-    def test_ends_with_newline(self, tmp_path):
-        """Test file ends with newline."""
-        file_path = tmp_path / "log.json"
-        entry = {"event": "test"}
+    def test_writes_compact_raw_event_verbatim(self, tmp_path):
+        """Test an event read from a single stdin line keeps its payload text."""
+        session_dir = tmp_path / "abc"
+        raw = '{"hook_event_name": "Stop", "session_id": "s"}'
 
-        write_log_entry(file_path, entry)
+        write_log_entry(session_dir, HookEvent.from_raw(raw))
 
-        content = file_path.read_text()
-        assert content.endswith("\n")
+        [segment] = list(session_dir.iterdir())
+        assert segment.read_text().endswith(raw[1:] + "\n")
 
-    def test_preserves_unicode(self, tmp_path):
-        """Test preserves unicode characters."""
-        file_path = tmp_path / "log.json"
-        entry = {"text": "日本語 emoji: 🚀"}
+    def test_concurrent_writers_lose_nothing(self, tmp_path):
+        """Test entries from concurrent writers all survive intact."""
+        session_dir = tmp_path / "abc"
+        policy = SegmentPolicy(max_bytes=64 * 1024, compression="none")
+
+        def write_many(worker):
+            for i in range(50):
+                write_log_entry(session_dir, {"worker": worker, "i": i, "pad": "x" * 2000}, policy)
 
-        write_log_entry(file_path, entry)
+        threads = [threading.Thread(target=write_many, args=(w,)) for w in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
 
-        content = json.loads(file_path.read_text())
-        assert content[0]["text"] == "日本語 emoji: 🚀"
+        entries = self._entries(session_dir)
+        assert len(entries) == 400
+        assert {(e["worker"], e["i"]) for e in entries} == {
+            (w, i) for w in range(8) for i in range(50)
+        }
 
-    def test_handles_write_error_gracefully(self, tmp_path):
+    def test_handles_write_error_gracefully(self, tmp_path, capsys):
         """Test handles write errors gracefully."""
-        # Create a directory where we expect a file
-        file_path = tmp_path / "blocked"
-        file_path.mkdir()
+        # A file where the session directory should be
+        session_dir = tmp_path / "blocked"
+        session_dir.write_text("")
 
         # Should not raise, just log to stderr
-        entry = {"event": "test"}
-        write_log_entry(file_path, entry)
+        write_log_entry(session_dir, {"event": "test"})
+
+        assert "Failed to write log entry" in capsys.readouterr().err
@@ -0,0 +1,234 @@
+"""Tests for playwright_healer targeted browser-lock recovery."""
+
+import os
+import socket
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.hooks.playwright_healer.browser_lock import (
+    LOCK_NAME,
+    candidate_profiles,
+    owns_profile,
+    proc_cmdline,
+    proc_ppid,
+    profile_dir_from_message,
+    read_lock,
+    recover_browser_locks,
+    recover_profile,
+    terminate,
+)
+
+
+@pytest.fixture
+def profile(tmp_path):
+    path = tmp_path / "mcp-chromium-abc"
+    path.mkdir()
+    return path
+
+
+def lock(profile: Path, pid: int, host: str = "") -> None:
+    os.symlink(f"{host or socket.gethostname()}-{pid}", profile / LOCK_NAME)
+
+
+def fake_browser(profile: Path, code: str = "import time; time.sleep(30)") -> subprocess.Popen:
+    """A process whose command line looks like Chromium running on profile."""
+    process = subprocess.Popen(
+        ["chromium", "-c", f"print(flush=True); {code}", f"--user-data-dir={profile}"],
+        executable=sys.executable,
+        stdout=subprocess.PIPE,
+    )
+    # Wait until it runs the code (and /proc shows its own command line)
+    process.stdout.readline()
+    return process
+
+
+@pytest.fixture
+def browser(profile):
+    process = fake_browser(profile)
+    yield process
+    process.kill()
+    process.wait()
+    process.stdout.close()
+
+
+class TestProfileDirFromMessage:
+    """Tests for profile_dir_from_message function."""
+
+    def test_extracts_profile(self):
+        """Test the profile path is taken from the MCP error."""
+        message = (
+            "Error: Browser is already in use for /usr/local/share/playwright/"
+            "mcp-chromium-1a2b, use --isolated to run multiple instances"
+        )
+
+        assert profile_dir_from_message(message) == Path(
+            "/usr/local/share/playwright/mcp-chromium-1a2b"
+        )
+
+    def test_no_profile(self):
+        """Test messages without a path yield None."""
+        assert profile_dir_from_message("Connection closed") is None
+        assert profile_dir_from_message(None) is None
+
+
+class TestCandidateProfiles:
+    """Tests for candidate_profiles function."""
+
+    def test_named_profile_only(self, tmp_path):
+        """Test a profile named in the error is the only candidate."""
+        (tmp_path / "mcp-chromium-other").mkdir()
+
+        result = candidate_profiles(
+            f"Browser is already in use for {tmp_path}/mcp-chromium-x,", [f"{tmp_path}/*"]
+        )
+
+        assert result == [tmp_path / "mcp-chromium-x"]
+
+    def test_configured_dirs_without_name(self, tmp_path):
+        """Test configured globs are used when the error names no profile."""
+        (tmp_path / "mcp-chromium-a").mkdir()
+        (tmp_path / "mcp-chromium-b").mkdir()
+
+        result = candidate_profiles("Connection closed", [f"{tmp_path}/mcp-chromium-*"])
+
+        assert [p.name for p in result] == ["mcp-chromium-a", "mcp-chromium-b"]
+
+
+class TestProc:
+    """Tests for /proc helpers."""
+
+    def test_read_lock(self, profile):
+        """Test the lock target is split into host and pid."""
+        lock(profile, 4242, host="my-host-name")
+
+        owner = read_lock(profile)
+
+        assert owner.host == "my-host-name"
+        assert owner.pid == 4242
+
+    def test_read_lock_missing_or_invalid(self, profile):
+        """Test no lock or an unparsable one reads as None."""
+        assert read_lock(profile) is None
+
+        os.symlink("garbage", profile / LOCK_NAME)
+
+        assert read_lock(profile) is None
+
+    def test_proc_of_self(self):
+        """Test cmdline and parent of the current process."""
+        assert proc_cmdline(os.getpid())
+        assert proc_ppid(os.getpid()) == os.getppid()
+
+    def test_owns_profile(self, profile):
+        """Test only a browser on that profile owns it."""
+        assert owns_profile(["/opt/chromium/chrome", f"--user-data-dir={profile}"], profile)
+        assert not owns_profile(["/opt/chromium/chrome", "--user-data-dir=/elsewhere"], profile)
+        assert not owns_profile(["python", f"--user-data-dir={profile}"], profile)
+        assert not owns_profile([], profile)
+
+    def test_terminate_escalates_to_sigkill(self, profile):
+        """Test a process ignoring SIGTERM is killed after the grace period."""
+        process = fake_browser(
+            profile,
+            "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+            "print(flush=True); time.sleep(30)",
+        )
+        # Second line: the SIGTERM handler is in place
+        process.stdout.readline()
+
+        assert terminate(process.pid, grace_seconds=0.3)
+        assert process.wait(5) == -9
+        process.stdout.close()
+
+
+class TestRecoverProfile:
+    """Tests for recover_profile function."""
+
+    def test_no_lock(self, profile):
+        """Test an unlocked profile is left as is."""
+        assert recover_profile(profile).status == "no_lock"
+
+    def test_dead_owner(self, profile):
+        """Test a lock whose owner exited is removed."""
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        lock(profile, process.pid)
+
+        result = recover_profile(profile)
+
+        assert result.status == "dead_owner"
+        assert result.lock_removed
+        assert not (profile / LOCK_NAME).is_symlink()
+
+    def test_reused_pid_is_not_killed(self, profile):
+        """Test a PID now running something else is not signalled."""
+        lock(profile, os.getpid())
+
+        with patch("claude_apps.hooks.playwright_healer.browser_lock.os.kill") as kill:
+            result = recover_profile(profile)
+
+        assert result.status == "pid_reused"
+        assert result.lock_removed
+        kill.assert_not_called()
+
+    def test_live_browser_of_other_session(self, profile, browser):
+        """Test a browser whose launcher still runs keeps its lock."""
+        lock(profile, browser.pid)
+
+        result = recover_profile(profile)
+
+        assert result.status == "in_use"
+        assert not result.lock_removed
+        assert browser.poll() is None
+        assert (profile / LOCK_NAME).is_symlink()
+
+    def test_orphaned_browser_is_terminated(self, profile, browser):
+        """Test an orphaned owner is terminated and its lock removed."""
+        lock(profile, browser.pid)
+
+        with patch(
+            "claude_apps.hooks.playwright_healer.browser_lock.is_orphaned", return_value=True
+        ):
+            result = recover_profile(profile, grace_seconds=2)
+
+        assert result.status == "orphaned_owner"
+        assert result.terminated
+        assert result.lock_removed
+        assert browser.wait(5) is not None
+
+    def test_foreign_host(self, profile):
+        """Test a lock from another host is removed without signalling."""
+        lock(profile, os.getpid(), host="elsewhere")
+
+        with patch("claude_apps.hooks.playwright_healer.browser_lock.os.kill") as kill:
+            result = recover_profile(profile)
+
+        assert result.status == "foreign_host"
+        assert result.lock_removed
+        kill.assert_not_called()
+
+
+class TestRecoverBrowserLocks:
+    """Tests for recover_browser_locks function."""
+
+    def test_only_named_profile_is_touched(self, tmp_path):
+        """Test other profiles' locks survive recovery of the named one."""
+        named = tmp_path / "mcp-chromium-a"
+        other = tmp_path / "mcp-chromium-b"
+        named.mkdir()
+        other.mkdir()
+        lock(named, 999999999)
+        lock(other, 999999999)
+
+        results = recover_browser_locks(
+            f"Browser is already in use for {named}, use --isolated",
+            [f"{tmp_path}/mcp-chromium-*"],
+        )
+
+        assert [r.profile_dir for r in results] == [str(named)]
+        assert not (named / LOCK_NAME).is_symlink()
+        assert (other / LOCK_NAME).is_symlink()
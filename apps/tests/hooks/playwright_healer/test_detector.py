@@ -4,11 +4,15 @@ from unittest.mock import patch
 
 import pytest
 
+from claude_apps.hooks.playwright_healer import detector
 from claude_apps.hooks.playwright_healer.detector import (
+    ErrorMatcher,
     categorize_error,
     detect_browser_error,
     extract_response_text,
+    get_matcher,
     is_playwright_tool,
+    response_regions,
 )
 
 
@@ -206,3 +210,95 @@ class TestDetectBrowserError:
             ])
 
             assert result["detected"] is True
+
+
+class TestResponseRegions:
+    """Tests for response_regions function."""
+
+    def test_short_text_is_whole(self):
+        """Test texts within two windows are scanned whole."""
+        assert response_regions("short error", window=256) == ["short error"]
+
+    def test_long_text_keeps_both_ends(self):
+        """Test long texts are cut to their first and last window."""
+        text = "head" + "x" * 10_000 + "tail"
+
+        regions = response_regions(text, window=256)
+
+        assert [len(r) for r in regions] == [256, 256]
+        assert regions[0].startswith("head")
+        assert regions[1].endswith("tail")
+
+    def test_list_items_and_error_fields(self):
+        """Test text items and error fields are scanned, images are not."""
+        regions = response_regions([
+            {"type": "text", "text": "first"},
+            {"type": "image", "data": "Browser is already in use"},
+            {"error": "boom"},
+        ])
+
+        assert regions == ["first", "boom"]
+
+
+class TestErrorMatcher:
+    """Tests for ErrorMatcher class."""
+
+    def test_config_order_wins(self):
+        """Test the earliest configured pattern is reported, not the leftmost match."""
+        matcher = ErrorMatcher.compile(["closed", "Browser has been closed"])
+
+        assert matcher.search(["Browser has been closed"]) == "closed"
+
+    def test_case_insensitive_and_escaped(self):
+        """Test patterns match case-insensitively and literally."""
+        matcher = ErrorMatcher.compile(["Target page, context (or) browser"])
+
+        assert matcher.search(["TARGET PAGE, CONTEXT (OR) BROWSER closed"]) is not None
+        assert matcher.search(["Target page, context or browser"]) is None
+
+    def test_no_patterns(self):
+        """Test an empty pattern list never matches."""
+        assert ErrorMatcher.compile([]).search(["anything"]) is None
+
+    def test_error_in_large_snapshot(self):
+        """Test errors at either end of a large response are found, the middle is not scanned."""
+        config = {"error_patterns": ["Browser is already in use"], "scan_window": 1024}
+        filler = "- row [ref=e1]\n" * 20_000
+
+        with patch(
+            "claude_apps.hooks.playwright_healer.detector.get_config",
+            return_value=config,
+        ):
+            tail = detect_browser_error(filler + "Browser is already in use")
+            head = detect_browser_error("Error: Browser is already in use\n" + filler)
+            middle = detect_browser_error(filler + "Browser is already in use" + filler)
+
+        assert tail["detected"] is True
+        assert head["detected"] is True
+        assert middle["detected"] is False
+
+
+class TestGetMatcher:
+    """Tests for get_matcher function."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, monkeypatch):
+        monkeypatch.setattr(detector, "_matcher", None)
+
+    def test_compiled_once_per_config_version(self, tmp_path, monkeypatch):
+        """Test config is read again only after config.yml changes."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("hooks: {}\n")
+        monkeypatch.setenv("CLAUDE_CONFIG_YML_PATH", str(config_file))
+
+        with patch(
+            "claude_apps.hooks.playwright_healer.detector.get_config",
+            return_value={"error_patterns": ["a"]},
+        ) as mock_config:
+            first = get_matcher()
+            assert get_matcher() is first
+            assert mock_config.call_count == 1
+
+            config_file.write_text("hooks: {} # edited\n")
+            assert get_matcher() is not first
+            assert mock_config.call_count == 2
@@ -1,253 +1,233 @@
 """Tests for playwright_healer hook recovery logic."""
 
-import json
 import time
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from claude_apps.hooks.playwright_healer.browser_lock import LockRecovery
 from claude_apps.hooks.playwright_healer.healer import (
+    STATE_NAMESPACE,
     attempt_recovery,
+    claim_recovery_attempt,
     get_recovery_state,
-    kill_stale_browser_processes,
-    remove_browser_lock_files,
+    release_browser_locks,
     save_recovery_state,
     should_attempt_recovery,
 )
+from claude_apps.shared.state_store import StateStoreError, get_state_store
+
+CONFIG = {"max_recovery_attempts": 3, "recovery_cooldown_seconds": 5}
+
+
+@pytest.fixture(autouse=True)
+def state_store(tmp_path, monkeypatch):
+    """Point the shared state store at a temp data directory."""
+    monkeypatch.setenv("CLAUDE_DATA_PATH", str(tmp_path / "data"))
+    return get_state_store()
 
 
 class TestGetRecoveryState:
     """Tests for get_recovery_state function."""
 
-    def test_returns_default_state_when_no_file(self, tmp_path):
-        """Test returns default state when no state file exists."""
-        with patch(
-            "claude_apps.hooks.playwright_healer.healer.get_state_path",
-            return_value=tmp_path / "nonexistent.json",
-        ):
-            state = get_recovery_state("session123")
+    def test_returns_default_state_when_no_state(self):
+        """Test returns default state when nothing was recorded."""
+        state = get_recovery_state("session123")
 
-            assert state["attempt_count"] == 0
-            assert state["last_attempt_time"] == 0
-            assert state["last_error_type"] is None
+        assert state["attempt_count"] == 0
+        assert state["last_attempt_time"] == 0
+        assert state["last_error_type"] is None
 
-    def test_reads_existing_state(self, tmp_path):
-        """Test reads existing state from file."""
-        state_file = tmp_path / "state.json"
-        state_file.write_text(json.dumps({
+    def test_reads_existing_state(self):
+        """Test reads state saved for the session."""
+        save_recovery_state("session123", {
             "attempt_count": 2,
             "last_attempt_time": 12345,
             "last_error_type": "browser_lock"
-        }))
+        })
 
-        with patch(
-            "claude_apps.hooks.playwright_healer.healer.get_state_path",
-            return_value=state_file,
-        ):
-            state = get_recovery_state("session123")
+        state = get_recovery_state("session123")
 
-            assert state["attempt_count"] == 2
-            assert state["last_error_type"] == "browser_lock"
-
-    def test_returns_default_on_invalid_json(self, tmp_path):
-        """Test returns default state on invalid JSON."""
-        state_file = tmp_path / "state.json"
-        state_file.write_text("invalid json")
+        assert state["attempt_count"] == 2
+        assert state["last_error_type"] == "browser_lock"
+        assert get_recovery_state("other")["attempt_count"] == 0
 
+    def test_returns_default_on_store_error(self):
+        """Test returns default state when the store is unusable."""
         with patch(
-            "claude_apps.hooks.playwright_healer.healer.get_state_path",
-            return_value=state_file,
+            "claude_apps.hooks.playwright_healer.healer.get_state_store",
+            side_effect=StateStoreError("locked"),
         ):
             state = get_recovery_state("session123")
 
-            assert state["attempt_count"] == 0
+        assert state["attempt_count"] == 0
 
 
 class TestSaveRecoveryState:
     """Tests for save_recovery_state function."""
 
-    def test_saves_state_to_file(self, tmp_path):
-        """Test saves state to file."""
-        state_file = tmp_path / "state" / "recovery_state.json"
-
-        with patch(
-            "claude_apps.hooks.playwright_healer.healer.get_state_path",
-            return_value=state_file,
-        ):
-            state = {"attempt_count": 1, "last_error_type": "browser_lock"}
-            save_recovery_state("session123", state)
-
-            assert state_file.exists()
-            saved = json.loads(state_file.read_text())
-            assert saved["attempt_count"] == 1
+    def test_saves_state_with_ttl(self, state_store):
+        """Test saves state to the store with an expiry."""
+        state = {"attempt_count": 1, "last_error_type": "browser_lock"}
+        save_recovery_state("session123", state)
 
-    def test_creates_parent_directories(self, tmp_path):
-        """Test creates parent directories."""
-        state_file = tmp_path / "nested" / "deep" / "state.json"
-
-        with patch(
-            "claude_apps.hooks.playwright_healer.healer.get_state_path",
-            return_value=state_file,
-        ):
-            save_recovery_state("session123", {"attempt_count": 0})
-
-            assert state_file.parent.exists()
+        entry = state_store.get_entry(STATE_NAMESPACE, "recovery:session123")
+        assert entry.value["attempt_count"] == 1
+        assert entry.expires_at is not None
 
 
 class TestShouldAttemptRecovery:
     """Tests for should_attempt_recovery function."""
 
-    def test_allows_first_attempt(self, tmp_path):
-        """Test allows first attempt."""
-        config = {"max_recovery_attempts": 3, "recovery_cooldown_seconds": 5}
-        state_file = tmp_path / "state.json"
-
+    @pytest.fixture(autouse=True)
+    def config(self):
         with patch(
             "claude_apps.hooks.playwright_healer.healer.get_config",
-            return_value=config,
+            return_value=CONFIG,
         ):
-            with patch(
-                "claude_apps.hooks.playwright_healer.healer.get_state_path",
-                return_value=state_file,
-            ):
-                result = should_attempt_recovery("session123", "browser_lock")
+            yield
 
-                assert result is True
+    def test_allows_first_attempt(self):
+        """Test allows first attempt."""
+        assert should_attempt_recovery("session123", "browser_lock") is True
 
-    def test_allows_different_error_type(self, tmp_path):
+    def test_allows_different_error_type(self):
         """Test allows attempt for different error type."""
-        config = {"max_recovery_attempts": 3, "recovery_cooldown_seconds": 5}
-        state_file = tmp_path / "state.json"
-        state_file.write_text(json.dumps({
+        save_recovery_state("session123", {
             "attempt_count": 3,
             "last_error_type": "browser_lock",
             "last_attempt_time": time.time()
-        }))
+        })
 
-        with patch(
-            "claude_apps.hooks.playwright_healer.healer.get_config",
-            return_value=config,
-        ):
-            with patch(
-                "claude_apps.hooks.playwright_healer.healer.get_state_path",
-                return_value=state_file,
-            ):
-                result = should_attempt_recovery("session123", "browser_closed")
+        assert should_attempt_recovery("session123", "browser_closed") is True
 
-                assert result is True
-
-    def test_blocks_max_attempts_reached(self, tmp_path):
+    def test_blocks_max_attempts_reached(self):
         """Test blocks when max attempts reached."""
-        config = {"max_recovery_attempts": 3, "recovery_cooldown_seconds": 5}
-        state_file = tmp_path / "state.json"
-        state_file.write_text(json.dumps({
+        save_recovery_state("session123", {
             "attempt_count": 3,
             "last_error_type": "browser_lock",
-            "last_attempt_time": time.time()
-        }))
+            "last_attempt_time": time.time() - 60
+        })
 
-        with patch(
-            "claude_apps.hooks.playwright_healer.healer.get_config",
-            return_value=config,
-        ):
-            with patch(
-                "claude_apps.hooks.playwright_healer.healer.get_state_path",
-                return_value=state_file,
-            ):
-                result = should_attempt_recovery("session123", "browser_lock")
-
-                assert result is False
+        assert should_attempt_recovery("session123", "browser_lock") is False
 
-    def test_blocks_during_cooldown(self, tmp_path):
+    def test_blocks_during_cooldown(self):
         """Test blocks during cooldown period."""
-        config = {"max_recovery_attempts": 3, "recovery_cooldown_seconds": 5}
-        state_file = tmp_path / "state.json"
-        state_file.write_text(json.dumps({
+        save_recovery_state("session123", {
             "attempt_count": 1,
             "last_error_type": "browser_lock",
             "last_attempt_time": time.time()  # Just now
-        }))
+        })
+
+        assert should_attempt_recovery("session123", "browser_lock") is False
+
 
+class TestClaimRecoveryAttempt:
+    """Tests for claim_recovery_attempt function."""
+
+    @pytest.fixture(autouse=True)
+    def config(self):
         with patch(
             "claude_apps.hooks.playwright_healer.healer.get_config",
-            return_value=config,
+            return_value=CONFIG,
         ):
-            with patch(
-                "claude_apps.hooks.playwright_healer.healer.get_state_path",
-                return_value=state_file,
-            ):
-                result = should_attempt_recovery("session123", "browser_lock")
+            yield
 
-                assert result is False
+    def test_records_attempt(self):
+        """Test a granted attempt is counted."""
+        assert claim_recovery_attempt("session123", "browser_lock") is True
 
+        state = get_recovery_state("session123")
+        assert state["attempt_count"] == 1
+        assert state["last_error_type"] == "browser_lock"
 
-class TestKillStaleBrowserProcesses:
-    """Tests for kill_stale_browser_processes function."""
+    def test_second_claim_within_cooldown_is_refused(self):
+        """Test concurrent calls for one error get a single attempt."""
+        assert claim_recovery_attempt("session123", "browser_lock") is True
+        assert claim_recovery_attempt("session123", "browser_lock") is False
 
-    def test_returns_success(self):
-        """Test returns success result."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+        assert get_recovery_state("session123")["attempt_count"] == 1
 
-            result = kill_stale_browser_processes()
+    def test_retries_after_losing_race(self, state_store):
+        """Test a lost compare-and-set re-reads and decides again."""
+        real = type(state_store).compare_and_set
 
-            assert result["success"] is True
-            assert result["action"] == "kill_stale_processes"
+        def race(store, namespace, key, value, version, ttl=None):
+            # Another session records its attempt just before ours
+            if version is None:
+                save_recovery_state("session123", {
+                    "attempt_count": 1,
+                    "last_error_type": "browser_lock",
+                    "last_attempt_time": time.time()
+                })
+            return real(store, namespace, key, value, version, ttl)
 
-    def test_handles_timeout(self):
-        """Test handles timeout error."""
-        import subprocess
+        with patch.object(type(state_store), "compare_and_set", race):
+            assert claim_recovery_attempt("session123", "browser_lock") is False
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired("pkill", 10)
+        assert get_recovery_state("session123")["attempt_count"] == 1
 
-            result = kill_stale_browser_processes()
 
-            assert result["success"] is False
-            assert "Timeout" in result["error"]
+class TestReleaseBrowserLocks:
+    """Tests for release_browser_locks function."""
 
-    def test_handles_exception(self):
-        """Test handles other exceptions."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = Exception("Process error")
-
-            result = kill_stale_browser_processes()
+    @pytest.fixture(autouse=True)
+    def config(self, tmp_path):
+        with patch(
+            "claude_apps.hooks.playwright_healer.healer.get_config",
+            return_value={**CONFIG, "profile_dirs": [f"{tmp_path}/mcp-chromium-*"]},
+        ):
+            yield
 
-            assert result["success"] is False
-            assert "Process error" in result["error"]
+    def test_releases_stale_lock(self):
+        """Test a lock whose owner is gone counts as released."""
+        with patch(
+            "claude_apps.hooks.playwright_healer.healer.recover_browser_locks",
+            return_value=[LockRecovery("/p", "dead_owner", 42, lock_removed=True)],
+        ):
+            result = release_browser_locks("Browser is already in use for /p,")
 
+        assert result["success"] is True
+        assert "Released 1 stale lock" in result["message"]
+        assert result["profiles"][0]["status"] == "dead_owner"
 
-class TestRemoveBrowserLockFiles:
-    """Tests for remove_browser_lock_files function."""
+    def test_live_owner_fails(self):
+        """Test a profile held by another session's browser is reported."""
+        with patch(
+            "claude_apps.hooks.playwright_healer.healer.recover_browser_locks",
+            return_value=[LockRecovery("/p", "in_use", 42)],
+        ):
+            result = release_browser_locks("Browser is already in use for /p,")
 
-    def test_returns_success_with_no_files(self):
-        """Test returns success even with no files to remove."""
-        with patch("glob.glob", return_value=[]):
-            result = remove_browser_lock_files()
+        assert result["success"] is False
+        assert "pid 42" in result["error"]
 
-            assert result["success"] is True
-            assert result["action"] == "remove_lock_files"
+    def test_nothing_locked(self):
+        """Test succeeds when no configured profile is locked."""
+        result = release_browser_locks("Connection closed")
 
-    def test_removes_lock_files(self, tmp_path):
-        """Test removes found lock files."""
-        lock_file = tmp_path / "SingletonLock"
-        lock_file.write_text("")
+        assert result["success"] is True
+        assert result["profiles"] == []
 
-        with patch("glob.glob", return_value=[str(lock_file)]):
-            result = remove_browser_lock_files()
+    def test_handles_exception(self):
+        """Test handles unexpected errors."""
+        with patch(
+            "claude_apps.hooks.playwright_healer.healer.recover_browser_locks",
+            side_effect=OSError("boom"),
+        ):
+            result = release_browser_locks(None)
 
-            assert result["success"] is True
-            assert len(result["files_removed"]) == 1
+        assert result["success"] is False
+        assert "boom" in result["error"]
 
 
 class TestAttemptRecovery:
     """Tests for attempt_recovery function."""
 
-    def test_skips_when_blocked(self, tmp_path):
-        """Test skips when should_attempt_recovery returns False."""
+    def test_skips_when_blocked(self):
+        """Test skips when claim_recovery_attempt returns False."""
         with patch(
-            "claude_apps.hooks.playwright_healer.healer.should_attempt_recovery",
+            "claude_apps.hooks.playwright_healer.healer.claim_recovery_attempt",
             return_value=False,
         ):
             error_info = {"error_type": "browser_lock"}
@@ -256,86 +236,71 @@ class TestAttemptRecovery:
             assert result["success"] is False
             assert result["action"] == "skipped"
 
-    def test_handles_browser_lock(self, tmp_path):
+    def test_handles_browser_lock(self):
         """Test handles browser_lock error type."""
-        state_file = tmp_path / "state.json"
-
         with patch(
-            "claude_apps.hooks.playwright_healer.healer.should_attempt_recovery",
+            "claude_apps.hooks.playwright_healer.healer.claim_recovery_attempt",
             return_value=True,
         ):
             with patch(
-                "claude_apps.hooks.playwright_healer.healer.get_state_path",
-                return_value=state_file,
-            ):
-                with patch(
-                    "claude_apps.hooks.playwright_healer.healer.remove_browser_lock_files",
-                    return_value={"success": True, "message": "Removed locks"},
-                ):
-                    with patch(
-                        "claude_apps.hooks.playwright_healer.healer.kill_stale_browser_processes",
-                        return_value={"success": True, "message": "Killed processes"},
-                    ):
-                        error_info = {"error_type": "browser_lock"}
-                        result = attempt_recovery("session123", "tool", error_info)
-
-                        assert result["success"] is True
-                        assert result["action"] == "browser_lock_recovery"
-
-    def test_handles_browser_closed(self, tmp_path):
-        """Test handles browser_closed error type."""
-        state_file = tmp_path / "state.json"
+                "claude_apps.hooks.playwright_healer.healer.release_browser_locks",
+                return_value={"success": True, "message": "Released 1 stale lock(s)"},
+            ) as release:
+                error_info = {"error_type": "browser_lock", "message": "in use for /p,"}
+                result = attempt_recovery("session123", "tool", error_info)
+
+                assert result["success"] is True
+                assert result["action"] == "browser_lock_recovery"
+                release.assert_called_once_with("in use for /p,")
 
+    def test_handles_browser_closed(self):
+        """Test handles browser_closed error type."""
         with patch(
-            "claude_apps.hooks.playwright_healer.healer.should_attempt_recovery",
+            "claude_apps.hooks.playwright_healer.healer.claim_recovery_attempt",
             return_value=True,
         ):
-            with patch(
-                "claude_apps.hooks.playwright_healer.healer.get_state_path",
-                return_value=state_file,
-            ):
-                error_info = {"error_type": "browser_closed"}
-                result = attempt_recovery("session123", "tool", error_info)
+            error_info = {"error_type": "browser_closed"}
+            result = attempt_recovery("session123", "tool", error_info)
 
-                assert result["success"] is True
-                assert result["action"] == "browser_closed_recovery"
+            assert result["success"] is True
+            assert result["action"] == "browser_closed_recovery"
 
-    def test_handles_connection_lost(self, tmp_path):
+    def test_handles_connection_lost(self):
         """Test handles connection_lost error type."""
-        state_file = tmp_path / "state.json"
-
         with patch(
-            "claude_apps.hooks.playwright_healer.healer.should_attempt_recovery",
+            "claude_apps.hooks.playwright_healer.healer.claim_recovery_attempt",
             return_value=True,
         ):
             with patch(
-                "claude_apps.hooks.playwright_healer.healer.get_state_path",
-                return_value=state_file,
+                "claude_apps.hooks.playwright_healer.healer.release_browser_locks",
+                return_value={"success": True, "message": "Released 0 stale lock(s)"},
             ):
-                with patch(
-                    "claude_apps.hooks.playwright_healer.healer.kill_stale_browser_processes",
-                    return_value={"success": True, "message": "Killed"},
-                ):
-                    error_info = {"error_type": "connection_lost"}
-                    result = attempt_recovery("session123", "tool", error_info)
+                error_info = {"error_type": "connection_lost"}
+                result = attempt_recovery("session123", "tool", error_info)
 
-                    assert result["success"] is True
-                    assert result["action"] == "connection_recovery"
+                assert result["success"] is True
+                assert result["action"] == "connection_recovery"
 
-    def test_handles_unknown_error_type(self, tmp_path):
+    def test_handles_unknown_error_type(self):
         """Test handles unknown error type."""
-        state_file = tmp_path / "state.json"
-
         with patch(
-            "claude_apps.hooks.playwright_healer.healer.should_attempt_recovery",
+            "claude_apps.hooks.playwright_healer.healer.claim_recovery_attempt",
             return_value=True,
         ):
-            with patch(
-                "claude_apps.hooks.playwright_healer.healer.get_state_path",
-                return_value=state_file,
-            ):
-                error_info = {"error_type": "unknown"}
-                result = attempt_recovery("session123", "tool", error_info)
+            error_info = {"error_type": "unknown"}
+            result = attempt_recovery("session123", "tool", error_info)
+
+            assert result["success"] is False
+            assert result["action"] == "unknown"
+
+    def test_records_attempt_in_store(self):
+        """Test a real attempt is recorded for the session."""
+        with patch(
+            "claude_apps.hooks.playwright_healer.healer.get_config",
+            return_value=CONFIG,
+        ):
+            attempt_recovery("session123", "tool", {"error_type": "browser_closed"})
 
-                assert result["success"] is False
-                assert result["action"] == "unknown"
+        state = get_recovery_state("session123")
+        assert state["attempt_count"] == 1
+        assert state["last_error_type"] == "browser_closed"
@@ -1,6 +1,5 @@
 """Tests for playwright_healer hook logger."""
 
-import json
 from pathlib import Path
 from unittest.mock import patch
 
@@ -11,6 +10,7 @@ from claude_apps.hooks.playwright_healer.logger import (
     log_healing_event,
     setup_logger,
 )
+from claude_apps.shared.event_log import read_records
 
 
 class TestSetupLogger:
@@ -66,7 +66,7 @@ class TestLogHealingEvent:
 
     def test_writes_to_log_file(self, tmp_path):
         """Test writes event to log file."""
-        log_file = tmp_path / "event.json"
+        log_file = tmp_path / "event.ndjson"
 
         with patch(
             "claude_apps.hooks.playwright_healer.logger.get_log_path",
@@ -84,14 +84,14 @@ class TestLogHealingEvent:
                 )
 
                 assert log_file.exists()
-                content = json.loads(log_file.read_text())
+                content = read_records(log_file)
                 assert len(content) == 1
                 assert content[0]["session_id"] == "session123"
                 assert content[0]["event_type"] == "error_detected"
 
     def test_includes_timestamp(self, tmp_path):
         """Test includes timestamp in log entry."""
-        log_file = tmp_path / "event.json"
+        log_file = tmp_path / "event.ndjson"
 
         with patch(
             "claude_apps.hooks.playwright_healer.logger.get_log_path",
@@ -107,12 +107,12 @@ class TestLogHealingEvent:
                     tool_name="tool",
                 )
 
-                content = json.loads(log_file.read_text())
+                content = read_records(log_file)
                 assert "timestamp" in content[0]
 
     def test_includes_extra_kwargs(self, tmp_path):
         """Test includes extra keyword arguments."""
-        log_file = tmp_path / "event.json"
+        log_file = tmp_path / "event.ndjson"
 
         with patch(
             "claude_apps.hooks.playwright_healer.logger.get_log_path",
@@ -129,7 +129,7 @@ class TestLogHealingEvent:
                     custom_field="custom_value",
                 )
 
-                content = json.loads(log_file.read_text())
+                content = read_records(log_file)
                 assert content[0]["custom_field"] == "custom_value"
 
     def test_handles_write_error(self, capsys):
@@ -158,7 +158,7 @@ class TestLogError:
 
     def test_writes_to_error_log(self, tmp_path):
         """Test writes error to error log file."""
-        log_file = tmp_path / "error.json"
+        log_file = tmp_path / "error.ndjson"
 
         with patch(
             "claude_apps.hooks.playwright_healer.logger.get_error_log_path",
@@ -171,12 +171,12 @@ class TestLogError:
                 log_error("Test error message", session_id="session123")
 
                 assert log_file.exists()
-                content = json.loads(log_file.read_text())
+                content = read_records(log_file)
                 assert content[0]["error_message"] == "Test error message"
 
     def test_uses_default_session_id(self, tmp_path):
         """Test uses 'unknown' as default session_id."""
-        log_file = tmp_path / "error.json"
+        log_file = tmp_path / "error.ndjson"
 
         with patch(
             "claude_apps.hooks.playwright_healer.logger.get_error_log_path",
@@ -188,12 +188,12 @@ class TestLogError:
             ):
                 log_error("Test error")
 
-                content = json.loads(log_file.read_text())
+                content = read_records(log_file)
                 assert content[0]["session_id"] == "unknown"
 
     def test_includes_extra_context(self, tmp_path):
         """Test includes extra context."""
-        log_file = tmp_path / "error.json"
+        log_file = tmp_path / "error.ndjson"
 
         with patch(
             "claude_apps.hooks.playwright_healer.logger.get_error_log_path",
@@ -205,7 +205,7 @@ class TestLogError:
             ):
                 log_error("Test error", extra_key="extra_value")
 
-                content = json.loads(log_file.read_text())
+                content = read_records(log_file)
                 assert content[0]["extra_key"] == "extra_value"
 
     def test_handles_write_error(self, capsys):
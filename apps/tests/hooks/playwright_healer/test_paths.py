@@ -11,7 +11,6 @@ from claude_apps.hooks.playwright_healer.paths import (
     get_error_log_path,
     get_log_base,
     get_log_path,
-    get_state_path,
 )
 
 
@@ -99,17 +98,17 @@ class TestGetLogPath:
             result = get_log_path("session123", "event")
 
             # Check filename matches timestamp pattern
-            assert re.match(r"^\d{8}_\d{6}\.json$", result.name)
+            assert re.match(r"^\d{8}_\d{6}\.ndjson$", result.name)
 
-    def test_has_json_extension(self):
-        """Test has .json extension."""
+    def test_has_ndjson_extension(self):
+        """Test has .ndjson extension."""
         with patch(
             "claude_apps.hooks.playwright_healer.paths.get_log_base",
             return_value=Path("/logs"),
         ):
             result = get_log_path("session123", "event")
 
-            assert result.suffix == ".json"
+            assert result.suffix == ".ndjson"
 
 
 class TestGetErrorLogPath:
@@ -134,37 +133,3 @@ class TestGetErrorLogPath:
             result = get_error_log_path("session123")
 
             assert "errors" in str(result)
-
-
-class TestGetStatePath:
-    """Tests for get_state_path function."""
-
-    def test_includes_session_id(self):
-        """Test includes session ID in path."""
-        with patch(
-            "claude_apps.hooks.playwright_healer.paths.get_log_base",
-            return_value=Path("/logs"),
-        ):
-            result = get_state_path("session123")
-
-            assert "session123" in str(result)
-
-    def test_includes_state_directory(self):
-        """Test includes 'state' in path."""
-        with patch(
-            "claude_apps.hooks.playwright_healer.paths.get_log_base",
-            return_value=Path("/logs"),
-        ):
-            result = get_state_path("session123")
-
-            assert "state" in str(result)
-
-    def test_filename_is_recovery_state(self):
-        """Test filename is recovery_state.json."""
-        with patch(
-            "claude_apps.hooks.playwright_healer.paths.get_log_base",
-            return_value=Path("/logs"),
-        ):
-            result = get_state_path("session123")
-
-            assert result.name == "recovery_state.json"
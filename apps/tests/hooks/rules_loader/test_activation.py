@@ -0,0 +1,147 @@
+"""Tests for rules loader relevance-scoped activation."""
+
+import pytest
+
+from claude_apps.hooks.rules_loader.activation import (
+    RuleMatcher,
+    detect_stacks,
+    normalize_activation,
+    split_frontmatter,
+)
+from claude_apps.hooks.rules_loader.loader import (
+    filter_rules_for_reinforcement,
+    load_rules,
+)
+
+RULES = [
+    {"name": "core", "content": "Core"},
+    {"name": "python", "content": "Python", "activation": {"keywords": ["python", "pytest"]}},
+    {"name": "sql", "content": "SQL", "activation": {"patterns": [r"select\s+\*"]}},
+    {"name": "apps", "content": "Apps", "activation": {"paths": ["*/apps/*"]}},
+    {"name": "node", "content": "Node", "activation": {"stacks": ["node"]}},
+]
+CONFIG = {"reinforcement_enabled": False, "rules": {"core": {"reinforce": True}}}
+
+
+def _names(rules):
+    return [r["name"] for r in rules]
+
+
+class TestSplitFrontmatter:
+    """Tests for split_frontmatter function."""
+
+    def test_parses_activation(self):
+        """Test frontmatter is parsed and removed from the text."""
+        meta, text = split_frontmatter("---\nactivation:\n  keywords: [go]\n---\n# RULE: 100\n")
+
+        assert meta == {"activation": {"keywords": ["go"]}}
+        assert text == "# RULE: 100\n"
+
+    def test_without_frontmatter(self):
+        """Test text without frontmatter is returned unchanged."""
+        assert split_frontmatter("# RULE: 100\n---\n") == ({}, "# RULE: 100\n---\n")
+
+    def test_unclosed_frontmatter(self):
+        """Test an unclosed block is left as content."""
+        assert split_frontmatter("---\nkeywords: [go]\n") == ({}, "---\nkeywords: [go]\n")
+
+
+class TestRuleMatcher:
+    """Tests for RuleMatcher class."""
+
+    def test_prompt_keywords_and_patterns(self):
+        """Test one scan of the prompt reports every matching rule."""
+        matcher = RuleMatcher.compile(RULES, {})
+
+        assert matcher.active("Run PYTEST then select * from t") == {"python", "sql"}
+        assert matcher.active("pythonic") == frozenset()
+
+    def test_overlapping_keywords_activate_every_rule(self):
+        """Test keywords matching the same text each activate their rule."""
+        rules = [
+            {"name": "A", "activation": {"keywords": ["docker compose"]}},
+            {"name": "B", "activation": {"keywords": ["compose"]}},
+            {"name": "C", "activation": {"patterns": [r"docker\s+\w+"]}},
+        ]
+        matcher = RuleMatcher.compile(rules, {})
+
+        assert matcher.active("run docker compose up") == {"A", "B", "C"}
+        assert matcher.active("compose a message") == {"B"}
+        assert matcher.active("nothing relevant") == frozenset()
+
+    def test_pattern_with_backreference(self):
+        """Test a pattern with groups keeps its own group numbering."""
+        rules = [
+            {"name": "python", "activation": {"keywords": ["python"]}},
+            {"name": "repeat", "activation": {"patterns": [r"\b(\w+) \1\b"]}},
+            {"name": "quoted", "activation": {"patterns": [r"(?P<q>['\"]).+(?P=q)"]}},
+            {"name": "flagged", "activation": {"patterns": [r"(?i)MAKE"]}},
+        ]
+        matcher = RuleMatcher.compile(rules, {})
+
+        assert matcher.active("the the python") == {"repeat", "python"}
+        assert matcher.active("say 'hi' then make") == {"quoted", "flagged"}
+        assert matcher.active("python only") == {"python"}
+
+    def test_cwd_globs_and_stacks(self, tmp_path):
+        """Test cwd globs and detected stacks activate rules."""
+        web = tmp_path / "apps" / "web"
+        web.mkdir(parents=True)
+        (web / "package.json").write_text("{}")
+        matcher = RuleMatcher.compile(RULES, {})
+
+        assert matcher.active("", str(web)) == {"apps", "node"}
+        assert matcher.active("", str(tmp_path)) == frozenset()
+
+    def test_config_overrides_frontmatter(self):
+        """Test activation in config replaces the rule's own."""
+        config = {"rules": {"python": {"activation": {"keywords": ["uv"]}}}}
+        matcher = RuleMatcher.compile(RULES, config)
+
+        assert matcher.active("use uv") == {"python"}
+        assert matcher.active("use python") == frozenset()
+
+    def test_invalid_pattern_raises(self):
+        """Test a broken pattern is reported when compiling."""
+        with pytest.raises(Exception):
+            RuleMatcher.compile([{"name": "bad", "activation": {"patterns": ["("]}}], {})
+
+    def test_normalize_activation(self):
+        """Test empty conditions count as none and strings become tuples."""
+        assert normalize_activation({"keywords": []}) is None
+        assert normalize_activation({"stacks": "go"})["stacks"] == ("go",)
+
+    def test_detect_stacks(self, tmp_path):
+        """Test marker files map to stacks."""
+        (tmp_path / "pyproject.toml").write_text("")
+        (tmp_path / "Taskfile.yml").write_text("")
+
+        assert detect_stacks(str(tmp_path)) == {"python", "taskfile"}
+        assert detect_stacks(str(tmp_path / "missing")) == frozenset()
+
+
+class TestFilterWithActivation:
+    """Tests for activation in filter_rules_for_reinforcement."""
+
+    def test_only_relevant_rules_reinforced(self):
+        """Test conditional rules need a match; others follow reinforce."""
+        hook_data = {"prompt": "fix the pytest failure", "cwd": "/nowhere"}
+
+        filtered = filter_rules_for_reinforcement(RULES, CONFIG, "UserPromptSubmit", hook_data)
+
+        assert _names(filtered) == ["core", "python"]
+
+    def test_session_start_ignores_activation(self):
+        """Test SessionStart still loads every rule."""
+        assert len(filter_rules_for_reinforcement(RULES, CONFIG, "SessionStart", {})) == 5
+
+    def test_frontmatter_from_files(self, tmp_path):
+        """Test activation declared in a rule file is honoured."""
+        (tmp_path / "010-go.md").write_text("---\nactivation:\n  keywords: [golang]\n---\n# Go\n")
+        rules = load_rules(str(tmp_path))
+
+        assert rules[0]["content"] == "# Go"
+        assert filter_rules_for_reinforcement(rules, {}, "UserPromptSubmit", {"prompt": "hi"}) == []
+        assert _names(
+            filter_rules_for_reinforcement(rules, {}, "UserPromptSubmit", {"prompt": "golang"})
+        ) == ["010-go"]
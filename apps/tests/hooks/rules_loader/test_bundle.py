@@ -0,0 +1,118 @@
+"""Tests for the compiled rules bundle."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.hooks.rules_loader import bundle as bundle_module
+from claude_apps.hooks.rules_loader.bundle import (
+    RulesBundle,
+    clear_bundles,
+    load_bundle,
+)
+from claude_apps.hooks.rules_loader.loader import filter_rules_for_reinforcement, load_rules
+
+CONFIG = {"reinforcement_enabled": False, "rules": {"000-core": {"reinforce": True}}}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    clear_bundles()
+    yield
+    clear_bundles()
+
+
+@pytest.fixture
+def rules_dir(tmp_path):
+    rules = tmp_path / "rules"
+    rules.mkdir()
+    (rules / "000-core.md").write_text("# Core\n")
+    (rules / "010-python.md").write_text("---\nactivation:\n  keywords: [python]\n---\n# Py\n")
+    (rules / "020-other.md").write_text("# Other\n")
+    (rules / "notes.txt").write_text("ignored")
+    return rules
+
+
+def _touch(path, text):
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestLoadBundle:
+    """Tests for load_bundle function."""
+
+    def test_matches_loader(self, rules_dir, tmp_path):
+        """Test the bundle holds what load_rules and the filter produce."""
+        bundle = load_bundle(rules_dir, CONFIG, tmp_path / "bundle.json")
+        rules = load_rules(str(rules_dir))
+
+        assert [r["name"] for r in bundle.rules] == [r["name"] for r in rules]
+        assert bundle.context == "# Core\n\n# Py\n\n# Other"
+        for event, data in (("SessionStart", {}), ("UserPromptSubmit", {"prompt": "python"})):
+            assert [r["name"] for r in bundle.select(CONFIG, event, data)] == [
+                r["name"] for r in filter_rules_for_reinforcement(rules, CONFIG, event, data)
+            ]
+
+    def test_unchanged_bundle_is_read_not_rebuilt(self, rules_dir, tmp_path):
+        """Test a new process reads the stored bundle without opening rule files."""
+        bundle_path = tmp_path / "bundle.json"
+        load_bundle(rules_dir, CONFIG, bundle_path)
+        clear_bundles()
+
+        with patch.object(bundle_module, "read_rule") as read_rule:
+            bundle = load_bundle(rules_dir, CONFIG, bundle_path)
+
+        read_rule.assert_not_called()
+        assert bundle.reinforced == ["000-core"]
+
+    def test_rereads_only_changed_files(self, rules_dir, tmp_path):
+        """Test a modified rule is the only file read again."""
+        bundle_path = tmp_path / "bundle.json"
+        load_bundle(rules_dir, CONFIG, bundle_path)
+        _touch(rules_dir / "020-other.md", "# Other v2\n")
+        clear_bundles()
+
+        with patch.object(bundle_module, "read_rule", wraps=bundle_module.read_rule) as read_rule:
+            bundle = load_bundle(rules_dir, CONFIG, bundle_path)
+
+        assert [c.args[0].name for c in read_rule.call_args_list] == ["020-other.md"]
+        assert bundle.rules[-1]["content"] == "# Other v2"
+
+    def test_config_change_recomputes_filter_only(self, rules_dir, tmp_path):
+        """Test a config change rebuilds filtering without re-reading rules."""
+        bundle_path = tmp_path / "bundle.json"
+        load_bundle(rules_dir, CONFIG, bundle_path)
+        config = {"reinforcement_enabled": True}
+
+        with patch.object(bundle_module, "read_rule") as read_rule:
+            bundle = load_bundle(rules_dir, config, bundle_path)
+
+        read_rule.assert_not_called()
+        assert bundle.reinforced == ["000-core", "020-other"]
+
+    def test_added_and_removed_files(self, rules_dir, tmp_path):
+        """Test the listing picks up new and deleted rules."""
+        bundle_path = tmp_path / "bundle.json"
+        load_bundle(rules_dir, CONFIG, bundle_path)
+        (rules_dir / "030-new.md").write_text("New")
+        (rules_dir / "020-other.md").unlink()
+
+        bundle = load_bundle(rules_dir, CONFIG, bundle_path)
+
+        assert [r["name"] for r in bundle.rules] == ["000-core", "010-python", "030-new"]
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """Test a missing rules directory gives an empty bundle."""
+        assert load_bundle(tmp_path / "missing", CONFIG).rules == []
+
+    def test_corrupt_bundle_is_rebuilt(self, rules_dir, tmp_path):
+        """Test an unreadable bundle file is replaced."""
+        bundle_path = tmp_path / "bundle.json"
+        bundle_path.write_text("{oops")
+
+        bundle = load_bundle(rules_dir, CONFIG, bundle_path)
+
+        assert len(bundle.rules) == 3
+        assert RulesBundle.from_json(bundle_path.read_text()).files == bundle.files
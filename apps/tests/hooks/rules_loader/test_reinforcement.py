@@ -0,0 +1,205 @@
+"""Tests for rules loader delta reinforcement."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.hooks.rules_loader.formatter import format_to_hook_json
+from claude_apps.hooks.rules_loader.reinforcement import (
+    STATE_NAME,
+    estimate_tokens,
+    plan_reinforcement,
+    reinforce,
+    retract_trimmed,
+    rule_digest,
+)
+from claude_apps.shared.context_budget import trim_context
+
+CONFIG = {"reinforce_every": 3, "reinforcement_reminder": True, "rules": {}}
+
+
+def _rules(**contents):
+    return [
+        {"filename": f"{name}.md", "name": name, "content": content}
+        for name, content in contents.items()
+    ]
+
+
+def _names(rules):
+    return [r["name"] for r in rules]
+
+
+class TestPlanReinforcement:
+    """Tests for plan_reinforcement function."""
+
+    def test_session_start_injects_all_and_resets(self):
+        """Test SessionStart injects every rule and forgets earlier prompts."""
+        state = {"prompt": 7, "rules": {"old": {"digest": "x", "prompt": 7}}}
+        rules = _rules(a="Rule A", b="Rule B")
+
+        plan = plan_reinforcement(state, rules, CONFIG, "SessionStart", now=1.0)
+
+        assert _names(plan.inject) == ["a", "b"]
+        assert state["prompt"] == 0
+        assert set(state["rules"]) == {"a", "b"}
+
+    def test_unchanged_rules_are_reminded(self):
+        """Test rules seen at session start are only named on the next prompt."""
+        state = {}
+        rules = _rules(a="Rule A " * 100, b="Rule B " * 100)
+        plan_reinforcement(state, rules, CONFIG, "SessionStart", now=1.0)
+
+        plan = plan_reinforcement(state, rules, CONFIG, "UserPromptSubmit", now=2.0)
+
+        assert plan.inject == []
+        assert _names(plan.reminded) == ["a", "b"]
+        assert f"a@{rule_digest('Rule A ' * 100)}" in plan.reminder
+        assert plan.saved_tokens > 0
+
+    def test_changed_rule_is_reinjected(self):
+        """Test a rule whose content changed is sent again in full."""
+        state = {}
+        plan_reinforcement(state, _rules(a="Rule A", b="Rule B"), CONFIG, "SessionStart", 1.0)
+
+        plan = plan_reinforcement(
+            state, _rules(a="Rule A v2", b="Rule B"), CONFIG, "UserPromptSubmit", 2.0
+        )
+
+        assert _names(plan.inject) == ["a"]
+        assert _names(plan.reminded) == ["b"]
+        assert state["rules"]["a"]["digest"] == rule_digest("Rule A v2")
+
+    def test_cadence_reinjects_every_n_prompts(self):
+        """Test unchanged rules come back once reinforce_every prompts pass."""
+        state = {}
+        rules = _rules(a="Rule A")
+        plan_reinforcement(state, rules, CONFIG, "SessionStart", 1.0)
+
+        injected = [
+            bool(plan_reinforcement(state, rules, CONFIG, "UserPromptSubmit", 2.0).inject)
+            for _ in range(6)
+        ]
+
+        assert injected == [False, False, True, False, False, True]
+
+    def test_per_rule_cadence_override(self):
+        """Test a rule's reinforce_every overrides the global cadence."""
+        config = {**CONFIG, "rules": {"a": {"reinforce": True, "reinforce_every": 1}}}
+        state = {}
+        rules = _rules(a="Rule A", b="Rule B")
+        plan_reinforcement(state, rules, config, "SessionStart", 1.0)
+
+        plan = plan_reinforcement(state, rules, config, "UserPromptSubmit", 2.0)
+
+        assert _names(plan.inject) == ["a"]
+
+    def test_reminder_can_be_disabled(self):
+        """Test no reminder line is built when disabled."""
+        config = {**CONFIG, "reinforcement_reminder": False}
+        state = {}
+        rules = _rules(a="Rule A")
+        plan_reinforcement(state, rules, config, "SessionStart", 1.0)
+
+        plan = plan_reinforcement(state, rules, config, "UserPromptSubmit", 2.0)
+
+        assert plan.reminder == ""
+        assert plan.injected_tokens == 0
+
+
+class TestReinforce:
+    """Tests for reinforce function."""
+
+    def test_persists_state_per_session(self, tmp_path):
+        """Test state survives between hook invocations."""
+        session_dir = tmp_path / "s1"
+        rules = _rules(a="Rule A")
+
+        reinforce(session_dir, rules, CONFIG, "SessionStart", now=1.0)
+        plan = reinforce(session_dir, rules, CONFIG, "UserPromptSubmit", now=2.0)
+
+        assert plan.inject == []
+        state = json.loads((session_dir / STATE_NAME).read_text())
+        assert state["prompt"] == 1
+        assert state["rules"]["a"]["injected_at"] == 1.0
+
+    def test_corrupt_state_starts_over(self, tmp_path):
+        """Test an unreadable state file is treated as a new session."""
+        (tmp_path / STATE_NAME).write_text("{not json")
+
+        plan = reinforce(tmp_path, _rules(a="Rule A"), CONFIG, "UserPromptSubmit", now=1.0)
+
+        assert _names(plan.inject) == ["a"]
+
+    def test_failed_write_keeps_previous_state(self, tmp_path):
+        """Test a write that fails midway leaves the last complete state."""
+        reinforce(tmp_path, _rules(a="Rule A"), CONFIG, "SessionStart", now=1.0)
+
+        with patch(
+            "claude_apps.shared.json_file.locked.os.replace",
+            side_effect=OSError(28, "ENOSPC"),
+        ):
+            with pytest.raises(OSError):
+                reinforce(tmp_path, _rules(a="Rule A"), CONFIG, "UserPromptSubmit", now=2.0)
+
+        assert json.loads((tmp_path / STATE_NAME).read_text())["prompt"] == 0
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+            [".reinforcement.lock", STATE_NAME]
+        )
+
+
+class TestRetractTrimmed:
+    """Tests for retract_trimmed function."""
+
+    def _context(self, rules):
+        return json.loads(format_to_hook_json(rules))["hookSpecificOutput"]["additionalContext"]
+
+    def test_cut_rules_are_injected_again(self, tmp_path):
+        """Test rules a budget cut count as new on the next prompt."""
+        rules = _rules(a="A" * 300, b="B" * 300, c="C" * 300)
+        reinforce(tmp_path, rules, CONFIG, "SessionStart", now=1.0)
+
+        # Keeps rule a whole and part of rule b
+        context = trim_context(self._context(rules), 500, "rules_loader")
+
+        assert retract_trimmed(tmp_path, context) == ["b", "c"]
+
+        plan = reinforce(tmp_path, rules, CONFIG, "UserPromptSubmit", now=2.0)
+        assert _names(plan.inject) == ["b", "c"]
+        assert _names(plan.reminded) == ["a"]
+
+    def test_whole_context_retracts_nothing(self, tmp_path):
+        """Test nothing is forgotten when every rule arrived whole."""
+        rules = _rules(a="Rule A", b="Rule B")
+        reinforce(tmp_path, rules, CONFIG, "SessionStart", now=1.0)
+
+        assert retract_trimmed(tmp_path, self._context(rules) + "\n\nreminder") == []
+        assert retract_trimmed(tmp_path, "") == []
+
+        assert set(json.loads((tmp_path / STATE_NAME).read_text())["rules"]) == {"a", "b"}
+
+    def test_only_latest_event_is_retracted(self, tmp_path):
+        """Test rules injected at earlier prompts are kept."""
+        rules = _rules(a="Rule A", b="Rule B")
+        reinforce(tmp_path, rules, CONFIG, "SessionStart", now=1.0)
+        plan = reinforce(tmp_path, _rules(a="Rule A", b="Rule B v2"), CONFIG, "UserPromptSubmit")
+
+        assert _names(plan.inject) == ["b"]
+        assert retract_trimmed(tmp_path, "") == ["b"]
+        assert set(json.loads((tmp_path / STATE_NAME).read_text())["rules"]) == {"a"}
+
+
+class TestReminderOutput:
+    """Tests for the reminder in hook output."""
+
+    def test_reminder_follows_rules(self):
+        """Test the reminder line is appended after injected rules."""
+        output = format_to_hook_json([{"content": "Rule A"}], reminder="Rules still in effect")
+
+        context = json.loads(output)["hookSpecificOutput"]["additionalContext"]
+        assert context == "Rule A\n\nRules still in effect"
+
+    def test_estimate_tokens(self):
+        """Test token estimates round up."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcde") == 2
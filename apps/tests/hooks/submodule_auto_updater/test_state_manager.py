@@ -1,13 +1,13 @@
 """Tests for submodule auto-updater state management."""
 
-import json
 import time
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from claude_apps.hooks.submodule_auto_updater.state_manager import NAMESPACE
 from claude_apps.hooks.submodule_auto_updater.updater import UpdateResult
+from claude_apps.shared.state_store import StateStoreError, get_state_store
 
 
 class TestStateManager:
@@ -15,70 +15,47 @@ class TestStateManager:
 
     @pytest.fixture(autouse=True)
     def setup_data_dir(self, tmp_path, monkeypatch):
-        """Set up temp data directory."""
-        data_dir = tmp_path / "data"
-        monkeypatch.setattr(
-            "claude_apps.hooks.submodule_auto_updater.state_manager.DATA_DIR",
-            data_dir,
-        )
-        monkeypatch.setattr(
-            "claude_apps.hooks.submodule_auto_updater.state_manager.CHECK_STATE_FILE",
-            data_dir / "submodule_check_state.json",
-        )
-        monkeypatch.setattr(
-            "claude_apps.hooks.submodule_auto_updater.state_manager.NOTIFY_STATE_FILE",
-            data_dir / "submodule_notify_state.json",
-        )
-        self.data_dir = data_dir
-        self.check_file = data_dir / "submodule_check_state.json"
-        self.notify_file = data_dir / "submodule_notify_state.json"
-
-    def test_ensure_data_dir_creates_directory(self):
-        """Test creates data directory."""
-        from claude_apps.hooks.submodule_auto_updater.state_manager import ensure_data_dir
-
-        ensure_data_dir()
+        """Point the state store at a temp data directory."""
+        monkeypatch.setenv("CLAUDE_DATA_PATH", str(tmp_path / "data"))
+        self.store = get_state_store()
 
-        assert self.data_dir.exists()
-
-    def test_read_check_state_returns_empty_when_no_file(self):
-        """Test returns empty dict when file doesn't exist."""
+    def test_read_check_state_returns_empty_when_no_state(self):
+        """Test returns empty dict when nothing was recorded."""
         from claude_apps.hooks.submodule_auto_updater.state_manager import read_check_state
 
         result = read_check_state()
 
         assert result == {}
 
-    def test_read_check_state_parses_json(self):
-        """Test parses JSON from file."""
+    def test_read_check_state_reads_store(self):
+        """Test reads the check state from the state store."""
         from claude_apps.hooks.submodule_auto_updater.state_manager import read_check_state
 
-        self.data_dir.mkdir(parents=True)
-        self.check_file.write_text('{"last_check_time": 12345}')
+        self.store.set(NAMESPACE, "check", {"last_check_time": 12345})
 
         result = read_check_state()
 
         assert result["last_check_time"] == 12345
 
-    def test_read_check_state_handles_invalid_json(self):
-        """Test handles invalid JSON gracefully."""
+    def test_read_check_state_handles_store_errors(self):
+        """Test handles an unusable state store gracefully."""
         from claude_apps.hooks.submodule_auto_updater.state_manager import read_check_state
 
-        self.data_dir.mkdir(parents=True)
-        self.check_file.write_text("not valid json")
-
-        result = read_check_state()
+        with patch(
+            "claude_apps.hooks.submodule_auto_updater.state_manager.get_state_store",
+            side_effect=StateStoreError("locked"),
+        ):
+            result = read_check_state()
 
         assert result == {}
 
-    def test_write_check_state_creates_file(self):
-        """Test creates state file."""
+    def test_write_check_state_records_check(self):
+        """Test records the check time."""
         from claude_apps.hooks.submodule_auto_updater.state_manager import write_check_state
 
         write_check_state()
 
-        assert self.check_file.exists()
-        state = json.loads(self.check_file.read_text())
+        state = self.store.get(NAMESPACE, "check")
         assert "last_check_time" in state
         assert "last_check_iso" in state
 
@@ -96,7 +73,7 @@ class TestStateManager:
 
         write_check_state(result)
 
-        state = json.loads(self.check_file.read_text())
+        state = self.store.get(NAMESPACE, "check")
         assert "last_update_time" in state
         assert state["last_update_result"]["updated"] is True
         assert state["last_update_result"]["old_commit"] == "abc123"
@@ -134,15 +111,11 @@ class TestStateManager:
 
     def test_should_check_returns_true_when_interval_passed(self):
         """Test returns True when interval has passed."""
-        from claude_apps.hooks.submodule_auto_updater.state_manager import (
-            read_check_state,
-            should_check,
-        )
+        from claude_apps.hooks.submodule_auto_updater.state_manager import should_check
 
         # Write old timestamp
-        self.data_dir.mkdir(parents=True)
         old_time = time.time() - 7200  # 2 hours ago
-        self.check_file.write_text(json.dumps({"last_check_time": old_time}))
+        self.store.set(NAMESPACE, "check", {"last_check_time": old_time})
 
         with patch(
             "claude_apps.hooks.submodule_auto_updater.state_manager.get_check_interval_seconds"
@@ -153,8 +126,8 @@ class TestStateManager:
 
             assert result is True
 
-    def test_read_notify_state_returns_empty_when_no_file(self):
-        """Test returns empty dict when notify file doesn't exist."""
+    def test_read_notify_state_returns_empty_when_no_state(self):
+        """Test returns empty dict when no notification was recorded."""
         from claude_apps.hooks.submodule_auto_updater.state_manager import read_notify_state
 
         result = read_notify_state()
@@ -195,12 +168,85 @@ class TestStateManager:
 
         assert result is True
 
-    def test_mark_notified_creates_file(self):
-        """Test creates notify state file."""
+    def test_mark_notified_records_session(self):
+        """Test records the notified session."""
         from claude_apps.hooks.submodule_auto_updater.state_manager import mark_notified
 
         mark_notified("my-session")
 
-        assert self.notify_file.exists()
-        state = json.loads(self.notify_file.read_text())
+        state = self.store.get(NAMESPACE, "notify")
         assert state["last_notified_session"] == "my-session"
+
+    def test_take_pending_update_once(self):
+        """Test an update applied in the background is returned exactly once."""
+        from claude_apps.hooks.submodule_auto_updater.state_manager import (
+            take_pending_update,
+            write_check_state,
+        )
+
+        write_check_state(
+            UpdateResult(updated=True, old_commit="abc123", new_commit="def456", commits_behind=2),
+            pending=True,
+        )
+
+        pending = take_pending_update()
+
+        assert pending is not None
+        assert pending.updated is True
+        assert pending.new_commit == "def456"
+        assert take_pending_update() is None
+
+    def test_take_pending_update_ignores_foreground_updates(self):
+        """Test updates announced by the hook itself are not pending."""
+        from claude_apps.hooks.submodule_auto_updater.state_manager import (
+            take_pending_update,
+            write_check_state,
+        )
+
+        write_check_state(UpdateResult(updated=True, old_commit="a", new_commit="b"))
+
+        assert take_pending_update() is None
+
+    def test_claim_check_once_per_interval(self):
+        """Test only the first claim within the interval runs a check."""
+        from claude_apps.hooks.submodule_auto_updater.state_manager import claim_check
+
+        with patch(
+            "claude_apps.hooks.submodule_auto_updater.state_manager.get_check_interval_seconds",
+            return_value=3600,
+        ):
+            assert claim_check() is True
+            assert claim_check() is False
+
+    def test_claim_check_lost_race(self):
+        """Test a session whose compare-and-set loses does not check."""
+        from claude_apps.hooks.submodule_auto_updater.state_manager import claim_check
+
+        with (
+            patch(
+                "claude_apps.hooks.submodule_auto_updater.state_manager.get_check_interval_seconds",
+                return_value=3600,
+            ),
+            patch.object(type(self.store), "compare_and_set", return_value=False),
+        ):
+            assert claim_check() is False
+
+    def test_claim_check_keeps_update_result(self):
+        """Test claiming a check preserves the recorded update."""
+        from claude_apps.hooks.submodule_auto_updater.state_manager import (
+            claim_check,
+            write_check_state,
+        )
+
+        write_check_state(UpdateResult(updated=True, old_commit="a", new_commit="b"))
+        state = self.store.get(NAMESPACE, "check")
+        state["last_check_time"] = 0
+        self.store.set(NAMESPACE, "check", state)
+
+        with patch(
+            "claude_apps.hooks.submodule_auto_updater.state_manager.get_check_interval_seconds",
+            return_value=3600,
+        ):
+            assert claim_check() is True
+
+        assert self.store.get(NAMESPACE, "check")["last_update_result"]["new_commit"] == "b"
@@ -8,9 +8,11 @@ import pytest
 from claude_apps.hooks.submodule_auto_updater.updater import (
     UpdateResult,
     check_and_update,
+    get_submodule_path,
     is_git_repo,
     run_git_command,
 )
+from claude_apps.shared.deadline import Deadline, DeadlineExceededError
 
 
 class TestUpdateResult:
@@ -44,6 +46,18 @@ class TestUpdateResult:
         assert result.commits_behind == 3
 
 
+class TestGetSubmodulePath:
+    """Tests for get_submodule_path function."""
+
+    def test_reads_environment_per_call(self, monkeypatch):
+        """Test CLAUDE_PATH is read when called, not when the module is imported."""
+        monkeypatch.setenv("CLAUDE_PATH", "/first/.claude")
+        assert get_submodule_path() == Path("/first/.claude")
+
+        monkeypatch.setenv("CLAUDE_PATH", "/second/.claude")
+        assert get_submodule_path() == Path("/second/.claude")
+
+
 class TestIsGitRepo:
     """Tests for is_git_repo function."""
 
@@ -117,6 +131,25 @@ class TestRunGitCommand:
             assert success is False
             assert "Command not found" in output
 
+    def test_deadline_bounds_timeout(self, tmp_path):
+        """Test a deadline shorter than the git timeout bounds the command."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="")
+
+            run_git_command(["fetch"], tmp_path, Deadline.after(2))
+
+            assert mock_run.call_args.kwargs["timeout"] <= 2
+
+    def test_deadline_cut_raises(self, tmp_path):
+        """Test a command cut off by the deadline raises DeadlineExceededError."""
+        import subprocess
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=2)
+
+            with pytest.raises(DeadlineExceededError):
+                run_git_command(["fetch"], tmp_path, Deadline.after(2))
+
 
 class TestCheckAndUpdate:
     """Tests for check_and_update function."""
@@ -0,0 +1,150 @@
+"""Tests for shared context_budget module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.shared.context_budget import (
+    Allocation,
+    Contribution,
+    allocate,
+    event_limit,
+    get_budget_config,
+    hook_priority,
+    load_usage,
+    record_usage,
+    trim_context,
+)
+from claude_apps.shared.context_budget.usage import USAGE_NAME
+
+
+class TestTrimContext:
+    """Tests for trim_context function."""
+
+    def test_fits_unchanged(self):
+        """Test text within the limit is returned as is."""
+        assert trim_context("short", 10) == "short"
+
+    def test_cuts_at_line_boundary(self):
+        """Test long text keeps whole lines and notes the omission."""
+        text = "\n".join(f"line {i:03d} " + "x" * 40 for i in range(20))
+
+        trimmed = trim_context(text, 400, "hook")
+
+        assert len(trimmed) <= 400
+        head, note = trimmed.rsplit("\n", 1)
+        assert text.startswith(head)
+        assert head.endswith("x" * 40)
+        assert (
+            note
+            == f"[context budget: {len(text) - len(head)} of {len(text)} chars from hook omitted]"
+        )
+
+    def test_small_room_leaves_only_note(self):
+        """Test too little room drops the text but keeps the note if it fits."""
+        assert trim_context("y" * 1000, 100).startswith("[context budget: 1000 of 1000")
+        assert trim_context("y" * 1000, 10) == ""
+
+
+class TestAllocate:
+    """Tests for allocate function."""
+
+    def test_unbounded(self):
+        """Test no limit keeps everything."""
+        allocations = allocate([Contribution("a", "x" * 10)], None)
+
+        assert allocations[0].text == "x" * 10
+        assert not allocations[0].trimmed
+
+    def test_priority_order_and_total(self):
+        """Test the joined result fits and high priority is served first."""
+        contributions = [
+            Contribution("low", "l" * 1000, priority=90),
+            Contribution("high", "h" * 1000, priority=10),
+            Contribution("mid", "m" * 1000, priority=50),
+        ]
+
+        allocations = allocate(contributions, 1500)
+
+        assert [a.hook for a in allocations] == ["low", "high", "mid"]
+        assert allocations[1].text == "h" * 1000
+        assert allocations[2].trimmed and allocations[2].text
+        assert allocations[0].injected_chars == 0
+        joined = "\n\n".join(a.text for a in allocations if a.text)
+        assert len(joined) <= 1500
+
+
+class TestConfig:
+    """Tests for budget configuration helpers."""
+
+    def test_event_limit(self):
+        """Test per-event limits override the default and tokens count as 4 chars."""
+        config = {"max_tokens": 100, "events": {"SessionStart": {"max_chars": 50}}}
+
+        assert event_limit(config, "SessionStart") == 50
+        assert event_limit(config, "UserPromptSubmit") == 400
+        assert event_limit({}, "Stop") is None
+
+    def test_hook_priority(self):
+        """Test configured priorities and the default."""
+        config = {"priorities": {"rules_loader": 10}, "default_priority": 50}
+
+        assert hook_priority(config, "rules_loader") == 10
+        assert hook_priority(config, "other") == 50
+
+    def test_get_budget_config_defaults(self):
+        """Test defaults are filled in under the configured section."""
+        with patch(
+            "claude_apps.shared.context_budget.budget.get_hook_config",
+            return_value={"max_chars": 10},
+        ):
+            config = get_budget_config()
+
+        assert config["max_chars"] == 10
+        assert config["enabled"] is True
+
+
+class TestUsage:
+    """Tests for per-session usage telemetry."""
+
+    def test_accumulates_per_hook_and_event(self, tmp_path):
+        """Test totals add up across events."""
+        session_dir = tmp_path / "s1"
+        record_usage(session_dir, "SessionStart", [Allocation("rules_loader", "x" * 10, 10)])
+        record_usage(
+            session_dir,
+            "UserPromptSubmit",
+            [Allocation("rules_loader", "x" * 4, 10), Allocation("changelog_monitor", "", 7)],
+        )
+
+        usage = load_usage(session_dir)
+
+        assert usage["hooks"]["rules_loader"] == {
+            "events": 2,
+            "offered_chars": 20,
+            "injected_chars": 14,
+            "trimmed": 1,
+            "dropped": 0,
+        }
+        assert usage["hooks"]["changelog_monitor"]["dropped"] == 1
+        assert usage["events"]["UserPromptSubmit"]["offered_chars"] == 17
+
+    def test_missing_usage_is_empty(self, tmp_path):
+        """Test a session without usage reads as empty totals."""
+        assert load_usage(tmp_path)["hooks"] == {}
+
+    def test_failed_write_keeps_previous_usage(self, tmp_path):
+        """Test a write that fails midway leaves the last complete totals."""
+        record_usage(tmp_path, "SessionStart", [Allocation("rules_loader", "x", 1)])
+
+        with patch(
+            "claude_apps.shared.json_file.locked.os.replace",
+            side_effect=OSError(28, "ENOSPC"),
+        ):
+            with pytest.raises(OSError):
+                record_usage(tmp_path, "SessionStart", [Allocation("rules_loader", "x", 1)])
+
+        assert load_usage(tmp_path)["hooks"]["rules_loader"]["events"] == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+            [".context_usage.lock", USAGE_NAME]
+        )
@@ -0,0 +1,221 @@
+"""Tests for shared deadline module."""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.shared.deadline import (
+    ENV_VAR,
+    Deadline,
+    DeadlineExceededError,
+    claim_continuation,
+    continue_in_background,
+    current_deadline,
+    deadline_scope,
+    get_claim_path,
+    hook_budget,
+    hook_deadline,
+    release_continuation,
+    run_within,
+)
+
+
+def _claim(name):
+    return claim_continuation(name, stale_seconds=60)
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    path = tmp_path / "config.yml"
+    path.write_text(
+        "hooks:\n  deadline:\n    default_seconds: null\n    margin_seconds: 0.5\n"
+        "    hooks:\n      slow: 2\n"
+    )
+    monkeypatch.setenv("CLAUDE_CONFIG_YML_PATH", str(path))
+    monkeypatch.setenv("CLAUDE_DATA_PATH", str(tmp_path / "data"))
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    return path
+
+
+class TestDeadline:
+    """Tests for the Deadline class."""
+
+    def test_unbounded(self):
+        """Test an unbounded deadline passes caps through."""
+        deadline = Deadline()
+
+        assert deadline.remaining() is None
+        assert deadline.timeout(30) == 30
+        assert not deadline.expired
+        assert not deadline.binds(30)
+
+    def test_timeout_is_capped_by_remaining(self):
+        """Test timeouts shrink to the time left minus the margin."""
+        deadline = Deadline.after(2, margin=0.5)
+
+        assert deadline.timeout(30) <= 1.5
+        assert deadline.timeout(0.1) == 0.1
+        assert deadline.binds(30)
+        assert not deadline.binds(0.1)
+
+    def test_timeout_raises_when_spent(self):
+        """Test no time left raises DeadlineExceededError."""
+        with pytest.raises(DeadlineExceededError):
+            Deadline(time.time() - 1).timeout(30)
+        with pytest.raises(DeadlineExceededError):
+            Deadline.after(0.1, margin=0.5).timeout()
+
+    def test_within_takes_earlier(self):
+        """Test within() never extends an inherited deadline."""
+        parent = Deadline.after(1)
+
+        assert parent.within(10).expires_at == parent.expires_at
+        assert parent.within(0.1).expires_at < parent.expires_at
+        assert Deadline().within(None).expires_at is None
+
+    def test_env_roundtrip(self):
+        """Test a child process sees the same deadline."""
+        deadline = Deadline.after(5)
+        env = deadline.env({})
+
+        assert Deadline.from_env(env).expires_at == pytest.approx(deadline.expires_at, abs=0.01)
+        assert ENV_VAR not in Deadline().env({ENV_VAR: "1"})
+        assert Deadline.from_env({ENV_VAR: "soon"}).expires_at is None
+
+
+class TestCurrentDeadline:
+    """Tests for current_deadline and deadline_scope."""
+
+    def test_scope_sets_and_restores(self, monkeypatch):
+        """Test the scope overrides the inherited deadline for its duration."""
+        monkeypatch.delenv(ENV_VAR, raising=False)
+        deadline = Deadline.after(5)
+
+        with deadline_scope(deadline):
+            assert current_deadline() is deadline
+
+        assert current_deadline().expires_at is None
+
+    def test_inherits_environment(self, monkeypatch):
+        """Test the environment deadline applies outside any scope."""
+        monkeypatch.setenv(ENV_VAR, "123.5")
+
+        assert current_deadline().expires_at == 123.5
+
+
+class TestHookDeadline:
+    """Tests for hook_budget and hook_deadline."""
+
+    def test_budget_from_config(self, config):
+        """Test a configured hook gets its budget and others none."""
+        slow = hook_deadline("slow")
+
+        assert 1.5 < slow.remaining() <= 2
+        assert slow.margin == 0.5
+        assert hook_deadline("other").expires_at is None
+
+    def test_inherited_deadline_caps_budget(self, config, monkeypatch):
+        """Test a parent's earlier deadline wins over the hook's budget."""
+        monkeypatch.setenv(ENV_VAR, str(time.time() + 0.5))
+
+        assert hook_deadline("slow").remaining() <= 0.5
+
+    def test_default_seconds(self):
+        """Test default_seconds applies to hooks without their own entry."""
+        assert hook_budget({"default_seconds": 4, "hooks": {"a": 1}}, "b") == 4.0
+        assert hook_budget({"default_seconds": 4, "hooks": {"a": 1}}, "a") == 1.0
+
+    def test_without_config(self, monkeypatch):
+        """Test a missing config leaves only the inherited deadline."""
+        monkeypatch.delenv("CLAUDE_CONFIG_YML_PATH", raising=False)
+        monkeypatch.delenv(ENV_VAR, raising=False)
+
+        assert hook_deadline("slow").expires_at is None
+
+
+class TestRunWithin:
+    """Tests for run_within function."""
+
+    def test_child_inherits_deadline(self):
+        """Test the child process sees the remaining budget."""
+        deadline = Deadline.after(30)
+        result = run_within(
+            [sys.executable, "-c", f"import os; print(os.environ['{ENV_VAR}'])"],
+            deadline,
+            capture_output=True,
+            text=True,
+        )
+
+        assert float(result.stdout) == pytest.approx(deadline.expires_at, abs=0.01)
+
+    def test_deadline_cut_raises(self):
+        """Test a command cut off by the deadline raises DeadlineExceededError."""
+        with pytest.raises(DeadlineExceededError):
+            run_within(
+                [sys.executable, "-c", "import time; time.sleep(5)"], Deadline.after(0.3), 30
+            )
+
+    def test_cap_timeout_is_not_a_deadline(self):
+        """Test the command's own timeout still raises TimeoutExpired."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_within(
+                [sys.executable, "-c", "import time; time.sleep(5)"], Deadline.after(30), 0.3
+            )
+
+
+class TestContinuations:
+    """Tests for background continuations."""
+
+    def test_claim_is_exclusive_until_released(self, config):
+        """Test a continuation can be claimed once at a time."""
+        assert claim_continuation("job")
+        assert not claim_continuation("job")
+
+        release_continuation("job")
+
+        assert claim_continuation("job")
+
+    def test_stale_claim_is_taken_over(self, config):
+        """Test a claim older than stale_seconds no longer blocks."""
+        assert claim_continuation("job")
+
+        assert claim_continuation("job", stale_seconds=0)
+
+    def test_stale_claim_is_taken_over_once(self, config):
+        """Test concurrent sessions finding a stale claim start one continuation."""
+        assert claim_continuation("job")
+        path = get_claim_path("job")
+        os.utime(path, (time.time() - 120, time.time() - 120))
+
+        with multiprocessing.Pool(8) as pool:
+            claimed = pool.map(_claim, ["job"] * 8)
+
+        assert claimed.count(True) == 1
+        assert int(path.read_text()) != os.getpid()
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_starts_detached_process_without_deadline(self, config, monkeypatch):
+        """Test the continuation runs detached and without the hook's deadline."""
+        monkeypatch.setenv(ENV_VAR, "123")
+
+        with patch("claude_apps.shared.deadline.background.subprocess.Popen") as popen:
+            assert continue_in_background("job", "some.module", ["--continue"])
+            assert not continue_in_background("job", "some.module", ["--continue"])
+
+        popen.assert_called_once()
+        args, kwargs = popen.call_args
+        assert args[0] == [sys.executable, "-m", "some.module", "--continue"]
+        assert kwargs["start_new_session"] is True
+        assert ENV_VAR not in kwargs["env"]
+
+    def test_spawn_failure_releases_claim(self, config):
+        """Test a failed spawn leaves the continuation unclaimed."""
+        with patch("claude_apps.shared.deadline.background.subprocess.Popen", side_effect=OSError):
+            assert not continue_in_background("job", "some.module")
+
+        assert claim_continuation("job")
@@ -0,0 +1,226 @@
+"""Tests for shared event_log module."""
+
+import json
+import time
+
+import pytest
+
+from claude_apps.shared.event_log import (
+    BLOB_DIR_NAME,
+    SegmentPolicy,
+    active_segment_path,
+    append_line,
+    append_lines_to_session,
+    append_record,
+    append_to_session,
+    compress_segment,
+    encode_record,
+    externalize,
+    find_blob_store,
+    get_blob,
+    is_blob_ref,
+    iter_records,
+    iter_session_records,
+    list_segments,
+    maintain_session,
+    put_blob,
+    read_records,
+    rehydrate,
+    render_json_array,
+    seal_segment,
+)
+
+
+class TestWriter:
+    """Tests for the append-only writer."""
+
+    def test_encode_record_is_single_compact_line(self):
+        """Test records encode to one line without ASCII escaping."""
+        line = encode_record({"text": "a\nb", "name": "é"})
+
+        assert "\n" not in line
+        assert line == '{"text":"a\\nb","name":"é"}'
+
+    def test_append_record_creates_file_and_parents(self, tmp_path):
+        """Test the first append creates missing directories."""
+        path = tmp_path / "a" / "b" / "log.ndjson"
+
+        append_record(path, {"n": 1})
+
+        assert path.read_text() == '{"n":1}\n'
+
+    def test_append_keeps_existing_lines(self, tmp_path):
+        """Test appending never rewrites earlier records."""
+        path = tmp_path / "log.ndjson"
+        append_line(path, '{"n":1}')
+        append_line(path, '{"n":2}')
+
+        assert path.read_text() == '{"n":1}\n{"n":2}\n'
+
+    def test_rejects_unserializable_record(self, tmp_path):
+        """Test non-JSON records raise TypeError and write nothing."""
+        path = tmp_path / "log.ndjson"
+
+        with pytest.raises(TypeError):
+            append_record(path, {"value": object()})
+        assert not path.exists()
+
+
+class TestReader:
+    """Tests for the log reader."""
+
+    def test_reads_ndjson(self, tmp_path):
+        """Test one record per line is read in order."""
+        path = tmp_path / "log.ndjson"
+        path.write_text('{"n":1}\n{"n":2}\n')
+
+        assert read_records(path) == [{"n": 1}, {"n": 2}]
+
+    def test_skips_torn_and_blank_lines(self, tmp_path):
+        """Test malformed lines do not hide the rest of the log."""
+        path = tmp_path / "log.ndjson"
+        path.write_text('{"n":1}\n\n{"n":\n{"n":3}\n')
+
+        assert read_records(path) == [{"n": 1}, {"n": 3}]
+
+    def test_reads_legacy_array_with_appended_lines(self, tmp_path):
+        """Test a pretty JSON array followed by NDJSON lines."""
+        path = tmp_path / "log.json"
+        path.write_text(json.dumps([{"n": 1}, {"n": 2}], indent=2) + '\n{"n":3}\n')
+
+        assert read_records(path) == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+    def test_missing_file_yields_nothing(self, tmp_path):
+        """Test a missing file is an empty log."""
+        assert list(iter_records(tmp_path / "missing.ndjson")) == []
+
+    def test_render_json_array_concatenates_files(self, tmp_path):
+        """Test rendering several logs as one pretty array."""
+        first = tmp_path / "a.ndjson"
+        second = tmp_path / "b.ndjson"
+        first.write_text('{"n":1}\n')
+        second.write_text('{"n":2}\n')
+
+        text = render_json_array([first, second])
+
+        assert json.loads(text) == [{"n": 1}, {"n": 2}]
+        assert text == json.dumps([{"n": 1}, {"n": 2}], indent=2) + "\n"
+
+
+class TestSegments:
+    """Tests for per-session rotating segments."""
+
+    def test_new_window_seals_previous_segment(self, tmp_path):
+        """Test the first append of a window seals the last window's file."""
+        policy = SegmentPolicy(max_age_seconds=60, compression="none")
+        now = time.time()
+
+        first = append_to_session(tmp_path, '{"n":1}', policy, now=now - 120)
+        second = append_to_session(tmp_path, '{"n":2}', policy, now=now)
+
+        assert first != second
+        assert not first.exists()
+        assert [p.name.split(".")[0] for p in list_segments(tmp_path)] == ["segment", "active"]
+        assert [r["n"] for r in iter_session_records(tmp_path)] == [1, 2]
+
+    def test_compresses_only_after_grace(self, tmp_path):
+        """Test sealed segments stay uncompressed while writers may hold them."""
+        policy = SegmentPolicy(grace_seconds=60)
+        sealed = seal_segment(active_segment_path(tmp_path, policy=policy))
+        assert sealed is None
+
+        append_to_session(tmp_path, '{"n":1}', policy)
+        sealed = seal_segment(active_segment_path(tmp_path, policy=policy))
+
+        assert maintain_session(tmp_path, policy) == (0, 0)
+        assert maintain_session(tmp_path, policy, now=time.time() + 120) == (0, 1)
+        assert not sealed.exists()
+        assert [p.suffix for p in list_segments(tmp_path)] == [".gz"]
+
+    @pytest.mark.parametrize("compression,suffix", [("gzip", ".gz"), ("lzma", ".xz")])
+    def test_compressed_segments_are_readable(self, tmp_path, compression, suffix):
+        """Test gzip and lzma segments read back transparently."""
+        path = tmp_path / "segment.20250101_000000.1.ndjson"
+        path.write_text('{"n":1}\n{"n":2}\n')
+
+        compressed = compress_segment(path, compression)
+
+        assert compressed.name.endswith(suffix)
+        assert not path.exists()
+        assert read_records(compressed) == [{"n": 1}, {"n": 2}]
+
+    def test_policy_validation(self):
+        """Test invalid policies are rejected."""
+        with pytest.raises(ValueError):
+            SegmentPolicy(compression="bz2")
+        with pytest.raises(ValueError):
+            SegmentPolicy(max_bytes=0)
+
+
+class TestAppendLinesToSession:
+    """Tests for batched segment appends."""
+
+    def test_appends_in_order(self, tmp_path):
+        """Test lines are appended in order with one segment per chunk."""
+        policy = SegmentPolicy(max_bytes=64, compression="none")
+        lines = [json.dumps({"n": n}) for n in range(20)]
+
+        written = append_lines_to_session(tmp_path, lines, policy, now=1_700_000_000)
+
+        assert written == sum(len(line) + 1 for line in lines)
+        assert [r["n"] for r in iter_session_records(tmp_path)] == list(range(20))
+        assert all(p.stat().st_size <= 64 for p in list_segments(tmp_path))
+
+
+class TestBlobs:
+    """Tests for the content-addressed blob store."""
+
+    def test_put_blob_is_content_addressed(self, tmp_path):
+        """Test identical values share one blob."""
+        first = put_blob(tmp_path, {"content": "x" * 100})
+        second = put_blob(tmp_path, {"content": "x" * 100})
+
+        assert first == second
+        assert is_blob_ref(first)
+        assert len(list(tmp_path.rglob("*.json.gz"))) == 1
+        assert get_blob(tmp_path, first["$blob"]) == {"content": "x" * 100}
+
+    def test_externalize_moves_large_members(self, tmp_path):
+        """Test members at or over the threshold are replaced by references."""
+        record = {"session_id": "s" * 200, "small": "a", "big": {"text": "b" * 200}}
+
+        moved = externalize(record, tmp_path, 100, skip=("session_id",))
+
+        assert moved == 1
+        assert record["session_id"] == "s" * 200
+        assert record["small"] == "a"
+        assert record["big"]["bytes"] == len(encode_record({"text": "b" * 200}))
+
+    def test_rehydrate_restores_members(self, tmp_path):
+        """Test references are replaced by stored content, missing ones kept."""
+        store = tmp_path / BLOB_DIR_NAME
+        record = {"big": ["c"] * 100}
+        externalize(record, store, 10)
+        missing = {"$blob": "0" * 64, "bytes": 5}
+        record["gone"] = missing
+
+        assert rehydrate(record, store) == {"big": ["c"] * 100, "gone": missing}
+
+    def test_find_blob_store_searches_parents(self, tmp_path):
+        """Test a log file finds the store under its log base."""
+        (tmp_path / BLOB_DIR_NAME).mkdir()
+        log = tmp_path / "session" / "active.ndjson"
+        log.parent.mkdir()
+
+        assert find_blob_store(log) == (tmp_path / BLOB_DIR_NAME).resolve()
+
+    def test_render_json_array_resolves_blobs(self, tmp_path):
+        """Test export rendering rehydrates references on request."""
+        store = tmp_path / BLOB_DIR_NAME
+        record = {"payload": "p" * 50}
+        externalize(record, store, 10)
+        log = tmp_path / "session" / "log.ndjson"
+        append_record(log, record)
+
+        assert json.loads(render_json_array([log], resolve_blobs=True)) == [{"payload": "p" * 50}]
+        assert is_blob_ref(json.loads(render_json_array([log]))[0]["payload"])
@@ -0,0 +1,177 @@
+"""Tests for shared hook_memo module."""
+
+import json
+import os
+import time
+
+import pytest
+
+from claude_apps.shared.hook_memo import (
+    MemoSpec,
+    get_memo_spec,
+    load_memo,
+    memo_key,
+    memo_lookup,
+    store_memo,
+)
+
+SESSION_START = json.dumps({"hook_event_name": "SessionStart", "source": "startup"})
+
+
+@pytest.fixture
+def claude_root(tmp_path, monkeypatch):
+    root = tmp_path / ".claude"
+    root.mkdir()
+    (root / "config.yml").write_text("hooks:\n  hook_memo:\n    enabled: true\n")
+    monkeypatch.setenv("CLAUDE_CONFIG_YML_PATH", str(root / "config.yml"))
+    monkeypatch.setenv("CLAUDE_DATA_PATH", str(tmp_path / "data"))
+    return root
+
+
+def _bump(path, text):
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestMemoSpec:
+    """Tests for MemoSpec and get_memo_spec."""
+
+    def test_from_mapping(self):
+        """Test a MEMO_INPUTS mapping becomes a spec."""
+        spec = MemoSpec.from_mapping({"events": ["SessionStart"], "files": ["a"], "ttl_seconds": 5})
+
+        assert spec == MemoSpec(("hook_event_name",), ("a",), ("SessionStart",), 5.0)
+
+    def test_declared_by_hook_package(self):
+        """Test hooks with MEMO_INPUTS have a spec and others do not."""
+        spec = get_memo_spec("claude_apps.hooks.session_context_injector")
+
+        assert spec is not None and spec.events == ("SessionStart",)
+        assert get_memo_spec("claude_apps.hooks.logger") is None
+        assert get_memo_spec("claude_apps.hooks.missing") is None
+
+
+class TestMemoKey:
+    """Tests for memo_key function."""
+
+    def test_depends_on_declared_fields_only(self, tmp_path):
+        """Test undeclared fields such as session_id do not change the key."""
+        spec = MemoSpec(fields=("hook_event_name", "source"))
+        a = memo_key(
+            "h", spec, json.dumps({"hook_event_name": "SessionStart", "session_id": "1"}), tmp_path
+        )
+        b = memo_key(
+            "h", spec, json.dumps({"hook_event_name": "SessionStart", "session_id": "2"}), tmp_path
+        )
+        c = memo_key(
+            "h", spec, json.dumps({"hook_event_name": "SessionStart", "source": "resume"}), tmp_path
+        )
+
+        assert a == b
+        assert a != c
+
+    def test_changes_with_files(self, tmp_path):
+        """Test editing a declared file or directory changes the key."""
+        (tmp_path / "rules").mkdir()
+        (tmp_path / "rules" / "a.md").write_text("a")
+        (tmp_path / "input.txt").write_text("one")
+        spec = MemoSpec(files=("input.txt", "rules"))
+        before = memo_key("h", spec, SESSION_START, tmp_path)
+
+        _bump(tmp_path / "input.txt", "two")
+        after_file = memo_key("h", spec, SESSION_START, tmp_path)
+        _bump(tmp_path / "rules" / "a.md", "b")
+
+        assert len({before, after_file, memo_key("h", spec, SESSION_START, tmp_path)}) == 3
+
+    def test_unmemoizable_events(self, tmp_path):
+        """Test other events and invalid input have no key."""
+        spec = MemoSpec(events=("SessionStart",))
+
+        assert memo_key("h", spec, json.dumps({"hook_event_name": "Stop"}), tmp_path) is None
+        assert memo_key("h", spec, "{oops", tmp_path) is None
+        assert memo_key("h", spec, "", tmp_path) is None
+
+
+class TestStore:
+    """Tests for store_memo and load_memo functions."""
+
+    def test_roundtrip_and_ttl(self, tmp_path):
+        """Test a stored response is replayed until it is older than the ttl."""
+        store_memo(tmp_path, "k", '{"ok": true}\n')
+
+        assert load_memo(tmp_path, "k") == '{"ok": true}\n'
+        assert load_memo(tmp_path, "k", ttl_seconds=60) == '{"ok": true}\n'
+        assert load_memo(tmp_path, "missing") is None
+
+        entry = json.loads((tmp_path / "k.json").read_text())
+        entry["stored_at"] = time.time() - 120
+        (tmp_path / "k.json").write_text(json.dumps(entry))
+        assert load_memo(tmp_path, "k", ttl_seconds=60) is None
+
+    def test_prunes_oldest(self, tmp_path):
+        """Test at most max_entries responses are kept."""
+        for i in range(4):
+            store_memo(tmp_path, f"k{i}", str(i), max_entries=2)
+            os.utime(tmp_path / f"k{i}.json", ns=(i * 10**9, i * 10**9))
+
+        store_memo(tmp_path, "k4", "4", max_entries=2)
+
+        assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["k3", "k4"]
+
+
+class TestMemoLookup:
+    """Tests for memo_lookup function."""
+
+    PACKAGE = "claude_apps.hooks.session_context_injector"
+
+    def test_miss_then_hit(self, claude_root):
+        """Test a stored response is found for the same inputs."""
+        stored, key = memo_lookup("session_context_injector", self.PACKAGE, SESSION_START)
+        assert stored is None and key is not None
+
+        store_memo(
+            claude_root.parent / "data" / "cache" / "hook_memo" / "session_context_injector",
+            key,
+            "out",
+        )
+
+        assert memo_lookup("session_context_injector", self.PACKAGE, SESSION_START) == ("out", key)
+
+    def test_config_change_misses(self, claude_root):
+        """Test editing config.yml invalidates stored responses."""
+        _, key = memo_lookup("session_context_injector", self.PACKAGE, SESSION_START)
+        _bump(claude_root / "config.yml", "hooks:\n  hook_memo:\n    enabled: true\n# edit\n")
+
+        assert memo_lookup("session_context_injector", self.PACKAGE, SESSION_START)[1] != key
+
+    def test_disabled_or_undeclared(self, claude_root):
+        """Test nothing is memoized when disabled or without MEMO_INPUTS."""
+        assert memo_lookup("logger", "claude_apps.hooks.logger", SESSION_START) == (None, None)
+
+        _bump(claude_root / "config.yml", "hooks:\n  hook_memo:\n    enabled: false\n")
+        assert memo_lookup("session_context_injector", self.PACKAGE, SESSION_START) == (None, None)
+
+    def test_resolves_declared_files(self, claude_root):
+        """Test files under the .claude root and the data directory are watched."""
+        package = "claude_apps.hooks.changelog_monitor"
+        (claude_root / "docs").mkdir()
+        (claude_root / "docs" / "ROADMAP.md").write_text("Last checked: 1.0.0\n")
+        cache = claude_root.parent / "data" / "cache" / "changelog.md"
+        cache.parent.mkdir(parents=True)
+        cache.write_text("# 1.0.0\n")
+
+        _, key = memo_lookup("changelog_monitor", package, SESSION_START)
+        _bump(cache, "# 1.0.1\n")
+        _, after_cache = memo_lookup("changelog_monitor", package, SESSION_START)
+        _bump(claude_root / "docs" / "ROADMAP.md", "Last checked: 1.0.1\n")
+        _, after_roadmap = memo_lookup("changelog_monitor", package, SESSION_START)
+
+        assert len({key, after_cache, after_roadmap}) == 3
+
+    def test_without_config_env(self, monkeypatch):
+        """Test a missing CLAUDE_CONFIG_YML_PATH disables the memo."""
+        monkeypatch.delenv("CLAUDE_CONFIG_YML_PATH", raising=False)
+
+        assert memo_lookup("session_context_injector", self.PACKAGE, SESSION_START) == (None, None)
@@ -0,0 +1,252 @@
+"""Tests for shared hook_protocol module."""
+
+import io
+import json
+from io import StringIO
+
+import pytest
+
+from claude_apps.shared.hook_protocol import (
+    CONTINUE,
+    HookEvent,
+    PromptEvent,
+    SessionEvent,
+    ToolEvent,
+    build_response,
+    dump_response,
+    iter_events,
+    read_events,
+    read_hook_event,
+    read_stdin,
+    scan_head,
+    scan_tail,
+    split_documents,
+    write_response,
+)
+
+POST_TOOL_USE = json.dumps(
+    {
+        "session_id": "abc",
+        "hook_event_name": "PostToolUse",
+        "tool_name": "Read",
+        "tool_input": {"file_path": "/x.py"},
+        "tool_response": {"file": {"content": "x" * 5000}},
+        "tool_use_id": "toolu_1",
+    }
+)
+
+
+class TestScanHead:
+    """Tests for scan_head function."""
+
+    def test_stops_at_first_structured_value(self):
+        """Test returns scalars before the first object/array."""
+        head, complete = scan_head(POST_TOOL_USE)
+
+        assert head == {"session_id": "abc", "hook_event_name": "PostToolUse", "tool_name": "Read"}
+        assert complete is False
+
+    def test_complete_for_flat_object(self):
+        """Test a flat object is fully scanned."""
+        head, complete = scan_head('{"a": 1, "b": "two", "c": null, "d": true}')
+
+        assert head == {"a": 1, "b": "two", "c": None, "d": True}
+        assert complete is True
+
+    def test_empty_object(self):
+        """Test empty object is complete and empty."""
+        assert scan_head("  {}  ") == ({}, True)
+
+    def test_decodes_escapes(self):
+        """Test string escapes in keys and values are decoded."""
+        head, _ = scan_head('{"k\\u00e9": "a\\"b"}')
+
+        assert head == {"ké": 'a"b'}
+
+    @pytest.mark.parametrize("raw", ["[1]", "not json", '{"a" 1}', '{"a": 1', '{"a": 1 "b": 2}'])
+    def test_rejects_malformed(self, raw: str):
+        """Test malformed heads raise ValueError."""
+        with pytest.raises(ValueError):
+            scan_head(raw)
+
+
+class TestScanTail:
+    """Tests for scan_tail function."""
+
+    def test_reads_trailing_scalars(self):
+        """Test scalars after the last structured value are decoded."""
+        assert scan_tail(POST_TOOL_USE) == {"tool_use_id": "toolu_1"}
+
+    def test_ignores_members_inside_strings(self):
+        """Test look-alike text inside a string value is not matched."""
+        raw = json.dumps({"a": 'x", "b": 1}'})
+
+        assert scan_tail(raw) == {}
+
+    def test_ignores_nested_members(self):
+        """Test members of a nested object closing the document are ignored."""
+        assert scan_tail('{"a": {"b": 1}}') == {}
+
+
+class TestHookEvent:
+    """Tests for HookEvent classes."""
+
+    def test_routing_fields_do_not_decode_payload(self):
+        """Test head and tail fields are served without a full decode."""
+        event = HookEvent.from_raw(POST_TOOL_USE)
+
+        assert isinstance(event, ToolEvent)
+        assert event.tool_name == "Read"
+        assert event.session_id == "abc"
+        assert event.tool_use_id == "toolu_1"
+        assert event._data is None
+
+    def test_heavy_fields_decode_on_access(self):
+        """Test tool_response triggers the full decode once."""
+        event = HookEvent.from_raw(POST_TOOL_USE)
+
+        assert event.tool_input == {"file_path": "/x.py"}
+        assert event._data is not None
+        assert event.tool_response["file"]["content"] == "x" * 5000
+
+    def test_behaves_as_mapping(self):
+        """Test dict-style access and equality with the decoded dict."""
+        event = HookEvent.from_raw(POST_TOOL_USE)
+
+        assert event["tool_name"] == "Read"
+        assert event.get("missing", "default") == "default"
+        assert "tool_input" in event
+        assert "missing" not in event
+        assert event == json.loads(POST_TOOL_USE)
+        assert dict(event) == json.loads(POST_TOOL_USE)
+        with pytest.raises(KeyError):
+            event["missing"]
+
+    def test_missing_key_on_flat_event_skips_decode(self):
+        """Test absent keys on a fully scanned event need no decode."""
+        raw = json.dumps({"hook_event_name": "Stop", "session_id": "s", "note": "n" * 5000})
+        event = HookEvent.from_raw(raw)
+
+        assert event.get("tool_name") is None
+        assert event._data is None
+        assert len(event) == 3
+
+    def test_small_event_decoded_eagerly(self):
+        """Test events below the lazy threshold are decoded up front."""
+        event = HookEvent.from_raw('{"hook_event_name": "Stop", "session_id": "s"}')
+
+        assert event._data == {"hook_event_name": "Stop", "session_id": "s"}
+        assert len(event) == 2
+
+    def test_small_non_object_rejected(self):
+        """Test a small document that is not an object raises ValueError."""
+        with pytest.raises(ValueError):
+            HookEvent.from_raw("[1, 2]")
+
+    def test_event_type_selection(self):
+        """Test the subclass follows hook_event_name."""
+        assert isinstance(HookEvent.from_dict({"hook_event_name": "UserPromptSubmit"}), PromptEvent)
+        assert isinstance(HookEvent.from_dict({"hook_event_name": "SessionStart"}), SessionEvent)
+        assert type(HookEvent.from_dict({"hook_event_name": "Stop"})) is HookEvent
+
+    def test_prompt_and_source(self):
+        """Test typed accessors on prompt and session events."""
+        prompt = HookEvent.from_dict({"hook_event_name": "UserPromptSubmit", "prompt": "hi"})
+        session = HookEvent.from_dict({"hook_event_name": "SessionStart", "source": "resume"})
+
+        assert prompt.prompt == "hi"
+        assert session.source == "resume"
+
+    def test_slotted(self):
+        """Test events carry no per-instance __dict__."""
+        assert not hasattr(HookEvent.from_raw(POST_TOOL_USE), "__dict__")
+
+    def test_to_json_reuses_raw(self):
+        """Test the raw text is returned without re-encoding."""
+        event = HookEvent.from_raw(POST_TOOL_USE)
+
+        assert event.to_json() is event.raw
+
+
+class TestReader:
+    """Tests for stdin reading and splitting."""
+
+    def test_read_stdin_prefers_buffer(self):
+        """Test binary buffer is read when present."""
+        stream = io.TextIOWrapper(io.BytesIO('{"a": "é"}'.encode()), encoding="utf-8")
+
+        assert read_stdin(stream) == '{"a": "é"}'
+
+    def test_split_single_pretty_document(self):
+        """Test pretty-printed input is one document."""
+        raw = '{\n  "a": 1,\n  "b": [1, 2]\n}\n'
+
+        assert split_documents(raw) == [raw.strip()]
+
+    def test_split_ndjson(self):
+        """Test one object per line is split into documents."""
+        assert split_documents('{"a": 1}\n{"b": 2}\n') == ['{"a": 1}', '{"b": 2}']
+
+    def test_ndjson_stops_at_blank_or_invalid_line(self):
+        """Test a blank or non-object line ends the batch."""
+        assert len(split_documents('{"a": 1}\n\n{"b": 2}')) == 1
+        assert len(split_documents('{"a": 1}\ninvalid\n{"b": 2}')) == 1
+
+    def test_iter_events_array(self):
+        """Test a JSON array yields one event per object."""
+        events = list(iter_events('[{"a": 1}, {"b": 2}]'))
+
+        assert events == [{"a": 1}, {"b": 2}]
+
+    def test_iter_events_invalid(self):
+        """Test unparseable input yields nothing."""
+        assert list(iter_events("not json")) == []
+        assert list(iter_events("[1, 2")) == []
+        assert list(iter_events("")) == []
+
+    def test_read_events_from_stream(self):
+        """Test read_events reads and splits a stream."""
+        events = read_events(StringIO('{"hook_event_name": "Stop"}\n'))
+
+        assert [e.hook_event_name for e in events] == ["Stop"]
+
+    def test_read_hook_event_returns_dict(self):
+        """Test legacy reader returns the first event as a dict."""
+        result = read_hook_event(StringIO('{"a": {"b": 1}}\n{"c": 2}\n'))
+
+        assert result == {"a": {"b": 1}}
+        assert type(result) is dict
+
+    def test_read_hook_event_truncated_body(self):
+        """Test a document broken past its head returns None."""
+        assert read_hook_event(StringIO('{"a": 1, "b": {"c": ')) is None
+
+
+class TestResponse:
+    """Tests for response serialization."""
+
+    def test_continue_fast_path(self):
+        """Test the default response is precomputed and valid JSON."""
+        assert json.loads(dump_response(dict(CONTINUE))) == CONTINUE
+
+    def test_build_response_with_context(self):
+        """Test additionalContext is nested under hookSpecificOutput."""
+        response = build_response("SessionStart", "ctx", system_message="note")
+
+        assert response["hookSpecificOutput"] == {
+            "hookEventName": "SessionStart",
+            "additionalContext": "ctx",
+        }
+        assert response["systemMessage"] == "note"
+
+    def test_build_response_without_context(self):
+        """Test empty context omits hookSpecificOutput."""
+        assert build_response("Stop") == CONTINUE
+
+    def test_write_response_writes_line(self):
+        """Test one JSON line is written."""
+        stream = StringIO()
+
+        write_response({"continue": False}, stream)
+
+        assert stream.getvalue() == '{"continue": false}\n'
@@ -0,0 +1,88 @@
+"""Tests for shared json_file module."""
+
+import json
+import multiprocessing
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.shared.json_file import lock_path, read_json_file, update_json_file
+
+
+def _increment(path, times):
+    def update(state):
+        state["n"] = state.get("n", 0) + 1
+        return True
+
+    for _ in range(times):
+        update_json_file(path, update)
+
+
+def _setter(**values):
+    def update(state):
+        state.update(values)
+        return True
+
+    return update
+
+
+class TestReadJsonFile:
+    """Tests for read_json_file function."""
+
+    def test_missing_or_invalid_is_empty(self, tmp_path):
+        """Test a missing, corrupt or non-object file reads as empty()."""
+        path = tmp_path / "state.json"
+        assert read_json_file(path) == {}
+
+        path.write_text("{not json")
+        assert read_json_file(path, lambda: {"version": 1}) == {"version": 1}
+
+        path.write_text("[1, 2]")
+        assert read_json_file(path) == {}
+
+
+class TestUpdateJsonFile:
+    """Tests for update_json_file function."""
+
+    def test_creates_directory_and_saves(self, tmp_path):
+        """Test the first update creates the directory, lock and file."""
+        path = tmp_path / "s1" / ".state.json"
+
+        assert update_json_file(path, _setter(a=1))
+
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert lock_path(path) == tmp_path / "s1" / ".state.lock"
+        assert sorted(p.name for p in path.parent.iterdir()) == [".state.json", ".state.lock"]
+
+    def test_unchanged_state_is_not_written(self, tmp_path):
+        """Test an update returning False leaves the file untouched."""
+        path = tmp_path / "state.json"
+
+        assert not update_json_file(path, lambda state: False)
+
+        assert not path.exists()
+
+    def test_failed_write_keeps_previous_content(self, tmp_path):
+        """Test a failing rename leaves the last complete file and no tmp file."""
+        path = tmp_path / "state.json"
+        update_json_file(path, _setter(a=1))
+
+        with patch(
+            "claude_apps.shared.json_file.locked.os.replace", side_effect=OSError(28, "ENOSPC")
+        ):
+            with pytest.raises(OSError):
+                update_json_file(path, _setter(a=2))
+
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["state.json", "state.lock"]
+
+    def test_concurrent_updates_are_not_lost(self, tmp_path):
+        """Test updates from several processes all land."""
+        path = tmp_path / "state.json"
+        workers = [multiprocessing.Process(target=_increment, args=(path, 50)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+
+        assert read_json_file(path) == {"n": 200}
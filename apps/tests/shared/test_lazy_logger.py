@@ -0,0 +1,63 @@
+"""Tests for config_helper lazy_logger module."""
+
+import io
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.shared.config_helper import lazy_logger
+from claude_apps.shared.config_helper.lazy_logger import LazyLogger, get_lazy_logger
+
+
+@pytest.fixture(autouse=True)
+def reset_configured():
+    """Let each test configure structlog from scratch."""
+    with patch.object(lazy_logger, "_configured", False):
+        yield
+
+
+class TestLazyLogger:
+    """Tests for LazyLogger class."""
+
+    def test_below_level_does_not_resolve(self):
+        """Test calls below the threshold never build a structlog logger."""
+        log = LazyLogger(level="INFO")
+
+        with patch.object(LazyLogger, "_resolve") as mock_resolve:
+            log.debug("quiet", key="value")
+
+        mock_resolve.assert_not_called()
+
+    def test_at_level_resolves_once(self):
+        """Test the first emitted call resolves and later calls reuse it."""
+        log = LazyLogger(level="INFO")
+
+        with patch.object(sys, "stderr", io.StringIO()):
+            log.info("first")
+            first = log._logger
+            log.warning("second")
+
+        assert first is not None
+        assert log._logger is first
+
+    def test_writes_to_current_stderr(self):
+        """Test output goes to sys.stderr as it is when the call happens."""
+        log = get_lazy_logger(json_output=True)
+        stderr = io.StringIO()
+        stdout = io.StringIO()
+
+        with patch.object(sys, "stderr", stderr), patch.object(sys, "stdout", stdout):
+            log.info("hello_event", key="value")
+
+        assert "hello_event" in stderr.getvalue()
+        assert stdout.getvalue() == ""
+
+    def test_unknown_level_defaults_to_info(self):
+        """Test unrecognised level names fall back to INFO."""
+        log = LazyLogger(level="bogus")
+
+        with patch.object(LazyLogger, "_resolve") as mock_resolve:
+            log.debug("quiet")
+
+        mock_resolve.assert_not_called()
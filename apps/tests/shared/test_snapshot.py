@@ -0,0 +1,154 @@
+"""Tests for config_helper snapshot module."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_apps.shared.config_helper import get_global_config, get_hook_config, snapshot
+from claude_apps.shared.config_helper.snapshot import (
+    clear_config_snapshots,
+    get_snapshot_key,
+    get_snapshot_path,
+    load_config_snapshot,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_snapshots(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Keep snapshots in tmp_path and start each test with an empty memo."""
+    monkeypatch.setenv("CLAUDE_DATA_PATH", str(tmp_path / ".data"))
+    clear_config_snapshots()
+    yield
+    clear_config_snapshots()
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    path = tmp_path / "config.yml"
+    path.write_text("hooks:\n  logger:\n    enabled: true\n")
+    return path
+
+
+def _bump(path: Path, content: str) -> None:
+    """Rewrite a file and move its mtime forward so the change is visible."""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestLoadConfigSnapshot:
+    """Tests for load_config_snapshot function."""
+
+    def test_parses_yaml(self, config_file: Path):
+        """Test returns parsed config."""
+        assert load_config_snapshot(config_file) == {"hooks": {"logger": {"enabled": True}}}
+
+    def test_missing_file_returns_empty(self, tmp_path: Path):
+        """Test a missing file yields an empty dict."""
+        assert load_config_snapshot(tmp_path / "absent.yml") == {}
+
+    def test_empty_file_returns_empty(self, tmp_path: Path):
+        """Test an empty document yields an empty dict."""
+        path = tmp_path / "config.yml"
+        path.write_text("")
+
+        assert load_config_snapshot(path) == {}
+
+    def test_parses_once_while_unchanged(self, config_file: Path):
+        """Test repeated loads reuse the in-process snapshot."""
+        with patch.object(snapshot, "parse_yaml_file", wraps=snapshot.parse_yaml_file) as parse:
+            load_config_snapshot(config_file)
+            load_config_snapshot(config_file)
+
+        assert parse.call_count == 1
+
+    def test_snapshot_key_tracks_changes(self, config_file: Path, tmp_path: Path):
+        """Test the snapshot key changes with the file and is None when missing."""
+        key = get_snapshot_key(config_file)
+        _bump(config_file, "hooks: {}\n")
+
+        assert get_snapshot_key(config_file) not in (None, key)
+        assert get_snapshot_key(tmp_path / "missing.yml") is None
+
+    def test_reparses_after_change(self, config_file: Path):
+        """Test a modified file is parsed again."""
+        load_config_snapshot(config_file)
+        _bump(config_file, "hooks:\n  logger:\n    enabled: false\n")
+
+        assert load_config_snapshot(config_file)["hooks"]["logger"]["enabled"] is False
+
+    def test_disk_snapshot_skips_parse(self, config_file: Path):
+        """Test a new process (empty memo) reads the on-disk snapshot."""
+        load_config_snapshot(config_file)
+        clear_config_snapshots()
+
+        with patch.object(snapshot, "parse_yaml_file") as parse:
+            result = load_config_snapshot(config_file)
+
+        parse.assert_not_called()
+        assert result == {"hooks": {"logger": {"enabled": True}}}
+        assert get_snapshot_path(config_file).exists()
+
+    def test_stale_disk_snapshot_ignored(self, config_file: Path):
+        """Test an on-disk snapshot for an older file version is not used."""
+        load_config_snapshot(config_file)
+        clear_config_snapshots()
+        _bump(config_file, "hooks: {}\n")
+
+        assert load_config_snapshot(config_file) == {"hooks": {}}
+
+    def test_corrupt_disk_snapshot_reparsed(self, config_file: Path):
+        """Test a damaged snapshot falls back to parsing YAML."""
+        load_config_snapshot(config_file)
+        clear_config_snapshots()
+        snapshot_path = get_snapshot_path(config_file)
+        header = snapshot_path.read_text().splitlines()[0]
+        snapshot_path.write_text(header + "\n{not json")
+
+        assert load_config_snapshot(config_file)["hooks"]["logger"]["enabled"] is True
+
+    def test_returns_independent_copies(self, config_file: Path):
+        """Test mutating a result does not affect later loads."""
+        first = load_config_snapshot(config_file)
+        first["hooks"]["logger"]["enabled"] = False
+
+        assert load_config_snapshot(config_file)["hooks"]["logger"]["enabled"] is True
+
+    def test_non_json_values_not_snapshotted(self, tmp_path: Path):
+        """Test YAML that does not survive JSON keeps its native types."""
+        path = tmp_path / "config.yml"
+        path.write_text("released: 2025-01-02\n1: one\n")
+
+        result = load_config_snapshot(path)
+
+        assert result[1] == "one"
+        assert str(result["released"]) == "2025-01-02"
+        assert not get_snapshot_path(path).exists()
+
+    def test_snapshot_path_without_env(self, config_file: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test snapshots fall back to .data next to the config."""
+        monkeypatch.delenv("CLAUDE_DATA_PATH")
+        monkeypatch.delenv("CLAUDE_CONFIG_YML_PATH", raising=False)
+
+        assert get_snapshot_path(config_file).parent == config_file.parent / ".data" / "cache"
+
+
+class TestGetGlobalConfig:
+    """Tests for get_global_config reading through snapshots."""
+
+    def test_reads_configured_file(self, config_file: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test global and hook config come from CLAUDE_CONFIG_YML_PATH."""
+        monkeypatch.setenv("CLAUDE_CONFIG_YML_PATH", str(config_file))
+
+        assert get_global_config()["hooks"]["logger"]["enabled"] is True
+        assert get_hook_config("logger") == {"enabled": True}
+        assert get_hook_config("missing") == {}
+
+    def test_requires_env(self, monkeypatch: pytest.MonkeyPatch):
+        """Test missing CLAUDE_CONFIG_YML_PATH still raises."""
+        monkeypatch.delenv("CLAUDE_CONFIG_YML_PATH", raising=False)
+
+        with pytest.raises(EnvironmentError):
+            get_global_config()
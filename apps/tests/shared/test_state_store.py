@@ -0,0 +1,139 @@
+"""Tests for shared state_store module."""
+
+import multiprocessing
+import time
+
+import pytest
+
+from claude_apps.shared.state_store import (
+    StateStore,
+    StateStoreError,
+    get_state_path,
+    get_state_store,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    with StateStore(tmp_path / "state.sqlite3") as store:
+        yield store
+
+
+def _increment(db_path, count):
+    with StateStore(db_path) as store:
+        for _ in range(count):
+            store.update("ns", "counter", lambda value: value + 1, default=0)
+
+
+class TestStateStore:
+    """Tests for the StateStore class."""
+
+    def test_set_and_get(self, store):
+        """Test values round-trip as JSON and versions grow per write."""
+        assert store.set("ns", "key", {"a": [1, 2]}) == 1
+        assert store.set("ns", "key", {"a": [3]}) == 2
+
+        entry = store.get_entry("ns", "key")
+
+        assert entry.value == {"a": [3]}
+        assert entry.version == 2
+        assert store.get("ns", "missing", "default") == "default"
+        assert store.get("other", "key") is None
+
+    def test_compare_and_set(self, store):
+        """Test a write succeeds only at the version the caller read."""
+        assert store.compare_and_set("ns", "key", "first", None)
+        assert not store.compare_and_set("ns", "key", "again", None)
+
+        version = store.get_entry("ns", "key").version
+
+        assert store.compare_and_set("ns", "key", "second", version)
+        assert not store.compare_and_set("ns", "key", "stale", version)
+        assert store.get("ns", "key") == "second"
+
+    def test_update(self, store):
+        """Test update applies fn to the current value or the default."""
+        assert store.update("ns", "list", lambda value: value + ["a"], default=[]) == ["a"]
+        assert store.update("ns", "list", lambda value: value + ["b"], default=[]) == ["a", "b"]
+
+    def test_failed_update_rolls_back(self, store):
+        """Test an exception from fn leaves the stored value unchanged."""
+        store.set("ns", "key", 1)
+
+        with pytest.raises(ValueError):
+            store.update("ns", "key", lambda value: int("x"))
+
+        assert store.get_entry("ns", "key").version == 1
+
+    def test_ttl_expiry(self, store):
+        """Test expired entries read as absent and are purged."""
+        store.set("ns", "short", "gone", ttl=0.05)
+        store.set("ns", "long", "kept", ttl=60)
+        store.set("ns", "forever", "kept")
+        time.sleep(0.1)
+
+        assert store.get("ns", "short") is None
+        assert store.get_namespace("ns") == {"long": "kept", "forever": "kept"}
+        assert store.purge_expired() == 1
+
+    def test_expired_entry_can_be_claimed(self, store):
+        """Test compare_and_set treats an expired entry as absent."""
+        store.set("ns", "claim", "old", ttl=0.05)
+        time.sleep(0.1)
+
+        assert store.compare_and_set("ns", "claim", "new", None)
+        assert store.get_entry("ns", "claim").version == 2
+
+    def test_delete(self, store):
+        """Test delete reports whether a live entry was removed."""
+        store.set("ns", "key", 1)
+
+        assert store.delete("ns", "key")
+        assert not store.delete("ns", "key")
+
+    def test_no_lost_updates_across_processes(self, tmp_path):
+        """Test concurrent processes updating one key lose no increments."""
+        db_path = tmp_path / "state.sqlite3"
+        StateStore(db_path).close()
+        workers = [multiprocessing.Process(target=_increment, args=(db_path, 50)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+
+        with StateStore(db_path) as store:
+            assert store.get("ns", "counter") == 200
+
+    def test_unopenable_database_raises(self, tmp_path):
+        """Test errors surface as StateStoreError."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        with pytest.raises(StateStoreError):
+            StateStore(blocker / "state.sqlite3")
+
+
+class TestGetStateStore:
+    """Tests for get_state_store function."""
+
+    def test_default_path_under_data(self, tmp_path, monkeypatch):
+        """Test the default database lives in the data directory."""
+        monkeypatch.setenv("CLAUDE_DATA_PATH", str(tmp_path))
+
+        assert get_state_path() == tmp_path / "state" / "hooks.sqlite3"
+        assert get_state_store().db_path == get_state_path()
+
+    def test_store_is_shared(self, tmp_path):
+        """Test one store is opened per database per process."""
+        path = tmp_path / "state.sqlite3"
+
+        assert get_state_store(path) is get_state_store(path)
+
+    def test_unresolvable_path_raises(self, monkeypatch):
+        """Test a missing data path surfaces as StateStoreError."""
+        monkeypatch.delenv("CLAUDE_DATA_PATH", raising=False)
+        monkeypatch.delenv("CLAUDE_CONFIG_YML_PATH", raising=False)
+        monkeypatch.delenv("CLAUDE_PATH", raising=False)
+
+        with pytest.raises(StateStoreError):
+            get_state_store()
@@ -0,0 +1,97 @@
+"""Tests for config_helper validation module."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude_apps.shared.config_helper import validation
+from claude_apps.shared.config_helper.validation import get_validated_config
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Point the on-disk cache at tmp_path and clear the in-process memo."""
+    monkeypatch.setenv("CLAUDE_DATA_PATH", str(tmp_path / ".data"))
+    with patch.dict(validation._memo, clear=True):
+        yield tmp_path / ".data" / "cache" / "config"
+
+
+def _validator(result=None) -> MagicMock:
+    return MagicMock(side_effect=lambda loaded: result or {**loaded, "validated": True})
+
+
+class TestGetValidatedConfig:
+    """Tests for get_validated_config function."""
+
+    def test_validates_on_first_call(self):
+        """Test calls validate and returns its result."""
+        validate = _validator()
+
+        result = get_validated_config("demo", {"a": 1}, validate)
+
+        assert result == {"a": 1, "validated": True}
+        validate.assert_called_once_with({"a": 1})
+
+    def test_memoizes_identical_input(self):
+        """Test identical input is validated only once."""
+        validate = _validator()
+
+        get_validated_config("demo", {"a": 1}, validate)
+        get_validated_config("demo", {"a": 1}, validate)
+
+        assert validate.call_count == 1
+
+    def test_revalidates_changed_input(self):
+        """Test a changed section is validated again."""
+        validate = _validator()
+
+        get_validated_config("demo", {"a": 1}, validate)
+        result = get_validated_config("demo", {"a": 2}, validate)
+
+        assert validate.call_count == 2
+        assert result["a"] == 2
+
+    def test_uses_disk_cache_across_processes(self, isolated_cache: Path):
+        """Test a fresh memo is served from the on-disk cache."""
+        get_validated_config("demo", {"a": 1}, _validator())
+        validation._memo.clear()
+        validate = _validator()
+
+        result = get_validated_config("demo", {"a": 1}, validate)
+
+        assert result == {"a": 1, "validated": True}
+        validate.assert_not_called()
+        assert (isolated_cache / "demo.json").exists()
+        # Written through a per-process tmp file, which is renamed away
+        assert [p.name for p in isolated_cache.iterdir()] == ["demo.json"]
+
+    def test_schema_change_invalidates(self, tmp_path: Path):
+        """Test editing the schema file forces revalidation."""
+        schema = tmp_path / "schemas.py"
+        schema.write_text("v1")
+        validate = _validator()
+
+        get_validated_config("demo", {"a": 1}, validate, schema)
+        schema.write_text("version two")
+        get_validated_config("demo", {"a": 1}, validate, schema)
+
+        assert validate.call_count == 2
+
+    def test_returns_independent_copies(self):
+        """Test callers cannot mutate the cached result."""
+        validate = _validator()
+
+        first = get_validated_config("demo", {"a": 1}, validate)
+        first["a"] = 99
+
+        assert get_validated_config("demo", {"a": 1}, validate)["a"] == 1
+
+    def test_validation_errors_propagate(self):
+        """Test errors raised by validate are not swallowed or cached."""
+        validate = MagicMock(side_effect=ValueError("bad"))
+
+        with pytest.raises(ValueError, match="bad"):
+            get_validated_config("demo", {"a": 1}, validate)
+
+        assert "demo" not in validation._memo
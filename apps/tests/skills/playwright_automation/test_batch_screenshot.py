@@ -0,0 +1,225 @@
+"""Tests for batch screenshot utility."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from claude_apps.skills.playwright_automation.batch_screenshot import (
+    Capture,
+    Manifest,
+    output_name,
+    parse_manifest,
+    parse_viewport,
+    run_batch,
+)
+
+MODULE = "claude_apps.skills.playwright_automation.batch_screenshot"
+
+
+@pytest.fixture(autouse=True)
+def cold_browser(monkeypatch):
+    """Launch a browser per call (these tests cover the launch path)."""
+    monkeypatch.setenv("CLAUDE_BROWSER_POOL", "0")
+
+
+@pytest.fixture
+def screencap_dir(tmp_path):
+    with patch(f"{MODULE}.SCREENCAP_DIR", str(tmp_path)):
+        yield tmp_path
+
+
+def fake_playwright(goto=None):
+    """Mock async Playwright whose pages run goto (an async function of url)."""
+    pages = []
+
+    async def new_context(**options):
+        page = MagicMock()
+        page.goto = AsyncMock(side_effect=goto)
+        page.wait_for_timeout = AsyncMock()
+        page.screenshot = AsyncMock()
+        page.viewport = options["viewport"]
+        pages.append(page)
+        context = MagicMock()
+        context.new_page = AsyncMock(return_value=page)
+        context.close = AsyncMock()
+        return context
+
+    browser = MagicMock()
+    browser.new_context = AsyncMock(side_effect=new_context)
+    browser.close = AsyncMock()
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(return_value=browser)
+
+    patcher = patch(f"{MODULE}.async_playwright")
+    patcher.start().return_value.__aenter__.return_value = playwright
+    return patcher, browser, pages
+
+
+class TestParseManifest:
+    """Tests for manifest parsing."""
+
+    def test_cross_product_and_explicit_captures(self):
+        """Test urls x viewports x full_page are expanded before explicit captures."""
+        manifest = parse_manifest(
+            {
+                "urls": ["https://a.test", "https://b.test"],
+                "viewports": ["1920x1080", {"width": 390, "height": 844}],
+                "full_page": [True, False],
+                "captures": [{"url": "https://c.test", "viewport": "800x600", "output": "c.png"}],
+                "settle_ms": 0,
+            }
+        )
+
+        assert len(manifest.captures) == 9
+        assert manifest.captures[0] == Capture("https://a.test", 1920, 1080, True)
+        assert manifest.captures[3] == Capture("https://a.test", 390, 844, False)
+        assert manifest.captures[-1] == Capture("https://c.test", 800, 600, True, "c.png")
+        assert manifest.settle_ms == 0
+        assert manifest.wait_until == "domcontentloaded"
+
+    def test_defaults(self):
+        """Test a bare URL list uses the default viewport and full page."""
+        manifest = parse_manifest({"urls": ["https://a.test"]})
+
+        assert manifest.captures == [Capture("https://a.test", 1920, 1080, True)]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            [],
+            {},
+            {"urls": ["https://a.test"], "viewports": ["wide"]},
+            {"urls": ["https://a.test"], "viewports": ["0x100"]},
+            {"urls": ["https://a.test"], "wait_until": "never"},
+            {"captures": [{"viewport": "800x600"}]},
+            {"captures": [{"url": "https://a.test", "output": "/tmp/a.png"}]},
+            {"captures": [{"url": "https://a.test", "output": "../a.png"}]},
+            {"captures": [{"url": "https://a.test", "output": "shots/../../a.png"}]},
+            {
+                "captures": [
+                    {"url": "https://a.test", "output": "a.png"},
+                    {"url": "https://b.test", "output": "./a.png"},
+                ]
+            },
+        ],
+    )
+    def test_invalid_manifest(self, data):
+        """Test malformed manifests and unsafe or shared outputs raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_manifest(data)
+
+    def test_output_in_subdirectory(self):
+        """Test an explicit output may name a path inside the batch directory."""
+        manifest = parse_manifest({"captures": [{"url": "https://a.test", "output": "m/a.png"}]})
+
+        assert manifest.captures[0].output == "m/a.png"
+
+    def test_parse_viewport(self):
+        """Test both viewport notations."""
+        assert parse_viewport("390X844") == (390, 844)
+        assert parse_viewport({"width": 390, "height": 844}) == (390, 844)
+
+    def test_output_names_are_unique_per_capture(self):
+        """Test generated names include index, domain and viewport."""
+        capture = Capture("https://example.com:8080/a", 390, 844, False)
+
+        assert output_name(7, capture) == "007_example-com-8080_390x844.png"
+        assert output_name(0, Capture("https://a.test", 1, 1, True, "x.png")) == "x.png"
+
+
+class TestRunBatch:
+    """Tests for run_batch function."""
+
+    def test_captures_all_and_writes_report(self, screencap_dir):
+        """Test every capture is taken in one browser and reported."""
+        manifest = parse_manifest(
+            {"urls": ["https://a.test", "https://b.test"], "viewports": ["1920x1080", "390x844"]}
+        )
+        patcher, browser, pages = fake_playwright()
+        try:
+            with patch(f"{MODULE}.touch") as touch:
+                report = run_batch(manifest, output_dir="sweep")
+        finally:
+            patcher.stop()
+
+        assert report["ok"] == 4
+        assert report["failed"] == 0
+        assert touch.call_count == 4
+        assert {tuple(p.viewport.values()) for p in pages} == {(1920, 1080), (390, 844)}
+        for page in pages:
+            page.wait_for_timeout.assert_awaited_once_with(2000)
+        browser.close.assert_awaited_once()
+
+        saved = json.loads((screencap_dir / "sweep" / "report.json").read_text())
+        assert saved["captures"][1]["viewport"] == "390x844"
+        expected = screencap_dir / "sweep" / "001_a-test_390x844_full.png"
+        assert saved["captures"][1]["output"] == str(expected)
+        assert all(c["status"] == "ok" and c["total_ms"] >= 0 for c in saved["captures"])
+
+    def test_concurrency_is_bounded(self, screencap_dir):
+        """Test no more than concurrency captures navigate at once."""
+        running = 0
+        peak = 0
+
+        async def goto(url, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        manifest = Manifest([Capture(f"https://{i}.test", 800, 600) for i in range(8)], settle_ms=0)
+        patcher, _, pages = fake_playwright(goto)
+        try:
+            report = run_batch(manifest, concurrency=3)
+        finally:
+            patcher.stop()
+
+        assert report["ok"] == 8
+        assert peak == 3
+        assert all(not p.wait_for_timeout.await_count for p in pages)
+
+    def test_failed_capture_does_not_stop_others(self, screencap_dir):
+        """Test a failing URL is reported while the rest are captured."""
+
+        async def goto(url, **kwargs):
+            if "bad" in url:
+                raise RuntimeError("net::ERR_NAME_NOT_RESOLVED")
+
+        manifest = Manifest(
+            [Capture("https://bad.test", 800, 600), Capture("https://ok.test", 800, 600)]
+        )
+        patcher, _, _ = fake_playwright(goto)
+        try:
+            report = run_batch(manifest)
+        finally:
+            patcher.stop()
+
+        bad, ok = report["captures"]
+        assert bad["status"] == "error"
+        assert "ERR_NAME_NOT_RESOLVED" in bad["error"]
+        assert ok["status"] == "ok"
+        assert report["failed"] == 1
+
+    def test_timeout_falls_back_to_domcontentloaded(self, screencap_dir):
+        """Test a timed-out wait strategy is retried with domcontentloaded."""
+
+        async def goto(url, wait_until, timeout):
+            if wait_until == "networkidle":
+                raise PlaywrightTimeoutError("timeout")
+
+        manifest = Manifest([Capture("https://a.test", 800, 600)], wait_until="networkidle")
+        patcher, _, pages = fake_playwright(goto)
+        try:
+            report = run_batch(manifest)
+        finally:
+            patcher.stop()
+
+        assert report["ok"] == 1
+        assert [c.kwargs["wait_until"] for c in pages[0].goto.await_args_list] == [
+            "networkidle",
+            "domcontentloaded",
+        ]
@@ -0,0 +1,369 @@
+"""Tests for the warm browser server and context pool."""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from claude_apps.skills.playwright_automation.browser_pool import (
+    BrowserPool,
+    PoolUnavailableError,
+    ServerState,
+    clear_state,
+    ensure_server,
+    has_clients,
+    idle_seconds,
+    is_healthy,
+    is_server,
+    open_async_browser,
+    open_browser,
+    pool_enabled,
+    read_state,
+    serve,
+    stop_server,
+    write_state,
+)
+
+MODULE = "claude_apps.skills.playwright_automation.browser_pool"
+
+
+@pytest.fixture(autouse=True)
+def claude_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLAUDE_PATH", str(tmp_path))
+    monkeypatch.delenv("CLAUDE_BROWSER_POOL", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def cdp_targets():
+    """Targets the cdp_endpoint lists (append to open a page)."""
+    return []
+
+
+@pytest.fixture
+def cdp_endpoint(cdp_targets):
+    """A local HTTP server answering like a CDP endpoint."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802 - BaseHTTPRequestHandler API
+            if self.path == "/json/list":
+                body = json.dumps(cdp_targets)
+            else:
+                body = json.dumps({"webSocketDebuggerUrl": "ws://127.0.0.1/devtools/browser/x"})
+            self.send_response(200 if self.path in ("/json/version", "/json/list") else 404)
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fake_server():
+    """A process whose command line looks like a running browser_pool server."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", "print(flush=True); import time; time.sleep(30)"]
+        + ["x/browser_pool", "serve"],
+        stdout=subprocess.PIPE,
+    )
+    # Wait until /proc shows its own command line
+    process.stdout.readline()
+    yield process
+    process.kill()
+    process.wait()
+    process.stdout.close()
+
+
+class TestState:
+    """Tests for the server state file."""
+
+    def test_roundtrip(self):
+        """Test the recorded server is read back."""
+        write_state(ServerState(123, "http://127.0.0.1:9", 1.0))
+
+        assert read_state() == ServerState(123, "http://127.0.0.1:9", 1.0)
+
+    def test_clear_only_own_state(self):
+        """Test a server does not remove a successor's state."""
+        write_state(ServerState(123, "http://127.0.0.1:9", 1.0))
+
+        clear_state(456)
+        assert read_state() is not None
+
+        clear_state(123)
+        assert read_state() is None
+
+    def test_idle_seconds_from_last_use(self, claude_path):
+        """Test idle time is measured from the state file's mtime."""
+        write_state(ServerState(123, "http://127.0.0.1:9", 1.0))
+        path = claude_path / ".data/playwright/browser_pool.json"
+        os.utime(path, (time.time() - 60, time.time() - 60))
+
+        assert idle_seconds() >= 59
+
+    def test_pool_enabled(self, monkeypatch):
+        """Test CLAUDE_BROWSER_POOL=0 disables the warm server."""
+        assert pool_enabled()
+
+        monkeypatch.setenv("CLAUDE_BROWSER_POOL", "0")
+
+        assert not pool_enabled()
+
+
+class TestHealth:
+    """Tests for is_server and is_healthy."""
+
+    def test_is_server(self, fake_server):
+        """Test only a browser_pool server process is recognized."""
+        assert is_server(fake_server.pid)
+        assert not is_server(os.getpid())
+
+    def test_is_healthy(self, cdp_endpoint):
+        """Test a CDP endpoint answering /json/version is healthy."""
+        assert is_healthy(cdp_endpoint)
+
+    def test_unreachable_is_unhealthy(self):
+        """Test a closed port is unhealthy."""
+        assert not is_healthy("http://127.0.0.1:9", timeout=0.2)
+
+    def test_has_clients(self, cdp_endpoint, cdp_targets):
+        """Test only open page targets count as clients."""
+        assert not has_clients(cdp_endpoint)
+
+        cdp_targets.append({"type": "service_worker", "url": "https://a.test/sw.js"})
+        assert not has_clients(cdp_endpoint)
+
+        cdp_targets.append({"type": "page", "url": "https://a.test"})
+        assert has_clients(cdp_endpoint)
+        assert not has_clients("http://127.0.0.1:9", timeout=0.2)
+
+
+class TestServe:
+    """Tests for the serve loop."""
+
+    def _serve(self, has_clients_results):
+        playwright = MagicMock()
+        browser = playwright.chromium.launch.return_value
+        browser.is_connected.return_value = True
+        with (
+            patch("playwright.sync_api.sync_playwright") as sync_playwright,
+            patch(f"{MODULE}.signal.signal"),
+            patch(f"{MODULE}.idle_seconds", return_value=1000.0),
+            patch(f"{MODULE}.has_clients", side_effect=has_clients_results) as clients,
+            patch(f"{MODULE}.touch") as touch,
+            patch(f"{MODULE}.time.sleep"),
+        ):
+            sync_playwright.return_value.__enter__.return_value = playwright
+            assert serve(idle_timeout=300) == 0
+        return browser, clients, touch
+
+    def test_idle_server_shuts_down(self):
+        """Test a server idle past the timeout with no pages open exits."""
+        browser, clients, touch = self._serve([False])
+
+        clients.assert_called_once()
+        touch.assert_not_called()
+        browser.close.assert_called_once()
+        assert read_state() is None
+
+    def test_connected_client_keeps_server_up(self):
+        """Test open pages count as use even after idle_timeout without a touch."""
+        browser, clients, touch = self._serve([True, True, False])
+
+        assert clients.call_count == 3
+        assert touch.call_count == 2
+        browser.close.assert_called_once()
+
+
+class TestEnsureServer:
+    """Tests for ensure_server function."""
+
+    def test_reuses_healthy_server(self, fake_server, cdp_endpoint):
+        """Test a healthy recorded server is used without starting another."""
+        write_state(ServerState(fake_server.pid, cdp_endpoint, time.time()))
+
+        with patch(f"{MODULE}.subprocess.Popen") as popen:
+            assert ensure_server() == cdp_endpoint
+
+        popen.assert_not_called()
+
+    def test_starts_server_when_none(self, cdp_endpoint):
+        """Test a server is started and waited for when none runs."""
+        process = MagicMock(pid=4242)
+        process.poll.return_value = None
+
+        def start(*args, **kwargs):
+            write_state(ServerState(4242, cdp_endpoint, time.time()))
+            return process
+
+        with patch(f"{MODULE}.subprocess.Popen", side_effect=start) as popen:
+            assert ensure_server() == cdp_endpoint
+
+        args = popen.call_args[0][0]
+        assert args[1:4] == ["-m", MODULE, "serve"]
+        assert popen.call_args[1]["start_new_session"] is True
+
+    def test_replaces_unhealthy_server(self, fake_server, cdp_endpoint):
+        """Test a server failing its health check is stopped and replaced."""
+        write_state(ServerState(fake_server.pid, "http://127.0.0.1:9", time.time()))
+        process = MagicMock(pid=4242)
+        process.poll.return_value = None
+
+        def start(*args, **kwargs):
+            write_state(ServerState(4242, cdp_endpoint, time.time()))
+            return process
+
+        with patch(f"{MODULE}.subprocess.Popen", side_effect=start):
+            assert ensure_server() == cdp_endpoint
+
+        assert fake_server.wait(5) is not None
+
+    def test_server_exit_raises(self):
+        """Test a server that exits during startup raises PoolUnavailableError."""
+        process = MagicMock(pid=4242, returncode=1)
+        process.poll.return_value = 1
+
+        with patch(f"{MODULE}.subprocess.Popen", return_value=process):
+            with pytest.raises(PoolUnavailableError):
+                ensure_server()
+
+    def test_stop_server(self, fake_server):
+        """Test stop signals the recorded server."""
+        write_state(ServerState(fake_server.pid, "http://127.0.0.1:9", time.time()))
+
+        assert stop_server()
+        assert fake_server.wait(5) is not None
+        assert not stop_server()
+
+
+class TestOpenBrowser:
+    """Tests for open_browser function."""
+
+    def test_connects_to_warm_server(self):
+        """Test the warm server's endpoint is connected to."""
+        playwright = MagicMock()
+
+        with patch(f"{MODULE}.ensure_server", return_value="http://127.0.0.1:1"):
+            with open_browser(playwright) as browser:
+                assert browser is playwright.chromium.connect_over_cdp.return_value
+
+        playwright.chromium.connect_over_cdp.assert_called_once_with("http://127.0.0.1:1")
+        playwright.chromium.launch.assert_not_called()
+        browser.close.assert_called_once()
+
+    def test_falls_back_to_launch(self):
+        """Test an unavailable server falls back to launching Chromium."""
+        playwright = MagicMock()
+
+        with patch(f"{MODULE}.ensure_server", side_effect=PoolUnavailableError("down")):
+            with open_browser(playwright) as browser:
+                assert browser is playwright.chromium.launch.return_value
+
+    def test_cold_or_disabled_launches(self, monkeypatch):
+        """Test warm=False or CLAUDE_BROWSER_POOL=0 never starts a server."""
+        playwright = MagicMock()
+
+        with patch(f"{MODULE}.ensure_server") as ensure:
+            with open_browser(playwright, warm=False):
+                pass
+            monkeypatch.setenv("CLAUDE_BROWSER_POOL", "0")
+            with open_browser(playwright):
+                pass
+
+        ensure.assert_not_called()
+        assert playwright.chromium.launch.call_count == 2
+
+    def test_async_connects_or_falls_back(self):
+        """Test the async variant connects to the server or launches."""
+        playwright = MagicMock()
+        playwright.chromium.connect_over_cdp = AsyncMock()
+        playwright.chromium.launch = AsyncMock()
+
+        async def acquire():
+            async with open_async_browser(playwright) as browser:
+                return browser
+
+        with patch(f"{MODULE}.ensure_server", return_value="http://127.0.0.1:1"):
+            warm = asyncio.run(acquire())
+        with patch(f"{MODULE}.ensure_server", side_effect=PoolUnavailableError("down")):
+            cold = asyncio.run(acquire())
+
+        playwright.chromium.connect_over_cdp.assert_awaited_once_with("http://127.0.0.1:1")
+        assert warm is playwright.chromium.connect_over_cdp.return_value
+        assert cold is playwright.chromium.launch.return_value
+        warm.close.assert_awaited()
+
+
+class TestBrowserPool:
+    """Tests for the BrowserPool class."""
+
+    def test_reuses_context_for_same_options(self):
+        """Test a released context is handed out again for the same options."""
+        browser = MagicMock()
+        browser.new_context.side_effect = lambda **_: MagicMock()
+        pool = BrowserPool(browser)
+
+        with pool.context(viewport={"width": 800, "height": 600}) as first:
+            pass
+        with pool.context(viewport={"width": 800, "height": 600}) as second:
+            pass
+        with pool.context(viewport={"width": 1024, "height": 768}) as third:
+            pass
+
+        assert second is first
+        assert third is not first
+        assert browser.new_context.call_count == 2
+        first.clear_cookies.assert_called()
+        first.close.assert_not_called()
+
+    def test_video_contexts_are_not_reused(self):
+        """Test a recording context is closed on release."""
+        browser = MagicMock()
+        pool = BrowserPool(browser)
+
+        with pool.context(record_video_dir="/tmp/v") as context:
+            pass
+
+        context.close.assert_called_once()
+
+    def test_failed_lease_closes_context(self):
+        """Test a context whose lease raised is not reused."""
+        browser = MagicMock()
+        pool = BrowserPool(browser)
+
+        with pytest.raises(RuntimeError):
+            with pool.context() as context:
+                raise RuntimeError("page crashed")
+
+        context.close.assert_called_once()
+
+    def test_max_idle_and_close(self):
+        """Test at most max_idle contexts are kept and close() closes them."""
+        browser = MagicMock()
+        browser.new_context.side_effect = lambda **_: MagicMock()
+        pool = BrowserPool(browser, max_idle=1)
+
+        with pool.context() as outer, pool.context() as inner:
+            pass
+
+        # inner is released first and kept; outer finds the pool full
+        outer.close.assert_called_once()
+        inner.close.assert_not_called()
+
+        pool.close()
+
+        inner.close.assert_called_once()
@@ -12,6 +12,12 @@ from claude_apps.skills.playwright_automation.screenshot import (
 )
 
 
+@pytest.fixture(autouse=True)
+def cold_browser(monkeypatch):
+    """Launch a browser per call (these tests cover the launch path)."""
+    monkeypatch.setenv("CLAUDE_BROWSER_POOL", "0")
+
+
 class TestTakeScreenshot:
     """Tests for take_screenshot function."""
 
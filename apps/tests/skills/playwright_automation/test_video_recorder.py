@@ -13,6 +13,12 @@ from claude_apps.skills.playwright_automation.video_recorder import (
 )
 
 
+@pytest.fixture(autouse=True)
+def cold_browser(monkeypatch):
+    """Launch a browser per call (these tests cover the launch path)."""
+    monkeypatch.setenv("CLAUDE_BROWSER_POOL", "0")
+
+
 class TestConvertToMp4:
     """Tests for convert_to_mp4 function."""
 
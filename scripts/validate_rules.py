@@ -37,11 +37,20 @@ RULE_HEADER_PATTERN = re.compile(r"^# RULE:\s*(\d{3})(?:\s+(.+))?$")
 CRITICAL_PATTERN = re.compile(r"\*\*CRITICAL\*\*")
 
 
+def strip_frontmatter(lines: list[str]) -> list[str]:
+    """Drop a leading YAML frontmatter block (rules_loader activation)."""
+    if lines and lines[0].strip() == "---":
+        for i in range(1, len(lines)):
+            if lines[i].strip() == "---":
+                return lines[i + 1 :]
+    return lines
+
+
 def parse_rule_file(path: Path) -> RuleInfo | None:
     """Parse a rule file and extract metadata."""
     try:
         content = path.read_text()
-        lines = content.split("\n")
+        lines = strip_frontmatter(content.split("\n"))
 
         if not lines:
             return None
@@ -68,7 +77,7 @@ def validate_rule_file(path: Path) -> ValidationResult:
 
     try:
         content = path.read_text()
-        lines = content.split("\n")
+        lines = strip_frontmatter(content.split("\n"))
     except Exception as e:
         return ValidationResult(path, [f"Could not read file: {e}"], [])
 